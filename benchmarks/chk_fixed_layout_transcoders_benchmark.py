@@ -0,0 +1,89 @@
+"""Time decoding and encoding the fixed-layout sections of the big test CHK.
+
+Run from the root of the repository:
+
+    python benchmarks/chk_fixed_layout_transcoders_benchmark.py
+
+Every map loads these sections, so they are timed one transcoder at a time:
+
+- decode: decoding the section bytes.
+- decode+read: decoding the section bytes and reading every record, which is what
+  decoding the rich section costs; MRGN and UPRP only build their records when read.
+- encode: encoding a freshly decoded section, which is encoded from the bytes it was
+  decoded from.
+- rebuilt encode: encoding an equal section built from its records, like the sections
+  built by editors and the rich transcoders.
+"""
+
+import dataclasses
+import logging
+import os
+import time
+from typing import Any, Callable
+
+from richchk.io.chk.chk_io import ChkIo
+from richchk.model.chk_section_name import ChkSectionName
+from richchk.transcoder.chk.chk_section_transcoder_factory import (
+    ChkSectionTranscoderFactory,
+)
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+# reads every record of a decoded section
+READERS: dict[ChkSectionName, Callable[[Any], Any]] = {
+    ChkSectionName.MRGN: lambda section: section.locations,
+    ChkSectionName.UNIS: lambda section: section.unit_hitpoints,
+    ChkSectionName.UNIX: lambda section: section.unit_hitpoints,
+    ChkSectionName.UPRP: lambda section: section.cuwp_slots,
+}
+NUM_RUNS = 2000
+
+
+def best_time_us(
+    function: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None
+) -> float:
+    best = float("inf")
+    for _ in range(NUM_RUNS):
+        argument = setup()
+        start = time.perf_counter()
+        function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best * 1_000_000
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    decoded_chk = ChkIo().decode_chk_file(CHK_FILE_PATH)
+    print(f"{CHK_FILE_PATH}: best of {NUM_RUNS} runs, in us")
+    print("      bytes   decode  decode+read   encode  rebuilt encode")
+    for section_name, read in READERS.items():
+        transcoder = ChkSectionTranscoderFactory.make_chk_section_transcoder(
+            section_name
+        )
+        decoded_section = decoded_chk.get_sections_by_name(section_name)[0]
+        chk_binary_data = transcoder.encode(decoded_section, include_header=False)
+        # replace only copies the records, not the bytes they were decoded from
+        rebuilt_section = dataclasses.replace(decoded_section)
+        assert transcoder.decode(chk_binary_data) == rebuilt_section
+        assert (
+            transcoder.encode(rebuilt_section, include_header=False) == chk_binary_data
+        )
+        decode_us = best_time_us(lambda _: transcoder.decode(chk_binary_data))
+        decode_read_us = best_time_us(
+            lambda _: read(transcoder.decode(chk_binary_data))
+        )
+        encode_us = best_time_us(
+            lambda section: transcoder.encode(section, include_header=False),
+            lambda: transcoder.decode(chk_binary_data),
+        )
+        rebuilt_encode_us = best_time_us(
+            lambda _: transcoder.encode(rebuilt_section, include_header=False)
+        )
+        print(
+            f"{section_name.value}: {len(chk_binary_data):6} {decode_us:8.1f} "
+            f"{decode_read_us:12.1f} {encode_us:8.1f} {rebuilt_encode_us:15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Time encoding the sections of the big test CHK serially and with a pool of workers.
+
+Run from the root of the repository:
+
+    python benchmarks/chk_io_encode_workers_benchmark.py
+
+ChkIo encodes the sections of a CHK one after the other.  This times encoding the same
+sections in a persistent thread or process pool instead, joined back in their original
+order, to see whether concurrent section encoding would pay off.  Sections without a
+transcoder are left out, as ChkIo copies their bytes.  The pools are started before
+timing, so only the handoff of each section to a worker is timed.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from richchk.io.chk.chk_io import ChkIo
+from richchk.model.chk.decoded_chk import DecodedChk
+from richchk.model.chk.decoded_chk_section import DecodedChkSection
+from richchk.model.chk.unknown.decoded_unknown_section import DecodedUnknownSection
+from richchk.transcoder.chk.chk_section_transcoder_factory import (
+    ChkSectionTranscoderFactory,
+)
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+NUM_RUNS = 10
+WORKER_COUNTS = [2, 4, 8]
+
+
+def encode_section(decoded_chk_section: DecodedChkSection) -> bytes:
+    """Encode a section with its header; module level so it can be sent to a process."""
+    transcoder: Any = ChkSectionTranscoderFactory.make_chk_section_transcoder(
+        decoded_chk_section.section_name()
+    )
+    return bytes(transcoder.encode(decoded_chk_section, include_header=True))
+
+
+def encode_sections(decoded_chk: DecodedChk, executor: Optional[Executor]) -> bytes:
+    sections = [
+        section
+        for section in decoded_chk.decoded_chk_sections
+        if not isinstance(section, DecodedUnknownSection)
+    ]
+    if executor is None:
+        return b"".join(map(encode_section, sections))
+    return b"".join(executor.map(encode_section, sections))
+
+
+def best_time_ms(
+    chk_binary_data: bytes, encode: Callable[[DecodedChk], bytes]
+) -> float:
+    chkio = ChkIo()
+    best = float("inf")
+    expected: Optional[bytes] = None
+    for _ in range(NUM_RUNS):
+        # a fresh decode, so nothing is encoded from the bytes of an earlier run
+        decoded_chk = chkio.decode_chk_binary_data(chk_binary_data)
+        start = time.perf_counter()
+        encoded = encode(decoded_chk)
+        best = min(best, time.perf_counter() - start)
+        assert expected is None or encoded == expected
+        expected = encoded
+    return best * 1000
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    with open(CHK_FILE_PATH, "rb") as f:
+        chk_binary_data = f.read()
+    print(f"{CHK_FILE_PATH}: {len(chk_binary_data)} bytes, best of {NUM_RUNS} runs")
+    serial_ms = best_time_ms(chk_binary_data, lambda chk: encode_sections(chk, None))
+    print(f"{'serial':>9}:            {serial_ms:8.2f} ms")
+    pool_types: list[Callable[[int], Executor]] = [
+        ThreadPoolExecutor,
+        ProcessPoolExecutor,
+    ]
+    for pool_type in pool_types:
+        for workers in WORKER_COUNTS:
+            with pool_type(workers) as executor:
+                # start every worker before timing
+                list(executor.map(abs, range(workers)))
+                pool_ms = best_time_ms(
+                    chk_binary_data, lambda chk: encode_sections(chk, executor)
+                )
+            name = "threads" if pool_type is ThreadPoolExecutor else "processes"
+            print(f"{name:>9}: workers={workers}: {pool_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare the peak memory of writing a CHK file by streaming against joining bytes.
+
+Run from the root of the repository:
+
+    python benchmarks/chk_io_stream_encode_benchmark.py
+
+The TRIG section of the big test CHK is repeated to make a map with a large TRIG
+section, which dominates the memory of encoding.  Peak memory is measured with
+tracemalloc while writing a freshly decoded CHK to a file, so the encoded sections are
+not served from ChkIo's caches.
+"""
+
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from richchk.io.chk.chk_io import ChkIo
+from richchk.model.chk.decoded_chk import DecodedChk
+from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
+from richchk.transcoder.chk.transcoders.chk_trig_transcoder import ChkTrigTranscoder
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+TRIG_REPEATS = 40
+
+
+def make_big_chk(chkio: ChkIo, chk_binary_data: bytes) -> DecodedChk:
+    decoded_chk = chkio.decode_chk_binary_data(chk_binary_data)
+    transcoder = ChkTrigTranscoder()
+    sections = []
+    for section in decoded_chk.decoded_chk_sections:
+        if isinstance(section, DecodedTrigSection):
+            trig_binary_data = transcoder.encode(section, include_header=False)
+            section = transcoder.decode(trig_binary_data * TRIG_REPEATS)
+        sections.append(section)
+    return DecodedChk(_decoded_chk_sections=sections)
+
+
+def measure(
+    write: Callable[[DecodedChk, str], None], decoded_chk: DecodedChk
+) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "output.chk")
+        tracemalloc.start()
+        start = time.perf_counter()
+        write(decoded_chk, path)
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    chkio = ChkIo()
+    with open(CHK_FILE_PATH, "rb") as f:
+        chk_binary_data = f.read()
+
+    def write_joined_bytes(decoded_chk: DecodedChk, path: str) -> None:
+        encoded = chkio.encode_chk_to_bytes(decoded_chk)
+        with open(path, "wb") as f:
+            f.write(encoded)
+
+    print(f"{CHK_FILE_PATH} with its TRIG section repeated {TRIG_REPEATS} times")
+    for name, write in [
+        ("joined bytes", write_joined_bytes),
+        ("stream", chkio.encode_chk_to_file),
+    ]:
+        seconds, peak = measure(write, make_big_chk(chkio, chk_binary_data))
+        peak_mb = peak / 1024 / 1024
+        print(f"{name:>12}: {seconds * 1000:8.2f} ms, {peak_mb:6.2f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
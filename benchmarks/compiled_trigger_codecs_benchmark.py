@@ -0,0 +1,122 @@
+"""Time decoding the TRIG section of the big test CHK with the compiled trigger codecs
+and with the transcoder factories.
+
+Run from the root of the repository:
+
+    python benchmarks/compiled_trigger_codecs_benchmark.py
+
+Both decode every condition and action of every trigger, once through the tables of
+the compiled codecs, and once by checking each slot against the ID enum and the
+transcoder factory and decoding it through the transcoder, as decoding did before the
+codecs were compiled.
+"""
+
+import logging
+import os
+import time
+from typing import Callable
+
+from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.query.chk_query_util import ChkQueryUtil
+from richchk.io.richchk.richchk_io import RichChkIo
+from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
+from richchk.model.chk.trig.decoded_trigger import DecodedTrigger
+from richchk.model.richchk.richchk_decode_context import RichChkDecodeContext
+from richchk.model.richchk.trig.trigger_action_id import TriggerActionId
+from richchk.model.richchk.trig.trigger_condition_id import TriggerConditionId
+from richchk.transcoder.richchk.transcoders.helpers.richchk_enum_transcoder import (
+    RichChkEnumTranscoder,
+)
+from richchk.transcoder.richchk.transcoders.trig.compiled_trigger_codecs import (
+    CompiledTriggerCodecs,
+)
+from richchk.transcoder.richchk.transcoders.trig.rich_trigger_action_transcoder_factory import (
+    RichTriggerActionTranscoderFactory,
+)
+from richchk.transcoder.richchk.transcoders.trig.rich_trigger_condition_transcoder_factory import (
+    RichTriggerConditionTranscoderFactory,
+)
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+NUM_REPEATS = 20
+
+
+def decode_with_codecs(
+    triggers: list[DecodedTrigger], context: RichChkDecodeContext
+) -> None:
+    for trigger in triggers:
+        CompiledTriggerCodecs.decode_conditions(trigger.conditions, context)
+        CompiledTriggerCodecs.decode_actions(trigger.actions, context)
+
+
+def decode_with_factories(
+    triggers: list[DecodedTrigger], context: RichChkDecodeContext
+) -> None:
+    condition_factory = RichTriggerConditionTranscoderFactory
+    action_factory = RichTriggerActionTranscoderFactory
+    for trigger in triggers:
+        for condition in trigger.conditions:
+            if not RichChkEnumTranscoder.contains_enum_by_id(
+                condition.condition_id, TriggerConditionId
+            ):
+                continue
+            condition_id = RichChkEnumTranscoder.decode_enum(
+                condition.condition_id, TriggerConditionId
+            )
+            if condition_id == TriggerConditionId.NO_CONDITION:
+                continue
+            if condition_factory.supports_transcoding_condition(condition_id):
+                condition_factory.make_rich_trigger_condition_transcoder(
+                    condition_id
+                ).decode(condition, context)
+        for action in trigger.actions:
+            if not RichChkEnumTranscoder.contains_enum_by_id(
+                action.action_id, TriggerActionId
+            ):
+                continue
+            action_id = RichChkEnumTranscoder.decode_enum(
+                action.action_id, TriggerActionId
+            )
+            if action_id == TriggerActionId.NO_ACTION:
+                continue
+            if action_factory.supports_transcoding_trig_action(action_id):
+                action_factory.make_rich_trigger_action_transcoder(action_id).decode(
+                    action, context
+                )
+
+
+def time_decode(
+    decode: Callable[[list[DecodedTrigger], RichChkDecodeContext], None],
+    triggers: list[DecodedTrigger],
+    context: RichChkDecodeContext,
+) -> float:
+    decode(triggers, context)
+    start = time.perf_counter()
+    for _ in range(NUM_REPEATS):
+        decode(triggers, context)
+    return (time.perf_counter() - start) / NUM_REPEATS
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    chk = ChkIo().decode_chk_file(CHK_FILE_PATH)
+    context = RichChkIo()._build_decode_context(chk)
+    triggers = ChkQueryUtil.find_only_decoded_section_in_chk(
+        DecodedTrigSection, chk
+    ).triggers
+    codecs_seconds = time_decode(decode_with_codecs, triggers, context)
+    factories_seconds = time_decode(decode_with_factories, triggers, context)
+    print(f"{len(triggers)} triggers")
+    for name, seconds in [
+        ("compiled codecs", codecs_seconds),
+        ("factories", factories_seconds),
+    ]:
+        print(
+            f"{name:>15}: {seconds * 1000:8.2f} ms, "
+            f"{seconds / len(triggers) * 1e6:8.2f} us per trigger"
+        )
+
+
+if __name__ == "__main__":
+    main()
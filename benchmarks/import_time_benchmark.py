@@ -0,0 +1,55 @@
+"""Time importing RichChkIo in fresh interpreters, as reported by python -X importtime.
+
+Run from the root of the repository:
+
+    python benchmarks/import_time_benchmark.py
+
+The transcoder factories import each transcoder the first time it is needed, so this
+should stay well below the cost of importing every transcoder up front, which is also
+reported for comparison.
+"""
+
+import subprocess
+import sys
+
+MODULE = "richchk.io.richchk.richchk_io"
+IMPORT_ALL_TRANSCODERS = (
+    "from richchk.transcoder.transcoder_manifest_generator import "
+    "render_transcoder_manifest; render_transcoder_manifest()"
+)
+NUM_RUNS = 10
+
+
+def time_import_ms(code: str) -> float:
+    """The cumulative import time of the modules imported by the code, in ms."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    total_us = 0
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative_us, name = line.split("|")
+        # only sum top level imports, which are not indented
+        if cumulative_us.strip().isdigit() and not name[1:].startswith(" "):
+            total_us += int(cumulative_us)
+    return total_us / 1000
+
+
+def main() -> None:
+    print(f"best of {NUM_RUNS} runs")
+    for label, code in [
+        (f"import {MODULE}", f"import {MODULE}"),
+        (
+            f"import {MODULE} and every transcoder",
+            f"import {MODULE}; {IMPORT_ALL_TRANSCODERS}",
+        ),
+    ]:
+        best = min(time_import_ms(code) for _ in range(NUM_RUNS))
+        print(f"{label}: {best:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
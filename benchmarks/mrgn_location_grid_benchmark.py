@@ -0,0 +1,120 @@
+"""Time finding MRGN locations by position with the location grid and with a scan.
+
+Run from the root of the repository:
+
+    python benchmarks/mrgn_location_grid_benchmark.py
+
+The MRGN has the most locations a map can have, placed at random on the largest map.
+Each query is run once with the location grid of the section, and once by checking
+every location.
+"""
+
+import random
+import time
+from typing import Callable
+
+from richchk.io.richchk.query.mrgn_query_util import MrgnQueryUtil
+from richchk.model.richchk.mrgn.rich_location import RichLocation
+from richchk.model.richchk.mrgn.rich_mrgn_section import RichMrgnSection
+from richchk.model.richchk.str.rich_string import RichString
+
+MAP_SIZE = 256 * 32
+NUM_LOCATIONS = 255
+NUM_QUERIES = 10000
+AREA_SIZE = 256
+
+
+def random_mrgn(rng: random.Random) -> RichMrgnSection:
+    locations = []
+    for index in range(NUM_LOCATIONS):
+        left, top = rng.randrange(MAP_SIZE), rng.randrange(MAP_SIZE)
+        locations.append(
+            RichLocation(
+                _left_x1=left,
+                _top_y1=top,
+                _right_x2=left + rng.randrange(32, 1024),
+                _bottom_y2=top + rng.randrange(32, 1024),
+                _custom_location_name=RichString(_value=f"location {index}"),
+                _index=index + 1,
+            )
+        )
+    return RichMrgnSection(_locations=locations)
+
+
+def scan_containing_point(x: int, y: int, mrgn: RichMrgnSection) -> list[RichLocation]:
+    return [
+        location
+        for location in mrgn.locations
+        if location.left_x1 <= x < location.right_x2
+        and location.top_y1 <= y < location.bottom_y2
+    ]
+
+
+def scan_overlapping_area(
+    left: int, top: int, right: int, bottom: int, mrgn: RichMrgnSection
+) -> list[RichLocation]:
+    return [
+        location
+        for location in mrgn.locations
+        if location.left_x1 < right
+        and left < location.right_x2
+        and location.top_y1 < bottom
+        and top < location.bottom_y2
+    ]
+
+
+def scan_nearest_location(x: int, y: int, mrgn: RichMrgnSection) -> RichLocation:
+    def squared_distance(location: RichLocation) -> int:
+        dx = max(location.left_x1 - x, 0, x - (location.right_x2 - 1))
+        dy = max(location.top_y1 - y, 0, y - (location.bottom_y2 - 1))
+        return dx * dx + dy * dy
+
+    return min(mrgn.locations, key=squared_distance)
+
+
+def time_queries(query: Callable[[int, int], object], points: list) -> float:
+    start = time.perf_counter()
+    for x, y in points:
+        query(x, y)
+    return (time.perf_counter() - start) / len(points)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    mrgn = random_mrgn(rng)
+    points = [
+        (rng.randrange(MAP_SIZE), rng.randrange(MAP_SIZE)) for _ in range(NUM_QUERIES)
+    ]
+    start = time.perf_counter()
+    mrgn.location_grid
+    build_seconds = time.perf_counter() - start
+    print(f"{NUM_LOCATIONS} locations, grid built in {build_seconds * 1000:.2f} ms")
+    queries = {
+        "containing point": (
+            lambda x, y: MrgnQueryUtil.find_locations_containing_point(x, y, mrgn),
+            lambda x, y: scan_containing_point(x, y, mrgn),
+        ),
+        "overlapping area": (
+            lambda x, y: MrgnQueryUtil.find_locations_overlapping_area(
+                x, y, x + AREA_SIZE, y + AREA_SIZE, mrgn
+            ),
+            lambda x, y: scan_overlapping_area(
+                x, y, x + AREA_SIZE, y + AREA_SIZE, mrgn
+            ),
+        ),
+        "nearest location": (
+            lambda x, y: MrgnQueryUtil.find_nearest_location(x, y, mrgn),
+            lambda x, y: scan_nearest_location(x, y, mrgn),
+        ),
+    }
+    for name, (grid_query, scan_query) in queries.items():
+        grid_seconds = time_queries(grid_query, points)
+        scan_seconds = time_queries(scan_query, points)
+        print(
+            f"{name:>16}: grid {grid_seconds * 1e6:8.2f} us, "
+            f"scan {scan_seconds * 1e6:8.2f} us per query"
+        )
+
+
+if __name__ == "__main__":
+    main()
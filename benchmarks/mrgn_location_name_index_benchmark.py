@@ -0,0 +1,131 @@
+"""Time finding MRGN locations by name with the location name index and with a scan.
+
+Run from the root of the repository:
+
+    python benchmarks/mrgn_location_name_index_benchmark.py
+
+The MRGN has the most locations a map can have, named like the locations of a large
+UMS map.  Each search is run once with the location name index of the section, and
+once by comparing the name with every location, as searches did before the index.
+"""
+
+import difflib
+import random
+import time
+from typing import Callable
+
+from richchk.io.richchk.query.mrgn_query_util import MrgnQueryUtil
+from richchk.model.richchk.mrgn.rich_location import RichLocation
+from richchk.model.richchk.mrgn.rich_mrgn_section import RichMrgnSection
+from richchk.model.richchk.str.rich_string import RichString
+
+NUM_LOCATIONS = 255
+NUM_QUERIES = 1000
+WORDS = [
+    "spawn",
+    "base",
+    "left",
+    "right",
+    "top",
+    "bottom",
+    "exit",
+    "Boss",
+    "arena",
+    "Player",
+    "gate",
+    "Shop",
+]
+
+
+def random_name(rng: random.Random, number: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randrange(1, 4))) + f" {number}"
+
+
+def random_mrgn(rng: random.Random) -> RichMrgnSection:
+    return RichMrgnSection(
+        _locations=[
+            RichLocation(
+                _left_x1=0,
+                _top_y1=0,
+                _right_x2=32,
+                _bottom_y2=32,
+                _custom_location_name=RichString(_value=random_name(rng, index)),
+                _index=index + 1,
+            )
+            for index in range(NUM_LOCATIONS)
+        ]
+    )
+
+
+def scan_by_name(location_name: str, mrgn: RichMrgnSection) -> list[RichLocation]:
+    return [
+        location
+        for location in mrgn.locations
+        if location.custom_location_name.value.lower() == location_name.lower()
+    ]
+
+
+def scan_by_fuzzy_search(location_name: str, mrgn: RichMrgnSection) -> RichLocation:
+    return max(
+        (
+            (
+                difflib.SequenceMatcher(
+                    None,
+                    location_name.lower(),
+                    location.custom_location_name.value.lower(),
+                ).ratio(),
+                location,
+            )
+            for location in mrgn.locations
+        ),
+        key=lambda x: x[0],
+    )[1]
+
+
+def time_queries(query: Callable[[str], object], names: list[str]) -> float:
+    start = time.perf_counter()
+    for name in names:
+        query(name)
+    return (time.perf_counter() - start) / len(names)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    mrgn = random_mrgn(rng)
+    location_names = [
+        location.custom_location_name.value for location in mrgn.locations
+    ]
+    # names in another case, which are found exactly ignoring case
+    exact_names = [rng.choice(location_names).upper() for _ in range(NUM_QUERIES)]
+    # misspelled names of locations
+    misspelled_names = [
+        random_name(rng, rng.randrange(NUM_LOCATIONS)).replace("a", "e", 1)
+        for _ in range(NUM_QUERIES)
+    ]
+    start = time.perf_counter()
+    mrgn.location_name_index.lowercased
+    build_seconds = time.perf_counter() - start
+    print(f"{NUM_LOCATIONS} locations, index built in {build_seconds * 1000:.2f} ms")
+    queries = {
+        "by name": (
+            exact_names,
+            lambda name: MrgnQueryUtil.find_location_by_name(name, mrgn),
+            lambda name: scan_by_name(name, mrgn),
+        ),
+        "by fuzzy search": (
+            misspelled_names,
+            lambda name: MrgnQueryUtil.find_location_by_fuzzy_search(name, mrgn),
+            lambda name: scan_by_fuzzy_search(name, mrgn),
+        ),
+    }
+    for query_name, (names, index_query, scan_query) in queries.items():
+        index_seconds = time_queries(index_query, names)
+        scan_seconds = time_queries(scan_query, names)
+        print(
+            f"{query_name:>15}: index {index_seconds * 1e6:8.2f} us, "
+            f"scan {scan_seconds * 1e6:8.2f} us per query"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Time RichChkIo.encode_chk on edits of the big test CHK, with and without a lineage.
+
+Run from the root of the repository:
+
+    python benchmarks/richchk_io_incremental_encode_benchmark.py
+
+An edit made with RichChkEditor keeps the lineage of the decoded RichChk, so only the
+replaced section is encoded again.  The same edit without a lineage encodes every
+section.
+"""
+
+import dataclasses
+import logging
+import os
+import time
+
+from richchk.editor.richchk.rich_chk_editor import RichChkEditor
+from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.query.chk_query_util import ChkQueryUtil
+from richchk.io.richchk.richchk_io import RichChkIo
+from richchk.model.richchk.rich_chk import RichChk
+from richchk.model.richchk.unis.rich_unis_section import RichUnisSection
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+NUM_EDITS = 20
+
+
+def edit_unit_settings(rich_chk: RichChk, armor: int) -> RichChk:
+    unis = ChkQueryUtil.find_only_rich_section_in_chk(RichUnisSection, rich_chk)
+    first = dataclasses.replace(unis.unit_settings[0], _armorpoints=armor)
+    return RichChkEditor().replace_chk_section(
+        RichUnisSection(_unit_settings=[first] + unis.unit_settings[1:]), rich_chk
+    )
+
+
+def time_edits(rich_chk: RichChk, keep_lineage: bool) -> float:
+    richchk_io = RichChkIo()
+    richchk_io.encode_chk(rich_chk)
+    total = 0.0
+    for armor in range(NUM_EDITS):
+        rich_chk = edit_unit_settings(rich_chk, armor)
+        if not keep_lineage:
+            rich_chk = RichChk(_chk_sections=rich_chk.chk_sections)
+        start = time.perf_counter()
+        richchk_io.encode_chk(rich_chk)
+        total += time.perf_counter() - start
+    return total / NUM_EDITS
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    chk = ChkIo().decode_chk_file(CHK_FILE_PATH)
+    print(f"{CHK_FILE_PATH}: mean of {NUM_EDITS} edits of the UNIS")
+    for keep_lineage in [False, True]:
+        rich_chk = RichChkIo().decode_chk(chk)
+        seconds = time_edits(rich_chk, keep_lineage)
+        print(f"lineage={str(keep_lineage):>5}: {seconds * 1000:8.2f} ms per encode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Time encoding the TRIG section of the big test CHK after editing a single trigger.
+
+Run from the root of the repository:
+
+    python benchmarks/trig_chunk_encode_cache_benchmark.py
+
+The triggers of the big test CHK are repeated to make a large TRIG section.  Each edit
+replaces one trigger with a copy of another, so every chunk but the edited one is
+encoded from the chunk bytes cache.  Emptying the cache before each encode times
+encoding the whole section.
+"""
+
+import logging
+import os
+import time
+
+from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.richchk_io import RichChkIo
+from richchk.model.richchk.rich_chk import RichChk
+from richchk.model.richchk.trig.rich_trig_section import RichTrigSection
+from richchk.transcoder.richchk.transcoders.trig.batched_trig_encode_optimizer import (
+    BatchedTrigEncodeOptimizer,
+)
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+TRIGGER_REPEATS = 10
+NUM_EDITS = 10
+
+
+def with_triggers(rich_chk: RichChk, triggers: list) -> RichChk:
+    return RichChk(
+        _chk_sections=[
+            RichTrigSection(_triggers=triggers)
+            if isinstance(section, RichTrigSection)
+            else section
+            for section in rich_chk.chk_sections
+        ]
+    )
+
+
+def time_edits(rich_chk: RichChk, triggers: list, use_cache: bool) -> float:
+    richchk_io = RichChkIo()
+    richchk_io.encode_chk(with_triggers(rich_chk, triggers))
+    total = 0.0
+    for edit in range(NUM_EDITS):
+        edited_triggers = list(triggers)
+        edited_triggers[edit * 997 % len(triggers)] = triggers[edit]
+        edited_chk = with_triggers(rich_chk, edited_triggers)
+        if not use_cache:
+            BatchedTrigEncodeOptimizer._chunk_bytes_cache.clear()
+        start = time.perf_counter()
+        richchk_io.encode_chk(edited_chk)
+        total += time.perf_counter() - start
+    return total / NUM_EDITS
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    rich_chk = RichChkIo().decode_chk(ChkIo().decode_chk_file(CHK_FILE_PATH))
+    trig = rich_chk.get_sections_by_type(RichTrigSection)[0]
+    triggers = list(trig.triggers) * TRIGGER_REPEATS
+    print(f"{CHK_FILE_PATH}: {len(triggers)} triggers, mean of {NUM_EDITS} edits")
+    for use_cache in [False, True]:
+        seconds = time_edits(rich_chk, triggers, use_cache)
+        print(f"chunk cache={str(use_cache):>5}: {seconds * 1000:8.2f} ms per encode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Time decoding the TRIG section of the big test CHK with and without sharing the
+objects decoded from equal slots, and count the objects and memory each decode keeps.
+
+Run from the root of the repository:
+
+    python benchmarks/trig_decode_intern_benchmark.py
+
+Both decode the columns of the section into rich triggers, once through the transcoder,
+which shares the conditions, actions and player sets decoded from equal slots, and once
+by decoding every slot and player execution on its own, as decoding did before.
+"""
+
+import logging
+import os
+import time
+import tracemalloc
+from typing import Callable
+
+from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.query.chk_query_util import ChkQueryUtil
+from richchk.io.richchk.richchk_io import RichChkIo
+from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
+from richchk.model.richchk.richchk_decode_context import RichChkDecodeContext
+from richchk.model.richchk.trig.rich_trig_section import RichTrigSection
+from richchk.model.richchk.trig.rich_trigger import RichTrigger
+from richchk.transcoder.richchk.transcoders.richchk_trig_transcoder import (
+    RichChkTrigTranscoder,
+)
+from richchk.transcoder.richchk.transcoders.trig.compiled_trigger_codecs import (
+    CompiledTriggerCodecs,
+)
+
+CHK_FILE_PATH = os.path.join("test", "resources", "demon_lore_yatapi_test.chk")
+NUM_REPEATS = 20
+
+
+def decode_interned(
+    trig: DecodedTrigSection, context: RichChkDecodeContext
+) -> RichTrigSection:
+    return RichChkTrigTranscoder().decode(trig, context)
+
+
+def decode_each_slot(
+    trig: DecodedTrigSection, context: RichChkDecodeContext
+) -> RichTrigSection:
+    transcoder = RichChkTrigTranscoder()
+    columns = trig.columns
+    assert columns is not None
+    rich_triggers = []
+    for trigger_index in range(columns.num_triggers):
+        conditions = CompiledTriggerCodecs.decode_conditions(
+            [
+                columns.condition(index)
+                for index in columns.condition_slots(trigger_index, skip_empty=True)
+            ],
+            context,
+        )
+        actions = CompiledTriggerCodecs.decode_actions(
+            [
+                columns.action(index)
+                for index in columns.action_slots(trigger_index, skip_empty=True)
+            ],
+            context,
+        )
+        players = transcoder._decode_player_execution(
+            columns.player_execution(trigger_index)
+        )
+        rich_triggers.append(
+            RichTrigger(_conditions=conditions, _actions=actions, _players=players)
+        )
+    return RichTrigSection(_triggers=rich_triggers)
+
+
+def time_decode(
+    decode: Callable[[DecodedTrigSection, RichChkDecodeContext], RichTrigSection],
+    trig: DecodedTrigSection,
+    context: RichChkDecodeContext,
+) -> float:
+    decode(trig, context)
+    start = time.perf_counter()
+    for _ in range(NUM_REPEATS):
+        decode(trig, context)
+    return (time.perf_counter() - start) / NUM_REPEATS
+
+
+def measure_memory(
+    decode: Callable[[DecodedTrigSection, RichChkDecodeContext], RichTrigSection],
+    trig: DecodedTrigSection,
+    context: RichChkDecodeContext,
+) -> tuple[int, int]:
+    """The number of distinct condition, action and player set objects of a decode,
+    and the bytes it keeps allocated."""
+    tracemalloc.start()
+    rich_trig = decode(trig, context)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = set()
+    for trigger in rich_trig.triggers:
+        objects.update(id(condition) for condition in trigger.conditions)
+        objects.update(id(action) for action in trigger.actions)
+        objects.add(id(trigger.players))
+    return len(objects), size
+
+
+def main() -> None:
+    # decoding logs every section without a transcoder, which would drown the timings
+    logging.disable(logging.ERROR)
+    chk = ChkIo().decode_chk_file(CHK_FILE_PATH)
+    context = RichChkIo()._build_decode_context(chk)
+    trig = ChkQueryUtil.find_only_decoded_section_in_chk(DecodedTrigSection, chk)
+    assert decode_interned(trig, context) == decode_each_slot(trig, context)
+    print(f"{trig.columns.num_triggers if trig.columns else 0} triggers")
+    for name, decode in [
+        ("interned", decode_interned),
+        ("each slot", decode_each_slot),
+    ]:
+        seconds = time_decode(decode, trig, context)
+        num_objects, size = measure_memory(decode, trig, context)
+        print(
+            f"{name:>9}: {seconds * 1000:8.2f} ms, {num_objects:6} objects, "
+            f"{size / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,35 @@
-"""Change RichChk behavior (logging, StormLib DLL, etc.) by external config.
+"""Change RichChk behavior (logging, caching, etc.) by external config.
 
 Example config.yaml:
 
 logging:
 
 level: INFO
+
+cache:
+
+directory: ~/.cache/richchk
+
+max_size_mb: 512
 """
+import os
+from typing import Any
+
+import yaml
 
 # defines a path to a local config.yaml file
-# currently the config only supports changing the logging level globally
 RICHCHK_CONFIG_ENV_VAR = "io.sethmachine.richchk.config"
+
+
+def load_richchk_config() -> dict[str, Any]:
+    """Load the config file defined by the RICHCHK_CONFIG_ENV_VAR environment variable.
+
+    :return: the parsed config, or an empty config if no config file is defined or it
+        does not exist.
+    """
+    maybe_config_file = os.getenv(RICHCHK_CONFIG_ENV_VAR)
+    if not maybe_config_file or not os.path.exists(maybe_config_file):
+        return {}
+    with open(maybe_config_file, "r") as f:
+        config = yaml.safe_load(f)
+    return config if isinstance(config, dict) else {}
@@ -18,25 +18,44 @@ class DecodedChkEditor:
 
         Throws if the section already exists.
         """
-        if chk.get_sections_by_name(new_section.section_name()):
+        if chk.contains_section(new_section.section_name()):
             msg = (
                 f"Cannot add CHK section with name {new_section.section_name()} "
                 f"as it already exists in the CHK!"
             )
             cls._LOG.error(msg)
             raise ValueError(msg)
-        new_sections = [section for section in chk.decoded_chk_sections]
+        new_sections = list(chk.decoded_chk_sections)
         new_sections.append(new_section)
-        return DecodedChk(_decoded_chk_sections=new_sections)
+        if chk.is_lazy:
+            return DecodedChk(_decoded_chk_sections=new_sections)
+        return DecodedChk(
+            _decoded_chk_sections=new_sections,
+            _prebuilt_section_index=chk.section_index.with_appended(
+                len(new_sections) - 1, new_section
+            ),
+        )
 
     @classmethod
     def remove_chk_sections_by_name(
         cls, section_to_remove: ChkSectionName, chk: DecodedChk
     ) -> DecodedChk:
         """Make a new CHK with all sections matching the name removed."""
+        if chk.is_lazy:
+            return DecodedChk(
+                _decoded_chk_sections=[
+                    section
+                    for section in chk.decoded_chk_sections
+                    if section.section_name() != section_to_remove
+                ]
+            )
+        removed = set(chk.section_index.indices_of_name(section_to_remove))
         new_sections = [
             section
-            for section in chk.decoded_chk_sections
-            if section.section_name() != section_to_remove
+            for index, section in enumerate(chk.decoded_chk_sections)
+            if index not in removed
         ]
-        return DecodedChk(_decoded_chk_sections=new_sections)
+        return DecodedChk(
+            _decoded_chk_sections=new_sections,
+            _prebuilt_section_index=chk.section_index.without_name(section_to_remove),
+        )
@@ -0,0 +1,109 @@
+"""Allocate new strings at the end of the string data of a STR or STRx section.
+
+A builder indexes the offset of every string in the string data, and where the string
+data ends, so adding strings neither encodes the section again nor searches its strings.
+The builder is kept for the section it made, so the next strings added to that section
+reuse the index instead of building it again.
+"""
+
+import itertools
+import weakref
+from collections.abc import Collection
+from typing import Any, Callable, ClassVar, Generic, TypeVar, cast
+
+from ...model.chk.decoded_string_section import DecodedStringSection
+from ...transcoder.chk.strings_common import _STRING_ENCODING
+
+_S = TypeVar("_S", bound=DecodedStringSection)
+
+
+class DecodedStringTableBuilder(Generic[_S]):
+    # id(section) -> (weakref(section), builder for that section)
+    _builders_by_section_id: ClassVar[dict[int, tuple[Any, Any]]] = {}
+
+    def __init__(
+        self,
+        decoded_string_section: _S,
+        offset_size: int,
+        make_section: Callable[[int, list[int], list[str]], _S],
+    ) -> None:
+        """:param offset_size: the size in bytes of the number of strings and of each
+        string offset, 2 for STR and 4 for STRx.
+        :param make_section: makes a section of the type of the section from its
+        number of strings, string offsets and strings."""
+        self._offset_size = offset_size
+        self._make_section = make_section
+        # positions are relative to the start of the string data, so unlike offsets
+        # they do not move when the offsets grow
+        sizes = [
+            len(string_.encode(_STRING_ENCODING)) + 1
+            for string_ in decoded_string_section.strings
+        ]
+        positions = list(itertools.accumulate(sizes, initial=0))
+        self._tail_position = positions[-1]
+        # reversed, so a string repeated in the string data keeps its first position
+        self._position_by_string: dict[str, int] = dict(
+            zip(
+                reversed(decoded_string_section.strings),
+                reversed(positions[:-1]),
+            )
+        )
+
+    @classmethod
+    def for_section(
+        cls,
+        decoded_string_section: _S,
+        offset_size: int,
+        make_section: Callable[[int, list[int], list[str]], _S],
+    ) -> "DecodedStringTableBuilder[_S]":
+        """The builder which made the section, or else a new builder for it."""
+        entry = cls._builders_by_section_id.get(id(decoded_string_section))
+        if entry is not None and entry[0]() is decoded_string_section:
+            return cast(DecodedStringTableBuilder[_S], entry[1])
+        builder = cls(decoded_string_section, offset_size, make_section)
+        builder._track(decoded_string_section)
+        return builder
+
+    def contains(self, string_: str) -> bool:
+        return string_ in self._position_by_string
+
+    def add_strings(
+        self, unique_strings_to_add: Collection[str], decoded_string_section: _S
+    ) -> _S:
+        """Add strings which are unique and not in the section yet, producing a new
+        section of the same type.
+
+        The builder then describes the new section, so it must not be used for the
+        original section anymore.
+        """
+        section = decoded_string_section
+        # each new string adds exactly one more offset, which moves the string data
+        header_size = (section.number_of_strings + 1) * self._offset_size
+        new_header_size = header_size + len(unique_strings_to_add) * self._offset_size
+        shift = new_header_size - header_size
+        new_string_offsets = [offset + shift for offset in section.strings_offsets]
+        position_by_string = self._position_by_string
+        position = self._tail_position
+        for string_to_add in unique_strings_to_add:
+            position_by_string[string_to_add] = position
+            new_string_offsets.append(new_header_size + position)
+            position += len(string_to_add.encode(_STRING_ENCODING)) + 1
+        self._tail_position = position
+        self._builders_by_section_id.pop(id(section), None)
+        new_section = self._make_section(
+            section.number_of_strings + len(unique_strings_to_add),
+            new_string_offsets,
+            section.strings + list(unique_strings_to_add),
+        )
+        self._track(new_section)
+        return new_section
+
+    def _track(self, decoded_string_section: _S) -> None:
+        # the builder must not reference the section, or it would never be collected
+        section_id = id(decoded_string_section)
+        builders_by_section_id = self._builders_by_section_id
+        section_ref = weakref.ref(
+            decoded_string_section,
+            lambda _: builders_by_section_id.pop(section_id, None),
+        )
+        builders_by_section_id[section_id] = (section_ref, self)
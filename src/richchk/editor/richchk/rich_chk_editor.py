@@ -1,4 +1,8 @@
-"""Replace existing RichChkSections in a RichChk."""
+"""Replace existing RichChkSections in a RichChk.
+
+Each edited RichChk keeps the lineage of the RichChk it was edited from, so RichChkIo
+only re-encodes the sections which were replaced, added or removed.
+"""
 
 import logging
 from typing import Union
@@ -17,32 +21,27 @@ class RichChkEditor:
     def replace_chk_section(
         self, new_section: RichChkSection, richchk: RichChk
     ) -> RichChk:
-        existing_sections = richchk.chk_sections
-        new_sections = self._replace_chk_section(new_section, existing_sections)
-        return RichChk(_chk_sections=new_sections)
-
-    def _replace_chk_section(
-        self,
-        new_section: RichChkSection,
-        existing_sections: list[Union[DecodedChkSection, RichChkSection]],
-    ) -> list[Union[DecodedChkSection, RichChkSection]]:
-        modified_sections: list[Union[DecodedChkSection, RichChkSection]] = []
+        section_index = richchk.section_index
+        new_sections = list(richchk.chk_sections)
         section_was_replaced = False
-        for section in existing_sections:
-            if (
-                isinstance(section, RichChkSection)
-                and section.section_name() == new_section.section_name()
-            ):
+        for index in section_index.indices_of_name(new_section.section_name()):
+            old_section = new_sections[index]
+            if isinstance(old_section, RichChkSection):
                 section_was_replaced = True
-                modified_sections.append(new_section)
-            else:
-                modified_sections.append(section)
+                new_sections[index] = new_section
+                section_index = section_index.with_replaced(
+                    index, old_section, new_section
+                )
         if not section_was_replaced:
             self.log.warning(
                 f"Unable to replace section with name {new_section.section_name()} "
                 f"because no RichChkSection was found with that section name"
             )
-        return modified_sections
+        return RichChk(
+            _chk_sections=new_sections,
+            _lineage=richchk.lineage,
+            _prebuilt_section_index=section_index,
+        )
 
     @classmethod
     def add_chk_section(
@@ -52,24 +51,35 @@ class RichChkEditor:
 
         Throws if the section already exists.
         """
-        if chk.get_sections_by_name(new_section.section_name()):
+        if chk.contains_section(new_section.section_name()):
             msg = (
                 f"Cannot add CHK section with name {new_section.section_name()} "
                 f"as it already exists in the CHK!"
             )
             raise ValueError(msg)
-        new_sections = [section for section in chk.chk_sections]
+        new_sections = list(chk.chk_sections)
         new_sections.append(new_section)
-        return RichChk(_chk_sections=new_sections)
+        return RichChk(
+            _chk_sections=new_sections,
+            _lineage=chk.lineage,
+            _prebuilt_section_index=chk.section_index.with_appended(
+                len(new_sections) - 1, new_section
+            ),
+        )
 
     @classmethod
     def remove_chk_sections_by_name(
         cls, section_to_remove: ChkSectionName, chk: RichChk
     ) -> RichChk:
         """Make a new CHK with all sections matching the name removed."""
+        removed = set(chk.section_index.indices_of_name(section_to_remove))
         new_sections = [
             section
-            for section in chk.chk_sections
-            if section.section_name() != section_to_remove
+            for index, section in enumerate(chk.chk_sections)
+            if index not in removed
         ]
-        return RichChk(_chk_sections=new_sections)
+        return RichChk(
+            _chk_sections=new_sections,
+            _lineage=chk.lineage,
+            _prebuilt_section_index=chk.section_index.without_name(section_to_remove),
+        )
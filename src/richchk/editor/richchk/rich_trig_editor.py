@@ -4,6 +4,7 @@ from collections.abc import Collection
 
 from ...model.richchk.trig.rich_trig_section import RichTrigSection
 from ...model.richchk.trig.rich_trigger import RichTrigger
+from ...model.richchk.trig.rich_trigger_chunk import RichTriggerChunk
 
 
 class RichTrigEditor:
@@ -13,7 +14,10 @@ class RichTrigEditor:
     ) -> RichTrigSection:
         """Adds triggers, producing a new RichTrigSection.
 
-        The underlying triggers in the new section are still a shallow copy.  Avoid any
-        mutations or side effects.
+        The new section shares the trigger chunks of the original section, so adding
+        triggers in many small batches does not copy the triggers added before.  The
+        underlying triggers are not copied either.  Avoid any mutations or side effects.
         """
-        return RichTrigSection(_triggers=list(trig.triggers) + list(triggers))
+        return RichTrigSection.from_trigger_chunks(
+            RichTriggerChunk.append(trig.trigger_chunks, triggers)
+        )
@@ -0,0 +1,171 @@
+"""Persist decoded CHKs on disk so unchanged maps are not decoded again in new processes.
+
+Entries are addressed by a hash of the CHK binary data and the RichChk version, so a
+changed map or an upgraded RichChk never reads a stale entry.  Each entry is a pickled
+DecodedChk in its own file; PersistentRichChkCache also stores RichChk entries in the
+same directory.  Reading an entry refreshes its modification
+time, and once the cache outgrows its size cap the least recently used entries are
+removed.
+
+The cache is opt-in, through the RichChk config:
+
+cache:
+
+directory: ~/.cache/richchk
+
+max_size_mb: 512
+
+Entries are unpickled, so the cache directory must only be writable by trusted users.
+"""
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import threading
+from typing import Any, Optional, Self, cast
+
+from ...config.richchk_config import RICHCHK_CONFIG_ENV_VAR, load_richchk_config
+from ...model.chk.decoded_chk import DecodedChk
+from ...util import logger
+from ...util.fileutils import CrossPlatformSafeTemporaryNamedFile
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _richchk_version() -> str:
+    try:
+        return importlib.metadata.version("richchk")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class PersistentChkCache:
+    DEFAULT_MAX_SIZE_MB = 512
+    _ENTRY_EXTENSION = ".pickle"
+    _DECODED_CHK_KIND = "decoded"
+    _VERSION = _richchk_version()
+
+    # (cache class, config file path) -> cache built from it
+    _from_config_cache: dict[tuple[type, str], Optional["PersistentChkCache"]] = {}
+    _from_config_lock = threading.Lock()
+
+    def __init__(
+        self, cache_directory: str, max_size_mb: float = DEFAULT_MAX_SIZE_MB
+    ) -> None:
+        """Cache decoded CHKs in a directory.
+
+        :param cache_directory: created if it does not exist.
+        :param max_size_mb: the least recently used entries are removed past this size.
+        """
+        self._log = logger.get_logger(PersistentChkCache.__name__)
+        if max_size_mb <= 0:
+            msg = f"The cache size cap must be positive, but got {max_size_mb} MB."
+            self._log.error(msg)
+            raise ValueError(msg)
+        self._cache_directory = os.path.expanduser(cache_directory)
+        self._max_size_bytes = int(max_size_mb * _BYTES_PER_MB)
+        os.makedirs(self._cache_directory, exist_ok=True)
+
+    @classmethod
+    def from_config(cls) -> Optional[Self]:
+        """The cache defined by the "cache" entry of the RichChk config, if any.
+
+        :return: None unless the config defines a cache directory.
+        """
+        config_key = (cls, os.getenv(RICHCHK_CONFIG_ENV_VAR, ""))
+        with cls._from_config_lock:
+            if config_key not in cls._from_config_cache:
+                cache_config = load_richchk_config().get("cache") or {}
+                cls._from_config_cache[config_key] = (
+                    cls(
+                        cache_config["directory"],
+                        cache_config.get("max_size_mb", cls.DEFAULT_MAX_SIZE_MB),
+                    )
+                    if cache_config.get("directory")
+                    else None
+                )
+            return cast(Optional[Self], cls._from_config_cache[config_key])
+
+    @property
+    def cache_directory(self) -> str:
+        return self._cache_directory
+
+    @property
+    def max_size_bytes(self) -> int:
+        return self._max_size_bytes
+
+    def get_decoded_chk(self, chk_binary_data: bytes) -> Optional[DecodedChk]:
+        entry = self._get(self._DECODED_CHK_KIND, chk_binary_data)
+        return entry if isinstance(entry, DecodedChk) else None
+
+    def put_decoded_chk(self, chk_binary_data: bytes, decoded_chk: DecodedChk) -> None:
+        """Store an eagerly decoded CHK; lazy CHKs are not stored."""
+        if not decoded_chk.is_lazy:
+            self._put(self._DECODED_CHK_KIND, chk_binary_data, decoded_chk)
+
+    def _get(self, kind: str, chk_binary_data: bytes) -> Optional[Any]:
+        entry_path = self._entry_path(kind, chk_binary_data)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._log.warning(f"Removing unreadable CHK cache entry {entry_path}")
+            self._remove_entry(entry_path)
+            return None
+        try:
+            # mark the entry as recently used
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return entry
+
+    def _put(self, kind: str, chk_binary_data: bytes, entry: Any) -> None:
+        entry_path = self._entry_path(kind, chk_binary_data)
+        try:
+            entry_bytes = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self._log.warning(f"Not caching a CHK which cannot be pickled: {e}")
+            return
+        if len(entry_bytes) > self._max_size_bytes:
+            return
+        with CrossPlatformSafeTemporaryNamedFile(
+            directory=self._cache_directory
+        ) as temp_file:
+            with open(temp_file, "wb") as f:
+                f.write(entry_bytes)
+            os.replace(temp_file, entry_path)
+        self._evict_least_recently_used_entries()
+
+    def _evict_least_recently_used_entries(self) -> None:
+        entries = []
+        with os.scandir(self._cache_directory) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(self._ENTRY_EXTENSION):
+                    try:
+                        stat = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size_bytes:
+                break
+            self._remove_entry(path)
+            total_size -= size
+
+    @staticmethod
+    def _remove_entry(entry_path: str) -> None:
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+
+    def _entry_path(self, kind: str, chk_binary_data: bytes) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{self._VERSION}:{kind}:".encode("utf-8"))
+        digest.update(chk_binary_data)
+        return os.path.join(
+            self._cache_directory, digest.hexdigest() + self._ENTRY_EXTENSION
+        )
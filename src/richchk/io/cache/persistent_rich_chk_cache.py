@@ -0,0 +1,20 @@
+"""Persist the RichChks decoded from CHKs on disk, next to the decoded CHKs.
+
+Kept apart from PersistentChkCache so the CHK IO, which only needs decoded CHKs, does
+not depend on the RichChk model.
+"""
+from typing import Optional
+
+from ...model.richchk.rich_chk import RichChk
+from .persistent_chk_cache import PersistentChkCache
+
+
+class PersistentRichChkCache(PersistentChkCache):
+    _RICH_CHK_KIND = "rich"
+
+    def get_rich_chk(self, chk_binary_data: bytes) -> Optional[RichChk]:
+        entry = self._get(self._RICH_CHK_KIND, chk_binary_data)
+        return entry if isinstance(entry, RichChk) else None
+
+    def put_rich_chk(self, chk_binary_data: bytes, rich_chk: RichChk) -> None:
+        self._put(self._RICH_CHK_KIND, chk_binary_data, rich_chk)
@@ -27,22 +27,29 @@ that does not successfully validate will be ignored
 """
 
 import logging
+import mmap
 import os
 import struct
 import weakref
 from io import BytesIO
-from typing import Any, Protocol, Union, cast
+from typing import Any, Iterator, Optional, Protocol, Union, cast
 
 from ...model.chk.decoded_chk import DecodedChk
 from ...model.chk.decoded_chk_section import DecodedChkSection
+from ...model.chk.lazy_chk_section import LazyChkSection
 from ...model.chk.unknown.decoded_unknown_section import DecodedUnknownSection
 from ...model.chk_section_name import ChkSectionName
-from ...transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
+from ...transcoder.chk.chk_section_transcoder import (
+    ChkSectionSink,
+    ChkSectionTranscoder,
+)
 from ...transcoder.chk.chk_section_transcoder_factory import ChkSectionTranscoderFactory
 from ...util import logger
+from ..cache.persistent_chk_cache import PersistentChkCache
 
 _CHK_SECTION_NAME_NUM_BYTES: int = 4
 _CHK_SECTION_TOTAL_BYTES_NUM_BYTES: int = 4
+_CHK_SECTION_HEADER_STRUCT: struct.Struct = struct.Struct("<4sI")
 _chk_bytes_cache: dict[Any, Any] = {}  # id(decoded_chk) → (weakref(decoded_chk), bytes)
 _section_bytes_cache: dict[
     Any, Any
@@ -62,15 +69,73 @@ class _ByteStream(Protocol):
 
 
 class ChkIo:
-    def __init__(self) -> None:
+    def __init__(self, persistent_cache: Optional[PersistentChkCache] = None) -> None:
+        """Decode and encode CHK data.
+
+        :param persistent_cache: on-disk cache of eagerly decoded CHK binary data, e.g.
+            PersistentChkCache.from_config(); nothing is cached by default.
+        """
         self.log: logging.Logger = logger.get_logger(ChkIo.__name__)
+        self._persistent_cache = persistent_cache
+
+    def decode_chk_file(self, chk_file_path: str, lazy: bool = False) -> DecodedChk:
+        """Decode a CHK file.
 
-    def decode_chk_file(self, chk_file_path: str) -> DecodedChk:
+        :param chk_file_path:
+        :param lazy: if True, read the file once and defer decoding each section until
+            it is first accessed.  See decode_chk_binary_data.
+        :return:
+        """
+        if lazy:
+            with open(chk_file_path, "rb") as f:
+                return self.decode_chk_binary_data(f.read(), lazy=True)
         with open(chk_file_path, "rb") as f:
             return self._decode_chk_byte_stream(f)
 
-    def decode_chk_binary_data(self, chk_binary_data: bytes) -> DecodedChk:
-        return self._decode_chk_byte_stream(BytesIO(chk_binary_data))
+    def decode_chk_binary_data(
+        self, chk_binary_data: bytes, lazy: bool = False
+    ) -> DecodedChk:
+        """Decode CHK binary data.
+
+        :param chk_binary_data:
+        :param lazy: if True, keep each section as a zero-copy slice of the binary data
+            and only decode it the first time it is accessed through the DecodedChk.
+            Sections that are never accessed are never decoded, and are re-encoded
+            byte-for-byte from the original data.
+        :return:
+        """
+        if lazy:
+            return self._frame_lazy_chk(memoryview(chk_binary_data))
+        if self._persistent_cache is None:
+            return self._decode_chk_byte_stream(BytesIO(chk_binary_data))
+        decoded_chk = self._persistent_cache.get_decoded_chk(chk_binary_data)
+        if decoded_chk is None:
+            decoded_chk = self._decode_chk_byte_stream(BytesIO(chk_binary_data))
+            self._persistent_cache.put_decoded_chk(chk_binary_data, decoded_chk)
+        return decoded_chk
+
+    def decode_chk_mmap(self, chk_file_path: str, lazy: bool = False) -> DecodedChk:
+        """Decode a CHK file by framing its sections over a read-only memory map.
+
+        Each section is handed to its transcoder as a memoryview slice of the mapped
+        file instead of a copied bytes object, so the only full copy of the CHK is the
+        mapping itself and section payloads are paged in only when a transcoder reads
+        them.  The mapping is closed before returning.
+
+        :param chk_file_path:
+        :param lazy: if True, defer decoding each section until it is first accessed.
+            The lazy sections then hold slices of the mapping, which stays open until
+            the last of them is garbage collected.
+        :return:
+        """
+        with open(chk_file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return DecodedChk([])
+            chk_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if lazy:
+            return self._frame_lazy_chk(memoryview(chk_mmap))
+        with chk_mmap, memoryview(chk_mmap) as chk_buffer:
+            return self._decode_chk_buffer(chk_buffer)
 
     def encode_chk_to_file(
         self,
@@ -87,7 +152,51 @@ class ChkIo:
             self.log.error(error_msg)
             raise FileExistsError(error_msg)
         with open(chk_output_file_path, "wb") as f:
-            f.write(self.encode_chk_to_bytes(decoded_chk))
+            self.encode_chk_to_stream(decoded_chk, f)
+
+    def encode_chk_to_stream(
+        self, decoded_chk: DecodedChk, chk_output_stream: ChkSectionSink
+    ) -> None:
+        """Encode the CHK, section by section, straight into a writable stream.
+
+        Each transcoder writes its own section, so large sections like TRIG are written
+        a chunk at a time instead of being joined into one copy of the whole CHK.
+
+        :param decoded_chk:
+        :param chk_output_stream: anything with a write method, e.g. a file opened in
+            binary mode or an mmap of the final size.
+        """
+        cached = _chk_bytes_cache.get(id(decoded_chk))
+        if cached is not None and cached[0]() is decoded_chk:
+            chk_output_stream.write(cached[1])
+            return
+        if decoded_chk.lazy_chk_sections is not None:
+            for lazy_chk_section in decoded_chk.lazy_chk_sections:
+                chk_output_stream.write(
+                    ChkSectionTranscoder.encode_chk_section_header(
+                        lazy_chk_section.actual_section_name,
+                        len(lazy_chk_section.chk_binary_data),
+                    )
+                )
+                chk_output_stream.write(lazy_chk_section.chk_binary_data)
+            return
+        for decoded_chk_section in decoded_chk.decoded_chk_sections:
+            if isinstance(decoded_chk_section, DecodedUnknownSection):
+                chk_output_stream.write(
+                    self._encode_unknown_chk_section(decoded_chk_section)
+                )
+                continue
+            cached_entry = _section_bytes_cache.get(id(decoded_chk_section))
+            if cached_entry is not None and cached_entry[0]() is decoded_chk_section:
+                chk_output_stream.write(cached_entry[1])
+                chk_output_stream.write(cached_entry[2])
+                continue
+            transcoder: ChkSectionTranscoder[
+                Any
+            ] = ChkSectionTranscoderFactory.make_chk_section_transcoder(
+                decoded_chk_section.section_name()
+            )
+            transcoder.encode_into(decoded_chk_section, chk_output_stream)
 
     def encode_chk_to_bytes(self, decoded_chk: DecodedChk) -> bytes:
         cache_key = id(decoded_chk)
@@ -95,6 +204,9 @@ class ChkIo:
         if cached is not None and cached[0]() is decoded_chk:
             return cast(bytes, cached[1])
 
+        if decoded_chk.lazy_chk_sections is not None:
+            return self._encode_lazy_chk_to_bytes(decoded_chk)
+
         sections = decoded_chk.decoded_chk_sections
         _encode_header = ChkSectionTranscoder.encode_chk_section_header
         _sec_cache = _section_bytes_cache
@@ -141,6 +253,28 @@ class ChkIo:
         _chk_bytes_cache[cache_key] = (_wr, result)
         return result
 
+    def _encode_lazy_chk_to_bytes(self, decoded_chk: DecodedChk) -> bytes:
+        """Re-encode a lazy CHK straight from the raw bytes of its sections.
+
+        A DecodedChk is immutable, so its sections still match the bytes they were
+        framed from, whether or not they have been decoded since.
+        """
+        assert decoded_chk.lazy_chk_sections is not None
+        parts: list[Union[bytes, memoryview]] = []
+        for lazy_chk_section in decoded_chk.lazy_chk_sections:
+            parts.append(
+                ChkSectionTranscoder.encode_chk_section_header(
+                    lazy_chk_section.actual_section_name,
+                    len(lazy_chk_section.chk_binary_data),
+                )
+            )
+            parts.append(lazy_chk_section.chk_binary_data)
+        result = b"".join(parts)
+        cache_key = id(decoded_chk)
+        _wr = weakref.ref(decoded_chk, lambda _: _chk_bytes_cache.pop(cache_key, None))
+        _chk_bytes_cache[cache_key] = (_wr, result)
+        return result
+
     def _decode_chk_byte_stream(self, chk_byte_stream: _ByteStream) -> DecodedChk:
         decoded_chk_sections: list[DecodedChkSection] = []
         maybe_chk_section_name_bytes = chk_byte_stream.read(_CHK_SECTION_NAME_NUM_BYTES)
@@ -165,8 +299,82 @@ class ChkIo:
             )
         return DecodedChk(decoded_chk_sections)
 
+    @classmethod
+    def _frame_chk_buffer(
+        cls, chk_buffer: memoryview
+    ) -> Iterator[tuple[str, memoryview]]:
+        """Yield the name and a zero-copy slice of the data of each CHK section."""
+        header_size = _CHK_SECTION_NAME_NUM_BYTES + _CHK_SECTION_TOTAL_BYTES_NUM_BYTES
+        offset = 0
+        while offset + header_size <= len(chk_buffer):
+            # u32 Name - A 4-byte string uniquely identifying that chunk's purpose.
+            # u32 Size - The size, in bytes, of the chunk (not including this header)
+            (
+                maybe_chk_section_name_bytes,
+                chk_section_size_in_bytes,
+            ) = _CHK_SECTION_HEADER_STRUCT.unpack_from(chk_buffer, offset)
+            offset += header_size
+            yield (
+                maybe_chk_section_name_bytes.decode("utf-8"),
+                chk_buffer[offset : offset + chk_section_size_in_bytes],
+            )
+            offset += chk_section_size_in_bytes
+
+    def _decode_chk_buffer(self, chk_buffer: memoryview) -> DecodedChk:
+        """Decode every CHK section, passing zero-copy slices to the transcoders."""
+        decoded_chk_sections: list[DecodedChkSection] = []
+        for maybe_chk_section_name, chk_section_view in self._frame_chk_buffer(
+            chk_buffer
+        ):
+            try:
+                decoded_chk_sections.append(
+                    self._decode_chk_binary_data_to_chk_section(
+                        maybe_chk_section_name, chk_section_view
+                    )
+                )
+            finally:
+                # the underlying buffer (e.g. an mmap) cannot be closed while any
+                # slice of it is still alive
+                chk_section_view.release()
+        return DecodedChk(decoded_chk_sections)
+
+    def _frame_lazy_chk(self, chk_buffer: memoryview) -> DecodedChk:
+        lazy_chk_sections: list[LazyChkSection] = []
+        for maybe_chk_section_name, chk_section_view in self._frame_chk_buffer(
+            chk_buffer
+        ):
+            lazy_chk_sections.append(
+                LazyChkSection(
+                    section_name=self._resolve_decoded_section_name(
+                        maybe_chk_section_name
+                    ),
+                    actual_section_name=maybe_chk_section_name,
+                    chk_binary_data=chk_section_view,
+                    decoder=self._decode_chk_binary_data_to_chk_section,
+                )
+            )
+        return DecodedChk.from_lazy_sections(lazy_chk_sections)
+
+    @classmethod
+    def _resolve_decoded_section_name(
+        cls, maybe_chk_section_name: str
+    ) -> ChkSectionName:
+        """The section name a section will report once it is decoded.
+
+        Sections which are not known or have no transcoder decode as unknown sections.
+        """
+        if ChkSectionName.contains(maybe_chk_section_name):
+            chk_section_name = ChkSectionName.get_by_value(maybe_chk_section_name)
+            if ChkSectionTranscoderFactory.supports_transcoding_chk_section(
+                chk_section_name
+            ):
+                return chk_section_name
+        return ChkSectionName.UNKNOWN
+
     def _decode_chk_binary_data_to_chk_section(
-        self, maybe_chk_section_name: str, chk_section_binary_data: bytes
+        self,
+        maybe_chk_section_name: str,
+        chk_section_binary_data: Union[bytes, memoryview],
     ) -> DecodedChkSection:
         if not ChkSectionName.contains(maybe_chk_section_name):
             self.log.warning(
@@ -199,9 +407,15 @@ class ChkIo:
 
     @classmethod
     def _decode_unknown_chk_section(
-        cls, unknown_chk_section_name: str, chk_section_binary_data: bytes
+        cls,
+        unknown_chk_section_name: str,
+        chk_section_binary_data: Union[bytes, memoryview],
     ) -> DecodedUnknownSection:
-        return DecodedUnknownSection(unknown_chk_section_name, chk_section_binary_data)
+        # unknown sections keep their payload, so a view must be copied out of the
+        # buffer it slices; bytes(...) of a bytes object is a no-op
+        return DecodedUnknownSection(
+            unknown_chk_section_name, bytes(chk_section_binary_data)
+        )
 
     @classmethod
     def _encode_unknown_chk_section(
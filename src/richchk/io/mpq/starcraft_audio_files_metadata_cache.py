@@ -0,0 +1,87 @@
+"""Persist the durations of audio files stored in MPQ archives across runs.
+
+Each duration is keyed by the archive table entry of its audio file (path, sizes, flags
+and file time), so an audio file is only read again once it changed.  The cache is a
+small JSON file which can be deleted at any time.
+"""
+import json
+import os
+import threading
+from typing import Optional
+
+from ...model.mpq.stormlib.search.stormlib_file_entry import StormLibFileEntry
+from ...util import logger
+from ...util.fileutils import CrossPlatformSafeTemporaryNamedFile
+
+
+class StarCraftAudioFilesMetadataCache:
+    def __init__(self, path_to_cache_file: str):
+        self._log = logger.get_logger(StarCraftAudioFilesMetadataCache.__name__)
+        self._path_to_cache_file = path_to_cache_file
+        self._durations_ms: Optional[dict[str, int]] = None
+        self._unsaved_durations_ms: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path_to_cache_file(self) -> str:
+        return self._path_to_cache_file
+
+    def get_duration_ms(self, file_entry: StormLibFileEntry) -> Optional[int]:
+        with self._lock:
+            return self._load().get(self._make_key(file_entry))
+
+    def put_duration_ms(self, file_entry: StormLibFileEntry, duration_ms: int) -> None:
+        key = self._make_key(file_entry)
+        with self._lock:
+            self._load()[key] = duration_ms
+            self._unsaved_durations_ms[key] = duration_ms
+
+    def save(self) -> None:
+        """Write the new durations to the cache file.
+
+        Durations saved by other processes in the meantime are kept.
+        """
+        with self._lock:
+            if not self._unsaved_durations_ms:
+                return
+            durations_ms = self._read_cache_file()
+            durations_ms.update(self._unsaved_durations_ms)
+            directory = os.path.dirname(os.path.abspath(self._path_to_cache_file))
+            os.makedirs(directory, exist_ok=True)
+            with CrossPlatformSafeTemporaryNamedFile(directory=directory) as temp_file:
+                with open(temp_file, "w") as f:
+                    json.dump(durations_ms, f)
+                os.replace(temp_file, self._path_to_cache_file)
+            self._durations_ms = durations_ms
+            self._unsaved_durations_ms = {}
+
+    def _load(self) -> dict[str, int]:
+        if self._durations_ms is None:
+            self._durations_ms = self._read_cache_file()
+        return self._durations_ms
+
+    def _read_cache_file(self) -> dict[str, int]:
+        if not os.path.exists(self._path_to_cache_file):
+            return {}
+        try:
+            with open(self._path_to_cache_file, "r") as f:
+                durations_ms = json.load(f)
+        except (OSError, ValueError):
+            self._log.warning(
+                f"Ignoring unreadable audio metadata cache {self._path_to_cache_file}"
+            )
+            return {}
+        if not isinstance(durations_ms, dict):
+            self._log.warning(
+                f"Ignoring malformed audio metadata cache {self._path_to_cache_file}"
+            )
+            return {}
+        return durations_ms
+
+    @staticmethod
+    def _make_key(file_entry: StormLibFileEntry) -> str:
+        return (
+            f"{file_entry.path_in_mpq}|{file_entry.file_size}|"
+            f"{file_entry.compressed_size}|{file_entry.file_flags}|"
+            f"{file_entry.file_time}"
+        )
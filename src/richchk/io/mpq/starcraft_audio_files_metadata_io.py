@@ -1,15 +1,26 @@
-"""Extract audio files metadata, including durations from a StarCraft MPQ."""
+"""Extract audio files metadata, including durations from a StarCraft MPQ.
+
+Durations are parsed straight from the audio data read into memory.  For WAV files only
+the header is read, since the duration follows from the format and the size of the data
+chunk.  The files that need reading are split across workers, each with its own handle
+to the archive, so decompression runs in parallel.  An optional
+StarCraftAudioFilesMetadataCache skips reading audio files that did not change.
+"""
+import io
 import os
 import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from mutagen.oggvorbis import OggVorbis
 
+from ...model.mpq.stormlib.search.stormlib_file_entry import StormLibFileEntry
 from ...model.mpq.stormlib.stormlib_archive_mode import StormLibArchiveMode
 from ...model.mpq.stormlib.stormlib_operation_result import StormLibOperationResult
 from ...model.mpq.stormlib.wav.stormlib_wav import StormLibWav
 from ...mpq.stormlib.stormlib_file_searcher import StormLibFileSearcher
 from ...mpq.stormlib.stormlib_wrapper import StormLibWrapper
-from ...util.fileutils import CrossPlatformSafeTemporaryNamedFile
+from .starcraft_audio_files_metadata_cache import StarCraftAudioFilesMetadataCache
 
 
 class StarCraftAudioFilesMetadataIo:
@@ -17,9 +28,24 @@ class StarCraftAudioFilesMetadataIo:
     _OGG_FILE_PATTERN = "*.ogg"
     _WAV_EXTENSION = ".wav"
     _OGG_EXTENSION = ".ogg"
+    # enough for the RIFF, fmt and data chunk headers of any WAV file in practice
+    _WAV_HEADER_READ_SIZE = 4096
+
+    def __init__(
+        self,
+        stormlib_wrapper: StormLibWrapper,
+        metadata_cache: Optional[StarCraftAudioFilesMetadataCache] = None,
+        workers: Optional[int] = None,
+    ):
+        """Extract audio files metadata from StarCraft MPQs.
 
-    def __init__(self, stormlib_wrapper: StormLibWrapper):
+        :param stormlib_wrapper:
+        :param metadata_cache: if given, durations are looked up in and saved to it.
+        :param workers: how many audio files to read at once; by default one per CPU.
+        """
         self._stormlib_wrapper = stormlib_wrapper
+        self._metadata_cache = metadata_cache
+        self._workers = workers
 
     def extract_all_audio_files_metadata(
         self, path_to_starcraft_mpq_file: str
@@ -33,51 +59,125 @@ class StarCraftAudioFilesMetadataIo:
         if not os.path.exists(path_to_starcraft_mpq_file):
             raise FileNotFoundError(path_to_starcraft_mpq_file)
         open_archive_result = self._stormlib_wrapper.open_archive(
-            path_to_starcraft_mpq_file, StormLibArchiveMode.STORMLIB_WRITE_ONLY
-        )
-        file_searcher = StormLibFileSearcher(
-            stormlib_reference=self._stormlib_wrapper.stormlib,
-            open_mpq_handle=open_archive_result,
+            path_to_starcraft_mpq_file, StormLibArchiveMode.STORMLIB_READ_ONLY
         )
-        all_wav_files = file_searcher.find_all_files_matching_pattern(
-            self._WAV_FILE_PATTERN
-        )
-        all_ogg_files = file_searcher.find_all_files_matching_pattern(
-            self._OGG_FILE_PATTERN
-        )
-        metadata = []
-        for wav in all_wav_files + all_ogg_files:
-            duration_ms = self._calculate_audio_file_duration_ms(
-                wav, open_archive_result
+        try:
+            file_searcher = StormLibFileSearcher(
+                stormlib_reference=self._stormlib_wrapper.stormlib,
+                open_mpq_handle=open_archive_result,
+            )
+            all_audio_files = file_searcher.find_all_file_entries_matching_pattern(
+                self._WAV_FILE_PATTERN
+            ) + file_searcher.find_all_file_entries_matching_pattern(
+                self._OGG_FILE_PATTERN
             )
-            metadata.append(
-                StormLibWav(_path_to_wav_in_mpq=wav, _duration_ms=duration_ms)
+            durations_ms: dict[StormLibFileEntry, int] = {}
+            files_to_read = []
+            for audio_file in all_audio_files:
+                cached_duration_ms = (
+                    self._metadata_cache.get_duration_ms(audio_file)
+                    if self._metadata_cache
+                    else None
+                )
+                if cached_duration_ms is None:
+                    files_to_read.append(audio_file)
+                else:
+                    durations_ms[audio_file] = cached_duration_ms
+            durations_ms.update(
+                self._read_audio_files_durations_ms(
+                    files_to_read, path_to_starcraft_mpq_file, open_archive_result
+                )
             )
-        self._stormlib_wrapper.close_archive(open_archive_result)
-        return metadata
+        finally:
+            self._stormlib_wrapper.close_archive(open_archive_result)
+        if self._metadata_cache and files_to_read:
+            for audio_file in files_to_read:
+                self._metadata_cache.put_duration_ms(
+                    audio_file, durations_ms[audio_file]
+                )
+            self._metadata_cache.save()
+        return [
+            StormLibWav(
+                _path_to_wav_in_mpq=audio_file.path_in_mpq,
+                _duration_ms=durations_ms[audio_file],
+            )
+            for audio_file in all_audio_files
+        ]
+
+    def _read_audio_files_durations_ms(
+        self,
+        audio_files: list[StormLibFileEntry],
+        path_to_starcraft_mpq_file: str,
+        open_archive_result: StormLibOperationResult,
+    ) -> dict[StormLibFileEntry, int]:
+        num_workers = min(self._workers or os.cpu_count() or 1, len(audio_files))
+        if num_workers <= 1:
+            return {
+                audio_file: self._calculate_audio_file_duration_ms(
+                    audio_file.path_in_mpq, open_archive_result
+                )
+                for audio_file in audio_files
+            }
+        # StormLib handles are not thread safe, so each worker opens its own
+        batches = [audio_files[i::num_workers] for i in range(num_workers)]
+        durations_ms: dict[StormLibFileEntry, int] = {}
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for batch_durations_ms in executor.map(
+                lambda batch: self._read_audio_files_batch_durations_ms(
+                    batch, path_to_starcraft_mpq_file
+                ),
+                batches,
+            ):
+                durations_ms.update(batch_durations_ms)
+        return durations_ms
+
+    def _read_audio_files_batch_durations_ms(
+        self, audio_files: list[StormLibFileEntry], path_to_starcraft_mpq_file: str
+    ) -> dict[StormLibFileEntry, int]:
+        open_archive_result = self._stormlib_wrapper.open_archive(
+            path_to_starcraft_mpq_file, StormLibArchiveMode.STORMLIB_READ_ONLY
+        )
+        try:
+            return {
+                audio_file: self._calculate_audio_file_duration_ms(
+                    audio_file.path_in_mpq, open_archive_result
+                )
+                for audio_file in audio_files
+            }
+        finally:
+            self._stormlib_wrapper.close_archive(open_archive_result)
 
     def _calculate_audio_file_duration_ms(
         self, wav_filepath_in_mpq: str, open_archive_result: StormLibOperationResult
     ) -> int:
-        with CrossPlatformSafeTemporaryNamedFile(
-            suffix=os.path.splitext(wav_filepath_in_mpq)[1]
-        ) as temp_wav_file:
-            self._stormlib_wrapper.extract_file(
+        extension = os.path.splitext(wav_filepath_in_mpq)[1].lower()
+        if extension == self._WAV_EXTENSION:
+            header = self._stormlib_wrapper.extract_file_bytes(
                 open_archive_result,
                 wav_filepath_in_mpq,
-                temp_wav_file,
-                overwrite_existing=True,
+                max_bytes=self._WAV_HEADER_READ_SIZE,
+            )
+            try:
+                return self._calculate_wav_duration_ms(header)
+            except (EOFError, wave.Error):
+                # the data chunk starts after the header read, so read the whole file
+                return self._calculate_wav_duration_ms(
+                    self._stormlib_wrapper.extract_file_bytes(
+                        open_archive_result, wav_filepath_in_mpq
+                    )
+                )
+        elif extension == self._OGG_EXTENSION:
+            return self._calculate_ogg_duration_ms(
+                self._stormlib_wrapper.extract_file_bytes(
+                    open_archive_result, wav_filepath_in_mpq
+                )
             )
-            if temp_wav_file.endswith(self._WAV_EXTENSION):
-                return self._calculate_wav_file_duration_ms(temp_wav_file)
-            elif temp_wav_file.endswith(self._OGG_EXTENSION):
-                return self._calculate_ogg_file_duration_ms(temp_wav_file)
-            else:
-                raise ValueError(f"Unsupported audio file {wav_filepath_in_mpq}")
+        else:
+            raise ValueError(f"Unsupported audio file {wav_filepath_in_mpq}")
 
     @classmethod
-    def _calculate_wav_file_duration_ms(cls, path_to_wav_file_on_disk: str) -> int:
-        with wave.open(path_to_wav_file_on_disk, "rb") as wav_file:
+    def _calculate_wav_duration_ms(cls, wav_data: bytes) -> int:
+        with wave.open(io.BytesIO(wav_data), "rb") as wav_file:
             frames = wav_file.getnframes()
             rate = wav_file.getframerate()
             duration = frames / float(rate)
@@ -85,8 +185,8 @@ class StarCraftAudioFilesMetadataIo:
         return int(duration_milliseconds)
 
     @classmethod
-    def _calculate_ogg_file_duration_ms(cls, path_to_ogg_file_on_disk: str) -> int:
-        audio = OggVorbis(path_to_ogg_file_on_disk)
+    def _calculate_ogg_duration_ms(cls, ogg_data: bytes) -> int:
+        audio = OggVorbis(io.BytesIO(ogg_data))
         duration = audio.info.length
         duration_milliseconds = duration * 1000
         return int(duration_milliseconds)
@@ -1,9 +1,12 @@
 """"""
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
 
 from ...editor.chk.decoded_strx_section_generator import DecodedStrxSectionGenerator
 from ...editor.richchk.rich_chk_editor import RichChkEditor
+from ...io.cache.persistent_rich_chk_cache import PersistentRichChkCache
 from ...io.chk.chk_io import ChkIo
 from ...io.richchk.richchk_io import RichChkIo
 from ...model.chk.str.decoded_str_section import DecodedStrSection
@@ -16,14 +19,32 @@ from ...model.richchk.wav.rich_wav_metadata_lookup import RichWavMetadataLookup
 from ...mpq.stormlib.stormlib_wrapper import StormLibWrapper
 from ...util.fileutils import CrossPlatformSafeTemporaryNamedFile
 from ..richchk.query.chk_query_util import ChkQueryUtil
+from .starcraft_audio_files_metadata_cache import StarCraftAudioFilesMetadataCache
 from .starcraft_audio_files_metadata_io import StarCraftAudioFilesMetadataIo
 
 
 class StarCraftMpqIo:
     _CHK_MPQ_PATH = "staredit\\scenario.chk"
 
-    def __init__(self, stormlib_wrapper: StormLibWrapper):
+    def __init__(
+        self,
+        stormlib_wrapper: StormLibWrapper,
+        audio_files_metadata_cache: Optional[StarCraftAudioFilesMetadataCache] = None,
+        persistent_chk_cache: Optional[PersistentRichChkCache] = None,
+    ):
+        """Read and save the CHK of StarCraft MPQs.
+
+        :param stormlib_wrapper:
+        :param audio_files_metadata_cache: if given, the durations of the audio files
+            of base MPQs are looked up in and saved to it when saving a CHK.
+        :param persistent_chk_cache: on-disk cache of the CHKs read from MPQs; by
+            default the one defined by the RichChk config, if any.
+        """
         self._stormlib_wrapper = stormlib_wrapper
+        self._audio_files_metadata_cache = audio_files_metadata_cache
+        self._persistent_chk_cache = (
+            persistent_chk_cache or PersistentRichChkCache.from_config()
+        )
 
     def extract_chk_from_mpq(
         self,
@@ -47,19 +68,34 @@ class StarCraftMpqIo:
     def read_chk_from_mpq(self, path_to_starcraft_mpq_file: str) -> RichChk:
         if not os.path.exists(path_to_starcraft_mpq_file):
             raise FileNotFoundError(path_to_starcraft_mpq_file)
-        with CrossPlatformSafeTemporaryNamedFile() as temp_chk_file:
-            open_result = self._stormlib_wrapper.open_archive(
-                path_to_starcraft_mpq_file, StormLibArchiveMode.STORMLIB_READ_ONLY
-            )
-            self._stormlib_wrapper.extract_file(
-                open_result,
-                self._CHK_MPQ_PATH,
-                temp_chk_file,
-                overwrite_existing=True,
+        chk_binary_data = self.read_chk_bytes_from_mpq(path_to_starcraft_mpq_file)
+        if self._persistent_chk_cache is not None:
+            cached_chk = self._persistent_chk_cache.get_rich_chk(chk_binary_data)
+            if cached_chk is not None:
+                return cached_chk
+        # only the RichChk is cached, the DecodedChk it is decoded from is not needed
+        chk = RichChkIo().decode_chk(ChkIo().decode_chk_binary_data(chk_binary_data))
+        if self._persistent_chk_cache is not None:
+            self._persistent_chk_cache.put_rich_chk(chk_binary_data, chk)
+        return chk
+
+    def read_chk_bytes_from_mpq(self, path_to_starcraft_mpq_file: str) -> bytes:
+        """Read the binary CHK data of the MPQ straight into memory.
+
+        :param path_to_starcraft_mpq_file:
+        :return:
+        """
+        if not os.path.exists(path_to_starcraft_mpq_file):
+            raise FileNotFoundError(path_to_starcraft_mpq_file)
+        open_result = self._stormlib_wrapper.open_archive(
+            path_to_starcraft_mpq_file, StormLibArchiveMode.STORMLIB_READ_ONLY
+        )
+        try:
+            return self._stormlib_wrapper.extract_file_bytes(
+                open_result, self._CHK_MPQ_PATH
             )
-            chk = RichChkIo().decode_chk(ChkIo().decode_chk_file(temp_chk_file))
+        finally:
             self._stormlib_wrapper.close_archive(open_result)
-            return chk
 
     def save_chk_to_mpq(
         self,
@@ -74,35 +110,104 @@ class StarCraftMpqIo:
             raise FileExistsError(
                 f"Refusing to create new MPQ because it already exists: {path_to_new_mpq_file}"
             )
-        with (
-            CrossPlatformSafeTemporaryNamedFile() as temp_chk_file,
-            CrossPlatformSafeTemporaryNamedFile() as temp_mpq_file,
-        ):
-
-            ChkIo().encode_chk_to_file(
+        self._save_chk_bytes_to_mpq(
+            ChkIo().encode_chk_to_bytes(
                 RichChkIo().encode_chk(
                     rich_chk=chk,
                     wav_metadata_lookup=self._build_wav_metadata_lookup(
                         path_to_base_mpq_file
                     ),
-                ),
-                temp_chk_file,
-                force_create=True,
+                )
+            ),
+            path_to_base_mpq_file,
+            path_to_new_mpq_file,
+        )
+
+    def save_many(
+        self,
+        path_to_base_mpq_file: str,
+        variants: Sequence[tuple[RichChk, str]],
+        overwrite_existing: bool = False,
+        workers: Optional[int] = None,
+    ) -> None:
+        """Save many variants of the same base map, each to its own new MPQ.
+
+        The base MPQ's audio metadata is only extracted once, and all variants are
+        encoded against the same lookup, so the encoding of sections the variants share
+        is reused and only what differs between variants is encoded again.  The new
+        MPQs are then written concurrently.
+
+        :param path_to_base_mpq_file: the map every variant is built from.
+        :param variants: pairs of the CHK of a variant and the path of its new MPQ.
+        :param overwrite_existing: whether existing new MPQ files can be replaced.
+        :param workers: how many MPQs to write at once; by default as many as the
+            thread pool executor picks.
+        """
+        if not os.path.exists(path_to_base_mpq_file):
+            raise FileNotFoundError(path_to_base_mpq_file)
+        paths_to_new_mpq_files = [path for _, path in variants]
+        if len(set(paths_to_new_mpq_files)) != len(paths_to_new_mpq_files):
+            raise ValueError(
+                "Refusing to save variants because several of them "
+                "have the same new MPQ path."
             )
+        for path_to_new_mpq_file in paths_to_new_mpq_files:
+            if os.path.exists(path_to_new_mpq_file) and not overwrite_existing:
+                raise FileExistsError(
+                    f"Refusing to create new MPQ because it already exists: {path_to_new_mpq_file}"
+                )
+        wav_metadata_lookup = self._build_wav_metadata_lookup(path_to_base_mpq_file)
+        richchk_io = RichChkIo()
+        chk_io = ChkIo()
+        encoded_chks = [
+            chk_io.encode_chk_to_bytes(
+                richchk_io.encode_chk(
+                    rich_chk=chk, wav_metadata_lookup=wav_metadata_lookup
+                )
+            )
+            for chk, _ in variants
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # StormLib releases the GIL, so compacting the archives runs in parallel
+            for future in [
+                executor.submit(
+                    self._save_chk_bytes_to_mpq,
+                    chk_binary_data,
+                    path_to_base_mpq_file,
+                    path_to_new_mpq_file,
+                )
+                for chk_binary_data, path_to_new_mpq_file in zip(
+                    encoded_chks, paths_to_new_mpq_files
+                )
+            ]:
+                future.result()
+
+    def _save_chk_bytes_to_mpq(
+        self,
+        chk_binary_data: bytes,
+        path_to_base_mpq_file: str,
+        path_to_new_mpq_file: str,
+    ) -> None:
+        # StormLib edits archives in place, so edit a copy of the base MPQ next to the
+        # new MPQ and move it in place once it is complete
+        with CrossPlatformSafeTemporaryNamedFile(
+            directory=os.path.dirname(os.path.abspath(path_to_new_mpq_file))
+        ) as temp_mpq_file:
             shutil.copyfile(path_to_base_mpq_file, temp_mpq_file)
             open_result = self._stormlib_wrapper.open_archive(
                 temp_mpq_file, StormLibArchiveMode.STORMLIB_WRITE_ONLY
             )
-            self._stormlib_wrapper.add_file(
-                open_result,
-                infile=temp_chk_file,
-                path_to_file_in_archive=self._CHK_MPQ_PATH,
-                overwrite_existing=True,
-            )
-            self._stormlib_wrapper.close_archive(
+            try:
+                self._stormlib_wrapper.add_file_bytes(
+                    open_result,
+                    data=chk_binary_data,
+                    path_to_file_in_archive=self._CHK_MPQ_PATH,
+                    overwrite_existing=True,
+                )
                 self._stormlib_wrapper.compact_archive(open_result)
-            )
-            shutil.copyfile(temp_mpq_file, path_to_new_mpq_file)
+            finally:
+                self._stormlib_wrapper.close_archive(open_result)
+            os.replace(temp_mpq_file, path_to_new_mpq_file)
 
     def create_mpq_with_strx(
         self,
@@ -121,44 +226,28 @@ class StarCraftMpqIo:
             raise FileExistsError(
                 f"Refusing to create new MPQ because it already exists: {path_to_new_mpq_file}"
             )
-        with (
-            CrossPlatformSafeTemporaryNamedFile() as temp_chk_file,
-            CrossPlatformSafeTemporaryNamedFile() as temp_mpq_file,
-        ):
-            chk = self.read_chk_from_mpq(path_to_base_mpq_file)
-            new_strx_section = DecodedStrxSectionGenerator.generate_strx_from_str(
-                ChkQueryUtil.find_only_decoded_section_in_chk(DecodedStrSection, chk)
-            )
-            new_chk = self._change_to_remastered_ver_version(
-                RichChkEditor.remove_chk_sections_by_name(
-                    ChkSectionName.STR,
-                    RichChkEditor.add_chk_section(new_strx_section, chk),
-                )
+        chk = self.read_chk_from_mpq(path_to_base_mpq_file)
+        new_strx_section = DecodedStrxSectionGenerator.generate_strx_from_str(
+            ChkQueryUtil.find_only_decoded_section_in_chk(DecodedStrSection, chk)
+        )
+        new_chk = self._change_to_remastered_ver_version(
+            RichChkEditor.remove_chk_sections_by_name(
+                ChkSectionName.STR,
+                RichChkEditor.add_chk_section(new_strx_section, chk),
             )
-            ChkIo().encode_chk_to_file(
+        )
+        self._save_chk_bytes_to_mpq(
+            ChkIo().encode_chk_to_bytes(
                 RichChkIo().encode_chk(
                     rich_chk=new_chk,
                     wav_metadata_lookup=self._build_wav_metadata_lookup(
                         path_to_base_mpq_file
                     ),
-                ),
-                temp_chk_file,
-                force_create=True,
-            )
-            shutil.copyfile(path_to_base_mpq_file, temp_mpq_file)
-            open_result = self._stormlib_wrapper.open_archive(
-                temp_mpq_file, StormLibArchiveMode.STORMLIB_WRITE_ONLY
-            )
-            self._stormlib_wrapper.add_file(
-                open_result,
-                infile=temp_chk_file,
-                path_to_file_in_archive=self._CHK_MPQ_PATH,
-                overwrite_existing=True,
-            )
-            self._stormlib_wrapper.close_archive(
-                self._stormlib_wrapper.compact_archive(open_result)
-            )
-            shutil.copyfile(temp_mpq_file, path_to_new_mpq_file)
+                )
+            ),
+            path_to_base_mpq_file,
+            path_to_new_mpq_file,
+        )
 
     def _change_to_remastered_ver_version(self, chk: RichChk) -> RichChk:
         """Replace the VER section with the remastered version to use STRx.
@@ -178,7 +267,8 @@ class StarCraftMpqIo:
         self, path_to_base_mpq_file: str
     ) -> RichWavMetadataLookup:
         wav_metadata = StarCraftAudioFilesMetadataIo(
-            stormlib_wrapper=self._stormlib_wrapper
+            stormlib_wrapper=self._stormlib_wrapper,
+            metadata_cache=self._audio_files_metadata_cache,
         ).extract_all_audio_files_metadata(path_to_base_mpq_file)
         return RichWavMetadataLookup(
             _metadata_by_wav_path={x.path_to_wav_in_mpq: x for x in wav_metadata}
@@ -138,14 +138,10 @@ class ChkQueryUtil:
     def _determine_if_rich_chk_contains_section(
         cls, chk_section_name: ChkSectionName, rich_chk: RichChk
     ) -> bool:
-        named_sections = rich_chk.get_sections_by_name(
-            chk_section_name=chk_section_name
-        )
-        return len(named_sections) > 0
+        return rich_chk.contains_section(chk_section_name)
 
     @classmethod
     def _determine_if_chk_contains_section(
         cls, chk_section_name: ChkSectionName, chk: DecodedChk
     ) -> bool:
-        named_sections = chk.get_sections_by_name(chk_section_name=chk_section_name)
-        return len(named_sections) > 0
+        return chk.contains_section(chk_section_name)
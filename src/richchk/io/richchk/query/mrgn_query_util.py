@@ -1,12 +1,12 @@
-"""Search RichMrgn for locations by their name or ID."""
+"""Search RichMrgn for locations by their name, ID or position."""
 
-import difflib
 from typing import Optional, TypeVar
 
 from ....model.chk.decoded_chk_section import DecodedChkSection
 from ....model.richchk.mrgn.rich_location import RichLocation
 from ....model.richchk.mrgn.rich_mrgn_section import RichMrgnSection
 from ....model.richchk.rich_chk_section import RichChkSection
+from ....model.richchk.rich_name_index import RichNameIndex
 
 _T = TypeVar("_T", bound=RichChkSection, covariant=True)
 _U = TypeVar("_U", bound=DecodedChkSection, covariant=True)
@@ -21,13 +21,9 @@ class MrgnQueryUtil:
 
         Throws if more than 1 location matches the exact name.
         """
-        exact_matches = []
-        for loc in mrgn.locations:
-            name1, name2 = MrgnQueryUtil._get_location_names_for_comparison(
-                location_name, loc.custom_location_name.value, ignorecase=ignorecase
-            )
-            if name1 == name2:
-                exact_matches.append(loc)
+        exact_matches = MrgnQueryUtil._get_location_name_index(
+            mrgn, ignorecase
+        ).find_by_name(location_name.lower() if ignorecase else location_name)
         if len(exact_matches) > 1:
             msg = (
                 f"There were more than 1 locations matching the exact name!  "
@@ -50,15 +46,12 @@ class MrgnQueryUtil:
         This will always return a result for the location with the highest similarity.
         If no location is greater than `min_similarity`, the method will throw.
         """
-        locs_by_similarity = []
-        for loc in mrgn.locations:
-            name1, name2 = MrgnQueryUtil._get_location_names_for_comparison(
-                location_name, loc.custom_location_name.value, ignorecase=ignorecase
-            )
-            matcher = difflib.SequenceMatcher(None, name1, name2)
-            similarity = matcher.ratio()
-            locs_by_similarity.append((similarity, loc))
-        best_match = max(locs_by_similarity, key=lambda x: x[0])
+        best_match = MrgnQueryUtil._get_location_name_index(
+            mrgn, ignorecase
+        ).find_most_similar(location_name.lower() if ignorecase else location_name)
+        if best_match is None:
+            msg = f"There are no locations to match {location_name} with."
+            raise ValueError(msg)
         if best_match[0] >= min_similarity:
             return best_match[1]
         else:
@@ -69,12 +62,41 @@ class MrgnQueryUtil:
             raise ValueError(msg)
 
     @staticmethod
-    def _get_location_names_for_comparison(
-        loc1_name: str, loc2_name: str, ignorecase: bool
-    ) -> tuple[str, str]:
+    def find_locations_containing_point(
+        x: int, y: int, mrgn: RichMrgnSection
+    ) -> list[RichLocation]:
+        """Finds every location containing the pixel at x and y, in their MRGN order.
+
+        A location contains the pixels from its left up to, excluding, its right, and
+        from its top up to, excluding, its bottom.  Inverted locations contain the same
+        pixels as the location with the coordinates swapped.
+        """
+        return mrgn.location_grid.locations_containing_point(x, y)
+
+    @staticmethod
+    def find_locations_overlapping_area(
+        left: int, top: int, right: int, bottom: int, mrgn: RichMrgnSection
+    ) -> list[RichLocation]:
+        """Finds every location sharing at least one pixel with the area, in their MRGN
+        order."""
+        return mrgn.location_grid.locations_overlapping_area(left, top, right, bottom)
+
+    @staticmethod
+    def find_nearest_location(
+        x: int, y: int, mrgn: RichMrgnSection
+    ) -> Optional[RichLocation]:
+        """Finds the location closest to the pixel at x and y, or None if the MRGN has
+        no location with any pixels.
+
+        A location containing the pixel is at distance 0.  Of equally close locations,
+        the first in the MRGN is returned.
+        """
+        return mrgn.location_grid.nearest_location(x, y)
+
+    @staticmethod
+    def _get_location_name_index(
+        mrgn: RichMrgnSection, ignorecase: bool
+    ) -> RichNameIndex[RichLocation]:
         if ignorecase:
-            return (
-                loc1_name.lower(),
-                loc2_name.lower(),
-            )
-        return loc1_name, loc2_name
+            return mrgn.location_name_index.lowercased
+        return mrgn.location_name_index
@@ -1,7 +1,5 @@
 """Search a RichChk for specific WAV files."""
 
-import os
-
 from ....model.richchk.rich_chk import RichChk
 from ....model.richchk.wav.rich_wav import RichWav
 from ....model.richchk.wav.rich_wav_section import RichWavSection
@@ -13,18 +11,15 @@ class WavQueryUtil:
     def find_only_wav_by_basename(wav_basename: str, chk: RichChk) -> RichWav:
         # possible edge case if more than 1 WAV file has the same exact basename
         wav_section = ChkQueryUtil.find_only_rich_section_in_chk(RichWavSection, chk)
-        # files in MPQ stored with Windows style paths
-        wav_by_basename = {
-            os.path.basename(x.path_in_chk.value.replace("\\", os.sep)): x
-            for x in wav_section.wavs
-        }
-        maybe_wav = wav_by_basename.get(wav_basename, None)
-        if not maybe_wav:
+        wav_basename_index = wav_section.wav_basename_index
+        # the last WAV file with the basename, if more than 1 has it
+        maybe_wavs = wav_basename_index.find_by_name(wav_basename)
+        if not maybe_wavs:
             raise ValueError(
                 f"Failed to find the WAV file by basename: {wav_basename}."
-                f"All known WAV files in CHK: {wav_by_basename.values()}"
+                f"All known WAV files in CHK: {wav_basename_index.items}"
             )
-        return maybe_wav
+        return maybe_wavs[-1]
 
     @staticmethod
     def find_only_wav_by_exact_match(path_to_wav_in_mpq: str, chk: RichChk) -> RichWav:
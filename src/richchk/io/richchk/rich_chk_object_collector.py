@@ -7,7 +7,7 @@ import dataclasses
 import weakref
 from collections import OrderedDict
 from enum import Enum
-from typing import Any, Tuple, Type
+from typing import Any, Iterable, Tuple, Type
 
 from ...model.richchk.mrgn.rich_location import RichLocation
 from ...model.richchk.mrgn.rich_mrgn_section import RichMrgnSection
@@ -61,14 +61,15 @@ _fields_cache: dict[Type[Any], Any] = {
 }
 
 
-def collect_rich_objects(
-    rich_chk: RichChk,
-) -> Tuple[
+RichObjects = Tuple[
     "OrderedDict[RichString, int]",
     "set[RichLocation]",
     "set[RichSwitch]",
     "set[RichCuwpSlot]",
-]:
+]
+
+
+def collect_rich_objects(rich_chk: RichChk) -> RichObjects:
     """Walk all RichChkSection objects once, collecting:
 
     - strings: OrderedDict[RichString, int] — all non-null RichString values (all
@@ -86,33 +87,52 @@ def collect_rich_objects(
         else:
             del _collect_cache[chk_id]
 
+    strings, locations, switches, cuwps = merge_rich_objects(
+        [collect_rich_objects_in_section(section) for section in rich_chk.chk_sections]
+    )
+
+    _wr = weakref.ref(rich_chk, lambda _: _collect_cache.pop(chk_id, None))
+    _collect_cache[chk_id] = (_wr, strings, locations, switches, cuwps)
+    return strings, locations, switches, cuwps
+
+
+def collect_rich_objects_in_section(section: object) -> RichObjects:
+    """Collect the objects of a single CHK section, as collect_rich_objects does.
+
+    Decoded CHK sections have no objects to collect.
+    """
     strings: OrderedDict[RichString, int] = OrderedDict()
     locations: set[RichLocation] = set()
     switches: set[RichSwitch] = set()
     cuwps: set[RichCuwpSlot] = set()
-
-    for section in rich_chk.chk_sections:
-        if not isinstance(section, RichChkSection):
-            continue
-        if isinstance(section, RichTrigSection):
-            _collect_from_trig_section(section, strings, locations, switches, cuwps)
-            continue
-        collect_locs = not isinstance(section, RichMrgnSection)
-        collect_swts = not isinstance(section, RichSwnmSection)
-        collect_cups = not isinstance(section, RichUprpSection)
+    if isinstance(section, RichTrigSection):
+        _collect_from_trig_section(section, strings, locations, switches, cuwps)
+    elif isinstance(section, RichChkSection):
         _collect_non_trig_section(
             section,
             strings,
             locations,
             switches,
             cuwps,
-            collect_locs,
-            collect_swts,
-            collect_cups,
+            not isinstance(section, RichMrgnSection),
+            not isinstance(section, RichSwnmSection),
+            not isinstance(section, RichUprpSection),
         )
+    return strings, locations, switches, cuwps
 
-    _wr = weakref.ref(rich_chk, lambda _: _collect_cache.pop(chk_id, None))
-    _collect_cache[chk_id] = (_wr, strings, locations, switches, cuwps)
+
+def merge_rich_objects(objects_by_section: Iterable[RichObjects]) -> RichObjects:
+    """Merge the objects collected from each section, in the order of the sections."""
+    strings: OrderedDict[RichString, int] = OrderedDict()
+    locations: set[RichLocation] = set()
+    switches: set[RichSwitch] = set()
+    cuwps: set[RichCuwpSlot] = set()
+    for sec_strings, sec_locs, sec_swts, sec_cuwps in objects_by_section:
+        for s in sec_strings:
+            strings[s] = 0
+        locations.update(sec_locs)
+        switches.update(sec_swts)
+        cuwps.update(sec_cuwps)
     return strings, locations, switches, cuwps
 
 
@@ -62,6 +62,11 @@ class RichStrLookupBuilder:
         self,
         decoded_string_section: DecodedStringSection,
     ) -> bytes:
+        if isinstance(decoded_string_section, (DecodedStrSection, DecodedStrxSection)):
+            # a decoded section still has the binary data the offsets point into
+            binary_data = decoded_string_section.binary_data
+            if binary_data is not None:
+                return binary_data
         if isinstance(decoded_string_section, DecodedStrSection):
             string_binary_data = ChkStrTranscoder().encode(
                 decoded_string_section, include_header=False
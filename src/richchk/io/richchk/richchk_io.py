@@ -1,4 +1,5 @@
 import collections
+import dataclasses
 import logging
 import weakref
 from typing import Any, Optional, Union, cast
@@ -6,6 +7,7 @@ from typing import Any, Optional, Union, cast
 from ...model.chk.decoded_chk import DecodedChk
 from ...model.chk.decoded_chk_section import DecodedChkSection
 from ...model.chk.decoded_string_section import DecodedStringSection
+from ...model.chk.dim.decoded_dim_section import DecodedDimSection
 from ...model.chk.mrgn.decoded_mrgn_section import DecodedMrgnSection
 from ...model.chk.str.decoded_str_section import DecodedStrSection
 from ...model.chk.strx.decoded_strx_section import DecodedStrxSection
@@ -15,7 +17,7 @@ from ...model.chk.uprp.decoded_uprp_section import DecodedUprpSection
 from ...model.chk.upus.decoded_upus_section import DecodedUpusSection
 from ...model.richchk.mrgn.rich_mrgn_lookup import RichMrgnLookup
 from ...model.richchk.mrgn.rich_mrgn_section import RichMrgnSection
-from ...model.richchk.rich_chk import RichChk
+from ...model.richchk.rich_chk import RichChk, RichChkLineage
 from ...model.richchk.rich_chk_section import RichChkSection
 from ...model.richchk.richchk_decode_context import RichChkDecodeContext
 from ...model.richchk.richchk_encode_context import RichChkEncodeContext
@@ -50,7 +52,11 @@ from .lookups.uprp.rich_cuwp_lookup_builder import RichCuwpLookupBuilder
 from .lookups.uprp.rich_uprp_rebuilder import RichUprpRebuilder
 from .lookups.upus.decoded_upus_rebuilder import DecodedUpusRebuilder
 from .query.chk_query_util import ChkQueryUtil
-from .rich_chk_object_collector import collect_rich_objects
+from .rich_chk_object_collector import (
+    RichObjects,
+    collect_rich_objects_in_section,
+    merge_rich_objects,
+)
 from .rich_str_lookup_builder import RichStrLookupBuilder
 
 _encode_cache: dict[
@@ -67,6 +73,56 @@ _NON_TRIG_CACHE_MAX = 8
 
 _trig_transcoder = RichChkTrigTranscoder()
 
+_REBUILT_RICH_SECTION_TYPES = (RichMrgnSection, RichSwnmSection, RichUprpSection)
+
+
+@dataclasses.dataclass(frozen=True)
+class _EncodedRichChkSection:
+    section: Union[RichChkSection, DecodedChkSection]
+    rich_objects: RichObjects
+    encoded_section: DecodedChkSection
+
+
+@dataclasses.dataclass(frozen=True)
+class _RichChkEncodeState:
+    """The last encoding of a RichChk, from which an edit of it is encoded."""
+
+    decoded_sections: list[DecodedChkSection]
+    # id(section) → how the section was encoded
+    encoded_sections: dict[int, _EncodedRichChkSection]
+    str_section: DecodedStringSection
+    mrgn_section: RichMrgnSection
+    swnm_section: RichSwnmSection
+    uprp_section: RichUprpSection
+    upus_section: DecodedUpusSection
+    encode_context: RichChkEncodeContext
+
+    def find_encoded_section(
+        self, section: Union[RichChkSection, DecodedChkSection]
+    ) -> Optional[_EncodedRichChkSection]:
+        encoded = self.encoded_sections.get(id(section))
+        return encoded if encoded is not None and encoded.section is section else None
+
+    def has_rebuilt(
+        self,
+        str_section: DecodedStringSection,
+        mrgn_section: RichMrgnSection,
+        swnm_section: RichSwnmSection,
+        uprp_section: RichUprpSection,
+    ) -> bool:
+        return (
+            str_section is self.str_section
+            and mrgn_section is self.mrgn_section
+            and swnm_section is self.swnm_section
+            and uprp_section is self.uprp_section
+        )
+
+
+# the last encoding of each lineage of RichChks, kept while any RichChk of it is alive
+_encode_states_by_lineage: weakref.WeakKeyDictionary[
+    RichChkLineage, _RichChkEncodeState
+] = weakref.WeakKeyDictionary()
+
 
 class RichChkIo:
     def __init__(self, optimize: bool = True) -> None:
@@ -90,7 +146,7 @@ class RichChkIo:
                     decoded_chk_section.section_name()
                 )
                 sections.append(transcoder.decode(decoded_chk_section, decode_context))
-        return RichChk(_chk_sections=sections)
+        return RichChk(_chk_sections=sections, _lineage=RichChkLineage())
 
     def encode_chk(
         self,
@@ -110,14 +166,14 @@ class RichChkIo:
         fp_secondary_key: Any = None
         non_trig_cache_key: Any = None
         if self._optimize:
-            trig_sec: Optional[RichTrigSection] = None
-            non_trig_ids: list[int] = []
-            for _sec in rich_chk.chk_sections:
-                if isinstance(_sec, RichTrigSection):
-                    trig_sec = _sec
-                else:
-                    non_trig_ids.append(id(_sec))
-            if trig_sec is not None:
+            trig_positions = rich_chk.section_index.indices_of_type(RichTrigSection)
+            if trig_positions:
+                trig_sec = cast(
+                    RichTrigSection, rich_chk.chk_sections[trig_positions[-1]]
+                )
+                non_trig_ids = list(map(id, rich_chk.chk_sections))
+                for _pos in reversed(trig_positions):
+                    del non_trig_ids[_pos]
                 non_trig_key = tuple(non_trig_ids)
                 wav_id = id(wav_metadata_lookup)
                 id_secondary_key = (non_trig_key, id(trig_sec), wav_id)
@@ -166,7 +222,94 @@ class RichChkIo:
                             _secondary_encode_cache.popitem(last=False)
                         return result
 
-        strings, locations, switches, cuwps = collect_rich_objects(rich_chk)
+        previous_state = (
+            self._find_previous_encode_state(rich_chk, wav_metadata_lookup)
+            if self._optimize
+            else None
+        )
+        encode_state = self._encode_sections(
+            rich_chk, wav_metadata_lookup, previous_state
+        )
+        if self._optimize and rich_chk.lineage is not None:
+            _encode_states_by_lineage[rich_chk.lineage] = encode_state
+        encode_context = encode_state.encode_context
+        decoded_sections = encode_state.decoded_sections
+        result = DecodedChk(_decoded_chk_sections=decoded_sections)
+        if non_trig_cache_key is not None:
+            trig_positions = rich_chk.section_index.indices_of_type(RichTrigSection)
+            if trig_positions:
+                _trig_pos = trig_positions[0]
+                if len(_non_trig_cache) >= _NON_TRIG_CACHE_MAX:
+                    _non_trig_cache.pop(next(iter(_non_trig_cache)))
+                _base_no_trig: list[Optional[DecodedChkSection]] = list(
+                    decoded_sections
+                )
+                _base_no_trig[_trig_pos] = None
+                _non_trig_cache[non_trig_cache_key] = (
+                    encode_context,
+                    _base_no_trig,
+                    _trig_pos,
+                )
+        _wr2 = weakref.ref(rich_chk, lambda _ref: _encode_cache.pop(cache_key, None))
+        _encode_cache[cache_key] = (_wr2, result)
+        if id_secondary_key is not None:
+            _secondary_encode_cache[id_secondary_key] = result
+            if len(_secondary_encode_cache) > _SECONDARY_CACHE_MAX:
+                _secondary_encode_cache.popitem(last=False)
+        if fp_secondary_key is not None:
+            _secondary_encode_cache[fp_secondary_key] = result
+            if len(_secondary_encode_cache) > _SECONDARY_CACHE_MAX:
+                _secondary_encode_cache.popitem(last=False)
+        return result
+
+    def _find_previous_encode_state(
+        self,
+        rich_chk: RichChk,
+        wav_metadata_lookup: Optional[RichWavMetadataLookup],
+    ) -> Optional["_RichChkEncodeState"]:
+        """The last encoding of a RichChk of the same lineage, if it can be reused."""
+        if rich_chk.lineage is None:
+            return None
+        previous_state = _encode_states_by_lineage.get(rich_chk.lineage)
+        if previous_state is None:
+            return None
+        previous_context = previous_state.encode_context
+        if (
+            previous_context.wav_metadata_lookup is not wav_metadata_lookup
+            or previous_context.optimize != self._optimize
+        ):
+            return None
+        return previous_state
+
+    def _encode_sections(
+        self,
+        rich_chk: RichChk,
+        wav_metadata_lookup: Optional[RichWavMetadataLookup],
+        previous_state: Optional["_RichChkEncodeState"],
+    ) -> "_RichChkEncodeState":
+        """Encode every section, reusing the previous encoding of unchanged sections.
+
+        Sections are unchanged if they are the same objects as in the previous
+        encoding.  The objects referenced by unchanged sections are not collected again,
+        and the STR, MRGN, SWNM and UPRP are only rebuilt when the referenced objects
+        changed.  Unchanged sections are not encoded again, unless rebuilding changed an
+        ID they might reference.
+        """
+        previous_sections = [
+            previous_state.find_encoded_section(chk_section)
+            if previous_state is not None
+            else None
+            for chk_section in rich_chk.chk_sections
+        ]
+        objects_by_section = [
+            previous_section.rich_objects
+            if previous_section is not None
+            else collect_rich_objects_in_section(chk_section)
+            for chk_section, previous_section in zip(
+                rich_chk.chk_sections, previous_sections
+            )
+        ]
+        strings, locations, switches, cuwps = merge_rich_objects(objects_by_section)
         new_str_section: DecodedStringSection = (
             DecodedStrSectionRebuilder.rebuild_str_section_from_strings(
                 strings, rich_chk
@@ -182,34 +325,51 @@ class RichChkIo:
             swnm_lookup,
         ) = RichSwnmRebuilder.rebuild_from_switches(switches, rich_chk)
         new_uprp = RichUprpRebuilder.rebuild_from_cuwps(cuwps, rich_chk)
-        new_upus = DecodedUpusRebuilder.rebuild_upus_from_rich_uprp(new_uprp)
-        encode_context = self._build_encode_context(
-            rich_chk,
-            new_str_section,
-            new_mrgn_section,
-            swnm_lookup,
-            new_uprp,
-            new_mrgn_lookup,
-            wav_metadata_lookup,
+        if previous_state is not None and previous_state.has_rebuilt(
+            new_str_section, new_mrgn_section, new_swnm_section, new_uprp
+        ):
+            # nothing referenced by the sections was added or removed
+            encode_context = previous_state.encode_context
+            new_upus = previous_state.upus_section
+        else:
+            new_upus = DecodedUpusRebuilder.rebuild_upus_from_rich_uprp(new_uprp)
+            encode_context = self._build_encode_context(
+                rich_chk,
+                new_str_section,
+                new_mrgn_section,
+                swnm_lookup,
+                new_uprp,
+                new_mrgn_lookup,
+                wav_metadata_lookup,
+            )
+        # the MRGN, SWNM and UPRP are encoded from their rebuilt sections
+        can_reuse_rebuilt_sections = (
+            previous_state is not None
+            and encode_context is previous_state.encode_context
+        )
+        can_reuse_unchanged_sections = previous_state is not None and (
+            can_reuse_rebuilt_sections
+            or encode_context.preserves_ids_of(previous_state.encode_context)
         )
         was_swnm_added = False
         was_uprp_added = False
         was_upus_added = False
         decoded_sections: list[DecodedChkSection] = []
-        for chk_section in rich_chk.chk_sections:
+        encoded_sections: dict[int, _EncodedRichChkSection] = {}
+        for chk_section, previous_section, rich_objects in zip(
+            rich_chk.chk_sections, previous_sections, objects_by_section
+        ):
             if isinstance(chk_section, DecodedUnknownSection):
                 decoded_sections.append(chk_section)
             elif isinstance(chk_section, DecodedStrSection) and isinstance(
                 new_str_section, DecodedStrSection
             ):
                 # replace the old STR section
-                # TODO: make an editor to replace sections by index or ID
                 decoded_sections.append(new_str_section)
             elif isinstance(chk_section, DecodedStrxSection) and isinstance(
                 new_str_section, DecodedStrxSection
             ):
                 # replace the old STR section
-                # TODO: make an editor to replace sections by index or ID
                 decoded_sections.append(new_str_section)
             elif isinstance(chk_section, DecodedUpusSection):
                 decoded_sections.append(new_upus)
@@ -221,28 +381,26 @@ class RichChkIo:
             ) and RichChkSectionTranscoderFactory.supports_transcoding_chk_section(
                 chk_section.section_name()
             ):
-                section_transcoder: RichChkSectionTranscoder[
-                    Any, Any
-                ] = RichChkSectionTranscoderFactory.make_chk_section_transcoder(
-                    chk_section.section_name()
-                )
-                if isinstance(chk_section, RichMrgnSection):
-                    decoded_sections.append(
-                        section_transcoder.encode(new_mrgn_section, encode_context)
-                    )
-                elif isinstance(chk_section, RichSwnmSection):
-                    decoded_sections.append(
-                        section_transcoder.encode(new_swnm_section, encode_context)
-                    )
+                if isinstance(chk_section, RichSwnmSection):
                     was_swnm_added = True
                 elif isinstance(chk_section, RichUprpSection):
-                    decoded_sections.append(
-                        section_transcoder.encode(new_uprp, encode_context)
-                    )
                     was_uprp_added = True
+                can_reuse_section = (
+                    can_reuse_rebuilt_sections
+                    if isinstance(chk_section, _REBUILT_RICH_SECTION_TYPES)
+                    else can_reuse_unchanged_sections
+                )
+                if previous_section is not None and can_reuse_section:
+                    decoded_sections.append(previous_section.encoded_section)
                 else:
                     decoded_sections.append(
-                        section_transcoder.encode(chk_section, encode_context)
+                        self._encode_rich_section(
+                            chk_section,
+                            new_mrgn_section,
+                            new_swnm_section,
+                            new_uprp,
+                            encode_context,
+                        )
                     )
             else:
                 raise NotImplementedError(
@@ -250,6 +408,9 @@ class RichChkIo:
                     f"is not supported for encoding.  "
                     f"How did we decode it in the first place?"
                 )
+            encoded_sections[id(chk_section)] = _EncodedRichChkSection(
+                chk_section, rich_objects, decoded_sections[-1]
+            )
         if not was_swnm_added:
             self.log.info(
                 "SWNM section is being added to CHK when it was not present before.  "
@@ -272,39 +433,37 @@ class RichChkIo:
                 "This likely means create unit with properties is being used for 1st time."
             )
             decoded_sections.append(new_upus)
-        result = DecodedChk(_decoded_chk_sections=decoded_sections)
-        if non_trig_cache_key is not None:
-            _trig_pos = next(
-                (
-                    i
-                    for i, s in enumerate(rich_chk.chk_sections)
-                    if isinstance(s, RichTrigSection)
-                ),
-                None,
-            )
-            if _trig_pos is not None:
-                if len(_non_trig_cache) >= _NON_TRIG_CACHE_MAX:
-                    _non_trig_cache.pop(next(iter(_non_trig_cache)))
-                _base_no_trig: list[Optional[DecodedChkSection]] = list(
-                    decoded_sections
-                )
-                _base_no_trig[_trig_pos] = None
-                _non_trig_cache[non_trig_cache_key] = (
-                    encode_context,
-                    _base_no_trig,
-                    _trig_pos,
-                )
-        _wr2 = weakref.ref(rich_chk, lambda _ref: _encode_cache.pop(cache_key, None))
-        _encode_cache[cache_key] = (_wr2, result)
-        if id_secondary_key is not None:
-            _secondary_encode_cache[id_secondary_key] = result
-            if len(_secondary_encode_cache) > _SECONDARY_CACHE_MAX:
-                _secondary_encode_cache.popitem(last=False)
-        if fp_secondary_key is not None:
-            _secondary_encode_cache[fp_secondary_key] = result
-            if len(_secondary_encode_cache) > _SECONDARY_CACHE_MAX:
-                _secondary_encode_cache.popitem(last=False)
-        return result
+        return _RichChkEncodeState(
+            decoded_sections=decoded_sections,
+            encoded_sections=encoded_sections,
+            str_section=new_str_section,
+            mrgn_section=new_mrgn_section,
+            swnm_section=new_swnm_section,
+            uprp_section=new_uprp,
+            upus_section=new_upus,
+            encode_context=encode_context,
+        )
+
+    @staticmethod
+    def _encode_rich_section(
+        chk_section: RichChkSection,
+        new_mrgn_section: RichMrgnSection,
+        new_swnm_section: RichSwnmSection,
+        new_uprp: RichUprpSection,
+        encode_context: RichChkEncodeContext,
+    ) -> DecodedChkSection:
+        section_transcoder: RichChkSectionTranscoder[
+            Any, DecodedChkSection
+        ] = RichChkSectionTranscoderFactory.make_chk_section_transcoder(
+            chk_section.section_name()
+        )
+        if isinstance(chk_section, RichMrgnSection):
+            return section_transcoder.encode(new_mrgn_section, encode_context)
+        elif isinstance(chk_section, RichSwnmSection):
+            return section_transcoder.encode(new_swnm_section, encode_context)
+        elif isinstance(chk_section, RichUprpSection):
+            return section_transcoder.encode(new_uprp, encode_context)
+        return section_transcoder.encode(chk_section, encode_context)
 
     def _build_decode_context(self, chk: DecodedChk) -> RichChkDecodeContext:
         rich_str_lookup = RichStrLookupBuilder().build_lookup(
@@ -331,6 +490,7 @@ class RichChkIo:
             _rich_cuwp_lookup=self._build_rich_cuwp_lookup_for_decode_context(
                 chk, partial_decode_context
             ),
+            _map_width=self._find_map_width(chk),
         )
 
     def _build_rich_swnm_lookup_for_decode_context(
@@ -349,6 +509,15 @@ class RichChkIo:
             )
             return RichSwnmLookup(_switch_by_id_lookup={}, _id_by_switch_lookup={})
 
+    def _find_map_width(self, chk: DecodedChk) -> Optional[int]:
+        try:
+            return ChkQueryUtil.find_only_decoded_section_in_chk(
+                DecodedDimSection, chk
+            ).width
+        except ValueError:
+            self.log.info("No DIM section found in this CHK.  The width is unknown.")
+            return None
+
     def _build_rich_cuwp_lookup_for_decode_context(
         self, chk: DecodedChk, partial_decode_context: RichChkDecodeContext
     ) -> RichCuwpLookup:
@@ -1,29 +1,118 @@
-"""Represents the ordered list of decoded CHK sections from a decoded CHK file."""
+"""Represents the ordered list of decoded CHK sections from a decoded CHK file.
+
+A DecodedChk can also be lazy, in which case each section is kept as raw bytes and only
+decoded the first time it is accessed through decoded_chk_sections or
+get_sections_by_name.  A lazy DecodedChk compares equal to an eager one with the same
+decoded sections.
+
+The sections of an eager DecodedChk are looked up through a ChkSectionIndex built with
+the DecodedChk, which DecodedChkEditor derives for edited CHKs.
+"""
 
 import dataclasses
 import functools
+import inspect
 from collections import defaultdict
+from typing import Optional, Type, TypeVar, cast
 
 from ...model.chk_section_name import ChkSectionName
+from ..chk_section_index import ChkSectionIndex
 from .decoded_chk_section import DecodedChkSection
+from .lazy_chk_section import LazyChkSection
 
+_T = TypeVar("_T", bound=DecodedChkSection)
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(frozen=True, eq=False)
 class DecodedChk:
     _decoded_chk_sections: list[DecodedChkSection]
+    _lazy_chk_sections: Optional[list[LazyChkSection]] = dataclasses.field(
+        default=None, repr=False
+    )
+    _section_index: ChkSectionIndex = dataclasses.field(init=False, repr=False)
+    # the index of the sections when it is already known, e.g. derived by an editor
+    _prebuilt_section_index: dataclasses.InitVar[Optional[ChkSectionIndex]] = None
+
+    def __post_init__(self, _prebuilt_section_index: Optional[ChkSectionIndex]) -> None:
+        if _prebuilt_section_index is None:
+            _prebuilt_section_index = ChkSectionIndex.build(self._decoded_chk_sections)
+        object.__setattr__(self, "_section_index", _prebuilt_section_index)
+
+    @classmethod
+    def from_lazy_sections(
+        cls, lazy_chk_sections: list[LazyChkSection]
+    ) -> "DecodedChk":
+        return cls(_decoded_chk_sections=[], _lazy_chk_sections=lazy_chk_sections)
 
     @functools.cached_property
-    def _sections_by_name(self) -> dict[ChkSectionName, list[DecodedChkSection]]:
+    def _lazy_sections_by_name(self) -> dict[ChkSectionName, list[LazyChkSection]]:
         sections_by_name = defaultdict(list)
-        for section in self._decoded_chk_sections:
-            sections_by_name[section.section_name()].append(section)
+        for section in self._lazy_chk_sections or []:
+            sections_by_name[section.section_name].append(section)
         return sections_by_name
 
+    @functools.cached_property
+    def _all_lazy_sections_decoded(self) -> list[DecodedChkSection]:
+        return [section.decode() for section in self._lazy_chk_sections or []]
+
+    @property
+    def is_lazy(self) -> bool:
+        return self._lazy_chk_sections is not None
+
+    @property
+    def lazy_chk_sections(self) -> Optional[list[LazyChkSection]]:
+        """The raw, possibly not yet decoded, sections of a lazy CHK; else None."""
+        return self._lazy_chk_sections
+
+    @property
+    def section_index(self) -> ChkSectionIndex:
+        """The index of the decoded sections, which is empty for a lazy CHK."""
+        return self._section_index
+
     @property
     def decoded_chk_sections(self) -> list[DecodedChkSection]:
+        if self._lazy_chk_sections is not None:
+            return self._all_lazy_sections_decoded
         return self._decoded_chk_sections
 
     def get_sections_by_name(
         self, chk_section_name: ChkSectionName
     ) -> list[DecodedChkSection]:
-        return self._sections_by_name[chk_section_name]
+        if self._lazy_chk_sections is not None:
+            return [
+                section.decode()
+                for section in self._lazy_sections_by_name.get(chk_section_name, [])
+            ]
+        sections = self._decoded_chk_sections
+        return [
+            sections[index]
+            for index in self._section_index.indices_of_name(chk_section_name)
+        ]
+
+    def get_sections_by_type(self, section_type: Type[_T]) -> list[_T]:
+        """All the sections which are instances of the type, in order."""
+        if self._lazy_chk_sections is not None:
+            # only the sections with the name of a concrete type need decoding
+            candidates = (
+                self.decoded_chk_sections
+                if inspect.isabstract(section_type)
+                else self.get_sections_by_name(section_type.section_name())
+            )
+            return [
+                section for section in candidates if isinstance(section, section_type)
+            ]
+        sections = self._decoded_chk_sections
+        return [
+            cast(_T, sections[index])
+            for index in self._section_index.indices_of_type(section_type)
+        ]
+
+    def contains_section(self, chk_section_name: ChkSectionName) -> bool:
+        if self._lazy_chk_sections is not None:
+            return bool(self._lazy_sections_by_name.get(chk_section_name))
+        return bool(self._section_index.indices_of_name(chk_section_name))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DecodedChk):
+            return NotImplemented
+        return self.decoded_chk_sections == other.decoded_chk_sections
@@ -7,6 +7,7 @@ This section is modeled as raw data for round-tripping without semantic interpre
 """
 
 import dataclasses
+from array import array
 
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
@@ -19,12 +20,12 @@ class DecodedIsomSection(DecodedChkSection):
     :param _data: flat array of u16 isometric terrain values
     """
 
-    _data: tuple[int, ...]
+    _data: "array[int]"
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.ISOM
 
     @property
-    def data(self) -> tuple[int, ...]:
+    def data(self) -> "array[int]":
         return self._data
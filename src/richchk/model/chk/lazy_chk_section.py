@@ -0,0 +1,78 @@
+"""A CHK section kept as its raw bytes until it is decoded for the first time.
+
+Used by a lazily decoded DecodedChk so that callers only pay for decoding the sections
+they actually read.  The raw bytes are kept even after decoding, which lets an untouched
+CHK be re-encoded byte-for-byte from the original buffer.
+"""
+
+from typing import Callable, Optional, Union
+
+from ..chk_section_name import ChkSectionName
+from .decoded_chk_section import DecodedChkSection
+
+ChkSectionDecoder = Callable[[str, Union[bytes, memoryview]], DecodedChkSection]
+
+
+class LazyChkSection:
+    """Raw CHK section data plus the means to decode it on demand.
+
+    :param section_name: the name the decoded section will report, which is
+        ChkSectionName.UNKNOWN for sections without a registered transcoder.
+    :param actual_section_name: the 4-byte name as it appears in the CHK.
+    :param chk_binary_data: the section data, not including the 8-byte header. This
+        may be a zero-copy view into the buffer the CHK was framed from.
+    :param decoder: decodes (actual_section_name, chk_binary_data) into a section.
+    """
+
+    __slots__ = (
+        "_section_name",
+        "_actual_section_name",
+        "_chk_binary_data",
+        "_decoder",
+        "_decoded_chk_section",
+    )
+
+    def __init__(
+        self,
+        section_name: ChkSectionName,
+        actual_section_name: str,
+        chk_binary_data: Union[bytes, memoryview],
+        decoder: ChkSectionDecoder,
+    ) -> None:
+        self._section_name = section_name
+        self._actual_section_name = actual_section_name
+        self._chk_binary_data = chk_binary_data
+        self._decoder = decoder
+        self._decoded_chk_section: Optional[DecodedChkSection] = None
+
+    @property
+    def section_name(self) -> ChkSectionName:
+        return self._section_name
+
+    @property
+    def actual_section_name(self) -> str:
+        return self._actual_section_name
+
+    @property
+    def chk_binary_data(self) -> Union[bytes, memoryview]:
+        return self._chk_binary_data
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._decoded_chk_section is not None
+
+    def decode(self) -> DecodedChkSection:
+        """Decode the section, memoizing the result for every later access."""
+        if self._decoded_chk_section is None:
+            self._decoded_chk_section = self._decoder(
+                self._actual_section_name, self._chk_binary_data
+            )
+        return self._decoded_chk_section
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(_actual_section_name='{self._actual_section_name}', "
+            f"total bytes={len(self._chk_binary_data)}, "
+            f"decoded={self.is_decoded})"
+        )
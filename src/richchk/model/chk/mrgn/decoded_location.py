@@ -42,9 +42,13 @@ larger than Top. However, you can reverse one or both of these for Inverted Loca
 """
 
 import dataclasses
+import struct
 
+# u32 left, top, right and bottom, u16 string number and elevation flags
+LOCATION_STRUCT = struct.Struct("<IIIIHH")
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(frozen=True, init=False)
 class DecodedLocation:
     """Represent a single decoded location from MRGN section.
 
@@ -68,6 +72,27 @@ class DecodedLocation:
     _string_id: int
     _elevation_flags: int
 
+    def __init__(
+        self,
+        _left_x1: int,
+        _top_y1: int,
+        _right_x2: int,
+        _bottom_y2: int,
+        _string_id: int,
+        _elevation_flags: int,
+    ) -> None:
+        # every MRGN decode builds hundreds of locations, so skip the frozen setattrs
+        self.__dict__.update(
+            {
+                "_left_x1": _left_x1,
+                "_top_y1": _top_y1,
+                "_right_x2": _right_x2,
+                "_bottom_y2": _bottom_y2,
+                "_string_id": _string_id,
+                "_elevation_flags": _elevation_flags,
+            }
+        )
+
     @property
     def left_x1(self) -> int:
         return self._left_x1
@@ -42,13 +42,15 @@ larger than Top. However, you can reverse one or both of these for Inverted Loca
 """
 
 import dataclasses
+import itertools
+from typing import Optional
 
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
-from .decoded_location import DecodedLocation
+from .decoded_location import LOCATION_STRUCT, DecodedLocation
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, init=False)
 class DecodedMrgnSection(DecodedChkSection):
     """Represent MRGN section for all location data in a map.
 
@@ -60,6 +62,33 @@ class DecodedMrgnSection(DecodedChkSection):
     # In a vanilla map, this section contains 64 locations.
     # In a Hybrid or Brood War map, this section will expand to contain 255 locations.
     _locations: list[DecodedLocation]
+    # the binary data of a decoded section, from which the locations are only decoded
+    # when they are first read
+    _binary_data: Optional[bytes] = dataclasses.field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    def __init__(self, _locations: list[DecodedLocation]) -> None:
+        self.__dict__.update({"_locations": _locations, "_binary_data": None})
+
+    @classmethod
+    def from_binary_data(cls, binary_data: bytes) -> "DecodedMrgnSection":
+        """A section whose locations are decoded from the binary data when read."""
+        section = cls.__new__(cls)
+        section.__dict__["_binary_data"] = binary_data
+        return section
+
+    def __getattr__(self, name: str) -> list[DecodedLocation]:
+        # only called when the locations have not been decoded yet
+        if name != "_locations" or self._binary_data is None:
+            raise AttributeError(name)
+        locations = list(
+            itertools.starmap(
+                DecodedLocation, LOCATION_STRUCT.iter_unpack(self._binary_data)
+            )
+        )
+        self.__dict__["_locations"] = locations
+        return locations
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
@@ -68,3 +97,13 @@ class DecodedMrgnSection(DecodedChkSection):
     @property
     def locations(self) -> list[DecodedLocation]:
         return self._locations
+
+    @property
+    def unread_binary_data(self) -> Optional[bytes]:
+        """The binary data the section was decoded from, until its locations are read.
+
+        Read locations may be edited in place, so they are encoded again.
+        """
+        if "_locations" in self.__dict__:
+            return None
+        return self._binary_data
@@ -24,13 +24,15 @@ character. Note that STR sections can be stacked in a similar fashion as MTXM
 """
 
 import dataclasses
+from typing import Optional
 
+from ....transcoder.chk.strings_common import _STRING_ENCODING
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
 from ..decoded_string_section import DecodedStringSection
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, init=False)
 class DecodedStrSection(DecodedChkSection, DecodedStringSection):
     # u16: Number of strings in the section (Default: 1024)
     _number_of_strings: int
@@ -40,6 +42,55 @@ class DecodedStrSection(DecodedChkSection, DecodedStringSection):
     # Strings: After the offsets, this is where every string in the map goes,
     # one after another. Each one is terminated by a null character.
     _strings: list[str]
+    # the binary data of a decoded section, from which the strings are only decoded
+    # when they are first read
+    _binary_data: Optional[bytes] = dataclasses.field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    def __init__(
+        self,
+        _number_of_strings: int,
+        _string_offsets: list[int],
+        _strings: list[str],
+    ) -> None:
+        self.__dict__.update(
+            {
+                "_number_of_strings": _number_of_strings,
+                "_string_offsets": _string_offsets,
+                "_strings": _strings,
+                "_binary_data": None,
+            }
+        )
+
+    @classmethod
+    def from_binary_data(
+        cls, number_of_strings: int, string_offsets: list[int], binary_data: bytes
+    ) -> "DecodedStrSection":
+        """A section whose strings are decoded from the binary data when read."""
+        section = cls.__new__(cls)
+        section.__dict__.update(
+            {
+                "_number_of_strings": number_of_strings,
+                "_string_offsets": string_offsets,
+                "_binary_data": binary_data,
+            }
+        )
+        return section
+
+    def __getattr__(self, name: str) -> list[str]:
+        # only called when the strings have not been decoded yet
+        if name != "_strings" or self._binary_data is None:
+            raise AttributeError(name)
+        # the strings start after the number of strings and the u16 offsets, and any
+        # bytes after the last null terminator are not a string
+        string_data = self._binary_data[(self._number_of_strings + 1) * 2 :]
+        strings = [
+            string_.decode(_STRING_ENCODING) for string_ in string_data.split(b"\0")
+        ]
+        strings.pop()
+        self.__dict__["_strings"] = strings
+        return strings
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
@@ -56,3 +107,8 @@ class DecodedStrSection(DecodedChkSection, DecodedStringSection):
     @property
     def strings(self) -> list[str]:
         return self._strings
+
+    @property
+    def binary_data(self) -> Optional[bytes]:
+        """The binary data the section was decoded from, if it was decoded."""
+        return self._binary_data
@@ -11,7 +11,7 @@ u16[width * height]: Tile values
 """
 
 import dataclasses
-from typing import Tuple
+from array import array
 
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
@@ -21,15 +21,16 @@ from ..decoded_chk_section import DecodedChkSection
 class DecodedTileSection(DecodedChkSection):
     """Represent TILE - Terrain (legacy).
 
-    :param _tiles: flat array of u16 tile values
+    :param _tiles: flat array of u16 tile values, row by row from the top left
+        corner of the map
     """
 
-    _tiles: Tuple[int, ...]
+    _tiles: "array[int]"
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.TILE
 
     @property
-    def tiles(self) -> Tuple[int, ...]:
+    def tiles(self) -> "array[int]":
         return self._tiles
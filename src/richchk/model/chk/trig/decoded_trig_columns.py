@@ -0,0 +1,283 @@
+"""Columnar (struct-of-arrays) storage for all the triggers of a TRIG section.
+
+A list of DecodedTrigger holds about 80 Python objects per trigger.  Instead, this keeps
+one compact typed array per field across every trigger of the section.  Condition
+columns hold 16 entries per trigger and action columns 64 entries per trigger, so the
+value for slot s of trigger t is at index t * 16 + s (or t * 64 + s).  The player flags
+column holds the 27 player bytes of each trigger back to back.
+
+DecodedTrigger, DecodedTriggerCondition and DecodedTriggerAction objects are only built
+on demand from the columns.
+"""
+
+from array import array
+from typing import ClassVar, Sequence, TypeAlias
+
+from .decoded_player_execution import DecodedPlayerExecution
+from .decoded_trigger import DecodedTrigger
+from .decoded_trigger_action import DecodedTriggerAction
+from .decoded_trigger_condition import DecodedTriggerCondition
+
+TrigColumn: TypeAlias = "array[int]"
+
+# maps every non-zero byte to 1
+_NON_ZERO_BYTES = bytes([0] + [1] * 255)
+
+
+class DecodedTrigColumns:
+    """Typed arrays of every condition, action and player execution field.
+
+    :param num_triggers: how many triggers the columns hold.
+    :param condition_columns: one array per field of CONDITION_FIELDS, in that order.
+    :param action_columns: one array per field of ACTION_FIELDS, in that order.
+    :param execution_flags: u32 execution flags of each trigger.
+    :param player_flags: u8[27] player flags of each trigger, back to back.
+    :param current_action_indices: u8 current action index of each trigger.
+    """
+
+    NUM_CONDITIONS_PER_TRIGGER: ClassVar[int] = 16
+    NUM_ACTIONS_PER_TRIGGER: ClassVar[int] = 64
+    NUM_PLAYER_EXECUTION_IDS: ClassVar[int] = 27
+
+    # (field name, array typecode) in the order the fields are stored in the CHK, which
+    # is also the order of the DecodedTriggerCondition/DecodedTriggerAction fields.
+    CONDITION_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("location_id", "I"),
+        ("group", "I"),
+        ("quantity", "I"),
+        ("unit_id", "H"),
+        ("numeric_comparison_operation", "B"),
+        ("condition_id", "B"),
+        ("numeric_comparand_type", "B"),
+        ("flags", "B"),
+        ("mask_flag", "H"),
+    )
+    ACTION_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("location_id", "I"),
+        ("text_string_id", "I"),
+        ("wav_string_id", "I"),
+        ("time", "I"),
+        ("first_group", "I"),
+        ("second_group", "I"),
+        ("action_argument_type", "H"),
+        ("action_id", "B"),
+        ("quantifier_or_switch_or_order", "B"),
+        ("flags", "B"),
+        ("padding", "B"),
+        ("mask_flag", "H"),
+    )
+    _CONDITION_ID_COLUMN: ClassVar[int] = 5
+    _ACTION_ID_COLUMN: ClassVar[int] = 7
+
+    __slots__ = (
+        "_num_triggers",
+        "_condition_columns",
+        "_action_columns",
+        "_execution_flags",
+        "_player_flags",
+        "_current_action_indices",
+    )
+
+    def __init__(
+        self,
+        num_triggers: int,
+        condition_columns: list[TrigColumn],
+        action_columns: list[TrigColumn],
+        execution_flags: TrigColumn,
+        player_flags: TrigColumn,
+        current_action_indices: TrigColumn,
+    ) -> None:
+        if len(condition_columns) != len(self.CONDITION_FIELDS) or len(
+            action_columns
+        ) != len(self.ACTION_FIELDS):
+            raise ValueError(
+                f"Expected {len(self.CONDITION_FIELDS)} condition columns and "
+                f"{len(self.ACTION_FIELDS)} action columns, but got "
+                f"{len(condition_columns)} and {len(action_columns)}."
+            )
+        self._num_triggers = num_triggers
+        self._condition_columns = condition_columns
+        self._action_columns = action_columns
+        self._execution_flags = execution_flags
+        self._player_flags = player_flags
+        self._current_action_indices = current_action_indices
+
+    @property
+    def num_triggers(self) -> int:
+        return self._num_triggers
+
+    @property
+    def condition_columns(self) -> list[TrigColumn]:
+        return self._condition_columns
+
+    @property
+    def action_columns(self) -> list[TrigColumn]:
+        return self._action_columns
+
+    @property
+    def condition_ids(self) -> TrigColumn:
+        return self._condition_columns[self._CONDITION_ID_COLUMN]
+
+    @property
+    def action_ids(self) -> TrigColumn:
+        return self._action_columns[self._ACTION_ID_COLUMN]
+
+    @property
+    def execution_flags(self) -> TrigColumn:
+        return self._execution_flags
+
+    @property
+    def player_flags(self) -> TrigColumn:
+        return self._player_flags
+
+    @property
+    def current_action_indices(self) -> TrigColumn:
+        return self._current_action_indices
+
+    def condition_slots(
+        self, trigger_index: int, skip_empty: bool = False
+    ) -> Sequence[int]:
+        """Slots of a trigger up to and including its last non-empty condition.
+
+        Empty slots after it may still hold data, which trigger keeps.
+
+        :param trigger_index:
+        :param skip_empty: also leave out empty slots before the last non-empty one.
+        :return: the indices into the condition columns.
+        """
+        return self._used_slots(
+            self.condition_ids,
+            trigger_index * self.NUM_CONDITIONS_PER_TRIGGER,
+            self.NUM_CONDITIONS_PER_TRIGGER,
+            skip_empty,
+        )
+
+    def action_slots(
+        self, trigger_index: int, skip_empty: bool = False
+    ) -> Sequence[int]:
+        """Slots of a trigger up to and including its last non-empty action.
+
+        Empty slots after it may still hold data, which trigger keeps.
+
+        :param trigger_index:
+        :param skip_empty: also leave out empty slots before the last non-empty one.
+        :return: the indices into the action columns.
+        """
+        return self._used_slots(
+            self.action_ids,
+            trigger_index * self.NUM_ACTIONS_PER_TRIGGER,
+            self.NUM_ACTIONS_PER_TRIGGER,
+            skip_empty,
+        )
+
+    @staticmethod
+    def _used_slots(
+        ids: TrigColumn, start: int, num_slots: int, skip_empty: bool
+    ) -> Sequence[int]:
+        end = start + num_slots
+        while end > start and not ids[end - 1]:
+            end -= 1
+        if skip_empty:
+            return [index for index in range(start, end) if ids[index]]
+        return range(start, end)
+
+    def condition(self, index: int) -> DecodedTriggerCondition:
+        """Build the condition at an index of the condition columns."""
+        return DecodedTriggerCondition(
+            *[column[index] for column in self._condition_columns]
+        )
+
+    def action(self, index: int) -> DecodedTriggerAction:
+        """Build the action at an index of the action columns."""
+        return DecodedTriggerAction(*[column[index] for column in self._action_columns])
+
+    def player_execution(self, trigger_index: int) -> DecodedPlayerExecution:
+        start = trigger_index * self.NUM_PLAYER_EXECUTION_IDS
+        return DecodedPlayerExecution(
+            _execution_flags=self._execution_flags[trigger_index],
+            _player_flags=self._player_flags[
+                start : start + self.NUM_PLAYER_EXECUTION_IDS
+            ].tolist(),
+            _current_action_index=self._current_action_indices[trigger_index],
+        )
+
+    def trigger(self, trigger_index: int) -> DecodedTrigger:
+        return self._build_triggers(trigger_index, trigger_index + 1)[0]
+
+    def to_triggers(self) -> list[DecodedTrigger]:
+        return self._build_triggers(0, self._num_triggers)
+
+    def _build_triggers(self, start: int, stop: int) -> list[DecodedTrigger]:
+        """Build the triggers from start up to, excluding, stop.
+
+        The zeroed slots after the last slot holding any data are left out, and empty
+        slots before it are kept, so the triggers encode back to the same bytes.
+        """
+        num_conditions = self.NUM_CONDITIONS_PER_TRIGGER
+        num_actions = self.NUM_ACTIONS_PER_TRIGGER
+        condition_mask = self._data_mask(
+            self._condition_columns, start * num_conditions, stop * num_conditions
+        )
+        action_mask = self._data_mask(
+            self._action_columns, start * num_actions, stop * num_actions
+        )
+        triggers = []
+        for trigger_index in range(start, stop):
+            position = trigger_index - start
+            condition_slots = self._slots_with_data(
+                condition_mask, position * num_conditions, num_conditions
+            )
+            action_slots = self._slots_with_data(
+                action_mask, position * num_actions, num_actions
+            )
+            triggers.append(
+                DecodedTrigger(
+                    _conditions=[
+                        self.condition(start * num_conditions + index)
+                        for index in condition_slots
+                    ],
+                    _actions=[
+                        self.action(start * num_actions + index)
+                        for index in action_slots
+                    ],
+                    _player_execution=self.player_execution(trigger_index),
+                )
+            )
+        return triggers
+
+    @staticmethod
+    def _data_mask(columns: list[TrigColumn], start: int, stop: int) -> bytes:
+        """One byte per slot from start up to, excluding, stop, which is 1 if the slot
+        holds any data and 0 otherwise.
+
+        The bytes of every column are OR-ed together as big integers, rather than
+        checking each slot field by field.
+        """
+        mask = 0
+        for column in columns:
+            width = column.itemsize
+            non_zero_bytes = column[start:stop].tobytes().translate(_NON_ZERO_BYTES)
+            for i in range(width):
+                mask |= int.from_bytes(non_zero_bytes[i::width], "little")
+        return mask.to_bytes(stop - start, "little")
+
+    @staticmethod
+    def _slots_with_data(mask: bytes, first: int, num_slots: int) -> range:
+        """The slots of the mask from first up to and including the last one of the
+        num_slots slots holding any data."""
+        return range(first, max(first, mask.rfind(1, first, first + num_slots) + 1))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DecodedTrigColumns):
+            return NotImplemented
+        return (
+            self._num_triggers == other._num_triggers
+            and self._condition_columns == other._condition_columns
+            and self._action_columns == other._action_columns
+            and self._execution_flags == other._execution_flags
+            and self._player_flags == other._player_flags
+            and self._current_action_indices == other._current_action_indices
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(num_triggers={self._num_triggers})"
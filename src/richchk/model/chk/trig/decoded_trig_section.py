@@ -130,10 +130,12 @@ will add more triggers.
 """
 
 import dataclasses
+import functools
 from typing import Any, Optional, Union
 
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
+from .decoded_trig_columns import DecodedTrigColumns
 from .decoded_trigger import DecodedTrigger
 
 
@@ -173,24 +175,29 @@ class TrigLazySpec:
         self.act_ab = act_ab
 
     def materialize(self) -> bytes:
-        n, trig_sz = self.n, self.trig_sz
-        data = bytearray(n * trig_sz)
+        return bytes(self.materialize_range(0, self.n))
+
+    def materialize_range(self, start: int, stop: int) -> bytearray:
+        """Build only the bytes of the triggers from start up to, excluding, stop."""
+        trig_sz = self.trig_sz
+        data = bytearray((stop - start) * trig_sz)
+        whole = start == 0 and stop == self.n
         for pos, buf in self.nz_bufs:
-            data[pos::trig_sz] = buf
-        ab = self.ab
-        off = self.cond_off_rel
-        data[off::trig_sz] = ab[0::4]
-        data[off + 1 :: trig_sz] = ab[1::4]
-        data[off + 2 :: trig_sz] = ab[2::4]
-        data[off + 3 :: trig_sz] = ab[3::4]
-        act_ab = self.act_ab
-        if act_ab is not None:
-            aoff = self.act_off_rel
-            data[aoff::trig_sz] = act_ab[0::4]
-            data[aoff + 1 :: trig_sz] = act_ab[1::4]
-            data[aoff + 2 :: trig_sz] = act_ab[2::4]
-            data[aoff + 3 :: trig_sz] = act_ab[3::4]
-        return bytes(data)
+            data[pos::trig_sz] = buf if whole else buf[start:stop]
+        self._write_amounts(data, self.cond_off_rel, self.ab, start, stop)
+        if self.act_ab is not None:
+            self._write_amounts(data, self.act_off_rel, self.act_ab, start, stop)
+        return data
+
+    def _write_amounts(
+        self, data: bytearray, off: int, amount_bytes: bytes, start: int, stop: int
+    ) -> None:
+        trig_sz = self.trig_sz
+        first, last = 4 * start, 4 * stop
+        data[off::trig_sz] = amount_bytes[first:last:4]
+        data[off + 1 :: trig_sz] = amount_bytes[first + 1 : last : 4]
+        data[off + 2 :: trig_sz] = amount_bytes[first + 2 : last : 4]
+        data[off + 3 :: trig_sz] = amount_bytes[first + 3 : last : 4]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -198,13 +205,16 @@ class DecodedTrigSection(DecodedChkSection):
     """Represent TRIG section for all trigger data.
 
     :param _triggers: contains all the triggers in this TRIG section. There can be
-        multiple TRIG sections.
+        multiple TRIG sections.  Unused when the section is backed by _columns.
     :param _raw_data: pre-encoded bytes from fused encoding path; when set,
         ChkTrigTranscoder skips re-encoding and uses these bytes directly.
     :param _lazy_spec: lazy encoding spec; when set, ChkTrigTranscoder materializes on
         first call and memoizes in _cache_box to avoid repeated allocation.
     :param _cache_box: mutable one-element list used as a write-once cache for the
         materialized bytearray from _lazy_spec. Mutable inside a frozen dataclass.
+    :param _columns: columnar backing of the triggers; when set, triggers are built from
+        the columns the first time they are accessed, and until then the transcoders
+        read and write whole columns instead of DecodedTrigger objects.
     """
 
     _triggers: list[DecodedTrigger]
@@ -217,11 +227,52 @@ class DecodedTrigSection(DecodedChkSection):
     _cache_box: list[bytes] = dataclasses.field(
         default_factory=list, compare=False, hash=False, repr=False
     )
+    _columns: Optional[DecodedTrigColumns] = dataclasses.field(
+        default=None, compare=False, hash=False, repr=False
+    )
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.TRIG
 
+    @classmethod
+    def from_columns(cls, columns: DecodedTrigColumns) -> "DecodedTrigSection":
+        return cls(_triggers=[], _columns=columns)
+
+    @functools.cached_property
+    def _triggers_from_columns(self) -> list[DecodedTrigger]:
+        assert self._columns is not None
+        return self._columns.to_triggers()
+
     @property
     def triggers(self) -> list[DecodedTrigger]:
+        if self._columns is not None:
+            return self._triggers_from_columns
         return self._triggers
+
+    @property
+    def columns(self) -> Optional[DecodedTrigColumns]:
+        """The columns backing this section, or None if it holds DecodedTrigger
+        objects.
+
+        Once triggers has been accessed, those objects may have been modified and take
+        precedence over the columns; see has_materialized_triggers.
+        """
+        return self._columns
+
+    @property
+    def has_materialized_triggers(self) -> bool:
+        """Whether DecodedTrigger objects have been built for a columnar section."""
+        return "_triggers_from_columns" in self.__dict__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DecodedTrigSection):
+            return NotImplemented
+        if (
+            self._columns is not None
+            and other._columns is not None
+            and not self.has_materialized_triggers
+            and not other.has_materialized_triggers
+        ):
+            return self._columns == other._columns
+        return self.triggers == other.triggers
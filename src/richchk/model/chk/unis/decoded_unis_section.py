@@ -31,6 +31,7 @@ u16[100]: Upgrade bonus weapon damage, in weapon ID order
 """
 
 import dataclasses
+from typing import Optional
 
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
@@ -65,6 +66,10 @@ class DecodedUnisSection(DecodedChkSection):
     _unit_base_weapon_damages: list[int]
     # u16[100]: Upgrade bonus weapon damage, in weapon ID order
     _unit_upgrade_weapon_damages: list[int]
+    # the binary data of a decoded section, which is encoded as is
+    _binary_data: Optional[bytes] = dataclasses.field(
+        default=None, init=False, compare=False, repr=False
+    )
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
@@ -109,3 +114,8 @@ class DecodedUnisSection(DecodedChkSection):
     @property
     def unit_upgrade_weapon_damages(self) -> list[int]:
         return self._unit_upgrade_weapon_damages.copy()
+
+    @property
+    def binary_data(self) -> Optional[bytes]:
+        """The binary data the section was decoded from, if it was decoded."""
+        return self._binary_data
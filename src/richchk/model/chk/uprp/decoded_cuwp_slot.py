@@ -66,9 +66,13 @@ u32: Unknown/unused. Padding?
 """
 
 import dataclasses
+import struct
 
+# the fields of a CUWP slot as stored in the CHK, 20 bytes
+CUWP_SLOT_STRUCT = struct.Struct("<HHBBBBIHHI")
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(frozen=True, init=False)
 class DecodedCuwpSlot:
     """Represent a single decoded create unit with properties slot.
 
@@ -105,6 +109,35 @@ class DecodedCuwpSlot:
     _flags: int
     _padding: int
 
+    def __init__(
+        self,
+        _valid_special_properties_flags: int,
+        _valid_unit_properties_flags: int,
+        _owner_player: int,
+        _hitpoints_percentage: int,
+        _shieldpoints_percentage: int,
+        _energypoints_percentage: int,
+        _resource_amount: int,
+        _units_in_hangar: int,
+        _flags: int,
+        _padding: int,
+    ) -> None:
+        # every UPRP decode builds 64 slots, so skip the frozen setattrs
+        self.__dict__.update(
+            {
+                "_valid_special_properties_flags": _valid_special_properties_flags,
+                "_valid_unit_properties_flags": _valid_unit_properties_flags,
+                "_owner_player": _owner_player,
+                "_hitpoints_percentage": _hitpoints_percentage,
+                "_shieldpoints_percentage": _shieldpoints_percentage,
+                "_energypoints_percentage": _energypoints_percentage,
+                "_resource_amount": _resource_amount,
+                "_units_in_hangar": _units_in_hangar,
+                "_flags": _flags,
+                "_padding": _padding,
+            }
+        )
+
     @property
     def valid_special_properties_flags(self) -> int:
         """Flag of which special properties can be applied to unit, and are valid."""
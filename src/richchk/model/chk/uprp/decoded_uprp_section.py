@@ -66,13 +66,15 @@ u32: Unknown/unused. Padding?
 """
 
 import dataclasses
+import itertools
+from typing import Optional
 
 from ...chk_section_name import ChkSectionName
 from ..decoded_chk_section import DecodedChkSection
-from .decoded_cuwp_slot import DecodedCuwpSlot
+from .decoded_cuwp_slot import CUWP_SLOT_STRUCT, DecodedCuwpSlot
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, init=False)
 class DecodedUprpSection(DecodedChkSection):
     """Represent TRIG section for all trigger data.
 
@@ -81,6 +83,33 @@ class DecodedUprpSection(DecodedChkSection):
     """
 
     _cuwp_slots: list[DecodedCuwpSlot]
+    # the binary data of a decoded section, from which the CUWP slots are only decoded
+    # when they are first read
+    _binary_data: Optional[bytes] = dataclasses.field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    def __init__(self, _cuwp_slots: list[DecodedCuwpSlot]) -> None:
+        self.__dict__.update({"_cuwp_slots": _cuwp_slots, "_binary_data": None})
+
+    @classmethod
+    def from_binary_data(cls, binary_data: bytes) -> "DecodedUprpSection":
+        """A section whose CUWP slots are decoded from the binary data when read."""
+        section = cls.__new__(cls)
+        section.__dict__["_binary_data"] = binary_data
+        return section
+
+    def __getattr__(self, name: str) -> list[DecodedCuwpSlot]:
+        # only called when the CUWP slots have not been decoded yet
+        if name != "_cuwp_slots" or self._binary_data is None:
+            raise AttributeError(name)
+        cuwp_slots = list(
+            itertools.starmap(
+                DecodedCuwpSlot, CUWP_SLOT_STRUCT.iter_unpack(self._binary_data)
+            )
+        )
+        self.__dict__["_cuwp_slots"] = cuwp_slots
+        return cuwp_slots
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
@@ -89,3 +118,13 @@ class DecodedUprpSection(DecodedChkSection):
     @property
     def cuwp_slots(self) -> list[DecodedCuwpSlot]:
         return self._cuwp_slots
+
+    @property
+    def unread_binary_data(self) -> Optional[bytes]:
+        """The binary data the section was decoded from, until its CUWP slots are read.
+
+        Read CUWP slots may be edited in place, so they are encoded again.
+        """
+        if "_cuwp_slots" in self.__dict__:
+            return None
+        return self._binary_data
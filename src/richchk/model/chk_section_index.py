@@ -0,0 +1,136 @@
+"""Index the sections of a CHK by section name and by section type.
+
+The index of a CHK is built once, when the CHK is made.  Editing a CHK derives the index
+of the edited CHK from the index of the original, instead of indexing every section
+again.
+"""
+
+import bisect
+import dataclasses
+from itertools import chain
+from typing import Any, Iterable, Mapping, Protocol
+
+from .chk_section_name import ChkSectionName
+
+
+class _ChkSection(Protocol):
+    @classmethod
+    def section_name(cls) -> ChkSectionName:
+        raise NotImplementedError
+
+
+@dataclasses.dataclass(frozen=True)
+class ChkSectionIndex:
+    """Where each section is in the list of sections of a CHK.
+
+    :param _indices_by_name: positions of the sections with each section name, in order
+    :param _indices_by_type: positions of the sections of each exact type, in order
+    """
+
+    _indices_by_name: Mapping[ChkSectionName, tuple[int, ...]]
+    _indices_by_type: Mapping[type, tuple[int, ...]]
+
+    @classmethod
+    def build(cls, chk_sections: Iterable[_ChkSection]) -> "ChkSectionIndex":
+        indices_by_name: dict[ChkSectionName, tuple[int, ...]] = {}
+        indices_by_type: dict[type, tuple[int, ...]] = {}
+        for index, section in enumerate(chk_sections):
+            name = section.section_name()
+            indices_by_name[name] = indices_by_name.get(name, ()) + (index,)
+            section_type = type(section)
+            indices_by_type[section_type] = indices_by_type.get(section_type, ()) + (
+                index,
+            )
+        return cls(_indices_by_name=indices_by_name, _indices_by_type=indices_by_type)
+
+    def indices_of_name(self, chk_section_name: ChkSectionName) -> tuple[int, ...]:
+        return self._indices_by_name.get(chk_section_name, ())
+
+    def indices_of_type(self, section_type: type) -> tuple[int, ...]:
+        """Positions of the sections which are instances of the type, in order."""
+        matching = [
+            indices
+            for indexed_type, indices in self._indices_by_type.items()
+            if issubclass(indexed_type, section_type)
+        ]
+        if len(matching) == 1:
+            return matching[0]
+        return tuple(sorted(chain.from_iterable(matching)))
+
+    def with_replaced(
+        self, index: int, old_section: _ChkSection, new_section: _ChkSection
+    ) -> "ChkSectionIndex":
+        """The index after replacing the section at a position with another one."""
+        indices_by_name = dict(self._indices_by_name)
+        indices_by_type = dict(self._indices_by_type)
+        self._move_index(
+            indices_by_name,
+            old_section.section_name(),
+            new_section.section_name(),
+            index,
+        )
+        self._move_index(indices_by_type, type(old_section), type(new_section), index)
+        return ChkSectionIndex(
+            _indices_by_name=indices_by_name, _indices_by_type=indices_by_type
+        )
+
+    def with_appended(self, index: int, new_section: _ChkSection) -> "ChkSectionIndex":
+        """The index after appending a section, which is at the given position."""
+        indices_by_name = dict(self._indices_by_name)
+        indices_by_type = dict(self._indices_by_type)
+        name = new_section.section_name()
+        indices_by_name[name] = indices_by_name.get(name, ()) + (index,)
+        section_type = type(new_section)
+        indices_by_type[section_type] = indices_by_type.get(section_type, ()) + (index,)
+        return ChkSectionIndex(
+            _indices_by_name=indices_by_name, _indices_by_type=indices_by_type
+        )
+
+    def without_name(self, chk_section_name: ChkSectionName) -> "ChkSectionIndex":
+        """The index after removing every section with the name.
+
+        The positions of the remaining sections move down past the removed ones.
+        """
+        removed = self.indices_of_name(chk_section_name)
+        if not removed:
+            return self
+        removed_set = set(removed)
+
+        def shift(indices: tuple[int, ...]) -> tuple[int, ...]:
+            return tuple(
+                index - bisect.bisect_left(removed, index)
+                for index in indices
+                if index not in removed_set
+            )
+
+        indices_by_name = {
+            name: shift(indices)
+            for name, indices in self._indices_by_name.items()
+            if name != chk_section_name
+        }
+        indices_by_type = {}
+        for section_type, indices in self._indices_by_type.items():
+            shifted = shift(indices)
+            if shifted:
+                indices_by_type[section_type] = shifted
+        return ChkSectionIndex(
+            _indices_by_name=indices_by_name, _indices_by_type=indices_by_type
+        )
+
+    @staticmethod
+    def _move_index(
+        indices_by_key: dict[Any, tuple[int, ...]],
+        old_key: object,
+        new_key: object,
+        index: int,
+    ) -> None:
+        if old_key == new_key:
+            return
+        remaining = tuple(i for i in indices_by_key[old_key] if i != index)
+        if remaining:
+            indices_by_key[old_key] = remaining
+        else:
+            del indices_by_key[old_key]
+        indices_by_key[new_key] = tuple(
+            sorted(indices_by_key.get(new_key, ()) + (index,))
+        )
@@ -0,0 +1,49 @@
+"""The archive table entry of a file found by SFileFindFirstFile or SFileFindNextFile.
+
+Two entries with the same path, sizes, flags and file time describe the same stored
+file, so an entry can identify the content of a file without reading it.
+"""
+import dataclasses
+
+from .stormlib_file_search_result import StormLibFileSearchResult
+
+
+@dataclasses.dataclass(frozen=True)
+class StormLibFileEntry:
+    _path_in_mpq: str
+    _file_size: int
+    _compressed_size: int
+    _file_flags: int
+    _file_time: int
+
+    @classmethod
+    def from_search_result(
+        cls, search_result: StormLibFileSearchResult
+    ) -> "StormLibFileEntry":
+        return cls(
+            _path_in_mpq=search_result.cFileName.decode("utf-8"),
+            _file_size=search_result.dwFileSize,
+            _compressed_size=search_result.dwCompSize,
+            _file_flags=search_result.dwFileFlags,
+            _file_time=(search_result.dwFileTimeHi << 32) | search_result.dwFileTimeLo,
+        )
+
+    @property
+    def path_in_mpq(self) -> str:
+        return self._path_in_mpq
+
+    @property
+    def file_size(self) -> int:
+        return self._file_size
+
+    @property
+    def compressed_size(self) -> int:
+        return self._compressed_size
+
+    @property
+    def file_flags(self) -> int:
+        return self._file_flags
+
+    @property
+    def file_time(self) -> int:
+        return self._file_time
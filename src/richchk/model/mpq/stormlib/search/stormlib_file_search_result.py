@@ -24,10 +24,12 @@ present)
 
 LCID   lcLocale;                         // Locale version };
 """
+import platform
 from ctypes import Structure, c_char, c_char_p, c_uint16, c_uint32
 
-# suggested max file name size, change if needed
-_MAX_FILE_NAME_SIZE = 260
+# StormLib's MAX_PATH: 260 on Windows, but StormPort.h defines it as 1024 elsewhere.
+# StormLib fills the whole struct, so a smaller buffer here overflows the heap.
+_MAX_FILE_NAME_SIZE = 260 if platform.system().lower() == "windows" else 1024
 
 
 class StormLibFileSearchResult(Structure):
@@ -5,6 +5,7 @@ data for round-tripping without semantic interpretation.
 """
 
 import dataclasses
+from array import array
 
 from ...chk_section_name import ChkSectionName
 from ..rich_chk_section import RichChkSection
@@ -17,12 +18,12 @@ class RichIsomSection(RichChkSection):
     :param _data: flat array of u16 isometric terrain values
     """
 
-    _data: list[int]
+    _data: "array[int]"
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.ISOM
 
     @property
-    def data(self) -> list[int]:
+    def data(self) -> "array[int]":
         return self._data
@@ -0,0 +1,196 @@
+"""A uniform grid over the locations of a RichMrgnSection, for finding locations by
+their position on the map.
+
+The bounds of the locations are split into about as many square cells as there are
+locations, and each cell lists the locations which overlap it.  A query only checks the
+locations of the cells it touches, rather than every location.
+
+Inverted locations, whose right is left of their left or whose bottom is above their
+top, cover the same area as the location with the coordinates swapped.  A location
+covers the pixels from its left up to, excluding, its right, and likewise from its top
+to its bottom.  Queries return locations in their order in the section.
+"""
+
+import dataclasses
+import math
+from typing import Optional
+
+from .rich_location import RichLocation
+
+# left, top, right, bottom
+_Bounds = tuple[int, int, int, int]
+
+# the smallest cell is a single tile
+_MIN_CELL_SIZE = 32
+
+
+@dataclasses.dataclass(frozen=True)
+class RichLocationGrid:
+    _locations: tuple[RichLocation, ...]
+    # the normalized bounds of each location, in the same order
+    _bounds: tuple[_Bounds, ...]
+    _origin_x: int
+    _origin_y: int
+    _cell_size: int
+    _num_columns: int
+    _num_rows: int
+    # the positions of the locations overlapping each cell, row by row
+    _cells: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def build(cls, locations: list[RichLocation]) -> "RichLocationGrid":
+        bounds = tuple(cls._normalized_bounds(location) for location in locations)
+        if not bounds:
+            return cls(tuple(locations), bounds, 0, 0, _MIN_CELL_SIZE, 0, 0, ())
+        origin_x = min(left for left, _, _, _ in bounds)
+        origin_y = min(top for _, top, _, _ in bounds)
+        width = max(max(right for _, _, right, _ in bounds) - origin_x, 1)
+        height = max(max(bottom for _, _, _, bottom in bounds) - origin_y, 1)
+        cell_size = max(
+            _MIN_CELL_SIZE, math.ceil(math.sqrt(width * height / len(bounds)))
+        )
+        num_columns = -(-width // cell_size)
+        num_rows = -(-height // cell_size)
+        cells: list[list[int]] = [[] for _ in range(num_columns * num_rows)]
+        for position, (left, top, right, bottom) in enumerate(bounds):
+            if left == right or top == bottom:
+                # an empty location covers no pixels
+                continue
+            first_column = (left - origin_x) // cell_size
+            last_column = (right - 1 - origin_x) // cell_size
+            for row in range(
+                (top - origin_y) // cell_size, (bottom - 1 - origin_y) // cell_size + 1
+            ):
+                for column in range(first_column, last_column + 1):
+                    cells[row * num_columns + column].append(position)
+        return cls(
+            tuple(locations),
+            bounds,
+            origin_x,
+            origin_y,
+            cell_size,
+            num_columns,
+            num_rows,
+            tuple(tuple(cell) for cell in cells),
+        )
+
+    @staticmethod
+    def _normalized_bounds(location: RichLocation) -> _Bounds:
+        return (
+            min(location.left_x1, location.right_x2),
+            min(location.top_y1, location.bottom_y2),
+            max(location.left_x1, location.right_x2),
+            max(location.top_y1, location.bottom_y2),
+        )
+
+    @property
+    def locations(self) -> tuple[RichLocation, ...]:
+        return self._locations
+
+    def locations_containing_point(self, x: int, y: int) -> list[RichLocation]:
+        column = (x - self._origin_x) // self._cell_size
+        row = (y - self._origin_y) // self._cell_size
+        if not (0 <= column < self._num_columns and 0 <= row < self._num_rows):
+            return []
+        bounds = self._bounds
+        return [
+            self._locations[position]
+            for position in self._cells[row * self._num_columns + column]
+            if bounds[position][0] <= x < bounds[position][2]
+            and bounds[position][1] <= y < bounds[position][3]
+        ]
+
+    def locations_overlapping_area(
+        self, left: int, top: int, right: int, bottom: int
+    ) -> list[RichLocation]:
+        """The locations sharing at least one pixel with the area, whose coordinates are
+        normalized the same as those of the locations."""
+        left, right = min(left, right), max(left, right)
+        top, bottom = min(top, bottom), max(top, bottom)
+        if left == right or top == bottom:
+            return []
+        first_column, last_column = self._clamped_cells(
+            left, right, self._origin_x, self._num_columns
+        )
+        first_row, last_row = self._clamped_cells(
+            top, bottom, self._origin_y, self._num_rows
+        )
+        candidates: set[int] = set()
+        for row in range(first_row, last_row + 1):
+            row_start = row * self._num_columns
+            for column in range(first_column, last_column + 1):
+                candidates.update(self._cells[row_start + column])
+        bounds = self._bounds
+        return [
+            self._locations[position]
+            for position in sorted(candidates)
+            if bounds[position][0] < right
+            and left < bounds[position][2]
+            and bounds[position][1] < bottom
+            and top < bounds[position][3]
+        ]
+
+    def _clamped_cells(
+        self, start: int, stop: int, origin: int, num_cells: int
+    ) -> tuple[int, int]:
+        """The first and last cells along one axis covering the pixels from start up
+        to, excluding, stop, clamped to the grid."""
+        first = max((start - origin) // self._cell_size, 0)
+        last = min((stop - 1 - origin) // self._cell_size, num_cells - 1)
+        return first, last
+
+    def nearest_location(self, x: int, y: int) -> Optional[RichLocation]:
+        """The location closest to the point, or containing it.
+
+        Distances are measured from the point to the closest pixel of each location.
+        Of equally close locations, the first in the section is returned.  Empty
+        locations are never the nearest, since they cover no pixels.
+        """
+        if not self._cells:
+            return None
+        cell_size = self._cell_size
+        column = (x - self._origin_x) // cell_size
+        row = (y - self._origin_y) // cell_size
+        # the most rings of cells around the point's cell which can overlap the grid
+        max_ring = max(
+            abs(column),
+            abs(self._num_columns - 1 - column),
+            abs(row),
+            abs(self._num_rows - 1 - row),
+        )
+        best: Optional[tuple[int, int]] = None
+        for ring in range(max_ring + 1):
+            # every pixel of a cell in this ring is at least this far from the point
+            if best is not None and (ring - 1) * cell_size > math.sqrt(best[0]):
+                break
+            for position in self._positions_in_ring(column, row, ring):
+                candidate = (self._squared_distance(position, x, y), position)
+                if best is None or candidate < best:
+                    best = candidate
+        return None if best is None else self._locations[best[1]]
+
+    def _positions_in_ring(self, column: int, row: int, ring: int) -> set[int]:
+        """The positions of the locations in the cells exactly ring cells away from the
+        cell at the column and row, in either direction."""
+        positions: set[int] = set()
+        num_columns = self._num_columns
+        first_row, last_row = max(row - ring, 0), min(row + ring, self._num_rows - 1)
+        for ring_row in range(first_row, last_row + 1):
+            if abs(ring_row - row) == ring:
+                # the top or bottom row of the ring
+                ring_columns = range(column - ring, column + ring + 1)
+            else:
+                # only the leftmost and rightmost cells of the ring
+                ring_columns = range(column - ring, column + ring + 1, max(2 * ring, 1))
+            row_start = ring_row * num_columns
+            for ring_column in ring_columns:
+                if 0 <= ring_column < num_columns:
+                    positions.update(self._cells[row_start + ring_column])
+        return positions
+
+    def _squared_distance(self, position: int, x: int, y: int) -> int:
+        left, top, right, bottom = self._bounds[position]
+        # the closest pixel of the location is at most right - 1 and bottom - 1
+        dx = max(left - x, 0, x - (right - 1))
+        dy = max(top - y, 0, y - (bottom - 1))
+        return dx * dx + dy * dy
@@ -1,9 +1,12 @@
 """MRGN - Locations."""
 import dataclasses
+import functools
 
 from ...chk_section_name import ChkSectionName
 from ..rich_chk_section import RichChkSection
+from ..rich_name_index import RichNameIndex
 from .rich_location import RichLocation
+from .rich_location_grid import RichLocationGrid
 
 
 @dataclasses.dataclass(frozen=True)
@@ -18,3 +21,16 @@ class RichMrgnSection(RichChkSection):
     @property
     def locations(self) -> list[RichLocation]:
         return self._locations
+
+    @functools.cached_property
+    def location_grid(self) -> RichLocationGrid:
+        """Find locations by their position, built the first time it is used."""
+        return RichLocationGrid.build(self._locations)
+
+    @functools.cached_property
+    def location_name_index(self) -> RichNameIndex[RichLocation]:
+        """Find locations by their name, built the first time it is used."""
+        return RichNameIndex.build(
+            self._locations,
+            [location.custom_location_name.value for location in self._locations],
+        )
@@ -9,21 +9,88 @@ height (from the DIM section).
 u16[width * height]: Tile values
 """
 import dataclasses
+from array import array
+from typing import Union
 
 from ...chk_section_name import ChkSectionName
 from ..rich_chk_section import RichChkSection
 from .rich_tile import RichTile
+from .rich_tile_sequence import RichTileSequence
 
 
 @dataclasses.dataclass(frozen=True)
 class RichMtxmSection(RichChkSection):
+    """Represent MTXM - Terrain, as a grid of tile IDs.
 
-    _tiles: list[RichTile]
+    RichTile objects are only made for the tiles which are read.
+
+    :param _tile_ids: u16 tile IDs, row by row from the top left corner of the map
+    :param _width: width of the map in tiles, which is the length of every row
+    """
+
+    _tile_ids: "array[int]"
+    _width: int
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.MTXM
 
     @property
-    def tiles(self) -> list[RichTile]:
-        return self._tiles
+    def tiles(self) -> RichTileSequence:
+        return RichTileSequence(self._tile_ids)
+
+    @property
+    def tile_ids(self) -> "array[int]":
+        return self._tile_ids
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return len(self._tile_ids) // self._width if self._width else 0
+
+    def tile_at(self, x: int, y: int) -> RichTile:
+        """The tile in column x of row y, both counted from 0 at the top left."""
+        return RichTile(_id=self._tile_ids[self._index_of(x, y)])
+
+    def row(self, y: int) -> list[RichTile]:
+        """All the tiles of row y, from left to right."""
+        start = self._index_of(0, y)
+        return list(map(RichTile, self._tile_ids[start : start + self._width]))
+
+    def fill_rectangle(
+        self, x: int, y: int, width: int, height: int, tile: Union[RichTile, int]
+    ) -> "RichMtxmSection":
+        """Copy this section with a rectangle of tiles set to the same tile.
+
+        :param x: the left column of the rectangle
+        :param y: the top row of the rectangle
+        :param width: the number of columns of the rectangle
+        :param height: the number of rows of the rectangle
+        :param tile: the tile, or tile ID, to fill the rectangle with
+        :return: a new section; this one is left unchanged
+        """
+        if width < 0 or height < 0:
+            raise ValueError(
+                f"The rectangle size must not be negative, but got {width}x{height}."
+            )
+        tile_ids = self._tile_ids[:]
+        if width and height:
+            self._index_of(x, y)
+            self._index_of(x + width - 1, y + height - 1)
+            tile_id = tile.id if isinstance(tile, RichTile) else tile
+            fill = array("H", [tile_id]) * width
+            for row_start in range(
+                y * self._width + x, (y + height) * self._width, self._width
+            ):
+                tile_ids[row_start : row_start + width] = fill
+        return RichMtxmSection(_tile_ids=tile_ids, _width=self._width)
+
+    def _index_of(self, x: int, y: int) -> int:
+        if not (0 <= x < self._width and 0 <= y < self.height):
+            raise IndexError(
+                f"Tile ({x}, {y}) is outside of the {self._width}x{self.height} map."
+            )
+        return y * self._width + x
@@ -0,0 +1,46 @@
+"""A read-only sequence of RichTile backed by an array of tile IDs.
+
+Maps have up to 65,536 tiles per terrain layer, so a RichTile is only made when it is
+read instead of keeping one object per tile alive.
+"""
+
+from array import array
+from typing import Iterator, Sequence, Union, overload
+
+from .rich_tile import RichTile
+
+
+class RichTileSequence(Sequence[RichTile]):
+    __slots__ = ("_tile_ids",)
+
+    def __init__(self, tile_ids: "array[int]") -> None:
+        self._tile_ids = tile_ids
+
+    def __len__(self) -> int:
+        return len(self._tile_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> RichTile:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RichTile]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[RichTile, list[RichTile]]:
+        if isinstance(index, slice):
+            return list(map(RichTile, self._tile_ids[index]))
+        return RichTile(_id=self._tile_ids[index])
+
+    def __iter__(self) -> Iterator[RichTile]:
+        return map(RichTile, self._tile_ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RichTileSequence):
+            return self._tile_ids == other._tile_ids
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{RichTileSequence.__name__}({len(self)} tiles)"
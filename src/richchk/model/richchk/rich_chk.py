@@ -8,36 +8,75 @@ between rich and decoded representations has not been written.
 
 This mixed data structure format is chosen so it is possible to go directly from a
 RichChk to an edited and saved .scm/.scx map file.
+
+A RichChk decoded by RichChkIo, and every RichChk derived from it with RichChkEditor,
+share a RichChkLineage.  Within a lineage, RichChkIo only re-encodes the sections which
+were replaced since the last encoding.
+
+Sections are looked up by name or type through a ChkSectionIndex built with the RichChk.
+RichChkEditor derives the index of an edited RichChk from the index of the original.
 """
 
 import dataclasses
-import functools
-from collections import defaultdict
-from typing import Union
+from typing import Optional, Type, TypeVar, Union, cast
 
 from ...model.chk_section_name import ChkSectionName
 from ..chk.decoded_chk_section import DecodedChkSection
+from ..chk_section_index import ChkSectionIndex
 from .rich_chk_section import RichChkSection
 
+_T = TypeVar("_T", bound=Union[RichChkSection, DecodedChkSection])
+
+
+class RichChkLineage:
+    """Identifies a decoded RichChk and all the RichChks edited from it."""
+
 
 @dataclasses.dataclass(frozen=True)
 class RichChk:
     _chk_sections: list[Union[RichChkSection, DecodedChkSection]]
+    _lineage: Optional[RichChkLineage] = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+    _section_index: ChkSectionIndex = dataclasses.field(
+        init=False, compare=False, repr=False
+    )
+    # the index of the sections when it is already known, e.g. derived by an editor
+    _prebuilt_section_index: dataclasses.InitVar[Optional[ChkSectionIndex]] = None
+
+    def __post_init__(self, _prebuilt_section_index: Optional[ChkSectionIndex]) -> None:
+        if _prebuilt_section_index is None:
+            _prebuilt_section_index = ChkSectionIndex.build(self._chk_sections)
+        object.__setattr__(self, "_section_index", _prebuilt_section_index)
 
     @property
     def chk_sections(self) -> list[Union[RichChkSection, DecodedChkSection]]:
         return self._chk_sections
 
-    @functools.cached_property
-    def _sections_by_name(
-        self,
-    ) -> dict[ChkSectionName, list[Union[RichChkSection, DecodedChkSection]]]:
-        sections_by_name = defaultdict(list)
-        for section in self._chk_sections:
-            sections_by_name[section.section_name()].append(section)
-        return sections_by_name
+    @property
+    def lineage(self) -> Optional[RichChkLineage]:
+        return self._lineage
+
+    @property
+    def section_index(self) -> ChkSectionIndex:
+        return self._section_index
 
     def get_sections_by_name(
         self, chk_section_name: ChkSectionName
     ) -> list[Union[RichChkSection, DecodedChkSection]]:
-        return self._sections_by_name[chk_section_name]
+        sections = self._chk_sections
+        return [
+            sections[index]
+            for index in self._section_index.indices_of_name(chk_section_name)
+        ]
+
+    def get_sections_by_type(self, section_type: Type[_T]) -> list[_T]:
+        """All the sections which are instances of the type, in order."""
+        sections = self._chk_sections
+        return [
+            cast(_T, sections[index])
+            for index in self._section_index.indices_of_type(section_type)
+        ]
+
+    def contains_section(self, chk_section_name: ChkSectionName) -> bool:
+        return bool(self._section_index.indices_of_name(chk_section_name))
@@ -0,0 +1,151 @@
+"""Find the items of a RichChkSection by their name, either exactly or by the most
+similar name.
+
+Similarity is the ratio of difflib.SequenceMatcher, which is too slow to compute for
+every name on every search.  The index instead orders the names by how many trigrams
+they share with the searched name, and skips every name whose similarity cannot reach
+that of the best name found so far.  The similarity of two names is at most twice the
+length of the shorter name, and at most twice the number of characters they have in
+common, over the sum of their lengths, so a name is only skipped when it cannot match
+better.  The result is therefore the same as computing the similarity of every name.
+"""
+
+import collections
+import dataclasses
+import difflib
+import functools
+from collections.abc import Sequence
+from typing import Generic, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+_TRIGRAM_SIZE = 3
+
+
+@dataclasses.dataclass(frozen=True)
+class RichNameIndex(Generic[_T]):
+    _items: tuple[_T, ...]
+    _names: tuple[str, ...]
+    # the positions of the items with each name, in order
+    _positions_by_name: dict[str, tuple[int, ...]]
+    # the positions of the first item with each distinct name, by the trigrams of that
+    # name; other items with the same name are always as similar and come later
+    _positions_by_trigram: dict[str, tuple[int, ...]]
+    _first_positions: tuple[int, ...]
+    # the number of each character in each name, only for the first positions
+    _character_counts: dict[int, collections.Counter[str]]
+
+    @classmethod
+    def build(cls, items: Sequence[_T], names: Sequence[str]) -> "RichNameIndex[_T]":
+        """:param names: the name of each item, in the same order."""
+        positions_by_name: dict[str, list[int]] = {}
+        for position, name in enumerate(names):
+            positions_by_name.setdefault(name, []).append(position)
+        first_positions = tuple(
+            positions[0] for positions in positions_by_name.values()
+        )
+        positions_by_trigram: dict[str, list[int]] = {}
+        for position in first_positions:
+            for trigram in cls._trigrams(names[position]):
+                positions_by_trigram.setdefault(trigram, []).append(position)
+        return cls(
+            tuple(items),
+            tuple(names),
+            {name: tuple(positions) for name, positions in positions_by_name.items()},
+            {
+                trigram: tuple(positions)
+                for trigram, positions in positions_by_trigram.items()
+            },
+            first_positions,
+            {
+                position: collections.Counter(names[position])
+                for position in first_positions
+            },
+        )
+
+    @staticmethod
+    def _trigrams(name: str) -> set[str]:
+        return {
+            name[start : start + _TRIGRAM_SIZE]
+            for start in range(len(name) - _TRIGRAM_SIZE + 1)
+        }
+
+    @property
+    def items(self) -> tuple[_T, ...]:
+        return self._items
+
+    @functools.cached_property
+    def lowercased(self) -> "RichNameIndex[_T]":
+        """The same items by their lowercase names, built the first time it is used."""
+        return RichNameIndex.build(self._items, [name.lower() for name in self._names])
+
+    def find_by_name(self, name: str) -> list[_T]:
+        """The items with exactly the name, in their order."""
+        return [
+            self._items[position] for position in self._positions_by_name.get(name, ())
+        ]
+
+    def find_most_similar(self, name: str) -> Optional[tuple[float, _T]]:
+        """The item whose name is the most similar to the name, with its similarity, or
+        None if there are no items.
+
+        The similarity is the ratio of a difflib.SequenceMatcher from the name to the
+        name of the item.  Of equally similar items, the first is returned.
+        """
+        exact_positions = self._positions_by_name.get(name)
+        if exact_positions:
+            # only an identical name is fully similar
+            return 1.0, self._items[exact_positions[0]]
+        if not self._items:
+            return None
+        best_similarity = -1.0
+        best_position = -1
+        character_counts = collections.Counter(name)
+        for position in self._positions_by_shared_trigrams(name):
+            other_name = self._names[position]
+            total_length = len(name) + len(other_name)
+            if not self._may_be_better(
+                2.0 * min(len(name), len(other_name)) / total_length,
+                position,
+                best_similarity,
+                best_position,
+            ):
+                continue
+            common_characters = character_counts & self._character_counts[position]
+            if not self._may_be_better(
+                2.0 * sum(common_characters.values()) / total_length,
+                position,
+                best_similarity,
+                best_position,
+            ):
+                continue
+            similarity = difflib.SequenceMatcher(None, name, other_name).ratio()
+            if self._may_be_better(
+                similarity, position, best_similarity, best_position
+            ):
+                best_similarity, best_position = similarity, position
+        return best_similarity, self._items[best_position]
+
+    def _positions_by_shared_trigrams(self, name: str) -> list[int]:
+        """The first positions of every distinct name, those sharing the most trigrams
+        with the name first, so the best names are likely found early."""
+        num_shared_trigrams: collections.Counter[int] = collections.Counter()
+        for trigram in self._trigrams(name):
+            num_shared_trigrams.update(self._positions_by_trigram.get(trigram, ()))
+        ordered_positions = [
+            position for position, _ in num_shared_trigrams.most_common()
+        ]
+        ordered_positions.extend(
+            position
+            for position in self._first_positions
+            if position not in num_shared_trigrams
+        )
+        return ordered_positions
+
+    @staticmethod
+    def _may_be_better(
+        similarity: float, position: int, best_similarity: float, best_position: int
+    ) -> bool:
+        return similarity > best_similarity or (
+            similarity == best_similarity and position < best_position
+        )
@@ -1,6 +1,7 @@
 """Contains all the global CHK context needed to produce RichChk representations."""
 
 import dataclasses
+from typing import Optional
 
 from ...model.richchk.str.rich_str_lookup import RichStrLookup
 from .mrgn.rich_mrgn_lookup import RichMrgnLookup
@@ -20,6 +21,8 @@ class RichChkDecodeContext:
     _rich_cuwp_lookup: RichCuwpLookup = RichCuwpLookup(
         _cuwp_by_id_lookup={}, _id_by_cuwp_lookup={}
     )
+    # width of the map in tiles, from the DIM section
+    _map_width: Optional[int] = None
 
     @property
     def rich_str_lookup(self) -> RichStrLookup:
@@ -36,3 +39,7 @@ class RichChkDecodeContext:
     @property
     def rich_cuwp_lookup(self) -> RichCuwpLookup:
         return self._rich_cuwp_lookup
+
+    @property
+    def map_width(self) -> Optional[int]:
+        return self._map_width
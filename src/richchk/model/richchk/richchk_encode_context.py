@@ -2,7 +2,7 @@
 representations."""
 
 import dataclasses
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 from ...model.richchk.mrgn.rich_mrgn_lookup import RichMrgnLookup
 from ...model.richchk.str.rich_str_lookup import RichStrLookup
@@ -11,6 +11,13 @@ from .uprp.rich_cuwp_lookup import RichCuwpLookup
 from .wav.rich_wav_metadata_lookup import RichWavMetadataLookup
 
 
+def _ids_are_preserved(old_ids: Mapping[Any, int], new_ids: Mapping[Any, int]) -> bool:
+    """Whether every object keeps its ID, unless it is no longer referenced at all."""
+    return old_ids is new_ids or all(
+        new_ids.get(key, old_id) == old_id for key, old_id in old_ids.items()
+    )
+
+
 @dataclasses.dataclass(frozen=True)
 class RichChkEncodeContext:
     _rich_str_lookup: RichStrLookup
@@ -44,3 +51,24 @@ class RichChkEncodeContext:
     @property
     def wav_metadata_lookup(self) -> Optional[RichWavMetadataLookup]:
         return self._wav_metadata_lookup
+
+    def preserves_ids_of(self, old_context: "RichChkEncodeContext") -> bool:
+        """Whether sections encoded with the old context encode the same with this."""
+        return (
+            _ids_are_preserved(
+                old_context.rich_str_lookup._id_by_string_lookup,
+                self.rich_str_lookup._id_by_string_lookup,
+            )
+            and _ids_are_preserved(
+                old_context.rich_mrgn_lookup._id_by_location_lookup,
+                self.rich_mrgn_lookup._id_by_location_lookup,
+            )
+            and _ids_are_preserved(
+                old_context.rich_swnm_lookup._id_by_switch_lookup,
+                self.rich_swnm_lookup._id_by_switch_lookup,
+            )
+            and _ids_are_preserved(
+                old_context.rich_cuwp_lookup._id_by_cuwp_lookup,
+                self.rich_cuwp_lookup._id_by_cuwp_lookup,
+            )
+        )
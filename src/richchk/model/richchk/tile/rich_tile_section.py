@@ -10,21 +10,30 @@ use.
 u16[width * height]: Tile values
 """
 import dataclasses
+from array import array
 
 from ...chk_section_name import ChkSectionName
-from ..mtxm.rich_tile import RichTile
+from ..mtxm.rich_tile_sequence import RichTileSequence
 from ..rich_chk_section import RichChkSection
 
 
 @dataclasses.dataclass(frozen=True)
 class RichTileSection(RichChkSection):
+    """Represent TILE - Terrain (legacy).
 
-    _tiles: list[RichTile]
+    :param _tile_ids: u16 tile IDs, row by row from the top left corner of the map
+    """
+
+    _tile_ids: "array[int]"
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.TILE
 
     @property
-    def tiles(self) -> list[RichTile]:
-        return self._tiles
+    def tiles(self) -> RichTileSequence:
+        return RichTileSequence(self._tile_ids)
+
+    @property
+    def tile_ids(self) -> "array[int]":
+        return self._tile_ids
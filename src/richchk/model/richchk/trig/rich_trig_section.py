@@ -129,89 +129,107 @@ encountered with Action byte as 0 This section can be split. Additional TRIG sec
 will add more triggers.
 """
 
-import array
 import dataclasses
-import sys
-from typing import Any, Optional, cast
+import functools
+from itertools import chain
+from typing import Iterable, Optional, cast
 
 from ...chk_section_name import ChkSectionName
 from ..rich_chk_section import RichChkSection
 from .rich_trigger import RichTrigger
+from .rich_trigger_chunk import RichTriggerChunk
 
-_IS_BIG_ENDIAN: bool = sys.byteorder == "big"
 
-
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, init=False, eq=False)
 class RichTrigSection(RichChkSection):
-    """Represent TRIG section for all trigger data."""
-
-    _triggers: list[RichTrigger]
-    _cond0_amounts_bytes: Optional[bytes] = dataclasses.field(
-        default=None, init=False, compare=False, repr=False, hash=False
-    )
-    _cond0_amounts_hash: int = dataclasses.field(
-        default=0, init=False, compare=False, repr=False, hash=False
-    )
-    _act0_amounts_bytes: Optional[bytes] = dataclasses.field(
-        default=None, init=False, compare=False, repr=False, hash=False
-    )
-    _act0_amounts_hash: int = dataclasses.field(
-        default=0, init=False, compare=False, repr=False, hash=False
-    )
-
-    def __post_init__(self) -> None:
-        ab: Optional[bytes] = None
-        ah: int = 0
-        act_ab: Optional[bytes] = None
-        act_ah: int = 0
-        if self._triggers:
-            try:
-                amt = array.array(
-                    "I",
-                    [cast(Any, t._conditions[0])._amount for t in self._triggers],
-                )
-                if _IS_BIG_ENDIAN:
-                    amt.byteswap()
-                ab = amt.tobytes()
-                ah = hash(ab)
-            except (IndexError, AttributeError, TypeError):
-                pass
-            try:
-                act_amt = array.array(
-                    "I",
-                    [cast(Any, t._actions[0])._amount for t in self._triggers],
-                )
-                if _IS_BIG_ENDIAN:
-                    act_amt.byteswap()
-                act_ab = act_amt.tobytes()
-                act_ah = hash(act_ab)
-            except (IndexError, AttributeError, TypeError):
-                pass
-        object.__setattr__(self, "_cond0_amounts_bytes", ab)
-        object.__setattr__(self, "_cond0_amounts_hash", ah)
-        object.__setattr__(self, "_act0_amounts_bytes", act_ab)
-        object.__setattr__(self, "_act0_amounts_hash", act_ah)
+    """Represent TRIG section for all trigger data.
+
+    The triggers are kept as a tuple of RichTriggerChunk, and the list of all triggers
+    is only made from the chunks when it is read.  Sections made from the chunks of
+    another section, e.g. by RichTrigEditor.add_triggers, share those chunks.  A section
+    is not edited in place, edits make a new section.
+
+    :param _triggers: the triggers of the section, which are split into chunks.
+    :param _trigger_chunks: the chunks of the section, instead of its triggers.
+    """
+
+    _trigger_chunks: tuple[RichTriggerChunk, ...]
+
+    def __init__(
+        self,
+        _triggers: Iterable[RichTrigger] = (),
+        _trigger_chunks: Optional[tuple[RichTriggerChunk, ...]] = None,
+    ) -> None:
+        if _trigger_chunks is None:
+            _trigger_chunks = RichTriggerChunk.split(_triggers)
+        elif _triggers:
+            raise ValueError(
+                "A RichTrigSection is made from either its triggers or its trigger "
+                "chunks, not both."
+            )
+        self.__dict__["_trigger_chunks"] = _trigger_chunks
+
+    @classmethod
+    def from_trigger_chunks(
+        cls, trigger_chunks: tuple[RichTriggerChunk, ...]
+    ) -> "RichTrigSection":
+        return cls(_trigger_chunks=trigger_chunks)
 
     @classmethod
     def section_name(cls) -> ChkSectionName:
         return ChkSectionName.TRIG
 
+    @functools.cached_property
+    def _triggers(self) -> list[RichTrigger]:
+        return list(
+            chain.from_iterable(chunk.triggers for chunk in self._trigger_chunks)
+        )
+
     @property
     def triggers(self) -> list[RichTrigger]:
         return self._triggers
 
     @property
+    def trigger_chunks(self) -> tuple[RichTriggerChunk, ...]:
+        return self._trigger_chunks
+
+    @functools.cached_property
     def cond0_amounts_bytes(self) -> Optional[bytes]:
-        return self._cond0_amounts_bytes
+        return self._join_amounts_bytes(
+            [chunk.cond0_amounts_bytes for chunk in self._trigger_chunks]
+        )
 
-    @property
+    @functools.cached_property
     def cond0_amounts_hash(self) -> int:
-        return self._cond0_amounts_hash
+        amounts_bytes = self.cond0_amounts_bytes
+        return 0 if amounts_bytes is None else hash(amounts_bytes)
 
-    @property
+    @functools.cached_property
     def act0_amounts_bytes(self) -> Optional[bytes]:
-        return self._act0_amounts_bytes
+        return self._join_amounts_bytes(
+            [chunk.act0_amounts_bytes for chunk in self._trigger_chunks]
+        )
 
-    @property
+    @functools.cached_property
     def act0_amounts_hash(self) -> int:
-        return self._act0_amounts_hash
+        amounts_bytes = self.act0_amounts_bytes
+        return 0 if amounts_bytes is None else hash(amounts_bytes)
+
+    @staticmethod
+    def _join_amounts_bytes(
+        amounts_bytes_per_chunk: list[Optional[bytes]],
+    ) -> Optional[bytes]:
+        if not amounts_bytes_per_chunk or None in amounts_bytes_per_chunk:
+            return None
+        return b"".join(cast(list[bytes], amounts_bytes_per_chunk))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RichTrigSection):
+            return NotImplemented
+        return (
+            self._trigger_chunks is other._trigger_chunks
+            or self._triggers == other._triggers
+        )
+
+    def __repr__(self) -> str:
+        return f"RichTrigSection(_triggers={self._triggers!r})"
@@ -0,0 +1,118 @@
+"""An immutable run of consecutive triggers of a RichTrigSection.
+
+A RichTrigSection keeps its triggers as a tuple of chunks, so appending triggers makes
+a section which shares every full chunk with the original.  Each chunk computes its
+amount fingerprints once, the first time they are needed, which makes the fingerprints
+of a section cost only the chunks which are new, and the TRIG encoder caches the encoded
+bytes of each chunk by its content.
+"""
+
+import array
+import dataclasses
+import functools
+import operator
+import sys
+from typing import Any, Callable, Iterable, Optional, cast
+
+from ...chk.trig.decoded_trigger_action import DecodedTriggerAction
+from ...chk.trig.decoded_trigger_condition import DecodedTriggerCondition
+from .rich_trigger import RichTrigger
+
+_IS_BIG_ENDIAN: bool = sys.byteorder == "big"
+
+# decoded conditions and actions are mutable, so their content is their field values
+_DECODED_VALUES_GETTERS: dict[type, Callable[[Any], tuple[int, ...]]] = {
+    decoded_type: operator.attrgetter(
+        *(field.name for field in dataclasses.fields(decoded_type))
+    )
+    for decoded_type in (DecodedTriggerCondition, DecodedTriggerAction)
+}
+
+
+def _content_of(item: Any) -> Any:
+    get_values = _DECODED_VALUES_GETTERS.get(type(item))
+    return item if get_values is None else (type(item), get_values(item))
+
+
+@dataclasses.dataclass(frozen=True)
+class RichTriggerChunk:
+    """At most MAX_NUM_TRIGGERS consecutive triggers."""
+
+    MAX_NUM_TRIGGERS = 256
+
+    _triggers: tuple[RichTrigger, ...]
+
+    @property
+    def triggers(self) -> tuple[RichTrigger, ...]:
+        return self._triggers
+
+    @functools.cached_property
+    def cond0_amounts_bytes(self) -> Optional[bytes]:
+        """The u32 amount of the first condition of each trigger, as CHK bytes.
+
+        None if a trigger has no first condition with an amount.
+        """
+        try:
+            return self._amounts_bytes(
+                [cast(Any, t._conditions[0])._amount for t in self._triggers]
+            )
+        except (IndexError, AttributeError, TypeError):
+            return None
+
+    @functools.cached_property
+    def act0_amounts_bytes(self) -> Optional[bytes]:
+        """The u32 amount of the first action of each trigger, as CHK bytes.
+
+        None if a trigger has no first action with an amount.
+        """
+        try:
+            return self._amounts_bytes(
+                [cast(Any, t._actions[0])._amount for t in self._triggers]
+            )
+        except (IndexError, AttributeError, TypeError):
+            return None
+
+    def content(self) -> tuple[Any, ...]:
+        """The conditions, actions and players of each trigger, as they are now.
+
+        Equal chunks have equal content, even if their triggers are different objects.
+        The content is not cached, because decoded conditions and actions can be edited
+        in place.
+        """
+        return tuple(
+            (
+                tuple(map(_content_of, t._conditions)),
+                tuple(map(_content_of, t._actions)),
+                t._players,
+            )
+            for t in self._triggers
+        )
+
+    @staticmethod
+    def _amounts_bytes(amounts: list[int]) -> bytes:
+        amounts_array = array.array("I", amounts)
+        if _IS_BIG_ENDIAN:
+            amounts_array.byteswap()
+        return amounts_array.tobytes()
+
+    @classmethod
+    def split(cls, triggers: Iterable[RichTrigger]) -> tuple["RichTriggerChunk", ...]:
+        """Split triggers into full chunks, followed by at most one partial chunk."""
+        return cls.append((), triggers)
+
+    @classmethod
+    def append(
+        cls, chunks: tuple["RichTriggerChunk", ...], triggers: Iterable[RichTrigger]
+    ) -> tuple["RichTriggerChunk", ...]:
+        """Append triggers to chunks, sharing every chunk but a partial last one."""
+        new_triggers = tuple(triggers)
+        if not new_triggers:
+            return chunks
+        max_num_triggers = cls.MAX_NUM_TRIGGERS
+        if chunks and len(chunks[-1]._triggers) < max_num_triggers:
+            new_triggers = chunks[-1]._triggers + new_triggers
+            chunks = chunks[:-1]
+        return chunks + tuple(
+            cls(_triggers=new_triggers[start : start + max_num_triggers])
+            for start in range(0, len(new_triggers), max_num_triggers)
+        )
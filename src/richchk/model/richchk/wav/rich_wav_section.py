@@ -5,9 +5,12 @@ Contains only WAV entries that are used or referenced in trigger data.
 Do not edit this section directly.  Instead, first add WAV files through Stormlib APIs.
 """
 import dataclasses
+import functools
+import os
 
 from ...chk_section_name import ChkSectionName
 from ..rich_chk_section import RichChkSection
+from ..rich_name_index import RichNameIndex
 from .rich_wav import RichWav
 
 
@@ -23,3 +26,16 @@ class RichWavSection(RichChkSection):
     @property
     def wavs(self) -> list[RichWav]:
         return self._wavs
+
+    @functools.cached_property
+    def wav_basename_index(self) -> RichNameIndex[RichWav]:
+        """Find WAV files by the basename of their path, built the first time it is
+        used."""
+        # files in MPQ stored with Windows style paths
+        return RichNameIndex.build(
+            self._wavs,
+            [
+                os.path.basename(wav.path_in_chk.value.replace("\\", os.sep))
+                for wav in self._wavs
+            ],
+        )
@@ -5,6 +5,7 @@ See: http://www.zezula.net/en/mpq/stormlib/sfilefindfirstfile.html
 import ctypes
 from ctypes import POINTER
 
+from ...model.mpq.stormlib.search.stormlib_file_entry import StormLibFileEntry
 from ...model.mpq.stormlib.search.stormlib_file_search_errors import (
     FailedToCloseSearchHandleException,
     NoFileFoundMatchingPatternException,
@@ -45,24 +46,39 @@ class StormLibFileSearcher:
         :param search_pattern: Name of the search mask. "*" will return all files.
         :return:
         """
-        matching_filepaths = []
+        return [
+            entry.path_in_mpq
+            for entry in self.find_all_file_entries_matching_pattern(search_pattern)
+        ]
+
+    def find_all_file_entries_matching_pattern(
+        self, search_pattern: str
+    ) -> list[StormLibFileEntry]:
+        """Finds the archive table entries of all files matching the given pattern.
+
+        :param search_pattern: Name of the search mask. "*" will return all files.
+        :return:
+        """
+        matching_entries = []
         try:
             file_search_wrapper = self._find_first_file_matching_pattern(search_pattern)
-            matching_filepaths.append(
-                file_search_wrapper.search_result.cFileName.decode("utf-8")
+            matching_entries.append(
+                StormLibFileEntry.from_search_result(file_search_wrapper.search_result)
             )
             while True:
                 try:
                     next_search_result = self._find_next_file(file_search_wrapper)
-                    matching_filepaths.append(
-                        next_search_result.search_result.cFileName.decode("utf-8")
+                    matching_entries.append(
+                        StormLibFileEntry.from_search_result(
+                            next_search_result.search_result
+                        )
                     )
                 except NoMoreMatchingFilesFoundException:
                     break
             self._close_file_search(file_search_wrapper)
         except NoFileFoundMatchingPatternException:
             pass
-        return matching_filepaths
+        return matching_entries
 
     def _find_first_file_matching_pattern(
         self, search_pattern: str
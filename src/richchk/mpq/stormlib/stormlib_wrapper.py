@@ -9,7 +9,7 @@ import ctypes
 import os
 import platform
 from ctypes import POINTER
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from ...model.mpq.stormlib.stormlib_archive_mode import StormLibArchiveMode
 from ...model.mpq.stormlib.stormlib_flag import StormLibFlag
@@ -168,6 +168,257 @@ class StormLibWrapper:
             _handle=stormlib_operation_result.handle, _result=result
         )
 
+    def open_file(
+        self,
+        stormlib_operation_result: StormLibOperationResult,
+        path_to_file_in_archive: str,
+    ) -> StormLibOperationResult:
+        """Opens a file in the opened MPQ archive for reading, returning its handle.
+
+        The file must be closed with close_file once done.
+
+        :param stormlib_operation_result: the result of opening the archive.
+        :param path_to_file_in_archive:
+        :return:
+        """
+        file_handle = StormLibMpqHandle()
+        func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_OPEN_FILE_EX.value
+        )
+        func.restype = ctypes.c_bool
+        func.argtypes = [
+            StormLibMpqHandle,
+            ctypes.c_char_p,
+            ctypes.c_uint,
+            POINTER(StormLibMpqHandle),
+        ]
+        result: int = func(
+            stormlib_operation_result.handle,
+            path_to_file_in_archive.encode(_STORMLIB_STRING_ARG_ENCODING),
+            StormLibFlag.SFILE_OPEN_FROM_MPQ.value,
+            ctypes.byref(file_handle),
+        )
+        self._throw_if_operation_fails(
+            StormLibOperation.S_FILE_OPEN_FILE_EX.value, result
+        )
+        return StormLibOperationResult(_handle=file_handle, _result=result)
+
+    def read_file(
+        self, open_file_result: StormLibOperationResult, max_bytes: Optional[int] = None
+    ) -> bytes:
+        """Reads the content of a file opened with open_file.
+
+        :param open_file_result: the result of opening the file.
+        :param max_bytes: only read up to this many bytes from the start of the file,
+            e.g. to parse a header without decompressing the whole file.
+        :return:
+        """
+        get_size_func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_GET_FILE_SIZE.value
+        )
+        get_size_func.restype = ctypes.c_uint32
+        get_size_func.argtypes = [StormLibMpqHandle, POINTER(ctypes.c_uint32)]
+        file_size: int = get_size_func(open_file_result.handle, None)
+        if file_size == StormLibFlag.SFILE_INVALID_SIZE.value:
+            self._throw_if_operation_fails(
+                StormLibOperation.S_FILE_GET_FILE_SIZE.value, 0
+            )
+        if max_bytes is not None:
+            file_size = min(file_size, max_bytes)
+        buffer = ctypes.create_string_buffer(file_size)
+        bytes_read = ctypes.c_uint32(0)
+        func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_READ_FILE.value
+        )
+        func.restype = ctypes.c_bool
+        func.argtypes = [
+            StormLibMpqHandle,
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+            POINTER(ctypes.c_uint32),
+            ctypes.c_void_p,
+        ]
+        result: int = func(
+            open_file_result.handle, buffer, file_size, ctypes.byref(bytes_read), None
+        )
+        self._throw_if_operation_fails(StormLibOperation.S_FILE_READ_FILE.value, result)
+        return buffer.raw[: bytes_read.value]
+
+    def close_file(
+        self, open_file_result: StormLibOperationResult
+    ) -> StormLibOperationResult:
+        """Closes a file opened with open_file.
+
+        :param open_file_result: the result of opening the file.
+        :return:
+        """
+        func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_CLOSE_FILE.value
+        )
+        func.restype = ctypes.c_bool
+        func.argtypes = [StormLibMpqHandle]
+        result: int = func(open_file_result.handle)
+        self._throw_if_operation_fails(
+            StormLibOperation.S_FILE_CLOSE_FILE.value, result
+        )
+        return StormLibOperationResult(_handle=open_file_result.handle, _result=result)
+
+    def create_file(
+        self,
+        stormlib_operation_result: StormLibOperationResult,
+        path_to_file_in_archive: str,
+        file_size: int,
+        overwrite_existing: bool = False,
+    ) -> StormLibOperationResult:
+        """Creates a new compressed file in an archive open in write mode, returning
+        its handle.
+
+        Exactly file_size bytes must then be written with write_file before the file
+        is completed with finish_file.  The same list file limitations as add_file
+        apply.
+
+        :param stormlib_operation_result: the result of opening the archive.
+        :param path_to_file_in_archive:
+        :param file_size: the size of the file, in bytes.
+        :param overwrite_existing:
+        :return:
+        """
+        flags = StormLibFlag.MPQ_FILE_COMPRESS.value
+        if overwrite_existing:
+            flags += StormLibFlag.MPQ_FILE_REPLACEEXISTING.value
+        file_handle = StormLibMpqHandle()
+        func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_CREATE_FILE.value
+        )
+        func.restype = ctypes.c_bool
+        func.argtypes = [
+            StormLibMpqHandle,
+            ctypes.c_char_p,
+            ctypes.c_uint64,
+            ctypes.c_uint32,
+            ctypes.c_uint32,
+            ctypes.c_uint32,
+            POINTER(StormLibMpqHandle),
+        ]
+        result: int = func(
+            stormlib_operation_result.handle,
+            path_to_file_in_archive.encode(_STORMLIB_STRING_ARG_ENCODING),
+            0,
+            file_size,
+            StormLibFlag.LANG_NEUTRAL.value,
+            flags,
+            ctypes.byref(file_handle),
+        )
+        self._throw_if_operation_fails(
+            StormLibOperation.S_FILE_CREATE_FILE.value, result
+        )
+        return StormLibOperationResult(_handle=file_handle, _result=result)
+
+    def write_file(
+        self, create_file_result: StormLibOperationResult, data: bytes
+    ) -> StormLibOperationResult:
+        """Writes data to a file created with create_file, compressing it with zlib.
+
+        :param create_file_result: the result of creating the file.
+        :param data:
+        :return:
+        """
+        func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_WRITE_FILE.value
+        )
+        func.restype = ctypes.c_bool
+        func.argtypes = [
+            StormLibMpqHandle,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+            ctypes.c_uint32,
+        ]
+        result: int = func(
+            create_file_result.handle,
+            data,
+            len(data),
+            StormLibFlag.MPQ_COMPRESSION_ZLIB.value,
+        )
+        self._throw_if_operation_fails(
+            StormLibOperation.S_FILE_WRITE_FILE.value, result
+        )
+        return StormLibOperationResult(
+            _handle=create_file_result.handle, _result=result
+        )
+
+    def finish_file(
+        self, create_file_result: StormLibOperationResult
+    ) -> StormLibOperationResult:
+        """Completes and closes a file created with create_file.
+
+        :param create_file_result: the result of creating the file.
+        :return:
+        """
+        func = getattr(
+            self._stormlib.stormlib_dll, StormLibOperation.S_FILE_FINISH_FILE.value
+        )
+        func.restype = ctypes.c_bool
+        func.argtypes = [StormLibMpqHandle]
+        result: int = func(create_file_result.handle)
+        self._throw_if_operation_fails(
+            StormLibOperation.S_FILE_FINISH_FILE.value, result
+        )
+        return StormLibOperationResult(
+            _handle=create_file_result.handle, _result=result
+        )
+
+    def extract_file_bytes(
+        self,
+        stormlib_operation_result: StormLibOperationResult,
+        path_to_file_in_archive: str,
+        max_bytes: Optional[int] = None,
+    ) -> bytes:
+        """Reads a file of the opened MPQ archive straight into memory.
+
+        :param stormlib_operation_result: the result of opening the archive.
+        :param path_to_file_in_archive:
+        :param max_bytes: only read up to this many bytes from the start of the file.
+        :return:
+        """
+        open_file_result = self.open_file(
+            stormlib_operation_result, path_to_file_in_archive
+        )
+        try:
+            return self.read_file(open_file_result, max_bytes=max_bytes)
+        finally:
+            self.close_file(open_file_result)
+
+    def add_file_bytes(
+        self,
+        stormlib_operation_result: StormLibOperationResult,
+        data: bytes,
+        path_to_file_in_archive: str,
+        overwrite_existing: bool = False,
+    ) -> StormLibOperationResult:
+        """Add in-memory data to the archive as a file with the given name.
+
+        This is the in-memory counterpart of add_file, with the same limitations.
+
+        :param stormlib_operation_result: the result of opening the archive.
+        :param data:
+        :param path_to_file_in_archive:
+        :param overwrite_existing:
+        :return:
+        """
+        self._log.info(f"adding {len(data)} bytes to {path_to_file_in_archive}")
+        create_file_result = self.create_file(
+            stormlib_operation_result,
+            path_to_file_in_archive,
+            len(data),
+            overwrite_existing=overwrite_existing,
+        )
+        self.write_file(create_file_result, data)
+        finish_file_result = self.finish_file(create_file_result)
+        return StormLibOperationResult(
+            _handle=stormlib_operation_result.handle,
+            _result=finish_file_result.result,
+        )
+
     def compact_archive(
         self, stormlib_operation_result: StormLibOperationResult
     ) -> StormLibOperationResult:
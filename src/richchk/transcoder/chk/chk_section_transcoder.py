@@ -11,6 +11,13 @@ from ...transcoder.chk.strings_common import _STRING_ENCODING
 _T = TypeVar("_T", bound=DecodedChkSection, contravariant=True)
 
 
+class ChkSectionSink(Protocol):
+    """Where encoded sections are written, e.g. an open file, a BytesIO or an mmap."""
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> Any:
+        raise NotImplementedError
+
+
 @runtime_checkable
 class ChkSectionTranscoder(Protocol[_T]):
     def __call__(self, *args: list[Any], **kwargs: dict[str, Any]) -> Any:
@@ -31,6 +38,22 @@ class ChkSectionTranscoder(Protocol[_T]):
             )
         return chk_binary_data
 
+    def encode_into(self, decoded_chk_section: _T, sink: ChkSectionSink) -> int:
+        """Write the encoded section, header included, into a sink.
+
+        Transcoders of large sections override this to write their data in chunks
+        rather than encoding the whole section in memory first.
+
+        :return: the number of bytes written
+        """
+        chk_binary_data = self._encode(decoded_chk_section)
+        header = self.encode_chk_section_header(
+            decoded_chk_section.section_name(), len(chk_binary_data)
+        )
+        sink.write(header)
+        sink.write(chk_binary_data)
+        return len(header) + len(chk_binary_data)
+
     @abstractmethod
     def _encode(self, decoded_chk_section: _T) -> bytes:
         raise NotImplementedError
@@ -3,7 +3,14 @@
 from typing import Any, ClassVar, Optional, Type, Union
 
 from ...model.chk_section_name import ChkSectionName
-from ...util.subpackages_importer import import_all_modules_in_subpackage
+from ...util.subpackages_importer import (
+    import_all_manifest_modules,
+    import_manifest_module,
+)
+from ..transcoder_manifest import (
+    CHK_SECTION_TRANSCODER_MODULES,
+    CHK_SECTION_TRANSCODERS_PACKAGE,
+)
 from .chk_section_transcoder import ChkSectionTranscoder
 
 
@@ -29,6 +36,13 @@ class ChkSectionTranscoderFactory:
         cached = cls._instances.get(chk_section_name)
         if cached is not None:
             return cached
+        if chk_section_name not in cls.transcoders:
+            # importing the transcoder module registers it with the factory
+            import_manifest_module(
+                CHK_SECTION_TRANSCODERS_PACKAGE,
+                CHK_SECTION_TRANSCODER_MODULES,
+                chk_section_name.name,
+            )
         try:
             maybe_transcoder: Union[
                 ChkSectionTranscoder[Any], _RegistrableTranscoder
@@ -54,14 +68,14 @@ class ChkSectionTranscoderFactory:
 
     @classmethod
     def get_all_registered_chk_section_names(cls) -> list[ChkSectionName]:
+        import_all_manifest_modules(
+            CHK_SECTION_TRANSCODERS_PACKAGE, CHK_SECTION_TRANSCODER_MODULES
+        )
         return [x for x in cls.transcoders.keys()]
 
-
-# import all transcoder to register with the factory
-# must happen after factory definition; otherwise causes circular import error
-_THIS_MODULE_PARENT_PACKAGE_NAME = ".transcoder.chk"
-_TRANSCODERS_SUBPACKAGE_NAME = "transcoders"
-
-import_all_modules_in_subpackage(
-    _THIS_MODULE_PARENT_PACKAGE_NAME, _TRANSCODERS_SUBPACKAGE_NAME
-)
+    @classmethod
+    def supports_transcoding_chk_section(cls, chk_section_name: ChkSectionName) -> bool:
+        return (
+            chk_section_name in cls.transcoders
+            or chk_section_name.name in CHK_SECTION_TRANSCODER_MODULES
+        )
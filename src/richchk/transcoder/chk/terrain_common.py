@@ -0,0 +1,21 @@
+"""Decode and encode the flat u16 arrays of the terrain sections MTXM, TILE and ISOM."""
+import sys
+from array import array
+
+# typed arrays are native-endian, while the CHK is little-endian
+_SWAP_BYTES: bool = sys.byteorder != "little"
+
+
+def _decode_u16_array(chk_section_binary_data: bytes) -> "array[int]":
+    values = array("H")
+    values.frombytes(chk_section_binary_data)
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values
+
+
+def _encode_u16_array(values: "array[int]") -> bytes:
+    if _SWAP_BYTES:
+        values = array("H", values)
+        values.byteswap()
+    return values.tobytes()
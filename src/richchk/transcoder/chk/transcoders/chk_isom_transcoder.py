@@ -3,11 +3,10 @@
 Flat array of u16 values.  Total count is ((width/2 + 1) * (height + 1)) * 4.
 """
 
-import struct
-
 from ....model.chk.isom.decoded_isom_section import DecodedIsomSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
+from ....transcoder.chk.terrain_common import _decode_u16_array, _encode_u16_array
 
 
 class ChkIsomTranscoder(
@@ -16,10 +15,7 @@ class ChkIsomTranscoder(
     chk_section_name=DecodedIsomSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedIsomSection:
-        num_values = len(chk_section_binary_data) // 2
-        data = struct.unpack(f"{num_values}H", chk_section_binary_data)
-        return DecodedIsomSection(_data=data)
+        return DecodedIsomSection(_data=_decode_u16_array(chk_section_binary_data))
 
     def _encode(self, decoded_chk_section: DecodedIsomSection) -> bytes:
-        data = decoded_chk_section.data
-        return struct.pack(f"{len(data)}H", *data)
+        return _encode_u16_array(decoded_chk_section.data)
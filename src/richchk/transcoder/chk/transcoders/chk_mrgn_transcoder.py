@@ -41,16 +41,31 @@ Note that in typical locations Right is always larger than Left and Bottom is al
 larger than Top. However, you can reverse one or both of these for Inverted Locations.
 """
 
+import functools
+import itertools
+import operator
 import struct
-from io import BytesIO
 
-from ....model.chk.mrgn.decoded_location import DecodedLocation
+from ....model.chk.mrgn.decoded_location import LOCATION_STRUCT
 from ....model.chk.mrgn.decoded_mrgn_section import DecodedMrgnSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
 
-_LOCATION_STRUCT = struct.Struct("IIIIHH")
-_LOCATION_SIZE = _LOCATION_STRUCT.size
+# the fields of a location in the order they are stored in the CHK
+_LOCATION_VALUES = operator.attrgetter(
+    "_left_x1",
+    "_top_y1",
+    "_right_x2",
+    "_bottom_y2",
+    "_string_id",
+    "_elevation_flags",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_locations_struct(num_locations: int) -> struct.Struct:
+    """The layout of a whole MRGN section, which only ever has 64 or 255 locations."""
+    return struct.Struct("<" + LOCATION_STRUCT.format[1:] * num_locations)
 
 
 class ChkMrgnTranscoder(
@@ -59,45 +74,14 @@ class ChkMrgnTranscoder(
     chk_section_name=DecodedMrgnSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedMrgnSection:
-        bytes_stream: BytesIO = BytesIO(chk_section_binary_data)
-        locations: list[DecodedLocation] = []
-        index = 0
-        while bytes_stream.tell() != len(chk_section_binary_data):
-            left_x1 = struct.unpack("I", bytes_stream.read(4))[0]
-            top_y1 = struct.unpack("I", bytes_stream.read(4))[0]
-            right_x2 = struct.unpack("I", bytes_stream.read(4))[0]
-            bottom_y2 = struct.unpack("I", bytes_stream.read(4))[0]
-            string_id = struct.unpack("H", bytes_stream.read(2))[0]
-            elevation_flags = struct.unpack("H", bytes_stream.read(2))[0]
-            locations.append(
-                DecodedLocation(
-                    _left_x1=left_x1,
-                    _top_y1=top_y1,
-                    _right_x2=right_x2,
-                    _bottom_y2=bottom_y2,
-                    _string_id=string_id,
-                    _elevation_flags=elevation_flags,
-                )
-            )
-            index += 1
-        return DecodedMrgnSection(_locations=locations)
+        # the locations are only decoded when they are read
+        return DecodedMrgnSection.from_binary_data(bytes(chk_section_binary_data))
 
     def _encode(self, decoded_chk_section: DecodedMrgnSection) -> bytes:
+        unread_binary_data = decoded_chk_section.unread_binary_data
+        if unread_binary_data is not None:
+            return unread_binary_data
         locations = decoded_chk_section.locations
-        n = len(locations)
-        buf = bytearray(n * _LOCATION_SIZE)
-        pack_into = _LOCATION_STRUCT.pack_into
-        offset = 0
-        for loc in locations:
-            pack_into(
-                buf,
-                offset,
-                loc.left_x1,
-                loc.top_y1,
-                loc.right_x2,
-                loc.bottom_y2,
-                loc.string_id,
-                loc.elevation_flags,
-            )
-            offset += _LOCATION_SIZE
-        return bytes(buf)
+        return _make_locations_struct(len(locations)).pack(
+            *itertools.chain.from_iterable(map(_LOCATION_VALUES, locations))
+        )
@@ -9,11 +9,10 @@ height (from the DIM section).
 u16[width * height]: Tile values
 """
 
-import struct
-
 from ....model.chk.mtxm.decoded_mtxm_section import DecodedMtxmSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
+from ....transcoder.chk.terrain_common import _decode_u16_array, _encode_u16_array
 
 
 class ChkMtxmTranscoder(
@@ -22,10 +21,7 @@ class ChkMtxmTranscoder(
     chk_section_name=DecodedMtxmSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedMtxmSection:
-        num_tiles = len(chk_section_binary_data) // 2
-        tiles = struct.unpack("<{}H".format(num_tiles), chk_section_binary_data)
-        return DecodedMtxmSection(_tiles=tiles)
+        return DecodedMtxmSection(_tiles=_decode_u16_array(chk_section_binary_data))
 
     def _encode(self, decoded_chk_section: DecodedMtxmSection) -> bytes:
-        num_tiles = len(decoded_chk_section.tiles)
-        return struct.pack("<{}H".format(num_tiles), *decoded_chk_section.tiles)
+        return _encode_u16_array(decoded_chk_section.tiles)
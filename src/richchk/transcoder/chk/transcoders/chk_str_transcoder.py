@@ -30,7 +30,6 @@ non-empty string values.
 """
 
 import struct
-from io import BytesIO
 
 from ....model.chk.str.decoded_str_section import DecodedStrSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
@@ -44,30 +43,20 @@ class ChkStrTranscoder(
     chk_section_name=DecodedStrSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedStrSection:
-        bytes_stream: BytesIO = BytesIO(chk_section_binary_data)
-        num_strings: int = struct.unpack("H", bytes_stream.read(2))[0]
+        num_strings: int = struct.unpack_from("H", chk_section_binary_data)[0]
 
         # Read all offsets at once
         string_offsets = list(
-            struct.unpack(f"{num_strings}H", bytes_stream.read(num_strings * 2))
+            struct.unpack_from(f"{num_strings}H", chk_section_binary_data, 2)
         )
 
-        strings: list[str] = []
         # there can be more offsets than actual string data,
         # means some offsets reference the same string!
-        current_string = bytearray()
-        while bytes_stream.tell() != len(chk_section_binary_data):
-            char = bytes_stream.read(1)
-            if char == b"\0":  # Null terminator
-                strings.append(current_string.decode(_STRING_ENCODING))
-                current_string = bytearray()
-            else:
-                current_string.extend(char)
-
-        return DecodedStrSection(
-            _number_of_strings=num_strings,
-            _string_offsets=string_offsets,
-            _strings=strings,
+        # the strings are split at their null terminators only when they are read
+        return DecodedStrSection.from_binary_data(
+            number_of_strings=num_strings,
+            string_offsets=string_offsets,
+            binary_data=bytes(chk_section_binary_data),
         )
 
     def _encode(self, decoded_chk_section: DecodedStrSection) -> bytes:
@@ -1,7 +1,6 @@
 """Decode and encode the STRx section which contains all strings in the CHK file."""
 
 import struct
-from io import BytesIO
 
 from ....model.chk.strx.decoded_strx_section import DecodedStrxSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
@@ -15,27 +14,20 @@ class ChkStrxTranscoder(
     chk_section_name=DecodedStrxSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedStrxSection:
-        bytes_stream: BytesIO = BytesIO(chk_section_binary_data)
-        num_strings: int = struct.unpack("I", bytes_stream.read(4))[0]
+        num_strings: int = struct.unpack_from("I", chk_section_binary_data)[0]
+
         # Read all offsets at once
         string_offsets = list(
-            struct.unpack(f"{num_strings}I", bytes_stream.read(num_strings * 4))
+            struct.unpack_from(f"{num_strings}I", chk_section_binary_data, 4)
         )
-        strings: list[str] = []
-        # Read bytes until null byte, then decode the full byte sequence
-        current_string = bytearray()
-        while bytes_stream.tell() != len(chk_section_binary_data):
-            char = bytes_stream.read(1)
-            if char == b"\0":  # Null terminator
-                strings.append(current_string.decode(_STRING_ENCODING))
-                current_string = bytearray()
-            else:
-                current_string.extend(char)
 
-        return DecodedStrxSection(
-            _number_of_strings=num_strings,
-            _string_offsets=string_offsets,
-            _strings=strings,
+        # there can be more offsets than actual string data,
+        # means some offsets reference the same string!
+        # the strings are split at their null terminators only when they are read
+        return DecodedStrxSection.from_binary_data(
+            number_of_strings=num_strings,
+            string_offsets=string_offsets,
+            binary_data=bytes(chk_section_binary_data),
         )
 
     def _encode(self, decoded_chk_section: DecodedStrxSection) -> bytes:
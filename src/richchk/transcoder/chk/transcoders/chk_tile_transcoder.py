@@ -10,11 +10,10 @@ maps.
 u16[width * height]: Tile values
 """
 
-import struct
-
 from ....model.chk.tile.decoded_tile_section import DecodedTileSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
+from ....transcoder.chk.terrain_common import _decode_u16_array, _encode_u16_array
 
 
 class ChkTileTranscoder(
@@ -23,10 +22,7 @@ class ChkTileTranscoder(
     chk_section_name=DecodedTileSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedTileSection:
-        num_tiles = len(chk_section_binary_data) // 2
-        tiles = struct.unpack("<{}H".format(num_tiles), chk_section_binary_data)
-        return DecodedTileSection(_tiles=tiles)
+        return DecodedTileSection(_tiles=_decode_u16_array(chk_section_binary_data))
 
     def _encode(self, decoded_chk_section: DecodedTileSection) -> bytes:
-        num_tiles = len(decoded_chk_section.tiles)
-        return struct.pack("<{}H".format(num_tiles), *decoded_chk_section.tiles)
+        return _encode_u16_array(decoded_chk_section.tiles)
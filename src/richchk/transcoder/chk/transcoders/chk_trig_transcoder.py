@@ -128,64 +128,58 @@ executed, trigger execution ends when this is 64 (Max Actions) or an action is
 encountered with Action byte as 0 This section can be split. Additional TRIG sections
 will add more triggers.
 """
+import functools
 import struct
+import sys
+from array import array
 from io import BytesIO
-from typing import Any, ClassVar
+from typing import Callable, ClassVar, Sequence, Union
 
 from ....model.chk.trig.decoded_player_execution import DecodedPlayerExecution
+from ....model.chk.trig.decoded_trig_columns import DecodedTrigColumns, TrigColumn
 from ....model.chk.trig.decoded_trig_section import DecodedTrigSection
 from ....model.chk.trig.decoded_trigger import DecodedTrigger
 from ....model.chk.trig.decoded_trigger_action import DecodedTriggerAction
 from ....model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
-from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
+from ....transcoder.chk.chk_section_transcoder import (
+    ChkSectionSink,
+    ChkSectionTranscoder,
+)
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
+from ....transcoder.chk.trigger_layout_codec import _TriggerLayoutCodec
 
 
 class ChkTrigTranscoder(
     ChkSectionTranscoder[DecodedTrigSection],
     _RegistrableTranscoder,
+    _TriggerLayoutCodec,
     chk_section_name=DecodedTrigSection.section_name(),
 ):
-    # Counts of elements
-    _NUM_CONDITIONS_PER_TRIGGER = 16
-    _NUM_ACTIONS_PER_TRIGGER = 64
-    _NUM_PLAYER_EXECUTION_IDS = 27
-
-    # Byte sizes for each component
-    _NUM_BYTES_PER_CONDITION = 20  # 3*4 + 2 + 4*1 + 2
-    _NUM_BYTES_PER_ACTION = 32  # 6*4 + 2 + 3*1 + 1 + 2
-    _NUM_BYTES_PER_PLAYER_EXECUTION = 32  # 4 + 27*1 + 1
-    _NUM_BYTES_PER_TRIGGER = (
-        _NUM_BYTES_PER_CONDITION * _NUM_CONDITIONS_PER_TRIGGER
-        + _NUM_BYTES_PER_ACTION * _NUM_ACTIONS_PER_TRIGGER
-        + _NUM_BYTES_PER_PLAYER_EXECUTION
-    )
-
-    # Values per struct
-    # location_id, group, quantity, unit_id, numeric_comparison_operation, condition_id,
-    # numeric_comparand_type, flags, mask_flag
-    _NUM_VALUES_PER_CONDITION = 9
-
-    # location_id, text_string_id, wav_string_id, time, first_group, second_group,
-    # action_argument_type, action_id, quantifier_or_switch_or_order, flags, padding, mask_flag
-    _NUM_VALUES_PER_ACTION = 12
-
-    # Format strings for struct packing
-    _CONDITION_FORMAT = "3I H 4B H"  # 20 bytes: 3*4 + 2 + 4*1 + 2
-    _ACTION_FORMAT = "6I H 3B B H"  # 32 bytes: 6*4 + 2 + 3*1 + 1 + 2
-    _PLAYER_EXECUTION_FORMAT = "I 27B B"  # 32 bytes: 4 + 27*1 + 1
-
-    # Bulk format strings for decoding multiple items at once
-    _ALL_CONDITIONS_FORMAT = (
-        _CONDITION_FORMAT * _NUM_CONDITIONS_PER_TRIGGER
-    )  # 16 conditions
-    _ALL_ACTIONS_FORMAT = _ACTION_FORMAT * _NUM_ACTIONS_PER_TRIGGER  # 64 actions
-
-    # Cache: id(DecodedPlayerExecution) → pre-packed 32-byte bytes.
-    # PE objects are permanent (held in _player_execution_cache), so id() is stable.
-    _pe_bytes_cache: ClassVar[dict[Any, Any]] = {}
+    # Triggers encoded at once by encode_into, about 600 KB per chunk
+    _NUM_TRIGGERS_PER_ENCODED_CHUNK = 256
+
+    # Typed arrays are native-endian, while the CHK is little-endian
+    _SWAP_COLUMN_BYTES: ClassVar[bool] = sys.byteorder != "little"
+
+    def __init__(self, vectorized: bool = True, columnar: bool = True):
+        """
+        :param vectorized: if True, decode the whole section in a single
+            struct.iter_unpack pass and skip trailing empty condition and action slots.
+            If False, decode one trigger at a time and keep all 16 conditions and 64
+            actions of every trigger.  Only used when columnar is False.
+        :param columnar: if True, decode into a DecodedTrigSection backed by one typed
+            array per field (DecodedTrigColumns) rather than DecodedTrigger objects.
+        """
+        self._vectorized = vectorized
+        self._columnar = columnar
 
     def decode(self, chk_section_binary_data: bytes) -> DecodedTrigSection:
+        if self._columnar:
+            return DecodedTrigSection.from_columns(
+                self._decode_columns(chk_section_binary_data)
+            )
+        if self._vectorized:
+            return self._decode_vectorized(chk_section_binary_data)
         num_triggers = len(chk_section_binary_data) // self._NUM_BYTES_PER_TRIGGER
         triggers = []
 
@@ -198,6 +192,97 @@ class ChkTrigTranscoder(
             )
         return DecodedTrigSection(_triggers=triggers)
 
+    @classmethod
+    def _decode_vectorized(cls, chk_section_binary_data: bytes) -> DecodedTrigSection:
+        return DecodedTrigSection(
+            _triggers=cls._decode_triggers(chk_section_binary_data)
+        )
+
+    @classmethod
+    def _decode_columns(
+        cls, chk_section_binary_data: Union[bytes, memoryview]
+    ) -> DecodedTrigColumns:
+        """Split the section into one typed array per field with strided byte copies.
+
+        The conditions, actions and player executions of every trigger are first
+        gathered into three contiguous blobs of fixed-size records, and each field is
+        then copied out of its blob byte by byte with one strided slice per byte.
+        """
+        trig_sz = cls._NUM_BYTES_PER_TRIGGER
+        num_triggers = len(chk_section_binary_data) // trig_sz
+        conds_sz = cls._NUM_BYTES_PER_CONDITION * cls._NUM_CONDITIONS_PER_TRIGGER
+        acts_sz = cls._NUM_BYTES_PER_ACTION * cls._NUM_ACTIONS_PER_TRIGGER
+        pe_sz = cls._NUM_BYTES_PER_PLAYER_EXECUTION
+        with memoryview(chk_section_binary_data) as view:
+            trigger_offsets = range(0, num_triggers * trig_sz, trig_sz)
+            conds = b"".join(view[off : off + conds_sz] for off in trigger_offsets)
+            acts = b"".join(
+                view[off + conds_sz : off + conds_sz + acts_sz]
+                for off in trigger_offsets
+            )
+            pes = b"".join(
+                view[off + trig_sz - pe_sz : off + trig_sz] for off in trigger_offsets
+            )
+        num_players = cls._NUM_PLAYER_EXECUTION_IDS
+        player_flags = bytearray(num_triggers * num_players)
+        for player in range(num_players):
+            player_flags[player::num_players] = pes[4 + player :: pe_sz]
+        return DecodedTrigColumns(
+            num_triggers=num_triggers,
+            condition_columns=cls._split_records(
+                conds,
+                cls._NUM_BYTES_PER_CONDITION,
+                [typecode for _, typecode in DecodedTrigColumns.CONDITION_FIELDS],
+            ),
+            action_columns=cls._split_records(
+                acts,
+                cls._NUM_BYTES_PER_ACTION,
+                [typecode for _, typecode in DecodedTrigColumns.ACTION_FIELDS],
+            ),
+            execution_flags=cls._split_records(pes, pe_sz, ["I"])[0],
+            player_flags=array("B", player_flags),
+            current_action_indices=array("B", pes[pe_sz - 1 :: pe_sz]),
+        )
+
+    @classmethod
+    def _split_records(
+        cls, records: bytes, record_size: int, typecodes: Sequence[str]
+    ) -> list[TrigColumn]:
+        """Copy each leading field of fixed-size records into its own typed array."""
+        num_records = len(records) // record_size
+        columns = []
+        offset = 0
+        for typecode in typecodes:
+            column = array(typecode)
+            width = column.itemsize
+            raw = bytearray(num_records * width)
+            for i in range(width):
+                raw[i::width] = records[offset + i :: record_size]
+            column.frombytes(raw)
+            if cls._SWAP_COLUMN_BYTES:
+                column.byteswap()
+            columns.append(column)
+            offset += width
+        return columns
+
+    @classmethod
+    def _join_records(
+        cls, columns: Sequence[TrigColumn], record_size: int, num_records: int
+    ) -> bytearray:
+        """Inverse of _split_records; bytes after the last field are left zeroed."""
+        records = bytearray(num_records * record_size)
+        offset = 0
+        for column in columns:
+            if cls._SWAP_COLUMN_BYTES:
+                column = array(column.typecode, column)
+                column.byteswap()
+            raw = column.tobytes()
+            width = column.itemsize
+            for i in range(width):
+                records[offset + i :: record_size] = raw[i::width]
+            offset += width
+        return records
+
     @classmethod
     def _decode_single_trigger(cls, trigger_bytes: bytes) -> DecodedTrigger:
         bytes_stream: BytesIO = BytesIO(trigger_bytes)
@@ -294,92 +379,90 @@ class ChkTrigTranscoder(
             result = decoded_chk_section._lazy_spec.materialize()
             cache_box.append(result)
             return result
-        # Pre-calculate total size needed
-        total_size = len(decoded_chk_section.triggers) * self._NUM_BYTES_PER_TRIGGER
-        data = bytearray(total_size)
-        offset = 0
-
-        for trigger in decoded_chk_section.triggers:
-            # Encode directly into the main bytearray
-            self._encode_trigger_into(trigger, data, offset)
-            offset += self._NUM_BYTES_PER_TRIGGER
-
-        return bytes(data)
+        columns = decoded_chk_section.columns
+        if columns is not None and not decoded_chk_section.has_materialized_triggers:
+            return bytes(self._encode_columns(columns, 0, columns.num_triggers))
+        return bytes(self._encode_triggers(decoded_chk_section.triggers))
+
+    def encode_into(
+        self, decoded_chk_section: DecodedTrigSection, sink: ChkSectionSink
+    ) -> int:
+        """Write the TRIG section into a sink, a chunk of triggers at a time.
+
+        Only one chunk is held in memory at once, rather than the whole section.
+        """
+        lazy_spec = decoded_chk_section._lazy_spec
+        if decoded_chk_section._raw_data is not None or (
+            lazy_spec is not None and decoded_chk_section._cache_box
+        ):
+            # already encoded in full, so there is nothing to save by chunking
+            return super().encode_into(decoded_chk_section, sink)
+        columns = decoded_chk_section.columns
+        encode_chunk: Callable[[int, int], bytearray]
+        if lazy_spec is not None:
+            num_triggers = lazy_spec.n
+            encode_chunk = lazy_spec.materialize_range
+        elif columns is not None and not decoded_chk_section.has_materialized_triggers:
+            num_triggers = columns.num_triggers
+            encode_chunk = functools.partial(self._encode_columns, columns)
+        else:
+            triggers = decoded_chk_section.triggers
+            num_triggers = len(triggers)
+
+            def encode_chunk(start: int, stop: int) -> bytearray:
+                return self._encode_triggers(triggers[start:stop])
+
+        section_size = num_triggers * self._NUM_BYTES_PER_TRIGGER
+        header = self.encode_chk_section_header(
+            decoded_chk_section.section_name(), section_size
+        )
+        sink.write(header)
+        for start in range(0, num_triggers, self._NUM_TRIGGERS_PER_ENCODED_CHUNK):
+            stop = min(start + self._NUM_TRIGGERS_PER_ENCODED_CHUNK, num_triggers)
+            sink.write(encode_chunk(start, stop))
+        return len(header) + section_size
 
     @classmethod
-    def _encode_trigger_into(
-        cls, trigger: DecodedTrigger, data: bytearray, base_offset: int
-    ) -> None:
-        # The bytearray is pre-zeroed, and empty conditions/actions are all-zeros.
-        # Real slots always precede empty slots, so we break on the first empty slot.
-        # Access private attributes directly to bypass property descriptor overhead.
-        # Use manual offset increment to avoid enumerate() and index multiplication.
-        cond_offset = base_offset
-        for condition in trigger._conditions:
-            cid = condition._condition_id
-            if not cid:
-                break
-            struct.pack_into(
-                cls._CONDITION_FORMAT,
-                data,
-                cond_offset,
-                condition._location_id,
-                condition._group,
-                condition._quantity,
-                condition._unit_id,
-                condition._numeric_comparison_operation,
-                cid,
-                condition._numeric_comparand_type,
-                condition._flags,
-                condition._mask_flag,
-            )
-            cond_offset += cls._NUM_BYTES_PER_CONDITION
-
-        act_base = (
-            base_offset + cls._NUM_BYTES_PER_CONDITION * cls._NUM_CONDITIONS_PER_TRIGGER
+    def _encode_columns(
+        cls, columns: DecodedTrigColumns, start: int, stop: int
+    ) -> bytearray:
+        """Encode the triggers from start up to, excluding, stop."""
+        num_triggers = stop - start
+        trig_sz = cls._NUM_BYTES_PER_TRIGGER
+        conds_sz = cls._NUM_BYTES_PER_CONDITION * cls._NUM_CONDITIONS_PER_TRIGGER
+        acts_sz = cls._NUM_BYTES_PER_ACTION * cls._NUM_ACTIONS_PER_TRIGGER
+        pe_sz = cls._NUM_BYTES_PER_PLAYER_EXECUTION
+        num_conds = cls._NUM_CONDITIONS_PER_TRIGGER
+        num_acts = cls._NUM_ACTIONS_PER_TRIGGER
+        num_players = cls._NUM_PLAYER_EXECUTION_IDS
+        whole = start == 0 and stop == columns.num_triggers
+
+        def rows(column: TrigColumn, per_trigger: int) -> TrigColumn:
+            return column if whole else column[start * per_trigger : stop * per_trigger]
+
+        conds = cls._join_records(
+            [rows(column, num_conds) for column in columns.condition_columns],
+            cls._NUM_BYTES_PER_CONDITION,
+            num_triggers * num_conds,
         )
-        act_offset = act_base
-        for action in trigger._actions:
-            aid = action._action_id
-            if not aid:
-                break
-            struct.pack_into(
-                cls._ACTION_FORMAT,
-                data,
-                act_offset,
-                action._location_id,
-                action._text_string_id,
-                action._wav_string_id,
-                action._time,
-                action._first_group,
-                action._second_group,
-                action._action_argument_type,
-                aid,
-                action._quantifier_or_switch_or_order,
-                action._flags,
-                action._padding,
-                action._mask_flag,
-            )
-            act_offset += cls._NUM_BYTES_PER_ACTION
-
-        pe_base = act_base + cls._NUM_BYTES_PER_ACTION * cls._NUM_ACTIONS_PER_TRIGGER
-        pe = trigger._player_execution
-        pe_key = (
-            pe._execution_flags,
-            tuple(pe._player_flags),
-            pe._current_action_index,
+        acts = cls._join_records(
+            [rows(column, num_acts) for column in columns.action_columns],
+            cls._NUM_BYTES_PER_ACTION,
+            num_triggers * num_acts,
         )
-        pe_bytes = cls._pe_bytes_cache.get(pe_key)
-        if pe_bytes is None:
-            buf = bytearray(cls._NUM_BYTES_PER_PLAYER_EXECUTION)
-            struct.pack_into(
-                cls._PLAYER_EXECUTION_FORMAT,
-                buf,
-                0,
-                pe._execution_flags,
-                *pe._player_flags,
-                pe._current_action_index,
-            )
-            pe_bytes = bytes(buf)
-            cls._pe_bytes_cache[pe_key] = pe_bytes
-        data[pe_base : pe_base + cls._NUM_BYTES_PER_PLAYER_EXECUTION] = pe_bytes
+        pes = cls._join_records([rows(columns.execution_flags, 1)], pe_sz, num_triggers)
+        player_flags = rows(columns.player_flags, num_players).tobytes()
+        for player in range(num_players):
+            pes[4 + player :: pe_sz] = player_flags[player::num_players]
+        pes[pe_sz - 1 :: pe_sz] = rows(columns.current_action_indices, 1).tobytes()
+
+        data = bytearray(num_triggers * trig_sz)
+        for i, off in enumerate(range(0, num_triggers * trig_sz, trig_sz)):
+            data[off : off + conds_sz] = conds[i * conds_sz : (i + 1) * conds_sz]
+            data[off + conds_sz : off + conds_sz + acts_sz] = acts[
+                i * acts_sz : (i + 1) * acts_sz
+            ]
+            data[off + trig_sz - pe_sz : off + trig_sz] = pes[
+                i * pe_sz : (i + 1) * pe_sz
+            ]
+        return data
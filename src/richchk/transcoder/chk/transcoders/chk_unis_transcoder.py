@@ -30,14 +30,34 @@ IDs)
 u16[100]: Upgrade bonus weapon damage, in weapon ID order
 """
 
+import itertools
 import struct
-from io import BytesIO
 
 from ....model.chk.unis.decoded_unis_section import DecodedUnisSection
 from ....model.chk.unis.unis_constants import NUM_SCM_WEAPONS, NUM_UNITS
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
 
+# (array typecode, length) of each array of the section, in the order of the CHK
+_ARRAYS = [
+    ("B", NUM_UNITS),
+    ("I", NUM_UNITS),
+    ("H", NUM_UNITS),
+    ("B", NUM_UNITS),
+    ("H", NUM_UNITS),
+    ("H", NUM_UNITS),
+    ("H", NUM_UNITS),
+    ("H", NUM_UNITS),
+    ("H", NUM_SCM_WEAPONS),
+    ("H", NUM_SCM_WEAPONS),
+]
+_SECTION_STRUCT = struct.Struct(
+    "<" + "".join(f"{length}{typecode}" for typecode, length in _ARRAYS)
+)
+# where each array starts and ends in the values unpacked by _SECTION_STRUCT
+_ARRAY_ENDS = list(itertools.accumulate(length for _, length in _ARRAYS))
+_ARRAY_BOUNDS = list(zip([0] + _ARRAY_ENDS[:-1], _ARRAY_ENDS))
+
 
 class ChkUnisTranscoder(
     ChkSectionTranscoder[DecodedUnisSection],
@@ -45,34 +65,20 @@ class ChkUnisTranscoder(
     chk_section_name=DecodedUnisSection.section_name(),
 ):
     def decode(self, chk_section_binary_data: bytes) -> DecodedUnisSection:
-        bytes_stream: BytesIO = BytesIO(chk_section_binary_data)
-        use_settings_flags = [
-            struct.unpack("B", bytes_stream.read(1))[0] for _ in range(NUM_UNITS)
-        ]
-        hitpoints = [
-            struct.unpack("I", bytes_stream.read(4))[0] for _ in range(NUM_UNITS)
-        ]
-        shields = [
-            struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_UNITS)
-        ]
-        armor = [struct.unpack("B", bytes_stream.read(1))[0] for _ in range(NUM_UNITS)]
-        build_time = [
-            struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_UNITS)
-        ]
-        minerals = [
-            struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_UNITS)
-        ]
-        gas = [struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_UNITS)]
-        string_ids = [
-            struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_UNITS)
-        ]
-        weapon_damage = [
-            struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_SCM_WEAPONS)
-        ]
-        weapon_bonus = [
-            struct.unpack("H", bytes_stream.read(2))[0] for _ in range(NUM_SCM_WEAPONS)
-        ]
-        return DecodedUnisSection(
+        values = _SECTION_STRUCT.unpack_from(chk_section_binary_data)
+        (
+            use_settings_flags,
+            hitpoints,
+            shields,
+            armor,
+            build_time,
+            minerals,
+            gas,
+            string_ids,
+            weapon_damage,
+            weapon_bonus,
+        ) = [list(values[start:end]) for start, end in _ARRAY_BOUNDS]
+        section = DecodedUnisSection(
             _unit_default_settings_flags=use_settings_flags,
             _unit_hitpoints=hitpoints,
             _unit_shieldpoints=shields,
@@ -84,38 +90,26 @@ class ChkUnisTranscoder(
             _unit_base_weapon_damages=weapon_damage,
             _unit_upgrade_weapon_damages=weapon_bonus,
         )
+        # the section is immutable, so it is encoded from the bytes it was decoded from
+        object.__setattr__(
+            section,
+            "_binary_data",
+            bytes(memoryview(chk_section_binary_data)[: _SECTION_STRUCT.size]),
+        )
+        return section
 
     def _encode(self, decoded_chk_section: DecodedUnisSection) -> bytes:
-        data: bytes = b""
-        data += struct.pack(
-            "{}B".format(NUM_UNITS), *decoded_chk_section.unit_default_settings_flags
-        )
-        data += struct.pack(
-            "{}I".format(NUM_UNITS), *decoded_chk_section.unit_hitpoints
-        )
-        data += struct.pack(
-            "{}H".format(NUM_UNITS), *decoded_chk_section.unit_shieldpoints
-        )
-        data += struct.pack(
-            "{}B".format(NUM_UNITS), *decoded_chk_section.unit_armorpoints
-        )
-        data += struct.pack(
-            "{}H".format(NUM_UNITS), *decoded_chk_section.unit_build_times
-        )
-        data += struct.pack(
-            "{}H".format(NUM_UNITS), *decoded_chk_section.unit_mineral_costs
-        )
-        data += struct.pack(
-            "{}H".format(NUM_UNITS), *decoded_chk_section.unit_gas_costs
-        )
-        data += struct.pack(
-            "{}H".format(NUM_UNITS), *decoded_chk_section.unit_string_ids
-        )
-        data += struct.pack(
-            "{}H".format(NUM_SCM_WEAPONS), *decoded_chk_section.unit_base_weapon_damages
-        )
-        data += struct.pack(
-            "{}H".format(NUM_SCM_WEAPONS),
-            *decoded_chk_section.unit_upgrade_weapon_damages
+        if decoded_chk_section.binary_data is not None:
+            return decoded_chk_section.binary_data
+        return _SECTION_STRUCT.pack(
+            *decoded_chk_section.unit_default_settings_flags,
+            *decoded_chk_section.unit_hitpoints,
+            *decoded_chk_section.unit_shieldpoints,
+            *decoded_chk_section.unit_armorpoints,
+            *decoded_chk_section.unit_build_times,
+            *decoded_chk_section.unit_mineral_costs,
+            *decoded_chk_section.unit_gas_costs,
+            *decoded_chk_section.unit_string_ids,
+            *decoded_chk_section.unit_base_weapon_damages,
+            *decoded_chk_section.unit_upgrade_weapon_damages,
         )
-        return data
@@ -41,63 +41,58 @@ Note that in typical locations Right is always larger than Left and Bottom is al
 larger than Top. However, you can reverse one or both of these for Inverted Locations.
 """
 
+import functools
+import itertools
+import operator
 import struct
-from io import BytesIO
 
-from ....model.chk.uprp.decoded_cuwp_slot import DecodedCuwpSlot
+from ....model.chk.uprp.decoded_cuwp_slot import CUWP_SLOT_STRUCT
 from ....model.chk.uprp.decoded_uprp_section import DecodedUprpSection
 from ....transcoder.chk.chk_section_transcoder import ChkSectionTranscoder
 from ....transcoder.chk.chk_section_transcoder_factory import _RegistrableTranscoder
 
+_NUM_CUWP_SLOTS = 64
+# the fields of a CUWP slot in the order they are stored in the CHK
+_CUWP_SLOT_VALUES = operator.attrgetter(
+    "_valid_special_properties_flags",
+    "_valid_unit_properties_flags",
+    "_owner_player",
+    "_hitpoints_percentage",
+    "_shieldpoints_percentage",
+    "_energypoints_percentage",
+    "_resource_amount",
+    "_units_in_hangar",
+    "_flags",
+    "_padding",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_cuwp_slots_struct(num_cuwp_slots: int) -> struct.Struct:
+    """The layout of a whole UPRP section, which always has 64 CUWP slots."""
+    return struct.Struct("<" + CUWP_SLOT_STRUCT.format[1:] * num_cuwp_slots)
+
 
 class ChkUprpTranscoder(
     ChkSectionTranscoder[DecodedUprpSection],
     _RegistrableTranscoder,
     chk_section_name=DecodedUprpSection.section_name(),
 ):
-    _NUM_CUWP_SLOTS = 64
-
     def decode(self, chk_section_binary_data: bytes) -> DecodedUprpSection:
-        bytes_stream: BytesIO = BytesIO(chk_section_binary_data)
-        cuwp_slots: list[DecodedCuwpSlot] = []
-        for _ in range(self._NUM_CUWP_SLOTS):
-            valid_special_properties_flags = struct.unpack("H", bytes_stream.read(2))[0]
-            valid_unit_properties_flags = struct.unpack("H", bytes_stream.read(2))[0]
-            owner_player = struct.unpack("B", bytes_stream.read(1))[0]
-            hitpoints_percent = struct.unpack("B", bytes_stream.read(1))[0]
-            shieldpoints_percent = struct.unpack("B", bytes_stream.read(1))[0]
-            enerypoints_percent = struct.unpack("B", bytes_stream.read(1))[0]
-            resource_amount = struct.unpack("I", bytes_stream.read(4))[0]
-            units_in_hangar = struct.unpack("H", bytes_stream.read(2))[0]
-            flags = struct.unpack("H", bytes_stream.read(2))[0]
-            padding = struct.unpack("I", bytes_stream.read(4))[0]
-            cuwp_slots.append(
-                DecodedCuwpSlot(
-                    _valid_special_properties_flags=valid_special_properties_flags,
-                    _valid_unit_properties_flags=valid_unit_properties_flags,
-                    _owner_player=owner_player,
-                    _hitpoints_percentage=hitpoints_percent,
-                    _shieldpoints_percentage=shieldpoints_percent,
-                    _energypoints_percentage=enerypoints_percent,
-                    _resource_amount=resource_amount,
-                    _units_in_hangar=units_in_hangar,
-                    _flags=flags,
-                    _padding=padding,
-                )
+        # the CUWP slots are only decoded when they are read
+        return DecodedUprpSection.from_binary_data(
+            bytes(
+                memoryview(chk_section_binary_data)[
+                    : _NUM_CUWP_SLOTS * CUWP_SLOT_STRUCT.size
+                ]
             )
-        return DecodedUprpSection(_cuwp_slots=cuwp_slots)
+        )
 
     def _encode(self, decoded_chk_section: DecodedUprpSection) -> bytes:
-        data: bytes = b""
-        for cuwp in decoded_chk_section.cuwp_slots:
-            data += struct.pack("H", cuwp.valid_special_properties_flags)
-            data += struct.pack("H", cuwp.valid_unit_properties_flags)
-            data += struct.pack("B", cuwp.owner_player)
-            data += struct.pack("B", cuwp.hitpoints_percentage)
-            data += struct.pack("B", cuwp.shieldpoints_percentage)
-            data += struct.pack("B", cuwp.energypoints_percentage)
-            data += struct.pack("I", cuwp.resource_amount)
-            data += struct.pack("H", cuwp.units_in_hangar)
-            data += struct.pack("H", cuwp.flags)
-            data += struct.pack("I", cuwp.padding)
-        return data
+        unread_binary_data = decoded_chk_section.unread_binary_data
+        if unread_binary_data is not None:
+            return unread_binary_data
+        cuwp_slots = decoded_chk_section.cuwp_slots
+        return _make_cuwp_slots_struct(len(cuwp_slots)).pack(
+            *itertools.chain.from_iterable(map(_CUWP_SLOT_VALUES, cuwp_slots))
+        )
@@ -0,0 +1,242 @@
+"""Decode and encode the 2400-byte trigger layout shared by the TRIG and MBRF sections.
+
+Every trigger, and every mission briefing, is 16 conditions (20 bytes each), 64 actions
+(32 bytes each) and a 32-byte player execution block.  The whole data is decoded with
+one struct pass and encoded into a single pre-zeroed buffer, which skips the zeroed
+condition and action slots after the last one holding any data.
+"""
+import struct
+from typing import Any, ClassVar, Sequence
+
+from ...model.chk.trig.decoded_player_execution import DecodedPlayerExecution
+from ...model.chk.trig.decoded_trigger import DecodedTrigger
+from ...model.chk.trig.decoded_trigger_action import DecodedTriggerAction
+from ...model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
+
+
+class _TriggerLayoutCodec:
+    # Counts of elements
+    _NUM_CONDITIONS_PER_TRIGGER = 16
+    _NUM_ACTIONS_PER_TRIGGER = 64
+    _NUM_PLAYER_EXECUTION_IDS = 27
+
+    # Byte sizes for each component
+    _NUM_BYTES_PER_CONDITION = 20  # 3*4 + 2 + 4*1 + 2
+    _NUM_BYTES_PER_ACTION = 32  # 6*4 + 2 + 3*1 + 1 + 2
+    _NUM_BYTES_PER_PLAYER_EXECUTION = 32  # 4 + 27*1 + 1
+    _NUM_BYTES_PER_TRIGGER = (
+        _NUM_BYTES_PER_CONDITION * _NUM_CONDITIONS_PER_TRIGGER
+        + _NUM_BYTES_PER_ACTION * _NUM_ACTIONS_PER_TRIGGER
+        + _NUM_BYTES_PER_PLAYER_EXECUTION
+    )
+
+    # Values per struct
+    # location_id, group, quantity, unit_id, numeric_comparison_operation, condition_id,
+    # numeric_comparand_type, flags, mask_flag
+    _NUM_VALUES_PER_CONDITION = 9
+
+    # location_id, text_string_id, wav_string_id, time, first_group, second_group,
+    # action_argument_type, action_id, quantifier_or_switch_or_order, flags, padding, mask_flag
+    _NUM_VALUES_PER_ACTION = 12
+
+    # Format strings for struct packing
+    _CONDITION_FORMAT = "3I H 4B H"  # 20 bytes: 3*4 + 2 + 4*1 + 2
+    _ACTION_FORMAT = "6I H 3B B H"  # 32 bytes: 6*4 + 2 + 3*1 + 1 + 2
+    _PLAYER_EXECUTION_FORMAT = "I 27B B"  # 32 bytes: 4 + 27*1 + 1
+
+    # Bulk format strings for decoding multiple items at once
+    _ALL_CONDITIONS_FORMAT = (
+        _CONDITION_FORMAT * _NUM_CONDITIONS_PER_TRIGGER
+    )  # 16 conditions
+    _ALL_ACTIONS_FORMAT = _ACTION_FORMAT * _NUM_ACTIONS_PER_TRIGGER  # 64 actions
+
+    # Whole-trigger format: 16 conditions, 64 actions, then the player execution.
+    # Little-endian with no padding, so one struct is exactly one 2400-byte trigger.
+    _TRIGGER_STRUCT: ClassVar[struct.Struct] = struct.Struct(
+        "<" + _ALL_CONDITIONS_FORMAT + _ALL_ACTIONS_FORMAT + _PLAYER_EXECUTION_FORMAT
+    )
+
+    # Offsets into the values unpacked by _TRIGGER_STRUCT
+    _CONDITION_ID_VALUE_INDEX = 5
+    _ACTION_ID_VALUE_INDEX = 7
+    _FIRST_ACTION_VALUE_INDEX = _NUM_VALUES_PER_CONDITION * _NUM_CONDITIONS_PER_TRIGGER
+    _FIRST_PLAYER_EXECUTION_VALUE_INDEX = (
+        _FIRST_ACTION_VALUE_INDEX + _NUM_VALUES_PER_ACTION * _NUM_ACTIONS_PER_TRIGGER
+    )
+
+    # Cache: (execution flags, player flags, current action index) → pre-packed
+    # 32-byte player execution.
+    _pe_bytes_cache: ClassVar[dict[Any, Any]] = {}
+
+    @classmethod
+    def _decode_triggers(cls, binary_data: bytes) -> list[DecodedTrigger]:
+        """Decode every trigger with one struct.iter_unpack pass over the data.
+
+        Conditions and actions after the last one holding any data are not
+        materialized.  They are all zeros and are encoded back as the same zeroed bytes,
+        so the result is otherwise identical to the per-trigger decoding.  Slots without
+        a condition or action byte which still hold data are kept, so the triggers
+        encode back to the same bytes.
+        """
+        num_triggers = len(binary_data) // cls._NUM_BYTES_PER_TRIGGER
+        cond_size = cls._NUM_VALUES_PER_CONDITION
+        act_size = cls._NUM_VALUES_PER_ACTION
+        first_act = cls._FIRST_ACTION_VALUE_INDEX
+        first_pe = cls._FIRST_PLAYER_EXECUTION_VALUE_INDEX
+        # condition/action id positions, from the last slot backwards
+        cond_id_indices = range(
+            first_act - cond_size + cls._CONDITION_ID_VALUE_INDEX, 0, -cond_size
+        )
+        act_id_indices = range(
+            first_pe - act_size + cls._ACTION_ID_VALUE_INDEX, first_act, -act_size
+        )
+        trig_sz = cls._NUM_BYTES_PER_TRIGGER
+        cond_sz = cls._NUM_BYTES_PER_CONDITION
+        act_sz = cls._NUM_BYTES_PER_ACTION
+        conds_sz = cond_sz * cls._NUM_CONDITIONS_PER_TRIGGER
+        pe_off = trig_sz - cls._NUM_BYTES_PER_PLAYER_EXECUTION
+        zeroed_trigger = bytes(trig_sz)
+
+        triggers = []
+        with memoryview(binary_data) as view:
+            for trig_off, values in zip(
+                range(0, num_triggers * trig_sz, trig_sz),
+                cls._TRIGGER_STRUCT.iter_unpack(view[: num_triggers * trig_sz]),
+            ):
+                cond_end = 0
+                for i in cond_id_indices:
+                    if values[i]:
+                        cond_end = i - cls._CONDITION_ID_VALUE_INDEX + cond_size
+                        break
+                # the bytes of the empty slots after the last condition, which are
+                # compared at once rather than value by value
+                data_start = trig_off + cond_end // cond_size * cond_sz
+                data_stop = trig_off + conds_sz
+                if (
+                    view[data_start:data_stop].tobytes()
+                    != zeroed_trigger[: data_stop - data_start]
+                ):
+                    cond_end = cls._end_of_data(values, cond_end, first_act, cond_size)
+                act_end = first_act
+                for i in act_id_indices:
+                    if values[i]:
+                        act_end = i - cls._ACTION_ID_VALUE_INDEX + act_size
+                        break
+                data_start = (
+                    trig_off + conds_sz + (act_end - first_act) // act_size * act_sz
+                )
+                data_stop = trig_off + pe_off
+                if (
+                    view[data_start:data_stop].tobytes()
+                    != zeroed_trigger[: data_stop - data_start]
+                ):
+                    act_end = cls._end_of_data(values, act_end, first_pe, act_size)
+                triggers.append(
+                    DecodedTrigger(
+                        _conditions=[
+                            DecodedTriggerCondition(*values[base : base + cond_size])
+                            for base in range(0, cond_end, cond_size)
+                        ],
+                        _actions=[
+                            DecodedTriggerAction(*values[base : base + act_size])
+                            for base in range(first_act, act_end, act_size)
+                        ],
+                        _player_execution=DecodedPlayerExecution(
+                            _execution_flags=values[first_pe],
+                            _player_flags=list(values[first_pe + 1 : first_pe + 28]),
+                            _current_action_index=values[first_pe + 28],
+                        ),
+                    )
+                )
+        return triggers
+
+    @staticmethod
+    def _end_of_data(values: Sequence[int], start: int, end: int, size: int) -> int:
+        """The end of the last slot holding any data, among the slots from start up to
+        end, which hold some."""
+        while not any(values[end - size : end]):
+            end -= size
+        return end
+
+    @classmethod
+    def _encode_triggers(cls, triggers: Sequence[DecodedTrigger]) -> bytearray:
+        data = bytearray(len(triggers) * cls._NUM_BYTES_PER_TRIGGER)
+        offset = 0
+        for trigger in triggers:
+            # Encode directly into the main bytearray
+            cls._encode_trigger_into(trigger, data, offset)
+            offset += cls._NUM_BYTES_PER_TRIGGER
+        return data
+
+    @classmethod
+    def _encode_trigger_into(
+        cls, trigger: DecodedTrigger, data: bytearray, base_offset: int
+    ) -> None:
+        # The bytearray is pre-zeroed, so the slots after the last condition/action of
+        # the trigger are left zeroed.  Slots without a condition/action byte are still
+        # written, as they may hold data.
+        # Access private attributes directly to bypass property descriptor overhead.
+        # Use manual offset increment to avoid enumerate() and index multiplication.
+        cond_offset = base_offset
+        for condition in trigger._conditions:
+            struct.pack_into(
+                cls._CONDITION_FORMAT,
+                data,
+                cond_offset,
+                condition._location_id,
+                condition._group,
+                condition._quantity,
+                condition._unit_id,
+                condition._numeric_comparison_operation,
+                condition._condition_id,
+                condition._numeric_comparand_type,
+                condition._flags,
+                condition._mask_flag,
+            )
+            cond_offset += cls._NUM_BYTES_PER_CONDITION
+
+        act_base = (
+            base_offset + cls._NUM_BYTES_PER_CONDITION * cls._NUM_CONDITIONS_PER_TRIGGER
+        )
+        act_offset = act_base
+        for action in trigger._actions:
+            struct.pack_into(
+                cls._ACTION_FORMAT,
+                data,
+                act_offset,
+                action._location_id,
+                action._text_string_id,
+                action._wav_string_id,
+                action._time,
+                action._first_group,
+                action._second_group,
+                action._action_argument_type,
+                action._action_id,
+                action._quantifier_or_switch_or_order,
+                action._flags,
+                action._padding,
+                action._mask_flag,
+            )
+            act_offset += cls._NUM_BYTES_PER_ACTION
+
+        pe_base = act_base + cls._NUM_BYTES_PER_ACTION * cls._NUM_ACTIONS_PER_TRIGGER
+        pe = trigger._player_execution
+        pe_key = (
+            pe._execution_flags,
+            tuple(pe._player_flags),
+            pe._current_action_index,
+        )
+        pe_bytes = cls._pe_bytes_cache.get(pe_key)
+        if pe_bytes is None:
+            buf = bytearray(cls._NUM_BYTES_PER_PLAYER_EXECUTION)
+            struct.pack_into(
+                cls._PLAYER_EXECUTION_FORMAT,
+                buf,
+                0,
+                pe._execution_flags,
+                *pe._player_flags,
+                pe._current_action_index,
+            )
+            pe_bytes = bytes(buf)
+            cls._pe_bytes_cache[pe_key] = pe_bytes
+        data[pe_base : pe_base + cls._NUM_BYTES_PER_PLAYER_EXECUTION] = pe_bytes
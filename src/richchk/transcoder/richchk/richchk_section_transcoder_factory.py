@@ -3,7 +3,14 @@
 from typing import Any, ClassVar, Optional, Type, Union
 
 from ...model.chk_section_name import ChkSectionName
-from ...util.subpackages_importer import import_all_modules_in_subpackage
+from ...util.subpackages_importer import (
+    import_all_manifest_modules,
+    import_manifest_module,
+)
+from ..transcoder_manifest import (
+    RICHCHK_SECTION_TRANSCODER_MODULES,
+    RICHCHK_SECTION_TRANSCODERS_PACKAGE,
+)
 from .richchk_section_transcoder import RichChkSectionTranscoder
 
 
@@ -31,6 +38,13 @@ class RichChkSectionTranscoderFactory:
         cached = cls._instances.get(chk_section_name)
         if cached is not None:
             return cached
+        if chk_section_name not in cls.transcoders:
+            # importing the transcoder module registers it with the factory
+            import_manifest_module(
+                RICHCHK_SECTION_TRANSCODERS_PACKAGE,
+                RICHCHK_SECTION_TRANSCODER_MODULES,
+                chk_section_name.name,
+            )
         try:
             maybe_transcoder: Union[
                 RichChkSectionTranscoder[Any, Any], _RichChkRegistrableTranscoder
@@ -56,18 +70,14 @@ class RichChkSectionTranscoderFactory:
 
     @classmethod
     def get_all_registered_chk_section_names(cls) -> list[ChkSectionName]:
+        import_all_manifest_modules(
+            RICHCHK_SECTION_TRANSCODERS_PACKAGE, RICHCHK_SECTION_TRANSCODER_MODULES
+        )
         return [x for x in cls.transcoders.keys()]
 
     @classmethod
     def supports_transcoding_chk_section(cls, chk_section_name: ChkSectionName) -> bool:
-        return chk_section_name in cls.transcoders
-
-
-# import all transcoder to register with the factory
-# must happen after factory definition; otherwise causes circular import error
-_THIS_MODULE_PARENT_PACKAGE_NAME = ".transcoder.richchk"
-_TRANSCODERS_SUBPACKAGE_NAME = "transcoders"
-
-import_all_modules_in_subpackage(
-    _THIS_MODULE_PARENT_PACKAGE_NAME, _TRANSCODERS_SUBPACKAGE_NAME
-)
+        return (
+            chk_section_name in cls.transcoders
+            or chk_section_name.name in RICHCHK_SECTION_TRANSCODER_MODULES
+        )
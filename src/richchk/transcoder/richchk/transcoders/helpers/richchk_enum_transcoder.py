@@ -1,4 +1,4 @@
-from typing import Generic, Type, TypeVar
+from typing import Generic, Optional, Type, TypeVar
 
 from .....model.richchk.richchk_enum import RichChkEnum
 from .....util import logger
@@ -9,6 +9,7 @@ _T = TypeVar("_T", bound=RichChkEnum, covariant=True)
 class RichChkEnumTranscoder(Generic[_T]):
     _LOG = logger.get_logger("RichChkEnumTranscoder")
     _ENUM_ID_MAP: dict[Type[_T], dict[int, _T]] = {}
+    _DENSE_TABLES: dict[Type[_T], tuple[Optional[_T], ...]] = {}
 
     @classmethod
     def _update_enum_id_map(cls, enum_type: Type[_T]) -> None:
@@ -26,30 +27,34 @@ class RichChkEnumTranscoder(Generic[_T]):
             return False
 
     @classmethod
-    def _get_enum_by_id(cls, maybe_enum_id: int, enum_type: Type[_T]) -> _T:
-        try:
-            enum_instance = cls._ENUM_ID_MAP[enum_type][maybe_enum_id]
-            assert isinstance(enum_instance, enum_type)
-            return enum_instance
-        except KeyError:
-            msg = (
-                f"Unexpected enum ID: {maybe_enum_id} for enum {enum_type}.  "
-                f"Expected one of {[x for x in enum_type]}"
+    def dense_table(cls, enum_type: Type[_T]) -> tuple[Optional[_T], ...]:
+        """The enum instances indexed by their ID, with None for the IDs in between
+        which have no instance."""
+        table = cls._DENSE_TABLES.get(enum_type)
+        if table is None:
+            cls._update_enum_id_map(enum_type)
+            enum_by_id = cls._ENUM_ID_MAP[enum_type]
+            table = tuple(
+                enum_by_id.get(enum_id) for enum_id in range(max(enum_by_id) + 1)
             )
-            cls._LOG.error(msg)
-            raise KeyError(msg)
+            cls._DENSE_TABLES[enum_type] = table
+        return table
 
     @classmethod
     def decode_enum(cls, maybe_enum_id: int, enum_type: Type[_T]) -> _T:
-        cls._update_enum_id_map(enum_type)
-        if not cls.contains_enum_by_id(maybe_enum_id, enum_type):
-            msg = (
-                f"Unexpected enum ID: {maybe_enum_id} for enum {enum_type}.  "
-                f"Expected one of {[x for x in enum_type]}"
-            )
-            cls._LOG.error(msg)
-            raise KeyError(msg)
-        return cls._get_enum_by_id(maybe_enum_id, enum_type)
+        table = cls._DENSE_TABLES.get(enum_type)
+        if table is None:
+            table = cls.dense_table(enum_type)
+        if 0 <= maybe_enum_id < len(table):
+            enum_instance = table[maybe_enum_id]
+            if enum_instance is not None:
+                return enum_instance
+        msg = (
+            f"Unexpected enum ID: {maybe_enum_id} for enum {enum_type}.  "
+            f"Expected one of {[x for x in enum_type]}"
+        )
+        cls._LOG.error(msg)
+        raise KeyError(msg)
 
     @classmethod
     def encode_enum(cls, rich_enum: RichChkEnum) -> int:
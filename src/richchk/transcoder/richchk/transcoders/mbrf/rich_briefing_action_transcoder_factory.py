@@ -3,7 +3,11 @@
 from typing import Any, ClassVar, Optional, Type, Union
 
 from .....model.richchk.mbrf.briefing_action_id import BriefingActionId
-from .....util.subpackages_importer import import_all_modules_in_subpackage
+from .....util.subpackages_importer import import_manifest_module
+from ....transcoder_manifest import (
+    BRIEFING_ACTION_TRANSCODER_MODULES,
+    BRIEFING_ACTION_TRANSCODERS_PACKAGE,
+)
 from .rich_briefing_action_transcoder import RichBriefingActionTranscoder
 
 
@@ -37,6 +41,13 @@ class RichBriefingActionTranscoderFactory:
         cached = cls._instances.get(briefing_action_id)
         if cached is not None:
             return cached
+        if briefing_action_id not in cls.transcoders:
+            # importing the transcoder module registers it with the factory
+            import_manifest_module(
+                BRIEFING_ACTION_TRANSCODERS_PACKAGE,
+                BRIEFING_ACTION_TRANSCODER_MODULES,
+                briefing_action_id.name,
+            )
         try:
             maybe_transcoder: Union[
                 RichBriefingActionTranscoder[Any, Any],
@@ -63,13 +74,7 @@ class RichBriefingActionTranscoderFactory:
     def supports_transcoding_briefing_action(
         cls, briefing_action_id: BriefingActionId
     ) -> bool:
-        return briefing_action_id in cls.transcoders
-
-
-# import all transcoders to register with the factory
-_THIS_MODULE_PARENT_PACKAGE_NAME = ".transcoder.richchk.transcoders.mbrf"
-_TRANSCODERS_SUBPACKAGE_NAME = "actions"
-
-import_all_modules_in_subpackage(
-    _THIS_MODULE_PARENT_PACKAGE_NAME, _TRANSCODERS_SUBPACKAGE_NAME
-)
+        return (
+            briefing_action_id in cls.transcoders
+            or briefing_action_id.name in BRIEFING_ACTION_TRANSCODER_MODULES
+        )
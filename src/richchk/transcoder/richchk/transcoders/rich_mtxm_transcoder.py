@@ -1,10 +1,10 @@
 """Decode MTXM."""
+import math
 import weakref
 from typing import Any, cast
 
 from ....model.chk.mtxm.decoded_mtxm_section import DecodedMtxmSection
 from ....model.richchk.mtxm.rich_mtxm_section import RichMtxmSection
-from ....model.richchk.mtxm.rich_tile import RichTile
 from ....model.richchk.richchk_decode_context import RichChkDecodeContext
 from ....model.richchk.richchk_encode_context import RichChkEncodeContext
 from ....transcoder.richchk.richchk_section_transcoder import RichChkSectionTranscoder
@@ -31,8 +31,11 @@ class RichMtxmTranscoder(
         decoded_chk_section: DecodedMtxmSection,
         rich_chk_decode_context: RichChkDecodeContext,
     ) -> RichMtxmSection:
+        tile_ids = decoded_chk_section.tiles[:]
         return RichMtxmSection(
-            _tiles=[RichTile(_id=t) for t in decoded_chk_section.tiles],
+            _tile_ids=tile_ids,
+            _width=rich_chk_decode_context.map_width
+            or self._infer_width(len(tile_ids)),
         )
 
     def encode(
@@ -44,9 +47,7 @@ class RichMtxmTranscoder(
         cached = _mtxm_encode_cache.get(cache_key)
         if cached is not None and cached[0]() is rich_chk_section:
             return cast(DecodedMtxmSection, cached[1])
-        result = DecodedMtxmSection(
-            _tiles=tuple(t.id for t in rich_chk_section.tiles),
-        )
+        result = DecodedMtxmSection(_tiles=rich_chk_section.tile_ids[:])
         _mtxm_encode_cache[cache_key] = (
             weakref.ref(
                 rich_chk_section, lambda _: _mtxm_encode_cache.pop(cache_key, None)
@@ -54,3 +55,13 @@ class RichMtxmTranscoder(
             result,
         )
         return result
+
+    def _infer_width(self, num_tiles: int) -> int:
+        """Guess the width of a map decoded without its DIM section."""
+        side = math.isqrt(num_tiles)
+        if side * side == num_tiles:
+            return side
+        self.log.warning(
+            f"Unknown map width for {num_tiles} tiles, treating them as a single row."
+        )
+        return num_tiles
@@ -3,7 +3,6 @@ import weakref
 from typing import Any, cast
 
 from ....model.chk.tile.decoded_tile_section import DecodedTileSection
-from ....model.richchk.mtxm.rich_tile import RichTile
 from ....model.richchk.richchk_decode_context import RichChkDecodeContext
 from ....model.richchk.richchk_encode_context import RichChkEncodeContext
 from ....model.richchk.tile.rich_tile_section import RichTileSection
@@ -31,9 +30,7 @@ class RichTileTranscoder(
         decoded_chk_section: DecodedTileSection,
         rich_chk_decode_context: RichChkDecodeContext,
     ) -> RichTileSection:
-        return RichTileSection(
-            _tiles=[RichTile(_id=t) for t in decoded_chk_section.tiles],
-        )
+        return RichTileSection(_tile_ids=decoded_chk_section.tiles[:])
 
     def encode(
         self,
@@ -44,9 +41,7 @@ class RichTileTranscoder(
         cached = _tile_encode_cache.get(cache_key)
         if cached is not None and cached[0]() is rich_chk_section:
             return cast(DecodedTileSection, cached[1])
-        result = DecodedTileSection(
-            _tiles=tuple(t.id for t in rich_chk_section.tiles),
-        )
+        result = DecodedTileSection(_tiles=rich_chk_section.tile_ids[:])
         _tile_encode_cache[cache_key] = (
             weakref.ref(
                 rich_chk_section, lambda _: _tile_encode_cache.pop(cache_key, None)
@@ -41,21 +41,6 @@ class RichChkMbrfTranscoder(
 
     _action_type_cache: ClassVar[dict[Any, Any]] = {}
 
-    _EMPTY_ACTION: DecodedTriggerAction = DecodedTriggerAction(
-        _location_id=0,
-        _text_string_id=0,
-        _wav_string_id=0,
-        _time=0,
-        _first_group=0,
-        _second_group=0,
-        _action_argument_type=0,
-        _action_id=BriefingActionId.NO_ACTION.id,
-        _quantifier_or_switch_or_order=0,
-        _flags=0,
-        _padding=0,
-        _mask_flag=0,
-    )
-
     _MBRF_MARKER_CONDITION: DecodedTriggerCondition = DecodedTriggerCondition(
         _location_id=0,
         _group=0,
@@ -68,18 +53,6 @@ class RichChkMbrfTranscoder(
         _mask_flag=0,
     )
 
-    _NULL_CONDITION: DecodedTriggerCondition = DecodedTriggerCondition(
-        _location_id=0,
-        _group=0,
-        _quantity=0,
-        _unit_id=0,
-        _numeric_comparison_operation=0,
-        _condition_id=0,
-        _numeric_comparand_type=0,
-        _flags=0,
-        _mask_flag=0,
-    )
-
     def __init__(self) -> None:
         self.log = logger.get_logger(RichChkMbrfTranscoder.__name__)
 
@@ -176,30 +149,27 @@ class RichChkMbrfTranscoder(
     ) -> DecodedTrigger:
         conditions = self._generate_mbrf_conditions()
         actions = self._encode_actions(rich_briefing.actions, rich_chk_encode_context)
-        padded_actions = self._pad_actions(actions)
+        self._validate_num_actions(actions)
         player_execution = self._encode_player_execution(rich_briefing.players)
         return DecodedTrigger(
             _conditions=conditions,
-            _actions=padded_actions,
+            _actions=actions,
             _player_execution=player_execution,
         )
 
-    def _pad_actions(
-        self, actions: list[DecodedTriggerAction]
-    ) -> list[DecodedTriggerAction]:
-        padding_needed = self._NUM_ACTIONS_PER_TRIGGER - len(actions)
-        if padding_needed < 0:
+    def _validate_num_actions(self, actions: list[DecodedTriggerAction]) -> None:
+        # the empty slots after the last action are not materialized, the same as when
+        # decoding, and are encoded as zeroed bytes
+        if len(actions) > self._NUM_ACTIONS_PER_TRIGGER:
             raise ValueError(
                 f"Too many briefing actions: {len(actions)} exceeds the maximum of "
                 f"{self._NUM_ACTIONS_PER_TRIGGER}."
             )
-        return actions + [self._EMPTY_ACTION] * padding_needed
 
     def _generate_mbrf_conditions(self) -> list[DecodedTriggerCondition]:
-        # First slot has condition_id=13 (MBRF marker); the remaining 15 are null.
-        conditions: list[DecodedTriggerCondition] = [self._MBRF_MARKER_CONDITION]
-        conditions += [self._NULL_CONDITION] * (self._NUM_CONDITIONS_PER_TRIGGER - 1)
-        return conditions
+        # First slot has condition_id=13 (MBRF marker); the remaining 15 are null, and
+        # are not materialized, the same as when decoding.
+        return [self._MBRF_MARKER_CONDITION]
 
     def _encode_actions(
         self,
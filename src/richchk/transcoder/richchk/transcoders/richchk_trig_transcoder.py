@@ -1,19 +1,14 @@
 """Decode the TRIG - Triggers section."""
-from typing import Any, ClassVar, Optional, Union, cast
+from typing import Any, ClassVar, Optional, Type, Union, cast
 
 from ....model.chk.trig.decoded_player_execution import DecodedPlayerExecution
+from ....model.chk.trig.decoded_trig_columns import DecodedTrigColumns
 from ....model.chk.trig.decoded_trig_section import DecodedTrigSection, TrigLazySpec
 from ....model.chk.trig.decoded_trigger import DecodedTrigger
 from ....model.chk.trig.decoded_trigger_action import DecodedTriggerAction
 from ....model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
 from ....model.richchk.richchk_decode_context import RichChkDecodeContext
 from ....model.richchk.richchk_encode_context import RichChkEncodeContext
-from ....model.richchk.trig.actions.flags.trigger_action_flags import (
-    _DEFAULT_TRIGGER_ACTION_FLAGS,
-)
-from ....model.richchk.trig.conditions.flags.trigger_condition_flags import (
-    _DEFAULT_TRIGGER_CONDITION_FLAGS,
-)
 from ....model.richchk.trig.conditions.no_condition_condition import (
     NoConditionCondition,
 )
@@ -23,7 +18,6 @@ from ....model.richchk.trig.rich_trigger import RichTrigger
 from ....model.richchk.trig.rich_trigger_action import RichTriggerAction
 from ....model.richchk.trig.rich_trigger_condition import RichTriggerCondition
 from ....model.richchk.trig.trigger_action_id import TriggerActionId
-from ....model.richchk.trig.trigger_condition_id import TriggerConditionId
 from ....transcoder.richchk.richchk_section_transcoder import RichChkSectionTranscoder
 from ....transcoder.richchk.richchk_section_transcoder_factory import (
     _RichChkRegistrableTranscoder,
@@ -31,12 +25,8 @@ from ....transcoder.richchk.richchk_section_transcoder_factory import (
 from ....util import logger
 from .helpers.richchk_enum_transcoder import RichChkEnumTranscoder
 from .trig.batched_trig_encode_optimizer import BatchedTrigEncodeOptimizer
-from .trig.rich_trigger_action_transcoder_factory import (
-    RichTriggerActionTranscoderFactory,
-)
-from .trig.rich_trigger_condition_transcoder_factory import (
-    RichTriggerConditionTranscoderFactory,
-)
+from .trig.compiled_trigger_codecs import CompiledTriggerCodecs
+from .trig.trig_decode_intern_table import TrigDecodeInternTable
 
 
 class RichChkTrigTranscoder(
@@ -45,8 +35,6 @@ class RichChkTrigTranscoder(
     chk_section_name=DecodedTrigSection.section_name(),
 ):
 
-    _action_type_cache: ClassVar[dict[Any, Any]] = {}
-    _condition_type_cache: ClassVar[dict[Any, Any]] = {}
     _optimizer: ClassVar[BatchedTrigEncodeOptimizer] = BatchedTrigEncodeOptimizer()
 
     _EMPTY_ACTION: DecodedTriggerAction = DecodedTriggerAction(
@@ -83,108 +71,84 @@ class RichChkTrigTranscoder(
         decoded_chk_section: DecodedTrigSection,
         rich_chk_decode_context: RichChkDecodeContext,
     ) -> RichTrigSection:
+        intern_table = TrigDecodeInternTable(rich_chk_decode_context)
+        columns = decoded_chk_section.columns
+        if columns is not None and not decoded_chk_section.has_materialized_triggers:
+            return self._decode_columns(columns, intern_table)
         rich_triggers = []
         for trigger in decoded_chk_section.triggers:
-            rich_triggers.append(self._decode_trigger(trigger, rich_chk_decode_context))
+            rich_triggers.append(self._decode_trigger(trigger, intern_table))
         return RichTrigSection(_triggers=rich_triggers)
 
-    def _decode_trigger(
-        self,
-        decoded_trigger: DecodedTrigger,
-        rich_chk_decode_context: RichChkDecodeContext,
-    ) -> RichTrigger:
-        conditions = self._decode_conditions(
-            decoded_trigger.conditions, rich_chk_decode_context
-        )
-        actions = self._decode_actions(decoded_trigger.actions, rich_chk_decode_context)
-        players = self._decode_player_execution(decoded_trigger.player_execution)
-        return RichTrigger(_conditions=conditions, _actions=actions, _players=players)
-
-    def _decode_conditions(
+    def _decode_columns(
         self,
-        decoded_conditions: list[DecodedTriggerCondition],
-        rich_chk_decode_context: RichChkDecodeContext,
-    ) -> list[Union[RichTriggerCondition, DecodedTriggerCondition]]:
-        conditions: list[Union[RichTriggerCondition, DecodedTriggerCondition]] = []
-        for condition in decoded_conditions:
-            if not RichChkEnumTranscoder.contains_enum_by_id(
-                condition.condition_id, TriggerConditionId
-            ):
-                self.log.error(
-                    f"Unknown trigger condition ID: {condition.condition_id}!  "
-                    f"Make sure all condition bytes are accounted for in the enum."
-                )
-                conditions.append(condition)
-            else:
-                maybe_condition = self._decode_single_condition(
-                    condition, rich_chk_decode_context
-                )
-                if maybe_condition:
-                    conditions.append(maybe_condition)
-        return conditions
+        columns: DecodedTrigColumns,
+        intern_table: TrigDecodeInternTable,
+    ) -> RichTrigSection:
+        """Decode straight from the columns of a TRIG section.
 
-    def _decode_single_condition(
-        self,
-        decoded_condition: DecodedTriggerCondition,
-        rich_chk_decode_context: RichChkDecodeContext,
-    ) -> Optional[Union[RichTriggerCondition, DecodedTriggerCondition]]:
-        condition_id = RichChkEnumTranscoder.decode_enum(
-            decoded_condition.condition_id, TriggerConditionId
-        )
-        if condition_id != TriggerConditionId.NO_CONDITION:
-            if RichTriggerConditionTranscoderFactory.supports_transcoding_condition(
-                condition_id
-            ):
-                transcoder = RichTriggerConditionTranscoderFactory.make_rich_trigger_condition_transcoder(
-                    condition_id
-                )
-                return transcoder.decode(decoded_condition, rich_chk_decode_context)
-            else:
-                return decoded_condition
-        return None
+        Player executions are validated a whole column at a time and decoded once per
+        distinct set of player flags, and objects are only built for the non-empty
+        condition and action slots not decoded yet.
+        """
+        self._validate_player_execution_columns(columns)
+        num_players = DecodedTrigColumns.NUM_PLAYER_EXECUTION_IDS
+        player_flags = columns.player_flags.tobytes()
+        rich_triggers = []
+        for trigger_index in range(columns.num_triggers):
+            conditions = intern_table.decode_condition_columns(
+                columns, columns.condition_slots(trigger_index, skip_empty=True)
+            )
+            actions = intern_table.decode_action_columns(
+                columns, columns.action_slots(trigger_index, skip_empty=True)
+            )
+            start = trigger_index * num_players
+            players = intern_table.players(
+                player_flags[start : start + num_players],
+                lambda: self._decode_player_execution(
+                    columns.player_execution(trigger_index)
+                ),
+            )
+            rich_triggers.append(
+                RichTrigger(_conditions=conditions, _actions=actions, _players=players)
+            )
+        return RichTrigSection(_triggers=rich_triggers)
 
-    def _decode_actions(
-        self,
-        decoded_actions: list[DecodedTriggerAction],
-        rich_chk_decode_context: RichChkDecodeContext,
-    ) -> list[Union[RichTriggerAction, DecodedTriggerAction]]:
-        actions: list[Union[RichTriggerAction, DecodedTriggerAction]] = []
-        for action in decoded_actions:
-            if not RichChkEnumTranscoder.contains_enum_by_id(
-                action.action_id, TriggerActionId
-            ):
-                self.log.error(
-                    f"Unknown trigger action ID: {action.action_id}!  "
-                    f"Make sure all action bytes are accounted for in the enum."
-                )
-                actions.append(action)
-            else:
-                maybe_action = self._decode_single_action(
-                    action, rich_chk_decode_context
-                )
-                if maybe_action:
-                    actions.append(maybe_action)
-        return actions
+    def _validate_player_execution_columns(self, columns: DecodedTrigColumns) -> None:
+        if any(columns.execution_flags):
+            execution_flags = next(x for x in columns.execution_flags if x)
+            msg = (
+                f"Unexpected value for trigger execution flags. "
+                f"Expected 0 but got {execution_flags}"
+            )
+            self.log.error(msg)
+            raise ValueError(msg)
+        if any(columns.current_action_indices):
+            current_action_index = next(x for x in columns.current_action_indices if x)
+            msg = (
+                f"Unexpected value for trigger action index. "
+                f"Expected 0 but got {current_action_index}"
+            )
+            self.log.error(msg)
+            raise ValueError(msg)
 
-    def _decode_single_action(
+    def _decode_trigger(
         self,
-        decoded_action: DecodedTriggerAction,
-        rich_chk_decode_context: RichChkDecodeContext,
-    ) -> Optional[Union[RichTriggerAction, DecodedTriggerAction]]:
-        action_id = RichChkEnumTranscoder.decode_enum(
-            decoded_action.action_id, TriggerActionId
+        decoded_trigger: DecodedTrigger,
+        intern_table: TrigDecodeInternTable,
+    ) -> RichTrigger:
+        conditions = intern_table.decode_conditions(decoded_trigger.conditions)
+        actions = intern_table.decode_actions(decoded_trigger.actions)
+        player_execution = decoded_trigger.player_execution
+        players = intern_table.players(
+            (
+                player_execution.execution_flags,
+                player_execution.current_action_index,
+                tuple(player_execution.player_flags),
+            ),
+            lambda: self._decode_player_execution(player_execution),
         )
-        if action_id != TriggerActionId.NO_ACTION:
-            if RichTriggerActionTranscoderFactory.supports_transcoding_trig_action(
-                action_id
-            ):
-                transcoder = RichTriggerActionTranscoderFactory.make_rich_trigger_action_transcoder(
-                    action_id
-                )
-                return transcoder.decode(decoded_action, rich_chk_decode_context)
-            else:
-                return decoded_action
-        return None
+        return RichTrigger(_conditions=conditions, _actions=actions, _players=players)
 
     def _decode_player_execution(
         self, player_execution: DecodedPlayerExecution
@@ -247,38 +211,22 @@ class RichChkTrigTranscoder(
         rich_chk_encode_context: RichChkEncodeContext,
     ) -> list[DecodedTriggerCondition]:
         decoded_conditions = []
-        cache = RichChkTrigTranscoder._condition_type_cache
         for condition in rich_conditions:
             condition_type = type(condition)
             if condition_type is DecodedTriggerCondition:
                 decoded_conditions.append(condition)
                 continue
-            rich_condition = cast(RichTriggerCondition, condition)
-            transcoder = cache.get(condition_type)
-            if transcoder is None:
-                cid = rich_condition.condition_id()
-                if RichTriggerConditionTranscoderFactory.supports_transcoding_condition(
-                    cid
-                ):
-                    transcoder = RichTriggerConditionTranscoderFactory.make_rich_trigger_condition_transcoder(
-                        cid
-                    )
-                    cache[condition_type] = transcoder
-                else:
-                    msg = (
-                        f"Unhandled RichTriggerCondition that can't be "
-                        f"decoded back due to missing transcoder: {condition}"
-                    )
-                    self.log.error(msg)
-                    raise ValueError(msg)
-            if rich_condition.flags is _DEFAULT_TRIGGER_CONDITION_FLAGS:
-                decoded_conditions.append(
-                    transcoder._encode(rich_condition, rich_chk_encode_context)
-                )
-            else:
-                decoded_conditions.append(
-                    transcoder.encode(rich_condition, rich_chk_encode_context)
+            encoder = CompiledTriggerCodecs.condition_encoder(
+                cast(Type[RichTriggerCondition], condition_type)
+            )
+            if encoder is None:
+                msg = (
+                    f"Unhandled RichTriggerCondition that can't be "
+                    f"decoded back due to missing transcoder: {condition}"
                 )
+                self.log.error(msg)
+                raise ValueError(msg)
+            decoded_conditions.append(encoder(condition, rich_chk_encode_context))
         return cast(list[DecodedTriggerCondition], decoded_conditions)
 
     def _generate_empty_condition(self) -> DecodedTriggerCondition:
@@ -290,38 +238,22 @@ class RichChkTrigTranscoder(
         rich_chk_encode_context: RichChkEncodeContext,
     ) -> list[DecodedTriggerAction]:
         decoded_actions = []
-        cache = RichChkTrigTranscoder._action_type_cache
         for action in rich_actions:
             action_type = type(action)
             if action_type is DecodedTriggerAction:
                 decoded_actions.append(action)
                 continue
-            rich_action = cast(RichTriggerAction, action)
-            transcoder = cache.get(action_type)
-            if transcoder is None:
-                aid = rich_action.action_id()
-                if RichTriggerActionTranscoderFactory.supports_transcoding_trig_action(
-                    aid
-                ):
-                    transcoder = RichTriggerActionTranscoderFactory.make_rich_trigger_action_transcoder(
-                        aid
-                    )
-                    cache[action_type] = transcoder
-                else:
-                    msg = (
-                        f"Unhandled RichTriggerAction that can't be "
-                        f"decoded back due to missing transcoder: {action}"
-                    )
-                    self.log.error(msg)
-                    raise ValueError(msg)
-            if rich_action.flags is _DEFAULT_TRIGGER_ACTION_FLAGS:
-                decoded_actions.append(
-                    transcoder._encode(rich_action, rich_chk_encode_context)
-                )
-            else:
-                decoded_actions.append(
-                    transcoder.encode(rich_action, rich_chk_encode_context)
+            encoder = CompiledTriggerCodecs.action_encoder(
+                cast(Type[RichTriggerAction], action_type)
+            )
+            if encoder is None:
+                msg = (
+                    f"Unhandled RichTriggerAction that can't be "
+                    f"decoded back due to missing transcoder: {action}"
                 )
+                self.log.error(msg)
+                raise ValueError(msg)
+            decoded_actions.append(encoder(action, rich_chk_encode_context))
         return cast(list[DecodedTriggerAction], decoded_actions)
 
     def _generate_empty_action(self) -> DecodedTriggerAction:
@@ -2,9 +2,10 @@
 import array
 import struct
 import sys
-from typing import Any, ClassVar, Optional, Union, cast
+from typing import Any, ClassVar, Optional, Sequence, Type, Union, cast
 
 from .....model.chk.trig.decoded_player_execution import DecodedPlayerExecution
+from .....model.chk.trig.decoded_trig_columns import DecodedTrigColumns
 from .....model.chk.trig.decoded_trig_section import TrigLazySpec
 from .....model.chk.trig.decoded_trigger_action import DecodedTriggerAction
 from .....model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
@@ -19,22 +20,33 @@ from .....model.richchk.trig.conditions.flags.trigger_condition_flags import (
     _DEFAULT_TRIGGER_CONDITION_FLAGS,
 )
 from .....model.richchk.trig.rich_trig_section import RichTrigSection
+from .....model.richchk.trig.rich_trigger import RichTrigger
 from .....model.richchk.trig.rich_trigger_action import RichTriggerAction
 from .....model.richchk.trig.rich_trigger_condition import RichTriggerCondition
-from .rich_trigger_action_transcoder_factory import RichTriggerActionTranscoderFactory
-from .rich_trigger_condition_transcoder_factory import (
-    RichTriggerConditionTranscoderFactory,
-)
+from .compiled_trigger_codecs import CompiledTriggerCodecs
+from .trig_chunk_bytes_cache import TrigChunkBytesCache
 
 _IS_BIG_ENDIAN: bool = sys.byteorder == "big"
 
 
+def _field_layout(fields: tuple[tuple[str, str], ...]) -> tuple[tuple[int, str], ...]:
+    """(byte offset within the struct, array typecode) of each field, in order."""
+    layout = []
+    offset = 0
+    for _, typecode in fields:
+        layout.append((offset, typecode))
+        offset += array.array(typecode).itemsize
+    return tuple(layout)
+
+
 class BatchedTrigEncodeOptimizer:
     """Encodes RichTrigSection to raw bytes using a batch/template strategy.
 
     For homogeneous trigger batches (same structure, only amounts vary), builds a binary
-    template once and writes varying amounts via strided slice operations. Falls back to
-    per-trigger packing for heterogeneous triggers.
+    template once and writes varying amounts via strided slice operations.  Any other
+    mix of triggers is split into runs of structurally identical triggers, each encoded
+    from its own template with every varying field patched in by strided writes.  Short
+    runs fall back to per-trigger packing.
     """
 
     _NUM_CONDITIONS_PER_TRIGGER = 16
@@ -64,8 +76,6 @@ class BatchedTrigEncodeOptimizer:
     _PE_STRUCT: ClassVar[struct.Struct] = struct.Struct(_PLAYER_EXECUTION_FORMAT)
     _I_STRUCT: ClassVar[struct.Struct] = struct.Struct("<I")
 
-    _action_type_cache: ClassVar[dict[Any, Any]] = {}
-    _condition_type_cache: ClassVar[dict[Any, Any]] = {}
     _fused_pe_bytes_cache: ClassVar[dict[Any, Any]] = {}
     _template_cache: ClassVar[
         dict[Any, Any]
@@ -81,6 +91,18 @@ class BatchedTrigEncodeOptimizer:
         dict[Any, Any]
     ] = {}  # (id(nz_pairs), n) → [(pos, buf)] pre-built strided write buffers
     _player_execution_cache: ClassVar[dict[Any, Any]] = {}
+    _chunk_bytes_cache: ClassVar[TrigChunkBytesCache] = TrigChunkBytesCache(
+        max_size=128 * 1024 * 1024
+    )
+
+    # Runs of structurally identical triggers shorter than this are packed per trigger
+    _MIN_TEMPLATE_RUN_LENGTH = 8
+    _CONDITION_FIELD_LAYOUT: ClassVar[tuple[tuple[int, str], ...]] = _field_layout(
+        DecodedTrigColumns.CONDITION_FIELDS
+    )
+    _ACTION_FIELD_LAYOUT: ClassVar[tuple[tuple[int, str], ...]] = _field_layout(
+        DecodedTrigColumns.ACTION_FIELDS
+    )
 
     def encode(
         self,
@@ -447,7 +469,299 @@ class BatchedTrigEncodeOptimizer:
                         data[act_off + 3 :: trig_sz] = ab[3::4]
                 return data
 
-        return self._simple_encode_to_bytes(rich_chk_section, context)
+        return self._encode_chunks(rich_chk_section, context)
+
+    @staticmethod
+    def _structural_fingerprint(trigger: RichTrigger) -> tuple[Any, ...]:
+        # condition and action types never overlap, so the combined type signature
+        # also pins down how many conditions and actions there are
+        return trigger._type_sig, trigger._players
+
+    def _encode_chunks(
+        self,
+        rich_chk_section: RichTrigSection,
+        context: RichChkEncodeContext,
+    ) -> bytes:
+        """Encode the section chunk by chunk, reusing the bytes of chunks encoded before.
+
+        A section with a few edited triggers only encodes the chunks holding them.
+        """
+        chunk_bytes_cache = self._chunk_bytes_cache
+        chunk_bytes_cache.use_context(context)
+        # id(condition or action), and each hashable rich condition or action itself,
+        # → encoded field values.  The triggers keep every object alive for the
+        # duration of the encode, so id() is stable.
+        values_by_id: dict[Any, tuple[int, ...]] = {}
+        encoded_chunks = []
+        for chunk in rich_chk_section.trigger_chunks:
+            encoded_chunk = chunk_bytes_cache.get(chunk)
+            if encoded_chunk is None:
+                encoded_chunk = bytes(
+                    self._encode_fingerprint_runs(chunk.triggers, context, values_by_id)
+                )
+                chunk_bytes_cache.put(chunk, encoded_chunk)
+            encoded_chunks.append(encoded_chunk)
+        return b"".join(encoded_chunks)
+
+    def _encode_fingerprint_runs(
+        self,
+        triggers: Sequence[RichTrigger],
+        context: RichChkEncodeContext,
+        values_by_id: dict[Any, tuple[int, ...]],
+    ) -> bytearray:
+        """Encode any mix of triggers by templating runs of structurally identical
+        triggers.
+
+        Consecutive triggers with the same condition types, action types and players
+        share one template, which is how generated trigger banks are laid out.  Fields
+        that are equal across the run are written once into the template, and every
+        field that varies (location, string, unit, group, switch, amount, ...) is
+        patched into the whole run with strided writes.
+        """
+        n = len(triggers)
+        trig_sz = self._NUM_BYTES_PER_TRIGGER
+        data = bytearray(n * trig_sz)
+        fingerprints = [self._structural_fingerprint(t) for t in triggers]
+        start = 0
+        while start < n:
+            fingerprint = fingerprints[start]
+            end = start + 1
+            while end < n and fingerprints[end] == fingerprint:
+                end += 1
+            if end - start >= self._MIN_TEMPLATE_RUN_LENGTH:
+                self._encode_run_with_template(
+                    triggers[start:end], data, start * trig_sz, context, values_by_id
+                )
+            else:
+                self._pack_triggers_into(
+                    triggers[start:end], data, start * trig_sz, context
+                )
+            start = end
+        return data
+
+    def _encode_run_with_template(
+        self,
+        run: Sequence[RichTrigger],
+        data: bytearray,
+        run_offset: int,
+        context: RichChkEncodeContext,
+        values_by_id: dict[Any, tuple[int, ...]],
+    ) -> None:
+        n = len(run)
+        trig_sz = self._NUM_BYTES_PER_TRIGGER
+        template = bytearray(trig_sz)
+        # (byte offset within the trigger, typecode, value of each trigger in the run)
+        patches: list[tuple[int, str, tuple[int, ...]]] = []
+
+        cond_off = 0
+        for i in range(len(run[0]._conditions)):
+            self._template_fields(
+                self._condition_rows(
+                    [t._conditions[i] for t in run], context, values_by_id
+                ),
+                self._COND_STRUCT,
+                self._CONDITION_FIELD_LAYOUT,
+                cond_off,
+                template,
+                patches,
+            )
+            cond_off += self._NUM_BYTES_PER_CONDITION
+        act_off = self._CONDS_SECTION_SIZE
+        for j in range(len(run[0]._actions)):
+            self._template_fields(
+                self._action_rows([t._actions[j] for t in run], context, values_by_id),
+                self._ACT_STRUCT,
+                self._ACTION_FIELD_LAYOUT,
+                act_off,
+                template,
+                patches,
+            )
+            act_off += self._NUM_BYTES_PER_ACTION
+        pe_base = self._CONDS_SECTION_SIZE + self._ACTS_SECTION_SIZE
+        player_execution = self._player_execution_bytes(run[0]._players)
+        template[pe_base : pe_base + self._NUM_BYTES_PER_PE] = player_execution
+
+        run_end = run_offset + n * trig_sz
+        data[run_offset:run_end] = template * n
+        for offset, typecode, values in patches:
+            column = array.array(typecode, values)
+            if _IS_BIG_ENDIAN:
+                column.byteswap()
+            raw = column.tobytes()
+            width = column.itemsize
+            for k in range(width):
+                data[run_offset + offset + k : run_end : trig_sz] = raw[k::width]
+
+    @staticmethod
+    def _template_fields(
+        rows: list[tuple[int, ...]],
+        struct_: struct.Struct,
+        layout: tuple[tuple[int, str], ...],
+        base: int,
+        template: bytearray,
+        patches: list[tuple[int, str, tuple[int, ...]]],
+    ) -> None:
+        """Pack the fields shared by all rows into the template, and queue a patch for
+        each field that varies between rows."""
+        first = rows[0]
+        if rows.count(first) == len(rows):
+            struct_.pack_into(template, base, *first)
+            return
+        constants = []
+        for (offset, typecode), column in zip(layout, zip(*rows)):
+            if column.count(column[0]) == len(column):
+                constants.append(column[0])
+            else:
+                constants.append(0)
+                patches.append((base + offset, typecode, column))
+        struct_.pack_into(template, base, *constants)
+
+    def _condition_rows(
+        self,
+        conditions: list[Union[RichTriggerCondition, DecodedTriggerCondition]],
+        context: RichChkEncodeContext,
+        values_by_id: dict[Any, tuple[int, ...]],
+    ) -> list[tuple[int, ...]]:
+        """Encoded field values of each condition, in CHK struct order."""
+        rows = []
+        get = values_by_id.get
+        for condition in conditions:
+            values = get(id(condition))
+            if values is None:
+                values = self._memoized_values(condition, values_by_id)
+            if values is None:
+                dc = self._encode_condition(condition, context)
+                values = (
+                    dc._location_id,
+                    dc._group,
+                    dc._quantity,
+                    dc._unit_id,
+                    dc._numeric_comparison_operation,
+                    dc._condition_id,
+                    dc._numeric_comparand_type,
+                    dc._flags,
+                    dc._mask_flag,
+                )
+                self._memoize_values(condition, values, values_by_id)
+            rows.append(values)
+        return rows
+
+    def _action_rows(
+        self,
+        actions: list[Union[RichTriggerAction, DecodedTriggerAction]],
+        context: RichChkEncodeContext,
+        values_by_id: dict[Any, tuple[int, ...]],
+    ) -> list[tuple[int, ...]]:
+        """Encoded field values of each action, in CHK struct order."""
+        rows = []
+        get = values_by_id.get
+        for action in actions:
+            values = get(id(action))
+            if values is None:
+                values = self._memoized_values(action, values_by_id)
+            if values is None:
+                da = self._encode_action(action, context)
+                values = (
+                    da._location_id,
+                    da._text_string_id,
+                    da._wav_string_id,
+                    da._time,
+                    da._first_group,
+                    da._second_group,
+                    da._action_argument_type,
+                    da._action_id,
+                    da._quantifier_or_switch_or_order,
+                    da._flags,
+                    da._padding,
+                    da._mask_flag,
+                )
+                self._memoize_values(action, values, values_by_id)
+            rows.append(values)
+        return rows
+
+    @staticmethod
+    def _memoized_values(item: Any, values_by_id: dict[Any, Any]) -> Any:
+        """Look up the values of a rich condition/action equal to one encoded before.
+
+        Rich conditions and actions are frozen, so equal ones encode to the same values
+        in the same context.  Generated trigger banks repeat many equal but distinct
+        objects, and hashing one is cheaper than transcoding it.
+        """
+        item_type = type(item)
+        if item_type is DecodedTriggerCondition or item_type is DecodedTriggerAction:
+            return None
+        try:
+            values = values_by_id.get(item)
+        except TypeError:
+            return None
+        if values is not None:
+            values_by_id[id(item)] = values
+        return values
+
+    @staticmethod
+    def _memoize_values(
+        item: Any, values: tuple[int, ...], values_by_id: dict[Any, Any]
+    ) -> None:
+        values_by_id[id(item)] = values
+        item_type = type(item)
+        if item_type is DecodedTriggerCondition or item_type is DecodedTriggerAction:
+            return
+        try:
+            values_by_id[item] = values
+        except TypeError:
+            pass
+
+    def _encode_condition(
+        self,
+        condition: Union[RichTriggerCondition, DecodedTriggerCondition],
+        context: RichChkEncodeContext,
+    ) -> DecodedTriggerCondition:
+        c_type = type(condition)
+        if c_type is DecodedTriggerCondition:
+            return cast(DecodedTriggerCondition, condition)
+        encoder = CompiledTriggerCodecs.condition_encoder(
+            cast(Type[RichTriggerCondition], c_type)
+        )
+        if encoder is None:
+            raise ValueError(f"No transcoder for condition type: {c_type}")
+        return encoder(condition, context)
+
+    def _encode_action(
+        self,
+        action: Union[RichTriggerAction, DecodedTriggerAction],
+        context: RichChkEncodeContext,
+    ) -> DecodedTriggerAction:
+        a_type = type(action)
+        if a_type is DecodedTriggerAction:
+            return cast(DecodedTriggerAction, action)
+        encoder = CompiledTriggerCodecs.action_encoder(
+            cast(Type[RichTriggerAction], a_type)
+        )
+        if encoder is None:
+            raise ValueError(f"No transcoder for action type: {a_type}")
+        return encoder(action, context)
+
+    def _player_execution_bytes(self, players: frozenset[Any]) -> bytes:
+        pe_bytes = self._fused_pe_bytes_cache.get(players)
+        if pe_bytes is None:
+            pe = self._player_execution_cache.get(players)
+            if pe is None:
+                player_flags = [0] * 27
+                for player_id in players:
+                    player_flags[player_id.id] = 1
+                pe = DecodedPlayerExecution(
+                    _execution_flags=0,
+                    _player_flags=player_flags,
+                    _current_action_index=0,
+                )
+                self._player_execution_cache[players] = pe
+            buf = bytearray(self._NUM_BYTES_PER_PE)
+            self._PE_STRUCT.pack_into(
+                buf, 0, pe.execution_flags, *pe.player_flags, pe.current_action_index
+            )
+            pe_bytes = bytes(buf)
+            self._fused_pe_bytes_cache[players] = pe_bytes
+        return cast(bytes, pe_bytes)
 
     def _simple_encode_to_bytes(
         self,
@@ -455,8 +769,19 @@ class BatchedTrigEncodeOptimizer:
         context: RichChkEncodeContext,
     ) -> bytes:
         triggers = rich_chk_section.triggers
+        data = bytearray(len(triggers) * self._NUM_BYTES_PER_TRIGGER)
+        self._pack_triggers_into(triggers, data, 0, context)
+        return data
+
+    def _pack_triggers_into(
+        self,
+        triggers: Sequence[RichTrigger],
+        data: bytearray,
+        offset: int,
+        context: RichChkEncodeContext,
+    ) -> None:
+        """Pack triggers one at a time into data, starting at the byte offset."""
         trig_sz = self._NUM_BYTES_PER_TRIGGER
-        data = bytearray(len(triggers) * trig_sz)
         pack_into_cond = self._COND_STRUCT.pack_into
         pack_into_act = self._ACT_STRUCT.pack_into
         pack_into_pe = self._PE_STRUCT.pack_into
@@ -473,12 +798,11 @@ class BatchedTrigEncodeOptimizer:
         set_deaths_type = SetDeathsAction
         decoded_cond_type = DecodedTriggerCondition
         decoded_act_type = DecodedTriggerAction
-        act_cache = self._action_type_cache
-        cond_cache = self._condition_type_cache
+        condition_encoder = CompiledTriggerCodecs.condition_encoder
+        action_encoder = CompiledTriggerCodecs.action_encoder
         pe_cache = self._fused_pe_bytes_cache
         pe_execution_cache = self._player_execution_cache
 
-        offset = 0
         for trigger in triggers:
             # --- conditions ---
             cond_off = offset
@@ -526,24 +850,12 @@ class BatchedTrigEncodeOptimizer:
                         raw_cond.mask_flag,
                     )
                 else:
-                    rich_cond = cast(RichTriggerCondition, condition)
-                    transcoder = cond_cache.get(c_type)
-                    if transcoder is None:
-                        cid = rich_cond.condition_id()
-                        if RichTriggerConditionTranscoderFactory.supports_transcoding_condition(
-                            cid
-                        ):
-                            _f = RichTriggerConditionTranscoderFactory
-                            transcoder = _f.make_rich_trigger_condition_transcoder(cid)
-                            cond_cache[c_type] = transcoder
-                        else:
-                            raise ValueError(
-                                f"No transcoder for condition type: {c_type}"
-                            )
-                    if rich_cond.flags is _DEFAULT_TRIGGER_CONDITION_FLAGS:
-                        dc = transcoder._encode(rich_cond, context)
-                    else:
-                        dc = transcoder.encode(rich_cond, context)
+                    cond_encoder = condition_encoder(
+                        cast(Type[RichTriggerCondition], c_type)
+                    )
+                    if cond_encoder is None:
+                        raise ValueError(f"No transcoder for condition type: {c_type}")
+                    dc = cond_encoder(condition, context)
                     pack_into_cond(
                         data,
                         cond_off,
@@ -614,22 +926,10 @@ class BatchedTrigEncodeOptimizer:
                         raw_act.mask_flag,
                     )
                 else:
-                    rich_act = cast(RichTriggerAction, action)
-                    transcoder = act_cache.get(a_type)
-                    if transcoder is None:
-                        aid = rich_act.action_id()
-                        if RichTriggerActionTranscoderFactory.supports_transcoding_trig_action(
-                            aid
-                        ):
-                            _af = RichTriggerActionTranscoderFactory
-                            transcoder = _af.make_rich_trigger_action_transcoder(aid)
-                            act_cache[a_type] = transcoder
-                        else:
-                            raise ValueError(f"No transcoder for action type: {a_type}")
-                    if rich_act.flags is _DEFAULT_TRIGGER_ACTION_FLAGS:
-                        da = transcoder._encode(rich_act, context)
-                    else:
-                        da = transcoder.encode(rich_act, context)
+                    act_encoder = action_encoder(cast(Type[RichTriggerAction], a_type))
+                    if act_encoder is None:
+                        raise ValueError(f"No transcoder for action type: {a_type}")
+                    da = act_encoder(action, context)
                     pack_into_act(
                         data,
                         act_off,
@@ -677,5 +977,3 @@ class BatchedTrigEncodeOptimizer:
             data[pe_base : pe_base + pe_sz] = pe_bytes
 
             offset += trig_sz
-
-        return data
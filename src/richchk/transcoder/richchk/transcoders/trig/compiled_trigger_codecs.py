@@ -0,0 +1,308 @@
+"""Decode and encode trigger conditions and actions with functions compiled once per
+process for each condition and action ID.
+
+Decoding a slot indexes a dense table by its raw condition or action ID byte.  Each
+entry holds the functions decoding slots of that ID, one for slots without flags and
+one for slots with any flags set: the methods of the transcoder of the ID, or functions
+skipping empty slots or keeping slots without a transcoder decoded.  The ID is not
+checked against the enum or the factory again.  An entry starts as a stub which
+compiles the functions of its ID the first time a slot with that ID is decoded, so only
+the transcoders of the IDs in use are imported.
+
+Encoding looks up the function compiled for the type of the rich condition or action.
+
+The compiled functions are the existing decode and encode methods of the transcoders,
+bound once, so the tables only save the lookups of the transcoder and the checks of
+the ID per slot.  The transcoders themselves are not specialized."""
+
+import functools
+from typing import Any, Callable, ClassVar, Optional, Type, Union
+
+from .....model.chk.trig.decoded_trigger_action import DecodedTriggerAction
+from .....model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
+from .....model.richchk.richchk_decode_context import RichChkDecodeContext
+from .....model.richchk.richchk_encode_context import RichChkEncodeContext
+from .....model.richchk.trig.actions.flags.trigger_action_flags import (
+    _DEFAULT_TRIGGER_ACTION_FLAGS,
+)
+from .....model.richchk.trig.conditions.flags.trigger_condition_flags import (
+    _DEFAULT_TRIGGER_CONDITION_FLAGS,
+)
+from .....model.richchk.trig.rich_trigger_action import RichTriggerAction
+from .....model.richchk.trig.rich_trigger_condition import RichTriggerCondition
+from .....model.richchk.trig.trigger_action_id import TriggerActionId
+from .....model.richchk.trig.trigger_condition_id import TriggerConditionId
+from .....util import logger
+from ..helpers.richchk_enum_transcoder import RichChkEnumTranscoder
+from .rich_trigger_action_transcoder_factory import RichTriggerActionTranscoderFactory
+from .rich_trigger_condition_transcoder_factory import (
+    RichTriggerConditionTranscoderFactory,
+)
+
+_AnyCondition = Union[RichTriggerCondition, DecodedTriggerCondition]
+_AnyAction = Union[RichTriggerAction, DecodedTriggerAction]
+_ConditionDecoder = Callable[
+    [DecodedTriggerCondition, RichChkDecodeContext], Optional[_AnyCondition]
+]
+_ActionDecoder = Callable[
+    [DecodedTriggerAction, RichChkDecodeContext], Optional[_AnyAction]
+]
+# the decoder of slots without flags, and the decoder of slots with any flags set
+_ConditionDecoders = tuple[_ConditionDecoder, _ConditionDecoder]
+_ActionDecoders = tuple[_ActionDecoder, _ActionDecoder]
+_ConditionEncoder = Callable[[Any, RichChkEncodeContext], DecodedTriggerCondition]
+_ActionEncoder = Callable[[Any, RichChkEncodeContext], DecodedTriggerAction]
+
+# condition and action IDs are a single byte
+_NUM_IDS = 256
+
+
+class CompiledTriggerCodecs:
+    _LOG: ClassVar[Any] = logger.get_logger("CompiledTriggerCodecs")
+    # the decoders of each raw condition or action ID, indexed by that ID
+    _condition_decoders: ClassVar[list[_ConditionDecoders]] = []
+    _action_decoders: ClassVar[list[_ActionDecoders]] = []
+    _condition_encoders: ClassVar[
+        dict[Type[RichTriggerCondition], _ConditionEncoder]
+    ] = {}
+    _action_encoders: ClassVar[dict[Type[RichTriggerAction], _ActionEncoder]] = {}
+
+    @classmethod
+    def decode_conditions(
+        cls,
+        decoded_conditions: list[DecodedTriggerCondition],
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> list[_AnyCondition]:
+        """Decode the conditions, skipping empty slots and keeping the conditions
+        without a transcoder decoded."""
+        conditions = []
+        for decoded_condition in decoded_conditions:
+            condition = cls.decode_condition(decoded_condition, rich_chk_decode_context)
+            if condition is not None:
+                conditions.append(condition)
+        return conditions
+
+    @classmethod
+    def decode_condition(
+        cls,
+        decoded_condition: DecodedTriggerCondition,
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> Optional[_AnyCondition]:
+        """Decode the condition, or None if its slot is empty."""
+        condition_id = decoded_condition.condition_id
+        if not 0 <= condition_id < _NUM_IDS:
+            return cls._keep_unknown_condition(
+                decoded_condition, rich_chk_decode_context
+            )
+        decoders = cls._condition_decoders or cls._stub_condition_decoders()
+        decode_without_flags, decode_with_flags = decoders[condition_id]
+        if decoded_condition.flags == 0:
+            return decode_without_flags(decoded_condition, rich_chk_decode_context)
+        return decode_with_flags(decoded_condition, rich_chk_decode_context)
+
+    @classmethod
+    def decode_actions(
+        cls,
+        decoded_actions: list[DecodedTriggerAction],
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> list[_AnyAction]:
+        """Decode the actions, skipping empty slots and keeping the actions without a
+        transcoder decoded."""
+        actions = []
+        for decoded_action in decoded_actions:
+            action = cls.decode_action(decoded_action, rich_chk_decode_context)
+            if action is not None:
+                actions.append(action)
+        return actions
+
+    @classmethod
+    def decode_action(
+        cls,
+        decoded_action: DecodedTriggerAction,
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> Optional[_AnyAction]:
+        """Decode the action, or None if its slot is empty."""
+        action_id = decoded_action.action_id
+        if not 0 <= action_id < _NUM_IDS:
+            return cls._keep_unknown_action(decoded_action, rich_chk_decode_context)
+        decoders = cls._action_decoders or cls._stub_action_decoders()
+        decode_without_flags, decode_with_flags = decoders[action_id]
+        if decoded_action.flags == 0:
+            return decode_without_flags(decoded_action, rich_chk_decode_context)
+        return decode_with_flags(decoded_action, rich_chk_decode_context)
+
+    @classmethod
+    def condition_encoder(
+        cls, condition_type: Type[RichTriggerCondition]
+    ) -> Optional[_ConditionEncoder]:
+        """The function encoding rich conditions of the type, or None if no transcoder
+        can encode them."""
+        encoder = cls._condition_encoders.get(condition_type)
+        if encoder is None:
+            condition_id = condition_type.condition_id()
+            if not RichTriggerConditionTranscoderFactory.supports_transcoding_condition(
+                condition_id
+            ):
+                return None
+            transcoder = RichTriggerConditionTranscoderFactory.make_rich_trigger_condition_transcoder(
+                condition_id
+            )
+            encoder = cls._compile_encoder(
+                transcoder._encode, transcoder.encode, _DEFAULT_TRIGGER_CONDITION_FLAGS
+            )
+            cls._condition_encoders[condition_type] = encoder
+        return encoder
+
+    @classmethod
+    def action_encoder(
+        cls, action_type: Type[RichTriggerAction]
+    ) -> Optional[_ActionEncoder]:
+        """The function encoding rich actions of the type, or None if no transcoder can
+        encode them."""
+        encoder = cls._action_encoders.get(action_type)
+        if encoder is None:
+            action_id = action_type.action_id()
+            if not RichTriggerActionTranscoderFactory.supports_transcoding_trig_action(
+                action_id
+            ):
+                return None
+            transcoder = (
+                RichTriggerActionTranscoderFactory.make_rich_trigger_action_transcoder(
+                    action_id
+                )
+            )
+            encoder = cls._compile_encoder(
+                transcoder._encode, transcoder.encode, _DEFAULT_TRIGGER_ACTION_FLAGS
+            )
+            cls._action_encoders[action_type] = encoder
+        return encoder
+
+    @staticmethod
+    def _compile_encoder(
+        encode_without_flags: Callable[[Any, RichChkEncodeContext], Any],
+        encode_with_flags: Callable[[Any, RichChkEncodeContext], Any],
+        default_flags: object,
+    ) -> Callable[[Any, RichChkEncodeContext], Any]:
+        def encode(rich: Any, rich_chk_encode_context: RichChkEncodeContext) -> Any:
+            # almost every condition and action has the shared default flags
+            if rich.flags is default_flags:
+                return encode_without_flags(rich, rich_chk_encode_context)
+            return encode_with_flags(rich, rich_chk_encode_context)
+
+        return encode
+
+    @classmethod
+    def _stub_condition_decoders(cls) -> list[_ConditionDecoders]:
+        stubs = [
+            functools.partial(cls._compile_condition_decoders, condition_id)
+            for condition_id in range(_NUM_IDS)
+        ]
+        cls._condition_decoders = [(stub, stub) for stub in stubs]
+        return cls._condition_decoders
+
+    @classmethod
+    def _stub_action_decoders(cls) -> list[_ActionDecoders]:
+        stubs = [
+            functools.partial(cls._compile_action_decoders, action_id)
+            for action_id in range(_NUM_IDS)
+        ]
+        cls._action_decoders = [(stub, stub) for stub in stubs]
+        return cls._action_decoders
+
+    @classmethod
+    def _compile_condition_decoders(
+        cls,
+        condition_id: int,
+        decoded_condition: DecodedTriggerCondition,
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> Optional[_AnyCondition]:
+        """Compile the decoders of the condition ID into the table, then decode the
+        condition with them."""
+        condition_ids = RichChkEnumTranscoder.dense_table(TriggerConditionId)
+        rich_condition_id = (
+            condition_ids[condition_id] if condition_id < len(condition_ids) else None
+        )
+        decoders: _ConditionDecoders
+        if rich_condition_id is None:
+            decoders = (cls._keep_unknown_condition, cls._keep_unknown_condition)
+        elif rich_condition_id == TriggerConditionId.NO_CONDITION:
+            decoders = (cls._skip, cls._skip)
+        elif RichTriggerConditionTranscoderFactory.supports_transcoding_condition(
+            rich_condition_id
+        ):
+            transcoder = RichTriggerConditionTranscoderFactory.make_rich_trigger_condition_transcoder(
+                rich_condition_id
+            )
+            decoders = (transcoder._decode, transcoder.decode)
+        else:
+            decoders = (cls._keep, cls._keep)
+        cls._condition_decoders[condition_id] = decoders
+        decode_without_flags, decode_with_flags = decoders
+        if decoded_condition.flags == 0:
+            return decode_without_flags(decoded_condition, rich_chk_decode_context)
+        return decode_with_flags(decoded_condition, rich_chk_decode_context)
+
+    @classmethod
+    def _compile_action_decoders(
+        cls,
+        action_id: int,
+        decoded_action: DecodedTriggerAction,
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> Optional[_AnyAction]:
+        """Compile the decoders of the action ID into the table, then decode the action
+        with them."""
+        action_ids = RichChkEnumTranscoder.dense_table(TriggerActionId)
+        rich_action_id = action_ids[action_id] if action_id < len(action_ids) else None
+        decoders: _ActionDecoders
+        if rich_action_id is None:
+            decoders = (cls._keep_unknown_action, cls._keep_unknown_action)
+        elif rich_action_id == TriggerActionId.NO_ACTION:
+            decoders = (cls._skip, cls._skip)
+        elif RichTriggerActionTranscoderFactory.supports_transcoding_trig_action(
+            rich_action_id
+        ):
+            transcoder = (
+                RichTriggerActionTranscoderFactory.make_rich_trigger_action_transcoder(
+                    rich_action_id
+                )
+            )
+            decoders = (transcoder._decode, transcoder.decode)
+        else:
+            decoders = (cls._keep, cls._keep)
+        cls._action_decoders[action_id] = decoders
+        decode_without_flags, decode_with_flags = decoders
+        if decoded_action.flags == 0:
+            return decode_without_flags(decoded_action, rich_chk_decode_context)
+        return decode_with_flags(decoded_action, rich_chk_decode_context)
+
+    @staticmethod
+    def _skip(decoded: Any, rich_chk_decode_context: RichChkDecodeContext) -> None:
+        return None
+
+    @staticmethod
+    def _keep(decoded: Any, rich_chk_decode_context: RichChkDecodeContext) -> Any:
+        return decoded
+
+    @classmethod
+    def _keep_unknown_condition(
+        cls,
+        decoded_condition: DecodedTriggerCondition,
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> DecodedTriggerCondition:
+        cls._LOG.error(
+            f"Unknown trigger condition ID: {decoded_condition.condition_id}!  "
+            f"Make sure all condition bytes are accounted for in the enum."
+        )
+        return decoded_condition
+
+    @classmethod
+    def _keep_unknown_action(
+        cls,
+        decoded_action: DecodedTriggerAction,
+        rich_chk_decode_context: RichChkDecodeContext,
+    ) -> DecodedTriggerAction:
+        cls._LOG.error(
+            f"Unknown trigger action ID: {decoded_action.action_id}!  "
+            f"Make sure all action bytes are accounted for in the enum."
+        )
+        return decoded_action
@@ -3,7 +3,14 @@
 from typing import Any, ClassVar, Optional, Type, Union
 
 from .....model.richchk.trig.trigger_action_id import TriggerActionId
-from .....util.subpackages_importer import import_all_modules_in_subpackage
+from .....util.subpackages_importer import (
+    import_all_manifest_modules,
+    import_manifest_module,
+)
+from ....transcoder_manifest import (
+    TRIGGER_ACTION_TRANSCODER_MODULES,
+    TRIGGER_ACTION_TRANSCODERS_PACKAGE,
+)
 from .rich_trigger_action_transcoder import RichTriggerActionTranscoder
 
 
@@ -36,6 +43,13 @@ class RichTriggerActionTranscoderFactory:
         cached = cls._instances.get(trig_action_id)
         if cached is not None:
             return cached
+        if trig_action_id not in cls.transcoders:
+            # importing the transcoder module registers it with the factory
+            import_manifest_module(
+                TRIGGER_ACTION_TRANSCODERS_PACKAGE,
+                TRIGGER_ACTION_TRANSCODER_MODULES,
+                trig_action_id.name,
+            )
         try:
             maybe_transcoder: Union[
                 RichTriggerActionTranscoder[Any, Any],
@@ -62,18 +76,14 @@ class RichTriggerActionTranscoderFactory:
 
     @classmethod
     def get_all_registered_trig_action_ids(cls) -> list[TriggerActionId]:
+        import_all_manifest_modules(
+            TRIGGER_ACTION_TRANSCODERS_PACKAGE, TRIGGER_ACTION_TRANSCODER_MODULES
+        )
         return [x for x in cls.transcoders.keys()]
 
     @classmethod
     def supports_transcoding_trig_action(cls, trig_action_id: TriggerActionId) -> bool:
-        return trig_action_id in cls.transcoders
-
-
-# import all transcoder to register with the factory
-# must happen after factory definition; otherwise causes circular import error
-_THIS_MODULE_PARENT_PACKAGE_NAME = ".transcoder.richchk.transcoders.trig"
-_TRANSCODERS_SUBPACKAGE_NAME = "actions"
-
-import_all_modules_in_subpackage(
-    _THIS_MODULE_PARENT_PACKAGE_NAME, _TRANSCODERS_SUBPACKAGE_NAME
-)
+        return (
+            trig_action_id in cls.transcoders
+            or trig_action_id.name in TRIGGER_ACTION_TRANSCODER_MODULES
+        )
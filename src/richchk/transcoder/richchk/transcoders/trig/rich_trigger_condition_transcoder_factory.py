@@ -3,7 +3,14 @@
 from typing import Any, ClassVar, Optional, Type, Union
 
 from .....model.richchk.trig.trigger_condition_id import TriggerConditionId
-from .....util.subpackages_importer import import_all_modules_in_subpackage
+from .....util.subpackages_importer import (
+    import_all_manifest_modules,
+    import_manifest_module,
+)
+from ....transcoder_manifest import (
+    TRIGGER_CONDITION_TRANSCODER_MODULES,
+    TRIGGER_CONDITION_TRANSCODERS_PACKAGE,
+)
 from .rich_trigger_condition_transcoder import RichTriggerConditionTranscoder
 
 
@@ -39,6 +46,13 @@ class RichTriggerConditionTranscoderFactory:
         cached = cls._instances.get(condition_id)
         if cached is not None:
             return cached
+        if condition_id not in cls.transcoders:
+            # importing the transcoder module registers it with the factory
+            import_manifest_module(
+                TRIGGER_CONDITION_TRANSCODERS_PACKAGE,
+                TRIGGER_CONDITION_TRANSCODER_MODULES,
+                condition_id.name,
+            )
         try:
             maybe_transcoder: Union[
                 RichTriggerConditionTranscoder[Any, Any],
@@ -65,18 +79,14 @@ class RichTriggerConditionTranscoderFactory:
 
     @classmethod
     def get_all_registered_condition_ids(cls) -> list[TriggerConditionId]:
+        import_all_manifest_modules(
+            TRIGGER_CONDITION_TRANSCODERS_PACKAGE, TRIGGER_CONDITION_TRANSCODER_MODULES
+        )
         return [x for x in cls.transcoders.keys()]
 
     @classmethod
     def supports_transcoding_condition(cls, condition_id: TriggerConditionId) -> bool:
-        return condition_id in cls.transcoders
-
-
-# import all transcoder to register with the factory
-# must happen after factory definition; otherwise causes circular import error
-_THIS_MODULE_PARENT_PACKAGE_NAME = ".transcoder.richchk.transcoders.trig"
-_TRANSCODERS_SUBPACKAGE_NAME = "conditions"
-
-import_all_modules_in_subpackage(
-    _THIS_MODULE_PARENT_PACKAGE_NAME, _TRANSCODERS_SUBPACKAGE_NAME
-)
+        return (
+            condition_id in cls.transcoders
+            or condition_id.name in TRIGGER_CONDITION_TRANSCODER_MODULES
+        )
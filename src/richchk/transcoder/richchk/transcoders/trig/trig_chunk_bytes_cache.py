@@ -0,0 +1,174 @@
+"""Cache the encoded bytes of trigger chunks, so editing a few triggers of a large TRIG
+section only encodes the chunks holding them again.
+
+Chunks are found by the identity of their triggers first, which is cheap and hits for
+sections edited from the same objects, and otherwise by the hash of their content, which
+also hits for equal triggers decoded or generated again.  Either way the content of the
+chunk must equal the content it was encoded from, so decoded conditions and actions
+edited in place are encoded again.
+"""
+
+import collections
+import dataclasses
+from typing import Any, Optional
+
+from .....model.richchk.richchk_encode_context import RichChkEncodeContext
+from .....model.richchk.trig.rich_trigger import RichTrigger
+from .....model.richchk.trig.rich_trigger_chunk import RichTriggerChunk
+
+
+@dataclasses.dataclass(frozen=True)
+class _CachedChunk:
+    content: tuple[Any, ...]
+    # the entry keeps the triggers alive, so their IDs cannot be reused
+    triggers: tuple[RichTrigger, ...]
+    trigger_ids: tuple[int, ...]
+    encoded_chunk: bytes
+    # the context the chunk was encoded with
+    context: RichChkEncodeContext
+
+
+class TrigChunkBytesCache:
+    """The encoded bytes of trigger chunks, least recently used evicted first.
+
+    Encoded bytes depend on the IDs of the strings, locations, switches and CUWPs in the
+    encode context, so a chunk is only reused while the context keeps every ID of the
+    context it was encoded with.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """:param max_size: the most encoded bytes to keep, over all chunks."""
+        self._max_size = max_size
+        self._size = 0
+        self._context: Optional[RichChkEncodeContext] = None
+        # id(context of cached chunks) → (that context, whether the current context
+        # encodes the same), the cached chunks keep the contexts alive
+        self._encodes_same_by_context_id: dict[
+            int, tuple[RichChkEncodeContext, bool]
+        ] = {}
+        self._chunks_by_content_hash: collections.OrderedDict[
+            int, _CachedChunk
+        ] = collections.OrderedDict()
+        # an entry may be stale once its triggers are edited in place, so it is only
+        # a hint of where the chunk of those triggers is
+        self._content_hash_by_trigger_ids: dict[tuple[int, ...], int] = {}
+
+    def use_context(self, context: RichChkEncodeContext) -> None:
+        """Encode the next chunks with the context."""
+        if self._context is not context:
+            self._context = context
+            self._encodes_same_by_context_id.clear()
+
+    def clear(self) -> None:
+        self._chunks_by_content_hash.clear()
+        self._content_hash_by_trigger_ids.clear()
+        self._encodes_same_by_context_id.clear()
+        self._size = 0
+
+    def get(self, chunk: RichTriggerChunk) -> Optional[bytes]:
+        trigger_ids = tuple(map(id, chunk.triggers))
+        # the content of the same triggers holds the same rich conditions and actions,
+        # which compare by identity, so checking it is much cheaper than hashing it
+        content = chunk.content()
+        content_hash = self._content_hash_by_trigger_ids.get(trigger_ids)
+        cached = None
+        if content_hash is not None:
+            cached = self._chunks_by_content_hash.get(content_hash)
+        if (
+            content_hash is None
+            or cached is None
+            or cached.trigger_ids != trigger_ids
+            or cached.content != content
+        ):
+            content_hash = self._hash(content)
+            if content_hash is None:
+                return None
+            cached = self._chunks_by_content_hash.get(content_hash)
+            if cached is None or cached.content != content:
+                return None
+        context = self._current_context()
+        if cached.context is not context and not self._encodes_same(cached.context):
+            return None
+        if cached.trigger_ids != trigger_ids or cached.context is not context:
+            # find these triggers by identity, with this context, the next time
+            cached = self._replace(
+                content_hash,
+                cached,
+                _CachedChunk(
+                    content,
+                    chunk.triggers,
+                    trigger_ids,
+                    cached.encoded_chunk,
+                    context,
+                ),
+            )
+        self._chunks_by_content_hash.move_to_end(content_hash)
+        return cached.encoded_chunk
+
+    def put(self, chunk: RichTriggerChunk, encoded_chunk: bytes) -> None:
+        content = chunk.content()
+        content_hash = self._hash(content)
+        if content_hash is None:
+            return
+        new = _CachedChunk(
+            content,
+            chunk.triggers,
+            tuple(map(id, chunk.triggers)),
+            encoded_chunk,
+            self._current_context(),
+        )
+        old = self._chunks_by_content_hash.get(content_hash)
+        if old is not None:
+            self._replace(content_hash, old, new)
+            return
+        self._chunks_by_content_hash[content_hash] = new
+        self._content_hash_by_trigger_ids[new.trigger_ids] = content_hash
+        self._size += len(encoded_chunk)
+        while self._size > self._max_size:
+            evicted_hash, evicted = self._chunks_by_content_hash.popitem(last=False)
+            self._forget_trigger_ids(evicted.trigger_ids, evicted_hash)
+            self._size -= len(evicted.encoded_chunk)
+
+    @staticmethod
+    def _hash(content: tuple[Any, ...]) -> Optional[int]:
+        """The hash of the content, or None if a condition or action is unhashable."""
+        try:
+            return hash(content)
+        except TypeError:
+            return None
+
+    def _current_context(self) -> RichChkEncodeContext:
+        if self._context is None:
+            raise ValueError("No encode context is used, call use_context first.")
+        return self._context
+
+    def _encodes_same(self, old_context: RichChkEncodeContext) -> bool:
+        """Whether chunks encoded with the old context encode the same with the current
+        one."""
+        cached = self._encodes_same_by_context_id.get(id(old_context))
+        if cached is not None and cached[0] is old_context:
+            return cached[1]
+        context = self._current_context()
+        encodes_same = (
+            old_context.wav_metadata_lookup is context.wav_metadata_lookup
+            and context.preserves_ids_of(old_context)
+        )
+        self._encodes_same_by_context_id[id(old_context)] = (old_context, encodes_same)
+        return encodes_same
+
+    def _replace(
+        self, content_hash: int, old: _CachedChunk, new: _CachedChunk
+    ) -> _CachedChunk:
+        self._forget_trigger_ids(old.trigger_ids, content_hash)
+        self._chunks_by_content_hash[content_hash] = new
+        self._content_hash_by_trigger_ids[new.trigger_ids] = content_hash
+        self._size += len(new.encoded_chunk) - len(old.encoded_chunk)
+        return new
+
+    def _forget_trigger_ids(
+        self, trigger_ids: tuple[int, ...], content_hash: int
+    ) -> None:
+        """Forget where the chunk of the triggers is, unless they moved to another chunk
+        since."""
+        if self._content_hash_by_trigger_ids.get(trigger_ids) == content_hash:
+            del self._content_hash_by_trigger_ids[trigger_ids]
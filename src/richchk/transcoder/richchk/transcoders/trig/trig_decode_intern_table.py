@@ -0,0 +1,148 @@
+"""Share the rich conditions, actions and player sets decoded from equal slots of one
+TRIG section.
+
+Maps repeat the same conditions and actions across many triggers, like the
+PreserveTrigger action or the same DeathsCondition on the same unit.  Rich conditions,
+actions and player sets are immutable, so a slot equal to one already decoded reuses
+the object decoded for it instead of decoding it again.  Slots are keyed by the tuple of
+their field values, which holds exactly the bytes of the slot.
+
+What a slot decodes to depends on the strings and locations of its map, so a table only
+lives for the decode of one section.  Slots kept decoded, because no transcoder
+supports them, are mutable and are never shared.
+"""
+
+import operator
+from typing import Callable, Hashable, Iterable, Union
+
+from .....model.chk.trig.decoded_trig_columns import DecodedTrigColumns
+from .....model.chk.trig.decoded_trigger_action import DecodedTriggerAction
+from .....model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
+from .....model.richchk.richchk_decode_context import RichChkDecodeContext
+from .....model.richchk.trig.player_id import PlayerId
+from .....model.richchk.trig.rich_trigger_action import RichTriggerAction
+from .....model.richchk.trig.rich_trigger_condition import RichTriggerCondition
+from .compiled_trigger_codecs import CompiledTriggerCodecs
+
+_AnyCondition = Union[RichTriggerCondition, DecodedTriggerCondition]
+_AnyAction = Union[RichTriggerAction, DecodedTriggerAction]
+
+_condition_values = operator.attrgetter(
+    *[name for name, _ in DecodedTrigColumns.CONDITION_FIELDS]
+)
+_action_values = operator.attrgetter(
+    *[name for name, _ in DecodedTrigColumns.ACTION_FIELDS]
+)
+
+
+class TrigDecodeInternTable:
+    """The objects decoded from the slots of one TRIG section, by slot values."""
+
+    def __init__(self, rich_chk_decode_context: RichChkDecodeContext) -> None:
+        self._context = rich_chk_decode_context
+        self._conditions_by_values: dict[tuple[int, ...], RichTriggerCondition] = {}
+        self._actions_by_values: dict[tuple[int, ...], RichTriggerAction] = {}
+        self._players_by_key: dict[Hashable, frozenset[PlayerId]] = {}
+
+    def decode_conditions(
+        self, decoded_conditions: Iterable[DecodedTriggerCondition]
+    ) -> list[_AnyCondition]:
+        """Decode the conditions, skipping empty slots."""
+        conditions = []
+        conditions_by_values = self._conditions_by_values
+        for decoded_condition in decoded_conditions:
+            values = _condition_values(decoded_condition)
+            condition = conditions_by_values.get(values)
+            if condition is None:
+                maybe_condition = CompiledTriggerCodecs.decode_condition(
+                    decoded_condition, self._context
+                )
+                if maybe_condition is None:
+                    continue
+                if isinstance(maybe_condition, RichTriggerCondition):
+                    conditions_by_values[values] = maybe_condition
+                conditions.append(maybe_condition)
+            else:
+                conditions.append(condition)
+        return conditions
+
+    def decode_condition_columns(
+        self, columns: DecodedTrigColumns, indices: Iterable[int]
+    ) -> list[_AnyCondition]:
+        """Decode the conditions at the indices of the condition columns, skipping
+        empty slots and only building the slots not decoded yet."""
+        conditions = []
+        conditions_by_values = self._conditions_by_values
+        condition_columns = columns.condition_columns
+        for index in indices:
+            values = tuple([column[index] for column in condition_columns])
+            condition = conditions_by_values.get(values)
+            if condition is None:
+                maybe_condition = CompiledTriggerCodecs.decode_condition(
+                    DecodedTriggerCondition(*values), self._context
+                )
+                if maybe_condition is None:
+                    continue
+                if isinstance(maybe_condition, RichTriggerCondition):
+                    conditions_by_values[values] = maybe_condition
+                conditions.append(maybe_condition)
+            else:
+                conditions.append(condition)
+        return conditions
+
+    def decode_actions(
+        self, decoded_actions: Iterable[DecodedTriggerAction]
+    ) -> list[_AnyAction]:
+        """Decode the actions, skipping empty slots."""
+        actions = []
+        actions_by_values = self._actions_by_values
+        for decoded_action in decoded_actions:
+            values = _action_values(decoded_action)
+            action = actions_by_values.get(values)
+            if action is None:
+                maybe_action = CompiledTriggerCodecs.decode_action(
+                    decoded_action, self._context
+                )
+                if maybe_action is None:
+                    continue
+                if isinstance(maybe_action, RichTriggerAction):
+                    actions_by_values[values] = maybe_action
+                actions.append(maybe_action)
+            else:
+                actions.append(action)
+        return actions
+
+    def decode_action_columns(
+        self, columns: DecodedTrigColumns, indices: Iterable[int]
+    ) -> list[_AnyAction]:
+        """Decode the actions at the indices of the action columns, skipping empty
+        slots and only building the slots not decoded yet."""
+        actions = []
+        actions_by_values = self._actions_by_values
+        action_columns = columns.action_columns
+        for index in indices:
+            values = tuple([column[index] for column in action_columns])
+            action = actions_by_values.get(values)
+            if action is None:
+                maybe_action = CompiledTriggerCodecs.decode_action(
+                    DecodedTriggerAction(*values), self._context
+                )
+                if maybe_action is None:
+                    continue
+                if isinstance(maybe_action, RichTriggerAction):
+                    actions_by_values[values] = maybe_action
+                actions.append(maybe_action)
+            else:
+                actions.append(action)
+        return actions
+
+    def players(
+        self, key: Hashable, decode: Callable[[], frozenset[PlayerId]]
+    ) -> frozenset[PlayerId]:
+        """The players decoded for the key, decoding them the first time the key is
+        seen."""
+        players = self._players_by_key.get(key)
+        if players is None:
+            players = decode()
+            self._players_by_key[key] = players
+        return players
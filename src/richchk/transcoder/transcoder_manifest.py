@@ -0,0 +1,176 @@
+"""Where each registered transcoder is defined, keyed by the name of its ID.
+
+Generated by richchk.transcoder.transcoder_manifest_generator; do not edit.
+"""
+
+
+CHK_SECTION_TRANSCODERS_PACKAGE = "richchk.transcoder.chk.transcoders"
+CHK_SECTION_TRANSCODER_MODULES: dict[str, str] = {
+    "DD2": "chk_dd2_transcoder",
+    "DIM": "chk_dim_transcoder",
+    "ERA": "chk_era_transcoder",
+    "FORC": "chk_forc_transcoder",
+    "ISOM": "chk_isom_transcoder",
+    "MASK": "chk_mask_transcoder",
+    "MBRF": "chk_mbrf_transcoder",
+    "MRGN": "chk_mrgn_transcoder",
+    "MTXM": "chk_mtxm_transcoder",
+    "OWNR": "chk_ownr_transcoder",
+    "PTEC": "chk_ptec_transcoder",
+    "PTEX": "chk_ptex_transcoder",
+    "PUNI": "chk_puni_transcoder",
+    "PUPX": "chk_pupx_transcoder",
+    "SIDE": "chk_side_transcoder",
+    "SPRP": "chk_sprp_transcoder",
+    "STR": "chk_str_transcoder",
+    "STRX": "chk_strx_transcoder",
+    "SWNM": "chk_swnm_transcoder",
+    "TECS": "chk_tecs_transcoder",
+    "TECX": "chk_tecx_transcoder",
+    "THG2": "chk_thg2_transcoder",
+    "TILE": "chk_tile_transcoder",
+    "TRIG": "chk_trig_transcoder",
+    "UNIS": "chk_unis_transcoder",
+    "UNIX": "chk_unix_transcoder",
+    "UPGR": "chk_upgr_transcoder",
+    "UPGS": "chk_upgs_transcoder",
+    "UPGX": "chk_upgx_transcoder",
+    "UPRP": "chk_uprp_transcoder",
+    "UPUS": "chk_upus_transcoder",
+    "VER": "chk_ver_transcoder",
+    "WAV": "chk_wav_transcoder",
+}
+
+RICHCHK_SECTION_TRANSCODERS_PACKAGE = "richchk.transcoder.richchk.transcoders"
+RICHCHK_SECTION_TRANSCODER_MODULES: dict[str, str] = {
+    "DD2": "rich_dd2_transcoder",
+    "DIM": "rich_dim_transcoder",
+    "ERA": "rich_era_transcoder",
+    "FORC": "rich_forc_transcoder",
+    "ISOM": "rich_isom_transcoder",
+    "MASK": "rich_mask_transcoder",
+    "MBRF": "richchk_mbrf_transcoder",
+    "MRGN": "richchk_mrgn_transcoder",
+    "MTXM": "rich_mtxm_transcoder",
+    "OWNR": "rich_ownr_transcoder",
+    "PTEC": "rich_ptec_transcoder",
+    "PTEX": "rich_ptex_transcoder",
+    "PUNI": "rich_puni_transcoder",
+    "PUPX": "rich_pupx_transcoder",
+    "SIDE": "rich_side_transcoder",
+    "SPRP": "richchk_sprp_transcoder",
+    "SWNM": "rich_swnm_transcoder",
+    "TECS": "rich_tecs_transcoder",
+    "TECX": "rich_tecx_transcoder",
+    "THG2": "rich_thg2_transcoder",
+    "TILE": "rich_tile_transcoder",
+    "TRIG": "richchk_trig_transcoder",
+    "UNIS": "richchk_unis_transcoder",
+    "UNIX": "richchk_unix_transcoder",
+    "UPGR": "rich_upgr_transcoder",
+    "UPGS": "rich_upgs_transcoder",
+    "UPGX": "rich_upgx_transcoder",
+    "UPRP": "richchk_uprp_transcoder",
+    "VER": "rich_ver_transcoder",
+    "WAV": "rich_wav_transcoder",
+}
+
+TRIGGER_ACTION_TRANSCODERS_PACKAGE = (
+    "richchk.transcoder.richchk.transcoders.trig.actions"
+)
+TRIGGER_ACTION_TRANSCODER_MODULES: dict[str, str] = {
+    "CENTER_VIEW": "rich_trig_center_view_action_transcoder",
+    "CREATE_UNIT": "rich_trig_create_unit_action_transcoder",
+    "CREATE_UNIT_WITH_PROPERTIES": "rich_trig_create_unit_with_properties_action_transcoder",
+    "DEFEAT": "rich_trigger_defeat_action_transcoder",
+    "DISPLAY_TEXT_MESSAGE": "rich_trig_display_text_message_action_transcoder",
+    "DRAW": "draw_transcoder",
+    "GIVE_UNITS_TO_PLAYER": "give_units_transcoder",
+    "KILL_UNIT": "kill_unit_action_transcoder",
+    "KILL_UNIT_AT_LOCATION": "kill_unit_at_location_action_transcoder",
+    "LEADERBOARD_COMPUTER_PLAYERS": "leaderboard_toggle_computers_transcoder",
+    "LEADERBOARD_GOAL_CONTROL": "leaderboard_goal_control_unit_transcoder",
+    "LEADERBOARD_GOAL_CONTROL_AT_LOCATION": "leaderboard_goal_control_unit_at_location_transcoder",
+    "LEADERBOARD_GOAL_KILLS": "leaderboard_goal_kills_transcoder",
+    "LEADERBOARD_GOAL_POINTS": "leaderboard_goal_score_transcoder",
+    "LEADERBOARD_GOAL_RESOURCES": "leaderboard_goal_resources_transcoder",
+    "LEADERBOARD_GREED": "leaderboard_goal_greed_transcoder",
+    "LEADER_BOARD_CONTROL": "leaderboard_show_control_unit_transcoder",
+    "LEADER_BOARD_CONTROL_AT_LOCATION": "leaderboard_show_control_unit_at_location_transcoder",
+    "LEADER_BOARD_KILLS": "leaderboard_show_kills_transcoder",
+    "LEADER_BOARD_POINTS": "leaderboard_show_score_transcoder",
+    "LEADER_BOARD_RESOURCES": "leaderboard_show_resources_transcoder",
+    "MINIMAP_PING": "minimap_ping_transcoder",
+    "MODIFY_UNIT_ENERGY": "modify_unit_energy_transcoder",
+    "MODIFY_UNIT_HANGER_COUNT": "modify_unit_hanger_transcoder",
+    "MODIFY_UNIT_HIT_POINTS": "modify_unit_hitpoints_transcoder",
+    "MODIFY_UNIT_RESOURCE_AMOUNT": "modify_unit_resources_transcoder",
+    "MODIFY_UNIT_SHIELD_POINTS": "modify_unit_shields_transcoder",
+    "MOVE_LOCATION": "move_location_to_unit_transcoder",
+    "MOVE_UNIT": "move_unit_transcoder",
+    "ORDER": "order_transcoder",
+    "PAUSE_GAME": "rich_trigger_pause_game_action_transcoder",
+    "PAUSE_TIMER": "pause_countdown_timer_transcoder",
+    "PLAY_WAV": "play_wav_action_transcoder",
+    "PRESERVE_TRIGGER": "rich_trigger_preserve_trigger_action_transcoder",
+    "REMOVE_UNIT": "remove_unit_action_transcoder",
+    "REMOVE_UNIT_AT_LOCATION": "remove_unit_at_location_action_transcoder",
+    "RUN_AI_SCRIPT": "rich_trig_run_ai_script_action_transcoder",
+    "RUN_AI_SCRIPT_AT_LOCATION": "rich_trig_run_ai_script_at_location_action_transcoder",
+    "SET_ALLIANCE_STATUS": "set_alliance_status_transcoder",
+    "SET_COUNTDOWN_TIMER": "set_countdown_timer_transcoder",
+    "SET_DEATHS": "set_deaths_transcoder",
+    "SET_DOODAD_STATE": "set_doodad_state_transcoder",
+    "SET_INVINCIBILITY": "set_invincibility_transcoder",
+    "SET_MISSION_OBJECTIVES": "rich_trig_set_mission_objectives_action_transcoder",
+    "SET_RESOURCES": "set_resources_action_transcoder",
+    "SET_SCORE": "set_score_action_transcoder",
+    "SET_SWITCH": "rich_trig_set_switch_action_transcoder",
+    "UNPAUSE_GAME": "rich_trigger_unpause_game_action_transcoder",
+    "UNPAUSE_TIMER": "unpause_countdown_timer_transcoder",
+    "VICTORY": "rich_trig_victory_action_transcoder",
+    "WAIT": "rich_trigger_wait_action_transcoder",
+}
+
+TRIGGER_CONDITION_TRANSCODERS_PACKAGE = (
+    "richchk.transcoder.richchk.transcoders.trig.conditions"
+)
+TRIGGER_CONDITION_TRANSCODER_MODULES: dict[str, str] = {
+    "ACCUMULATE": "rich_trigger_accumulate_resources_condition_transcoder",
+    "ALWAYS": "rich_trigger_always_condition_transcoder",
+    "BRING": "rich_trigger_bring_condition_transcoder",
+    "COMMAND": "rich_trigger_command_condition_transcoder",
+    "COMMANDS_THE_MOST_AT": "rich_trigger_command_most_at_condition_transcoder",
+    "COMMAND_THE_LEAST": "rich_trigger_command_least_condition_transcoder",
+    "COMMAND_THE_LEAST_AT": "rich_trigger_command_least_at_condition_transcoder",
+    "COMMAND_THE_MOST": "rich_trigger_command_most_condition_transcoder",
+    "COUNTDOWN_TIMER": "rich_trigger_countdown_timer_condition_transcoder",
+    "DEATHS": "rich_trigger_deaths_condition_transcoder",
+    "ELAPSED_TIME": "rich_trigger_elapsed_time_condition_transcoder",
+    "HIGHEST_SCORE": "rich_trigger_highest_score_condition_transcoder",
+    "KILL": "rich_trigger_kill_condition_transcoder",
+    "LEAST_KILLS": "rich_trigger_least_kills_condition_transcoder",
+    "LEAST_RESOURCES": "rich_trigger_least_resources_condition_transcoder",
+    "LOWEST_SCORE": "rich_trigger_lowest_score_condition_transcoder",
+    "MOST_KILLS": "rich_trigger_most_kills_condition_transcoder",
+    "MOST_RESOURCES": "rich_trigger_most_resources_condition_transcoder",
+    "NEVER": "rich_trigger_never_condition_transcoder",
+    "OPPONENTS": "rich_trigger_opponents_remaining_condition_transcoder",
+    "SCORE": "rich_trigger_score_condition_transcoder",
+    "SWITCH": "rich_trigger_switch_condition_transcoder",
+}
+
+BRIEFING_ACTION_TRANSCODERS_PACKAGE = (
+    "richchk.transcoder.richchk.transcoders.mbrf.actions"
+)
+BRIEFING_ACTION_TRANSCODER_MODULES: dict[str, str] = {
+    "DISPLAY_SPEAKING_PORTRAIT": "display_speaking_portrait_briefing_action_transcoder",
+    "HIDE_PORTRAIT": "hide_portrait_briefing_action_transcoder",
+    "MISSION_OBJECTIVES": "mission_objectives_briefing_action_transcoder",
+    "PLAY_WAV": "play_wav_briefing_action_transcoder",
+    "SHOW_PORTRAIT": "show_portrait_briefing_action_transcoder",
+    "SKIP_TUTORIAL_ENABLED": "skip_tutorial_enabled_briefing_action_transcoder",
+    "TEXT_MESSAGE": "text_message_briefing_action_transcoder",
+    "TRANSMISSION": "transmission_briefing_action_transcoder",
+    "WAIT": "wait_briefing_action_transcoder",
+}
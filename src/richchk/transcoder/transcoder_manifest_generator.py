@@ -0,0 +1,107 @@
+"""Generate the transcoder manifest which lets the transcoder factories import lazily.
+
+The factories look up the module of a transcoder in the manifest the first time its ID
+is requested, instead of importing every transcoder up front.  Regenerate the manifest
+whenever a transcoder is added, renamed or moved:
+
+python -m richchk.transcoder.transcoder_manifest_generator
+"""
+
+import importlib
+import os
+from typing import Any, Callable
+
+from ..util.subpackages_importer import import_all_modules_in_subpackage
+
+_RICHCHK_PACKAGE_NAME = "richchk"
+# the line length of black, which formats the generated manifest like the sources
+_MAX_LINE_LENGTH = 88
+_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "transcoder_manifest.py")
+
+# manifest name prefix, the package of the transcoders, and the factory registry
+_MANIFEST_SPECS: list[tuple[str, str, Callable[[], dict[Any, type]]]] = [
+    (
+        "CHK_SECTION",
+        "richchk.transcoder.chk.transcoders",
+        lambda: importlib.import_module(
+            "richchk.transcoder.chk.chk_section_transcoder_factory"
+        ).ChkSectionTranscoderFactory.transcoders,
+    ),
+    (
+        "RICHCHK_SECTION",
+        "richchk.transcoder.richchk.transcoders",
+        lambda: importlib.import_module(
+            "richchk.transcoder.richchk.richchk_section_transcoder_factory"
+        ).RichChkSectionTranscoderFactory.transcoders,
+    ),
+    (
+        "TRIGGER_ACTION",
+        "richchk.transcoder.richchk.transcoders.trig.actions",
+        lambda: importlib.import_module(
+            "richchk.transcoder.richchk.transcoders.trig."
+            "rich_trigger_action_transcoder_factory"
+        ).RichTriggerActionTranscoderFactory.transcoders,
+    ),
+    (
+        "TRIGGER_CONDITION",
+        "richchk.transcoder.richchk.transcoders.trig.conditions",
+        lambda: importlib.import_module(
+            "richchk.transcoder.richchk.transcoders.trig."
+            "rich_trigger_condition_transcoder_factory"
+        ).RichTriggerConditionTranscoderFactory.transcoders,
+    ),
+    (
+        "BRIEFING_ACTION",
+        "richchk.transcoder.richchk.transcoders.mbrf.actions",
+        lambda: importlib.import_module(
+            "richchk.transcoder.richchk.transcoders.mbrf."
+            "rich_briefing_action_transcoder_factory"
+        ).RichBriefingActionTranscoderFactory.transcoders,
+    ),
+]
+
+_MANIFEST_HEADER = '''"""Where each registered transcoder is defined, keyed by the name of its ID.
+
+Generated by richchk.transcoder.transcoder_manifest_generator; do not edit.
+"""
+'''
+
+
+def render_transcoder_manifest() -> str:
+    """Import every transcoder and render the manifest of where each one is defined."""
+    lines = [_MANIFEST_HEADER]
+    for prefix, package_name, get_registered_transcoders in _MANIFEST_SPECS:
+        parent_package_name, subpackage_name = package_name.rsplit(".", 1)
+        import_all_modules_in_subpackage(
+            parent_package_name[len(_RICHCHK_PACKAGE_NAME) :], subpackage_name
+        )
+        modules_by_name = {}
+        for transcoded_id, transcoder in get_registered_transcoders().items():
+            if not transcoder.__module__.startswith(f"{package_name}."):
+                raise ValueError(
+                    f"{transcoder.__name__} must be defined in {package_name}."
+                )
+            modules_by_name[transcoded_id.name] = transcoder.__module__[
+                len(package_name) + 1 :
+            ]
+        lines.append("")
+        package_line = f'{prefix}_TRANSCODERS_PACKAGE = "{package_name}"'
+        if len(package_line) > _MAX_LINE_LENGTH:
+            package_line = f'{prefix}_TRANSCODERS_PACKAGE = (\n    "{package_name}"\n)'
+        lines.append(package_line)
+        lines.append(f"{prefix}_TRANSCODER_MODULES: dict[str, str] = {{")
+        for name, module_name in sorted(modules_by_name.items()):
+            lines.append(f'    "{name}": "{module_name}",')
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    # render before opening, since rendering imports the current manifest
+    manifest = render_transcoder_manifest()
+    with open(_MANIFEST_PATH, "w") as f:
+        f.write(manifest)
+
+
+if __name__ == "__main__":
+    main()
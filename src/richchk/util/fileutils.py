@@ -24,11 +24,13 @@ class CrossPlatformSafeTemporaryNamedFile:
         delete: bool = True,
         prefix: Optional[str] = None,
         suffix: Optional[str] = None,
+        directory: Optional[str] = None,
     ) -> None:
         self._delete = delete
         self._filename = ""
         self._prefix = prefix
         self._suffix = suffix
+        self._directory = directory
 
     def __enter__(self) -> str:
         # Generate a random temporary file name
@@ -45,14 +47,16 @@ class CrossPlatformSafeTemporaryNamedFile:
         parts.append(os.urandom(24).hex())
         if self._suffix:
             parts.append(self._suffix)
-        return os.path.join(tempfile.gettempdir(), "".join(parts))
+        return os.path.join(self._directory or tempfile.gettempdir(), "".join(parts))
 
     def __exit__(
         self, exc_type: typing.Any, exc_val: typing.Any, exc_tb: typing.Any
     ) -> None:
         if self._delete:
             assert isinstance(self._filename, str)
-            os.remove(self._filename)
+            # the file may have been moved in place of another one already
+            if os.path.exists(self._filename):
+                os.remove(self._filename)
 
 
 def absolute_filepaths(
@@ -8,9 +8,7 @@ import logging
 import os
 from typing import Optional
 
-import yaml
-
-from richchk.config.richchk_config import RICHCHK_CONFIG_ENV_VAR
+from richchk.config.richchk_config import RICHCHK_CONFIG_ENV_VAR, load_richchk_config
 
 SCRIPT_PATH = os.path.dirname(os.path.realpath(__file__))
 LOGDIR = os.path.join(SCRIPT_PATH, "logs")
@@ -100,24 +98,21 @@ def _determine_log_level_or_default() -> int:
     if cache_key in _log_level_cache:
         return _log_level_cache[cache_key]
     innerlog = get_logger("RichChkLoggingConfig", _use_default_log_level=True)
-    if maybe_config_file and os.path.exists(maybe_config_file):
-        # Read config file
-        with open(maybe_config_file, "r") as f:
-            config = yaml.safe_load(f)
-        # Get logging level from config
-        log_level = config["logging"]["level"]
-        # Convert log level string to logging module level
-        logging_level = getattr(logging, log_level.upper(), _DEFAULT_LOG_LEVEl)
-        innerlog.debug(
-            f"Using non-default log level {log_level} specified in {maybe_config_file}"
-        )
-        _log_level_cache[cache_key] = logging_level
-        return logging_level
-    elif maybe_config_file and not os.path.exists(maybe_config_file):
+    if maybe_config_file and not os.path.exists(maybe_config_file):
         innerlog.error(
             f"No logging config file exists at path specified "
             f"by environment variable {RICHCHK_CONFIG_ENV_VAR} ; using default logging level.  "
             f"File {maybe_config_file} does not exist!"
         )
-    _log_level_cache[cache_key] = _DEFAULT_LOG_LEVEl
-    return _DEFAULT_LOG_LEVEl
+    # the config may only configure other things
+    log_level = (load_richchk_config().get("logging") or {}).get("level")
+    if not log_level:
+        _log_level_cache[cache_key] = _DEFAULT_LOG_LEVEl
+        return _DEFAULT_LOG_LEVEl
+    # Convert log level string to logging module level
+    logging_level = getattr(logging, log_level.upper(), _DEFAULT_LOG_LEVEl)
+    innerlog.debug(
+        f"Using non-default log level {log_level} specified in {maybe_config_file}"
+    )
+    _log_level_cache[cache_key] = logging_level
+    return logging_level
@@ -1,10 +1,13 @@
 """Load all modules from a given subpackage relative to a parent package.
 
-Use this to enable the factory pattern for dynamic class registration.
+Use this to enable the factory pattern for dynamic class registration.  Factories with
+a generated manifest of the module defining each registered class can instead import a
+module only once its class is first needed.
 """
 
 import importlib
 import pkgutil
+from typing import Mapping
 
 _CHKJSON_PACKAGE_NAME = "richchk"
 
@@ -21,3 +24,27 @@ def import_all_modules_in_subpackage(package_name: str, subpackage_name: str) ->
             f"{package_name}.{subpackage_name}.{module_name}",
             package=_CHKJSON_PACKAGE_NAME,
         )
+
+
+def import_manifest_module(
+    package_name: str, modules_by_name: Mapping[str, str], name: str
+) -> bool:
+    """Import the module which registers the class for a name in a manifest.
+
+    :param package_name: absolute name of the package containing the manifest modules.
+    :param modules_by_name: manifest of registered names to module names in the package.
+    :param name:
+    :return: whether the manifest lists a module for the name.
+    """
+    module_name = modules_by_name.get(name)
+    if module_name is None:
+        return False
+    importlib.import_module(f"{package_name}.{module_name}")
+    return True
+
+
+def import_all_manifest_modules(
+    package_name: str, modules_by_name: Mapping[str, str]
+) -> None:
+    for module_name in sorted(set(modules_by_name.values())):
+        importlib.import_module(f"{package_name}.{module_name}")
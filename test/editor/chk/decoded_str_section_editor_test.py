@@ -87,3 +87,36 @@ def test_added_strings_have_correct_offsets(str_section):
         next_strings_to_add, str_section
     )
     assert_string_offsets_are_valid_for_str(next_new_str)
+
+
+def test_strings_added_one_at_a_time_match_strings_added_at_once(str_section):
+    strings_to_add = [str(uuid.uuid4()) for _ in range(5)]
+    new_str = str_section
+    for string_to_add in strings_to_add:
+        new_str = DecodedStrSectionEditor().add_strings_to_str_section(
+            [string_to_add, _EXPECTED_STRINGS[0]], new_str
+        )
+    assert new_str == DecodedStrSectionEditor().add_strings_to_str_section(
+        strings_to_add, str_section
+    )
+    assert_string_offsets_are_valid_for_str(new_str)
+
+
+def test_it_does_not_add_a_string_again_after_adding_it_to_an_edited_section(
+    str_section,
+):
+    string_to_add = str(uuid.uuid4())
+    new_str = DecodedStrSectionEditor().add_strings_to_str_section(
+        [string_to_add], str_section
+    )
+    assert (
+        DecodedStrSectionEditor().add_strings_to_str_section([string_to_add], new_str)
+        is new_str
+    )
+    # the original section does not have the string, even after the edit
+    assert (
+        DecodedStrSectionEditor().add_strings_to_str_section(
+            [string_to_add], str_section
+        )
+        == new_str
+    )
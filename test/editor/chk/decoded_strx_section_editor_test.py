@@ -101,3 +101,16 @@ def _assert_new_strings_are_added(new_strx, old_strx, strings_added):
     )
     assert len(new_strx.strings) == (len(old_strx.strings) + len(strings_added))
     assert new_strx.strings[:index_for_newly_added_strings] == old_strx.strings
+
+
+def test_strings_added_one_at_a_time_match_strings_added_at_once(decoded_strx):
+    strings_to_add = [str(uuid.uuid4()) for _ in range(5)]
+    new_strx = decoded_strx
+    for string_to_add in strings_to_add:
+        new_strx = DecodedStrxSectionEditor().add_strings_to_strx_section(
+            [string_to_add, _EXPECTED_STRINGS[0]], new_strx
+        )
+    assert new_strx == DecodedStrxSectionEditor().add_strings_to_strx_section(
+        strings_to_add, decoded_strx
+    )
+    assert_string_offsets_are_valid_for_strx(new_strx)
@@ -1,10 +1,19 @@
 """"""
 
+import pytest
+
 from richchk.editor.richchk.rich_chk_editor import RichChkEditor
-from richchk.model.richchk.rich_chk import RichChk
+from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.richchk_io import RichChkIo
+from richchk.model.chk.decoded_chk_section import DecodedChkSection
+from richchk.model.chk_section_index import ChkSectionIndex
+from richchk.model.chk_section_name import ChkSectionName
+from richchk.model.richchk.rich_chk import RichChk, RichChkLineage
+from richchk.model.richchk.rich_chk_section import RichChkSection
 from richchk.model.richchk.unis.unit_id import UnitId
 from richchk.model.richchk.unix.rich_unix_section import RichUnixSection
 
+from ...chk_resources import DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH
 from ...fixtures.unit_settings_fixtures import (
     generate_rich_unix_with_terran_marine_setting,
     generate_unit_setting,
@@ -40,3 +49,56 @@ def test_it_does_not_modify_rich_chk_if_section_not_found():
     modified_rich_chk = editor.replace_chk_section(new_unix, rich_chk)
     assert new_unix not in modified_rich_chk.chk_sections
     assert modified_rich_chk == rich_chk
+
+
+def test_edited_rich_chks_keep_the_lineage():
+    lineage = RichChkLineage()
+    rich_unix = generate_rich_unix_with_terran_marine_setting()
+    rich_chk = RichChk(_chk_sections=[rich_unix], _lineage=lineage)
+    new_unix = RichUnixSection(
+        _unit_settings=[generate_unit_setting(UnitId.ZERG_ZERGLING)]
+    )
+    editor = RichChkEditor()
+    replaced = editor.replace_chk_section(new_unix, rich_chk)
+    removed = RichChkEditor.remove_chk_sections_by_name(
+        RichUnixSection.section_name(), replaced
+    )
+    added = RichChkEditor.add_chk_section(rich_unix, removed)
+    assert replaced.lineage is lineage
+    assert removed.lineage is lineage
+    assert added.lineage is lineage
+    assert added == rich_chk
+
+
+@pytest.fixture(scope="module")
+def demon_lore_rich_chk() -> RichChk:
+    return RichChkIo().decode_chk(
+        ChkIo().decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    )
+
+
+def _assert_section_index_is_rebuilt_index(rich_chk: RichChk) -> None:
+    assert rich_chk.section_index == ChkSectionIndex.build(rich_chk.chk_sections)
+
+
+def test_edits_keep_the_section_index_in_step_with_the_sections(demon_lore_rich_chk):
+    new_unix = RichUnixSection(
+        _unit_settings=[generate_unit_setting(UnitId.ZERG_ZERGLING)]
+    )
+    replaced = RichChkEditor().replace_chk_section(new_unix, demon_lore_rich_chk)
+    _assert_section_index_is_rebuilt_index(replaced)
+    assert replaced.get_sections_by_name(ChkSectionName.UNIX) == [new_unix]
+    removed = RichChkEditor.remove_chk_sections_by_name(ChkSectionName.UNIX, replaced)
+    _assert_section_index_is_rebuilt_index(removed)
+    assert not removed.contains_section(ChkSectionName.UNIX)
+    added = RichChkEditor.add_chk_section(new_unix, removed)
+    _assert_section_index_is_rebuilt_index(added)
+    assert added.get_sections_by_type(RichUnixSection) == [new_unix]
+
+
+def test_it_gets_sections_by_type(demon_lore_rich_chk):
+    sections = demon_lore_rich_chk.chk_sections
+    for section_type in [RichChkSection, DecodedChkSection, RichUnixSection]:
+        assert demon_lore_rich_chk.get_sections_by_type(section_type) == [
+            section for section in sections if isinstance(section, section_type)
+        ]
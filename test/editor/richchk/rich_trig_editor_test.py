@@ -8,10 +8,18 @@ from richchk.model.richchk.str.rich_string import RichString
 from richchk.model.richchk.trig.actions.display_text_message_action import (
     DisplayTextMessageAction,
 )
+from richchk.model.richchk.trig.actions.set_deaths_action import SetDeathsAction
 from richchk.model.richchk.trig.conditions.always_condition import AlwaysCondition
+from richchk.model.richchk.trig.conditions.comparators.numeric_comparator import (
+    NumericComparator,
+)
+from richchk.model.richchk.trig.conditions.deaths_condition import DeathsCondition
+from richchk.model.richchk.trig.enums.amount_modifier import AmountModifier
 from richchk.model.richchk.trig.player_id import PlayerId
 from richchk.model.richchk.trig.rich_trig_section import RichTrigSection
 from richchk.model.richchk.trig.rich_trigger import RichTrigger
+from richchk.model.richchk.trig.rich_trigger_chunk import RichTriggerChunk
+from richchk.model.richchk.unis.unit_id import UnitId
 
 
 @pytest.fixture(scope="function")
@@ -50,3 +58,46 @@ def test_it_adds_triggers(rich_trig):
     assert len(new_trig.triggers) == len(expected_triggers)
     for expected in expected_triggers:
         assert expected in new_trig.triggers
+
+
+def _deaths_trigger(amount: int) -> RichTrigger:
+    return RichTrigger(
+        _conditions=[
+            DeathsCondition(
+                _group=PlayerId.PLAYER_1,
+                _comparator=NumericComparator.EXACTLY,
+                _amount=amount,
+                _unit=UnitId.TERRAN_MARINE,
+            )
+        ],
+        _actions=[
+            SetDeathsAction(
+                _group=PlayerId.PLAYER_1,
+                _unit=UnitId.TERRAN_MARINE,
+                _amount=amount + 1,
+                _amount_modifier=AmountModifier.SET_TO,
+            )
+        ],
+        _players={PlayerId.PLAYER_1},
+    )
+
+
+def test_it_adds_triggers_in_batches_sharing_the_full_chunks():
+    triggers = [_deaths_trigger(amount) for amount in range(1000)]
+    trig = RichTrigSection(_triggers=[])
+    for start in range(0, len(triggers), 30):
+        previous_chunks = trig.trigger_chunks
+        trig = RichTrigEditor.add_triggers(triggers[start : start + 30], trig)
+        full_chunks = [
+            chunk
+            for chunk in previous_chunks
+            if len(chunk.triggers) == RichTriggerChunk.MAX_NUM_TRIGGERS
+        ]
+        assert all(a is b for a, b in zip(full_chunks, trig.trigger_chunks))
+    expected = RichTrigSection(_triggers=triggers)
+    assert trig == expected
+    assert trig.triggers == triggers
+    assert trig.cond0_amounts_bytes == expected.cond0_amounts_bytes
+    assert trig.cond0_amounts_hash == expected.cond0_amounts_hash
+    assert trig.act0_amounts_bytes == expected.act0_amounts_bytes
+    assert trig.act0_amounts_hash == expected.act0_amounts_hash
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+import yaml
+
+from richchk.config.richchk_config import RICHCHK_CONFIG_ENV_VAR
+from richchk.io.cache.persistent_chk_cache import PersistentChkCache
+from richchk.io.chk.chk_io import ChkIo
+from richchk.util.fileutils import CrossPlatformSafeTemporaryNamedFile
+
+from ...chk_resources import SCX_CHK_FILE
+
+
+def _read_chk_binary_data(chk_file_path) -> bytes:
+    with open(chk_file_path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="function")
+def cache_directory(tmp_path):
+    return str(tmp_path / "chk-cache")
+
+
+def test_it_returns_cached_decoded_chk(cache_directory):
+    cache = PersistentChkCache(cache_directory)
+    chk_binary_data = _read_chk_binary_data(SCX_CHK_FILE)
+    assert cache.get_decoded_chk(chk_binary_data) is None
+    decoded_chk = ChkIo(persistent_cache=cache).decode_chk_binary_data(chk_binary_data)
+    cached_chk = PersistentChkCache(cache_directory).get_decoded_chk(chk_binary_data)
+    assert cached_chk is not None
+    assert cached_chk is not decoded_chk
+    assert cached_chk == decoded_chk
+    assert ChkIo().encode_chk_to_bytes(cached_chk) == chk_binary_data
+
+
+def test_it_misses_for_changed_chk_binary_data(cache_directory):
+    cache = PersistentChkCache(cache_directory)
+    chk_binary_data = _read_chk_binary_data(SCX_CHK_FILE)
+    ChkIo(persistent_cache=cache).decode_chk_binary_data(chk_binary_data)
+    assert cache.get_decoded_chk(chk_binary_data + b"\x00") is None
+
+
+def test_it_does_not_cache_lazy_decoded_chk(cache_directory):
+    cache = PersistentChkCache(cache_directory)
+    chk_binary_data = _read_chk_binary_data(SCX_CHK_FILE)
+    ChkIo(persistent_cache=cache).decode_chk_binary_data(chk_binary_data, lazy=True)
+    assert cache.get_decoded_chk(chk_binary_data) is None
+
+
+def test_it_evicts_least_recently_used_entries(cache_directory):
+    scx_chk_binary_data = _read_chk_binary_data(SCX_CHK_FILE)
+    other_chk_binary_data = scx_chk_binary_data + b"\x00"
+    decoded_chk = ChkIo().decode_chk_binary_data(scx_chk_binary_data)
+    cache = PersistentChkCache(cache_directory)
+    cache.put_decoded_chk(scx_chk_binary_data, decoded_chk)
+    entry_size = sum(
+        entry.stat().st_size for entry in os.scandir(cache.cache_directory)
+    )
+    # room for a single entry only
+    small_cache = PersistentChkCache(
+        cache_directory, max_size_mb=1.5 * entry_size / (1024 * 1024)
+    )
+    entry_path = next(os.scandir(cache.cache_directory)).path
+    os.utime(entry_path, (0, 0))
+    small_cache.put_decoded_chk(other_chk_binary_data, decoded_chk)
+    assert small_cache.get_decoded_chk(scx_chk_binary_data) is None
+    assert small_cache.get_decoded_chk(other_chk_binary_data) == decoded_chk
+
+
+def test_it_ignores_unreadable_entries(cache_directory):
+    cache = PersistentChkCache(cache_directory)
+    chk_binary_data = _read_chk_binary_data(SCX_CHK_FILE)
+    ChkIo(persistent_cache=cache).decode_chk_binary_data(chk_binary_data)
+    for entry in os.scandir(cache.cache_directory):
+        with open(entry.path, "wb") as f:
+            f.write(b"not a pickle")
+    assert cache.get_decoded_chk(chk_binary_data) is None
+    assert not os.listdir(cache.cache_directory)
+
+
+def test_it_refuses_a_non_positive_size_cap(cache_directory):
+    with pytest.raises(ValueError):
+        PersistentChkCache(cache_directory, max_size_mb=0)
+
+
+def test_it_is_built_from_config(cache_directory, monkeypatch):
+    with CrossPlatformSafeTemporaryNamedFile(
+        prefix="config", suffix=".yaml"
+    ) as temp_config_file:
+        with open(temp_config_file, "w") as f:
+            yaml.dump(
+                {"cache": {"directory": cache_directory, "max_size_mb": 16}},
+                f,
+                default_flow_style=False,
+            )
+        monkeypatch.setenv(RICHCHK_CONFIG_ENV_VAR, temp_config_file)
+        cache = PersistentChkCache.from_config()
+        assert cache is not None
+        assert cache.cache_directory == cache_directory
+        assert cache.max_size_bytes == 16 * 1024 * 1024
+        assert PersistentChkCache.from_config() is cache
+
+
+def test_it_is_not_built_without_config(monkeypatch):
+    monkeypatch.setenv(RICHCHK_CONFIG_ENV_VAR, "a-config-file-that-does-not-exist.yaml")
+    assert PersistentChkCache.from_config() is None
@@ -0,0 +1,47 @@
+import pytest
+import yaml
+
+from richchk.config.richchk_config import RICHCHK_CONFIG_ENV_VAR
+from richchk.io.cache.persistent_chk_cache import PersistentChkCache
+from richchk.io.cache.persistent_rich_chk_cache import PersistentRichChkCache
+from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.richchk_io import RichChkIo
+from richchk.util.fileutils import CrossPlatformSafeTemporaryNamedFile
+
+from ...chk_resources import DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH
+
+
+@pytest.fixture(scope="function")
+def cache_directory(tmp_path):
+    return str(tmp_path / "chk-cache")
+
+
+def test_it_returns_cached_rich_chk(cache_directory):
+    cache = PersistentRichChkCache(cache_directory)
+    with open(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, "rb") as f:
+        chk_binary_data = f.read()
+    rich_chk = RichChkIo().decode_chk(ChkIo().decode_chk_binary_data(chk_binary_data))
+    cache.put_rich_chk(chk_binary_data, rich_chk)
+    assert cache.get_decoded_chk(chk_binary_data) is None
+    assert (
+        PersistentRichChkCache(cache_directory).get_rich_chk(chk_binary_data)
+        == rich_chk
+    )
+
+
+def test_it_is_built_from_config_apart_from_the_decoded_chk_cache(
+    cache_directory, monkeypatch
+):
+    with CrossPlatformSafeTemporaryNamedFile(
+        prefix="config", suffix=".yaml"
+    ) as temp_config_file:
+        with open(temp_config_file, "w") as f:
+            yaml.dump(
+                {"cache": {"directory": cache_directory}}, f, default_flow_style=False
+            )
+        monkeypatch.setenv(RICHCHK_CONFIG_ENV_VAR, temp_config_file)
+        cache = PersistentRichChkCache.from_config()
+        assert isinstance(cache, PersistentRichChkCache)
+        assert cache.cache_directory == cache_directory
+        assert PersistentRichChkCache.from_config() is cache
+        assert type(PersistentChkCache.from_config()) is PersistentChkCache
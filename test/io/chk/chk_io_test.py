@@ -1,13 +1,16 @@
 import os
 import uuid
+from io import BytesIO
 from test.chk_resources import DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH
 from typing import TypeVar
 
 import pytest
 
 from richchk.io.chk.chk_io import ChkIo
+from richchk.io.richchk.richchk_io import RichChkIo
 from richchk.model.chk.decoded_chk import DecodedChk
 from richchk.model.chk.decoded_chk_section import DecodedChkSection
+from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
 from richchk.model.chk.unknown.decoded_unknown_section import DecodedUnknownSection
 from richchk.model.chk_section_name import ChkSectionName
 from richchk.transcoder.chk.chk_section_transcoder_factory import (
@@ -62,6 +65,88 @@ def test_chk_io_it_encodes_to_output_file_without_changing_data(chk_output_file_
     assert output_chk_data == expected_chk_data
 
 
+def test_chk_io_decodes_chk_mmap_same_as_chk_file():
+    chkio = ChkIo()
+    chk: DecodedChk = chkio.decode_chk_mmap(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    _assert_decoded_chk_has_expected_decoded_sections(chk)
+    assert chk == chkio.decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    for section in chk.decoded_chk_sections:
+        if isinstance(section, DecodedUnknownSection):
+            assert isinstance(section.chk_binary_data, bytes)
+
+
+def test_chk_io_it_decodes_chk_mmap_and_encodes_without_changing_data():
+    chkio = ChkIo()
+    with open(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, "rb") as f:
+        chk_binary_data = f.read()
+    chk: DecodedChk = chkio.decode_chk_mmap(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    assert chkio.encode_chk_to_bytes(chk) == chk_binary_data
+
+
+def test_chk_io_lazy_decode_only_decodes_accessed_sections():
+    chkio = ChkIo()
+    chk: DecodedChk = chkio.decode_chk_file(
+        DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, lazy=True
+    )
+    assert chk.is_lazy
+    assert not any(section.is_decoded for section in chk.lazy_chk_sections)
+    trig_sections = chk.get_sections_by_name(ChkSectionName.TRIG)
+    assert len(trig_sections) == 1
+    assert isinstance(trig_sections[0], DecodedTrigSection)
+    decoded_names = {
+        section.section_name for section in chk.lazy_chk_sections if section.is_decoded
+    }
+    assert decoded_names == {ChkSectionName.TRIG}
+    assert chk.get_sections_by_name(ChkSectionName.TRIG)[0] is trig_sections[0]
+
+
+def test_chk_io_lazy_decode_is_equal_to_eager_decode():
+    chkio = ChkIo()
+    eager_chk = chkio.decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    lazy_chk = chkio.decode_chk_mmap(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, lazy=True)
+    assert lazy_chk == eager_chk
+    _assert_decoded_chk_has_expected_decoded_sections(lazy_chk)
+    for section_name in ChkSectionName:
+        assert lazy_chk.get_sections_by_name(
+            section_name
+        ) == eager_chk.get_sections_by_name(section_name)
+
+
+def test_chk_io_lazy_decode_encodes_untouched_sections_without_changing_data():
+    chkio = ChkIo()
+    with open(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, "rb") as f:
+        chk_binary_data = f.read()
+    chk: DecodedChk = chkio.decode_chk_binary_data(chk_binary_data, lazy=True)
+    chk.get_sections_by_name(ChkSectionName.STR)
+    chk.get_sections_by_name(ChkSectionName.TRIG)
+    assert chkio.encode_chk_to_bytes(chk) == chk_binary_data
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_chk_io_it_encodes_to_stream_without_changing_data(lazy):
+    chkio = ChkIo()
+    with open(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, "rb") as f:
+        chk_binary_data = f.read()
+    chk: DecodedChk = chkio.decode_chk_binary_data(chk_binary_data, lazy=lazy)
+    stream = BytesIO()
+    chkio.encode_chk_to_stream(chk, stream)
+    assert stream.getvalue() == chk_binary_data
+
+
+def test_chk_io_it_encodes_rich_chk_to_file_without_changing_data(
+    chk_output_file_path,
+):
+    chkio = ChkIo()
+    chk: DecodedChk = RichChkIo().encode_chk(
+        RichChkIo().decode_chk(
+            chkio.decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+        )
+    )
+    chkio.encode_chk_to_file(chk, chk_output_file_path)
+    with open(chk_output_file_path, "rb") as f:
+        assert f.read() == chkio.encode_chk_to_bytes(chk)
+
+
 def _assert_decoded_chk_has_expected_decoded_sections(chk: DecodedChk):
     section_by_name = {
         _get_actual_section_name_for_chk_section(section): section
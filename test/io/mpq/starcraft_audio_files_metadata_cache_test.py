@@ -0,0 +1,78 @@
+import os
+
+from richchk.io.mpq.starcraft_audio_files_metadata_cache import (
+    StarCraftAudioFilesMetadataCache,
+)
+from richchk.model.mpq.stormlib.search.stormlib_file_entry import StormLibFileEntry
+from richchk.util.fileutils import CrossPlatformSafeTemporaryNamedFile
+
+_WAV_FILE_ENTRY = StormLibFileEntry(
+    _path_in_mpq="staredit\\wav\\monitor humming.1.wav",
+    _file_size=36000,
+    _compressed_size=12000,
+    _file_flags=0x80000200,
+    _file_time=0,
+)
+
+
+def test_it_saves_and_reloads_durations():
+    with CrossPlatformSafeTemporaryNamedFile() as temp_cache_file:
+        os.remove(temp_cache_file)
+        cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        assert cache.get_duration_ms(_WAV_FILE_ENTRY) is None
+        cache.put_duration_ms(_WAV_FILE_ENTRY, 4144)
+        assert cache.get_duration_ms(_WAV_FILE_ENTRY) == 4144
+        cache.save()
+        reloaded_cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        assert reloaded_cache.get_duration_ms(_WAV_FILE_ENTRY) == 4144
+
+
+def test_it_misses_if_the_audio_file_changed():
+    with CrossPlatformSafeTemporaryNamedFile() as temp_cache_file:
+        cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        cache.put_duration_ms(_WAV_FILE_ENTRY, 4144)
+        changed_file_entry = StormLibFileEntry(
+            _path_in_mpq=_WAV_FILE_ENTRY.path_in_mpq,
+            _file_size=_WAV_FILE_ENTRY.file_size + 1,
+            _compressed_size=_WAV_FILE_ENTRY.compressed_size,
+            _file_flags=_WAV_FILE_ENTRY.file_flags,
+            _file_time=_WAV_FILE_ENTRY.file_time,
+        )
+        assert cache.get_duration_ms(changed_file_entry) is None
+
+
+def test_it_keeps_durations_saved_by_another_cache():
+    with CrossPlatformSafeTemporaryNamedFile() as temp_cache_file:
+        os.remove(temp_cache_file)
+        other_file_entry = StormLibFileEntry(
+            _path_in_mpq="staredit\\wav\\bandit1.ogg",
+            _file_size=1000,
+            _compressed_size=1000,
+            _file_flags=0x80000000,
+            _file_time=0,
+        )
+        cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        other_cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        cache.put_duration_ms(_WAV_FILE_ENTRY, 4144)
+        other_cache.put_duration_ms(other_file_entry, 1500)
+        cache.save()
+        other_cache.save()
+        reloaded_cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        assert reloaded_cache.get_duration_ms(_WAV_FILE_ENTRY) == 4144
+        assert reloaded_cache.get_duration_ms(other_file_entry) == 1500
+
+
+def test_it_ignores_a_malformed_cache_file():
+    with CrossPlatformSafeTemporaryNamedFile() as temp_cache_file:
+        with open(temp_cache_file, "w") as f:
+            f.write("not json")
+        cache = StarCraftAudioFilesMetadataCache(temp_cache_file)
+        assert cache.get_duration_ms(_WAV_FILE_ENTRY) is None
+        cache.put_duration_ms(_WAV_FILE_ENTRY, 4144)
+        cache.save()
+        assert (
+            StarCraftAudioFilesMetadataCache(temp_cache_file).get_duration_ms(
+                _WAV_FILE_ENTRY
+            )
+            == 4144
+        )
@@ -1,8 +1,12 @@
+import os
 import shutil
 import uuid
 
 import pytest
 
+from richchk.io.mpq.starcraft_audio_files_metadata_cache import (
+    StarCraftAudioFilesMetadataCache,
+)
 from richchk.io.mpq.starcraft_audio_files_metadata_io import (
     StarCraftAudioFilesMetadataIo,
 )
@@ -97,3 +101,49 @@ def test_it_throws_when_extracting_wav_metadata_if_mpq_does_not_exist(
             audio_files_metadata_io.extract_all_audio_files_metadata(
                 f"{uuid.uuid4()}-some-file.scx"
             )
+
+
+@pytest.mark.usefixtures("embedded_stormlib")
+@pytest.mark.parametrize("workers", [1, 3])
+def test_it_extracts_all_wav_metadata_in_memory(embedded_stormlib, workers):
+    if embedded_stormlib:
+        with CrossPlatformSafeTemporaryNamedFile() as temp_scx_file:
+            shutil.copy(COMPLEX_STARCRAFT_SCX_MAP, temp_scx_file)
+            wav_metadata = StarCraftAudioFilesMetadataIo(
+                embedded_stormlib, workers=workers
+            ).extract_all_audio_files_metadata(temp_scx_file)
+            expected_metadata = {
+                StormLibWav(_path_to_wav_in_mpq=key, _duration_ms=value)
+                for (key, value) in _EXPECTED_WAV_FILE_DURATIONS_MS.items()
+            }
+            assert set(wav_metadata) == expected_metadata
+
+
+@pytest.mark.usefixtures("embedded_stormlib")
+def test_it_does_not_read_cached_audio_files_again(embedded_stormlib, monkeypatch):
+    if embedded_stormlib:
+        with (
+            CrossPlatformSafeTemporaryNamedFile() as temp_scx_file,
+            CrossPlatformSafeTemporaryNamedFile() as temp_cache_file,
+        ):
+            shutil.copy(COMPLEX_STARCRAFT_SCX_MAP, temp_scx_file)
+            os.remove(temp_cache_file)
+            wav_metadata = StarCraftAudioFilesMetadataIo(
+                embedded_stormlib,
+                metadata_cache=StarCraftAudioFilesMetadataCache(temp_cache_file),
+            ).extract_all_audio_files_metadata(temp_scx_file)
+            assert os.path.exists(temp_cache_file)
+
+            def _fail_to_read(*args, **kwargs):
+                raise AssertionError("a cached audio file was read again")
+
+            monkeypatch.setattr(
+                StarCraftAudioFilesMetadataIo,
+                "_calculate_audio_file_duration_ms",
+                _fail_to_read,
+            )
+            cached_wav_metadata = StarCraftAudioFilesMetadataIo(
+                embedded_stormlib,
+                metadata_cache=StarCraftAudioFilesMetadataCache(temp_cache_file),
+            ).extract_all_audio_files_metadata(temp_scx_file)
+            assert cached_wav_metadata == wav_metadata
@@ -1,3 +1,4 @@
+import os
 import shutil
 import uuid
 
@@ -5,11 +6,13 @@ import pytest
 
 from richchk.editor.richchk.rich_chk_editor import RichChkEditor
 from richchk.editor.richchk.rich_trig_editor import RichTrigEditor
+from richchk.io.cache.persistent_rich_chk_cache import PersistentRichChkCache
 from richchk.io.mpq.starcraft_audio_files_metadata_io import (
     StarCraftAudioFilesMetadataIo,
 )
 from richchk.io.mpq.starcraft_mpq_io import StarCraftMpqIo
 from richchk.io.richchk.query.chk_query_util import ChkQueryUtil
+from richchk.io.richchk.richchk_io import RichChkIo
 from richchk.model.chk.str.decoded_str_section import DecodedStrSection
 from richchk.model.chk.strx.decoded_strx_section import DecodedStrxSection
 from richchk.model.chk_section_name import ChkSectionName
@@ -208,3 +211,121 @@ def test_it_replaces_str_with_strx(mpq_io):
                 RichVerSection, new_chk
             )
             assert new_ver.version == VerVersion.STARCRAFT_REMASTERED_BROODWAR
+
+
+def test_it_saves_many_variants_of_the_same_base_map(mpq_io):
+    if mpq_io:
+        with (
+            CrossPlatformSafeTemporaryNamedFile() as temp_base_file,
+            CrossPlatformSafeTemporaryNamedFile() as temp_first_variant,
+            CrossPlatformSafeTemporaryNamedFile() as temp_second_variant,
+        ):
+            shutil.copy(EXAMPLE_STARCRAFT_SCX_MAP, temp_base_file)
+            chk = mpq_io.read_chk_from_mpq(temp_base_file)
+            updated_trig = RichTrigEditor.add_triggers(
+                [
+                    RichTrigger(
+                        _conditions=[AlwaysCondition()],
+                        _actions=[],
+                        _players={PlayerId.PLAYER_1},
+                    )
+                ],
+                ChkQueryUtil.find_only_rich_section_in_chk(RichTrigSection, chk),
+            )
+            updated_chk = RichChkEditor().replace_chk_section(updated_trig, chk)
+            mpq_io.save_many(
+                temp_base_file,
+                [(chk, temp_first_variant), (updated_chk, temp_second_variant)],
+                overwrite_existing=True,
+            )
+            assert mpq_io.read_chk_from_mpq(temp_first_variant) == chk
+            assert mpq_io.read_chk_from_mpq(temp_second_variant) == updated_chk
+
+
+def test_it_throws_saving_many_variants_to_the_same_mpq(mpq_io):
+    if mpq_io:
+        with (
+            CrossPlatformSafeTemporaryNamedFile() as temp_base_file,
+            CrossPlatformSafeTemporaryNamedFile() as temp_outfile,
+        ):
+            shutil.copy(EXAMPLE_STARCRAFT_SCX_MAP, temp_base_file)
+            chk = mpq_io.read_chk_from_mpq(temp_base_file)
+            with pytest.raises(ValueError):
+                mpq_io.save_many(
+                    temp_base_file,
+                    [(chk, temp_outfile), (chk, temp_outfile)],
+                    overwrite_existing=True,
+                )
+
+
+def test_it_throws_saving_many_variants_if_no_overwrite_and_outfile_exists(mpq_io):
+    if mpq_io:
+        with (
+            CrossPlatformSafeTemporaryNamedFile() as temp_base_file,
+            CrossPlatformSafeTemporaryNamedFile() as temp_outfile,
+        ):
+            shutil.copy(EXAMPLE_STARCRAFT_SCX_MAP, temp_base_file)
+            chk = mpq_io.read_chk_from_mpq(temp_base_file)
+            with pytest.raises(FileExistsError):
+                mpq_io.save_many(temp_base_file, [(chk, temp_outfile)])
+
+
+def test_it_closes_the_archive_when_saving_fails(mpq_io, monkeypatch):
+    if mpq_io:
+        with (
+            CrossPlatformSafeTemporaryNamedFile() as temp_base_file,
+            CrossPlatformSafeTemporaryNamedFile() as temp_outfile,
+        ):
+            shutil.copy(EXAMPLE_STARCRAFT_SCX_MAP, temp_base_file)
+            chk = mpq_io.read_chk_from_mpq(temp_base_file)
+            wrapper = mpq_io._stormlib_wrapper
+            open_archive = wrapper.open_archive
+            close_archive = wrapper.close_archive
+            opened_handles = []
+            closed_handles = []
+
+            def _record_open(*args, **kwargs):
+                open_result = open_archive(*args, **kwargs)
+                opened_handles.append(open_result.handle.value)
+                return open_result
+
+            def _record_close(open_result):
+                closed_handles.append(open_result.handle.value)
+                return close_archive(open_result)
+
+            def _fail_to_compact(open_result):
+                raise OSError("compacting failed")
+
+            monkeypatch.setattr(wrapper, "open_archive", _record_open)
+            monkeypatch.setattr(wrapper, "close_archive", _record_close)
+            monkeypatch.setattr(wrapper, "compact_archive", _fail_to_compact)
+            with pytest.raises(OSError):
+                mpq_io.save_chk_to_mpq(
+                    chk, temp_base_file, temp_outfile, overwrite_existing=True
+                )
+            assert opened_handles
+            assert sorted(closed_handles) == sorted(opened_handles)
+            assert _read_file_as_bytes(temp_outfile) == b""
+
+
+@pytest.mark.usefixtures("embedded_stormlib")
+def test_it_reads_unchanged_chk_from_persistent_cache(
+    embedded_stormlib, tmp_path, monkeypatch
+):
+    if embedded_stormlib:
+        cache = PersistentRichChkCache(str(tmp_path / "chk-cache"))
+        mpq_io = StarCraftMpqIo(embedded_stormlib, persistent_chk_cache=cache)
+        with CrossPlatformSafeTemporaryNamedFile() as temp_scx_file:
+            shutil.copy(EXAMPLE_STARCRAFT_SCX_MAP, temp_scx_file)
+            chk = mpq_io.read_chk_from_mpq(temp_scx_file)
+            # only the RichChk is stored, not the DecodedChk it was decoded from
+            assert len(os.listdir(cache.cache_directory)) == 1
+
+            def _fail_to_decode(*args, **kwargs):
+                raise AssertionError("an unchanged CHK was decoded again")
+
+            monkeypatch.setattr(RichChkIo, "decode_chk", _fail_to_decode)
+            cached_chk = StarCraftMpqIo(
+                embedded_stormlib, persistent_chk_cache=cache
+            ).read_chk_from_mpq(temp_scx_file)
+            assert cached_chk == chk
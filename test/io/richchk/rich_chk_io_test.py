@@ -1,3 +1,4 @@
+import dataclasses
 import unittest
 import uuid
 from test.chk_resources import DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH, SCX_CHK_FILE
@@ -5,19 +6,23 @@ from typing import TypeVar
 
 import pytest
 
+from richchk.editor.richchk.rich_chk_editor import RichChkEditor
 from richchk.io.chk.chk_io import ChkIo
 from richchk.io.richchk.query.chk_query_util import ChkQueryUtil
 from richchk.io.richchk.richchk_io import RichChkIo
 from richchk.model.chk.decoded_chk import DecodedChk
 from richchk.model.chk.decoded_chk_section import DecodedChkSection
+from richchk.model.chk.dim.decoded_dim_section import DecodedDimSection
 from richchk.model.chk.mrgn.decoded_mrgn_section import DecodedMrgnSection
 from richchk.model.chk.str.decoded_str_section import DecodedStrSection
 from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
 from richchk.model.chk.unis.decoded_unis_section import DecodedUnisSection
 from richchk.model.chk.unknown.decoded_unknown_section import DecodedUnknownSection
 from richchk.model.chk_section_name import ChkSectionName
+from richchk.model.richchk.mtxm.rich_mtxm_section import RichMtxmSection
 from richchk.model.richchk.rich_chk import RichChk
 from richchk.model.richchk.rich_chk_section import RichChkSection
+from richchk.model.richchk.str.rich_string import RichNullString, RichString
 from richchk.model.richchk.unis.rich_unis_section import RichUnisSection
 from richchk.transcoder.chk.transcoders.chk_trig_transcoder import ChkTrigTranscoder
 from richchk.transcoder.richchk.richchk_section_transcoder_factory import (
@@ -100,6 +105,14 @@ def test_integration_rich_chk_io_decodes_and_encodes_back_unchanged_for_scx_file
     assert_chks_are_equal(actual_encoded_chk, chk)
 
 
+def test_integration_rich_chk_io_decodes_terrain_with_the_map_dimensions():
+    chk: DecodedChk = ChkIo().decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    rich_chk: RichChk = RichChkIo().decode_chk(chk)
+    dim = ChkQueryUtil.find_only_decoded_section_in_chk(DecodedDimSection, chk)
+    mtxm = ChkQueryUtil.find_only_rich_section_in_chk(RichMtxmSection, rich_chk)
+    assert (mtxm.width, mtxm.height) == (dim.width, dim.height)
+
+
 def test_integration_it_adds_swnm_to_chk_after_encoding_if_it_did_not_exist():
     chkio = ChkIo()
     richhk_io = RichChkIo()
@@ -126,6 +139,67 @@ def test_integration_it_adds_swnm_to_chk_after_encoding_if_it_did_not_exist():
     )
 
 
+def _replace_first_unit_setting(rich_chk: RichChk, **fields) -> RichChk:
+    unis = ChkQueryUtil.find_only_rich_section_in_chk(RichUnisSection, rich_chk)
+    first = dataclasses.replace(unis.unit_settings[0], **fields)
+    return RichChkEditor().replace_chk_section(
+        RichUnisSection(_unit_settings=[first] + unis.unit_settings[1:]), rich_chk
+    )
+
+
+def _encode_without_lineage(rich_chk: RichChk) -> bytes:
+    return ChkIo().encode_chk_to_bytes(
+        RichChkIo().encode_chk(RichChk(_chk_sections=list(rich_chk.chk_sections)))
+    )
+
+
+def test_integration_it_only_encodes_sections_replaced_since_the_last_encode():
+    chkio = ChkIo()
+    richchk_io = RichChkIo()
+    rich_chk = richchk_io.decode_chk(
+        chkio.decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    )
+    assert rich_chk.lineage is not None
+    encoded = richchk_io.encode_chk(rich_chk)
+    edited_rich_chk = _replace_first_unit_setting(rich_chk, _armorpoints=7)
+    assert edited_rich_chk.lineage is rich_chk.lineage
+    encoded_edit = richchk_io.encode_chk(edited_rich_chk)
+    trig_index = next(
+        i
+        for i, section in enumerate(encoded.decoded_chk_sections)
+        if isinstance(section, DecodedTrigSection)
+    )
+    assert (
+        encoded_edit.decoded_chk_sections[trig_index]
+        is encoded.decoded_chk_sections[trig_index]
+    )
+    assert chkio.encode_chk_to_bytes(encoded_edit) == _encode_without_lineage(
+        edited_rich_chk
+    )
+
+
+@pytest.mark.parametrize(
+    "unit_names", [["incremental"], ["first", "second"], ["first", "first", None]]
+)
+def test_integration_it_encodes_edits_adding_strings_like_a_full_encode(unit_names):
+    chkio = ChkIo()
+    richchk_io = RichChkIo()
+    rich_chk = richchk_io.decode_chk(
+        chkio.decode_chk_file(DEMON_LORE_YATAPI_TEST_CHK_FILE_PATH)
+    )
+    richchk_io.encode_chk(rich_chk)
+    for unit_name in unit_names:
+        rich_chk = _replace_first_unit_setting(
+            rich_chk,
+            _custom_unit_name=RichString(_value=unit_name)
+            if unit_name
+            else RichNullString(),
+        )
+        assert chkio.encode_chk_to_bytes(
+            richchk_io.encode_chk(rich_chk)
+        ) == _encode_without_lineage(rich_chk)
+
+
 def assert_all_supported_rich_chk_sections_are_present(rich_chk: RichChk):
     """All supported RichChkSections are present in the RichChk."""
     for (
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from richchk.io.richchk.rich_str_lookup_builder import RichStrLookupBuilder
@@ -89,3 +91,38 @@ def test_it_throws_if_string_section_is_not_str_or_strx():
 
     with pytest.raises(ValueError):
         RichStrLookupBuilder().build_lookup(UnknownStringSection())
+
+
+def test_it_builds_the_same_lookup_from_decoded_and_from_edited_sections(
+    strx_section,
+):
+    edited_strx_section = DecodedStrxSection(
+        _number_of_strings=strx_section.number_of_strings,
+        _string_offsets=strx_section.strings_offsets,
+        _strings=strx_section.strings,
+    )
+    assert edited_strx_section.binary_data is None
+    assert RichStrLookupBuilder().build_lookup(
+        strx_section
+    ) == RichStrLookupBuilder().build_lookup(edited_strx_section)
+
+
+@pytest.mark.parametrize(
+    "section_fixture, offset_size", [("str_section", 2), ("strx_section", 4)]
+)
+def test_it_builds_the_lookup_from_the_strings_of_a_replaced_section(
+    section_fixture, offset_size, request
+):
+    string_section = request.getfixturevalue(section_fixture)
+    header_size = 3 * offset_size
+    replaced_section = dataclasses.replace(
+        string_section,
+        _number_of_strings=2,
+        _string_offsets=[header_size, header_size + 4],
+        _strings=["abc", "QQQ"],
+    )
+    assert replaced_section.binary_data is None
+    lookup = RichStrLookupBuilder().build_lookup(replaced_section)
+    assert lookup.get_string_by_id(1) == RichString(_value="abc")
+    assert lookup.get_string_by_id(2) == RichString(_value="QQQ")
+    assert len(lookup._string_by_id_lookup) == 2
@@ -111,3 +111,53 @@ def test_it_finds_location_by_fuzzy_match_preferring_case_agreement():
         "locatiON", mrgn, ignorecase=False
     )
     assert loc2 == mrgn.locations[1]
+
+
+def test_it_finds_locations_by_position():
+    mrgn = RichMrgnSection(
+        _locations=[
+            generate_rich_location_with_name("loc1"),
+            generate_rich_location_with_name("loc2"),
+        ]
+    )
+    assert MrgnQueryUtil.find_locations_containing_point(100, 200, mrgn) == [
+        mrgn.locations[0],
+        mrgn.locations[1],
+    ]
+    assert not MrgnQueryUtil.find_locations_containing_point(300, 400, mrgn)
+    assert MrgnQueryUtil.find_locations_overlapping_area(0, 0, 101, 201, mrgn) == [
+        mrgn.locations[0],
+        mrgn.locations[1],
+    ]
+    assert MrgnQueryUtil.find_nearest_location(0, 0, mrgn) == mrgn.locations[0]
+
+
+def test_it_builds_the_location_grid_once_per_mrgn():
+    mrgn = RichMrgnSection(_locations=[generate_rich_location_with_name("loc1")])
+    MrgnQueryUtil.find_locations_containing_point(100, 200, mrgn)
+    grid = mrgn.location_grid
+    MrgnQueryUtil.find_nearest_location(0, 0, mrgn)
+    assert mrgn.location_grid is grid
+
+
+def test_it_throws_if_more_than_1_location_matches_the_exact_name():
+    mrgn = RichMrgnSection(
+        _locations=[
+            generate_rich_location_with_name("loc1"),
+            generate_rich_location_with_name("LOC1"),
+        ]
+    )
+    assert (
+        MrgnQueryUtil.find_location_by_name("LOC1", mrgn, ignorecase=False)
+        == mrgn.locations[1]
+    )
+    with pytest.raises(ValueError):
+        MrgnQueryUtil.find_location_by_name("loc1", mrgn, ignorecase=True)
+
+
+def test_it_builds_the_location_name_index_once_per_mrgn():
+    mrgn = RichMrgnSection(_locations=[generate_rich_location_with_name("loc1")])
+    MrgnQueryUtil.find_location_by_fuzzy_search("loc", mrgn)
+    index = mrgn.location_name_index.lowercased
+    MrgnQueryUtil.find_location_by_name("LOC1", mrgn)
+    assert mrgn.location_name_index.lowercased is index
@@ -92,3 +92,23 @@ def test_integration_it_finds_by_exact_match(real_rich_chk_with_wav):
         search, real_rich_chk_with_wav
     )
     assert search == found_wav.path_in_chk.value
+
+
+def test_it_finds_the_last_wav_with_the_same_basename():
+    chk = RichChk(
+        _chk_sections=[
+            RichWavSection(
+                _wavs=[
+                    RichWav(
+                        _path_in_chk=RichString(_value="staredit\\wav\\hello.wav"),
+                        _index=0,
+                    ),
+                    RichWav(
+                        _path_in_chk=RichString(_value="other\\hello.wav"),
+                        _index=1,
+                    ),
+                ]
+            )
+        ]
+    )
+    assert WavQueryUtil.find_only_wav_by_basename("hello.wav", chk).index == 1
@@ -0,0 +1,140 @@
+import functools
+import random
+
+import pytest
+
+from richchk.model.richchk.mrgn.rich_location import RichLocation
+from richchk.model.richchk.mrgn.rich_location_grid import RichLocationGrid
+from richchk.model.richchk.str.rich_string import RichString
+
+_MAP_SIZE = 4096
+
+
+def _location(left: int, top: int, right: int, bottom: int) -> RichLocation:
+    return RichLocation(left, top, right, bottom, RichString(_value="location"))
+
+
+def _random_locations(seed: int, num_locations: int = 255) -> list[RichLocation]:
+    rng = random.Random(seed)
+    locations = []
+    for _ in range(num_locations):
+        x1, x2 = rng.randrange(_MAP_SIZE), rng.randrange(_MAP_SIZE)
+        y1, y2 = rng.randrange(_MAP_SIZE), rng.randrange(_MAP_SIZE)
+        if rng.random() < 0.8:
+            # most locations are small and not inverted
+            x1, y1 = min(x1, x2), min(y1, y2)
+            x2, y2 = x1 + rng.randrange(0, 512), y1 + rng.randrange(0, 512)
+        locations.append(_location(x1, y1, x2, y2))
+    return locations
+
+
+@functools.lru_cache(maxsize=None)
+def _bounds(location: RichLocation) -> tuple[int, int, int, int]:
+    return (
+        min(location.left_x1, location.right_x2),
+        min(location.top_y1, location.bottom_y2),
+        max(location.left_x1, location.right_x2),
+        max(location.top_y1, location.bottom_y2),
+    )
+
+
+def _brute_force_containing(locations, x, y):
+    return [
+        location
+        for location in locations
+        if _bounds(location)[0] <= x < _bounds(location)[2]
+        and _bounds(location)[1] <= y < _bounds(location)[3]
+    ]
+
+
+def _brute_force_overlapping(locations, left, top, right, bottom):
+    left, right = min(left, right), max(left, right)
+    top, bottom = min(top, bottom), max(top, bottom)
+    return [
+        location
+        for location in locations
+        if _bounds(location)[0] < right
+        and left < _bounds(location)[2]
+        and _bounds(location)[1] < bottom
+        and top < _bounds(location)[3]
+        # empty locations and areas cover no pixels
+        and _bounds(location)[0] < _bounds(location)[2]
+        and _bounds(location)[1] < _bounds(location)[3]
+        and left < right
+        and top < bottom
+    ]
+
+
+def _brute_force_nearest(locations, x, y):
+    best = None
+    for location in locations:
+        left, top, right, bottom = _bounds(location)
+        if left == right or top == bottom:
+            continue
+        dx = max(left - x, 0, x - (right - 1))
+        dy = max(top - y, 0, y - (bottom - 1))
+        if best is None or dx * dx + dy * dy < best[0]:
+            best = (dx * dx + dy * dy, location)
+    return None if best is None else best[1]
+
+
+def _ids(locations):
+    return [id(location) for location in locations]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_it_finds_the_same_locations_as_a_brute_force_scan(seed):
+    locations = _random_locations(seed)
+    grid = RichLocationGrid.build(locations)
+    rng = random.Random(seed)
+    for _ in range(300):
+        # include points and areas outside of every location
+        x = rng.randrange(-256, _MAP_SIZE + 768)
+        y = rng.randrange(-256, _MAP_SIZE + 768)
+        assert _ids(grid.locations_containing_point(x, y)) == _ids(
+            _brute_force_containing(locations, x, y)
+        )
+        assert grid.nearest_location(x, y) is _brute_force_nearest(locations, x, y)
+        area = (x, y, x + rng.randrange(-300, 300), y + rng.randrange(-300, 300))
+        assert _ids(grid.locations_overlapping_area(*area)) == _ids(
+            _brute_force_overlapping(locations, *area)
+        )
+
+
+def test_locations_contain_their_left_and_top_but_not_their_right_and_bottom():
+    location = _location(32, 64, 96, 128)
+    grid = RichLocationGrid.build([location])
+    assert grid.locations_containing_point(32, 64) == [location]
+    assert grid.locations_containing_point(95, 127) == [location]
+    assert not grid.locations_containing_point(96, 64)
+    assert not grid.locations_containing_point(32, 128)
+
+
+def test_inverted_locations_cover_the_same_pixels():
+    location = _location(96, 128, 32, 64)
+    grid = RichLocationGrid.build([location])
+    assert grid.locations_containing_point(32, 64) == [location]
+    assert grid.locations_overlapping_area(0, 0, 33, 65) == [location]
+
+
+def test_nearest_location_prefers_the_first_of_equally_close_locations():
+    first = _location(0, 0, 32, 32)
+    second = _location(63, 0, 96, 32)
+    grid = RichLocationGrid.build([first, second])
+    assert grid.nearest_location(46, 16) is first
+    assert grid.nearest_location(47, 16) is first
+    assert grid.nearest_location(48, 16) is second
+
+
+def test_it_finds_nothing_without_locations():
+    grid = RichLocationGrid.build([])
+    assert not grid.locations_containing_point(0, 0)
+    assert not grid.locations_overlapping_area(0, 0, 32, 32)
+    assert grid.nearest_location(0, 0) is None
+
+
+def test_empty_locations_are_never_found():
+    grid = RichLocationGrid.build([_location(32, 32, 32, 32)])
+    assert not grid.locations_containing_point(32, 32)
+    assert not grid.locations_overlapping_area(0, 0, 64, 64)
+    assert grid.nearest_location(32, 32) is None
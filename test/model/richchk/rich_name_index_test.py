@@ -0,0 +1,61 @@
+import difflib
+import random
+
+import pytest
+
+from richchk.model.richchk.rich_name_index import RichNameIndex
+
+_WORDS = ["my", "home", "base", "Spawn", "spawn", "left", "right", "P1", "p2", "exit"]
+
+
+def _random_names(seed: int, num_names: int = 100) -> list[str]:
+    rng = random.Random(seed)
+    names = []
+    for _ in range(num_names):
+        if names and rng.random() < 0.05:
+            # repeat a name
+            names.append(rng.choice(names))
+        else:
+            names.append(" ".join(rng.choices(_WORDS, k=rng.randrange(0, 4))))
+    return names
+
+
+def _brute_force_most_similar(names, name):
+    return max(
+        (
+            (difflib.SequenceMatcher(None, name, other_name).ratio(), position)
+            for position, other_name in enumerate(names)
+        ),
+        key=lambda x: x[0],
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_it_finds_the_same_names_as_a_brute_force_search(seed):
+    names = _random_names(seed)
+    positions = list(range(len(names)))
+    index = RichNameIndex.build(positions, names)
+    lowercase_names = [other_name.lower() for other_name in names]
+    rng = random.Random(seed)
+    for _ in range(100):
+        name = " ".join(rng.choices(_WORDS + ["location", "x"], k=rng.randrange(0, 4)))
+        assert index.find_most_similar(name) == _brute_force_most_similar(names, name)
+        assert index.find_by_name(name) == [
+            position for position in positions if names[position] == name
+        ]
+        assert index.lowercased.find_most_similar(
+            name.lower()
+        ) == _brute_force_most_similar(lowercase_names, name.lower())
+
+
+def test_it_prefers_the_first_of_equally_similar_names():
+    index = RichNameIndex.build(["a", "b", "c"], ["home 1", "home 2", "home 2"])
+    assert index.find_most_similar("home") == (0.8, "a")
+    assert index.find_most_similar("home 2") == (1.0, "b")
+    assert index.find_by_name("home 2") == ["b", "c"]
+
+
+def test_it_finds_nothing_without_items():
+    index = RichNameIndex.build([], [])
+    assert index.find_most_similar("home") is None
+    assert not index.find_by_name("home")
@@ -0,0 +1,60 @@
+import dataclasses
+
+import pytest
+
+from richchk.model.richchk.str.rich_string import RichString
+from richchk.model.richchk.trig.actions.display_text_message_action import (
+    DisplayTextMessageAction,
+)
+from richchk.model.richchk.trig.conditions.always_condition import AlwaysCondition
+from richchk.model.richchk.trig.player_id import PlayerId
+from richchk.model.richchk.trig.rich_trig_section import RichTrigSection
+from richchk.model.richchk.trig.rich_trigger import RichTrigger
+from richchk.model.richchk.trig.rich_trigger_chunk import RichTriggerChunk
+
+
+def _make_trigger(text: str) -> RichTrigger:
+    return RichTrigger(
+        _conditions=[AlwaysCondition()],
+        _actions=[DisplayTextMessageAction(_text=RichString(_value=text))],
+        _players=frozenset({PlayerId.ALL_PLAYERS}),
+    )
+
+
+@pytest.fixture(scope="function")
+def triggers():
+    return [_make_trigger(f"trigger {i}") for i in range(300)]
+
+
+def test_it_keeps_the_triggers_it_was_made_with(triggers):
+    rich_trig = RichTrigSection(_triggers=triggers)
+    triggers.append(_make_trigger("added after"))
+    assert len(rich_trig.triggers) == 300
+    assert rich_trig.triggers == [
+        trigger for chunk in rich_trig.trigger_chunks for trigger in chunk.triggers
+    ]
+
+
+def test_it_replaces_a_section(triggers):
+    rich_trig = RichTrigSection(_triggers=triggers)
+    replaced = dataclasses.replace(rich_trig)
+    assert replaced == rich_trig
+    assert replaced.trigger_chunks is rich_trig.trigger_chunks
+    chunks = RichTriggerChunk.split(triggers[:10])
+    assert dataclasses.replace(rich_trig, _trigger_chunks=chunks).triggers == (
+        triggers[:10]
+    )
+
+
+def test_it_makes_a_section_from_trigger_chunks(triggers):
+    chunks = RichTriggerChunk.split(triggers)
+    rich_trig = RichTrigSection.from_trigger_chunks(chunks)
+    assert rich_trig.trigger_chunks is chunks
+    assert rich_trig == RichTrigSection(_triggers=triggers)
+
+
+def test_it_throws_if_made_from_both_triggers_and_trigger_chunks(triggers):
+    with pytest.raises(ValueError):
+        RichTrigSection(
+            _triggers=triggers, _trigger_chunks=RichTriggerChunk.split(triggers)
+        )
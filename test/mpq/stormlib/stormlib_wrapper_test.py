@@ -207,3 +207,70 @@ def test_it_compacts_archive(embedded_stormlib):
                 )
             )
             assert compacted_bytes == _read_file_as_bytes(temp_scx_file)
+
+
+@pytest.mark.usefixtures("embedded_stormlib")
+def test_it_extracts_chk_bytes_same_as_chk_file(embedded_stormlib):
+    if embedded_stormlib:
+        with (
+            CrossPlatformSafeTemporaryNamedFile() as temp_scx_file,
+            CrossPlatformSafeTemporaryNamedFile() as temp_chk_file,
+        ):
+            shutil.copyfile(EXAMPLE_STARCRAFT_SCX_MAP, temp_scx_file)
+            open_result = embedded_stormlib.open_archive(
+                temp_scx_file,
+                archive_mode=StormLibArchiveMode.STORMLIB_READ_ONLY,
+            )
+            embedded_stormlib.extract_file(
+                open_result,
+                path_to_file_in_archive=_CHK_MPQ_PATH,
+                outfile=temp_chk_file,
+                overwrite_existing=True,
+            )
+            chk_bytes = embedded_stormlib.extract_file_bytes(open_result, _CHK_MPQ_PATH)
+            embedded_stormlib.close_archive(open_result)
+            assert chk_bytes
+            assert chk_bytes == _read_file_as_bytes(temp_chk_file)
+
+
+@pytest.mark.usefixtures("embedded_stormlib")
+def test_it_throws_if_extracting_bytes_of_missing_file(embedded_stormlib):
+    if embedded_stormlib:
+        with CrossPlatformSafeTemporaryNamedFile() as temp_scx_file:
+            shutil.copyfile(EXAMPLE_STARCRAFT_SCX_MAP, temp_scx_file)
+            open_result = embedded_stormlib.open_archive(
+                temp_scx_file,
+                archive_mode=StormLibArchiveMode.STORMLIB_READ_ONLY,
+            )
+            with pytest.raises(ValueError):
+                embedded_stormlib.extract_file_bytes(
+                    open_result, f"{uuid.uuid4()}-some-file"
+                )
+            embedded_stormlib.close_archive(open_result)
+
+
+@pytest.mark.usefixtures("embedded_stormlib")
+def test_it_adds_file_bytes_to_archive(embedded_stormlib):
+    if embedded_stormlib:
+        with CrossPlatformSafeTemporaryNamedFile() as temp_scx_file:
+            shutil.copyfile(EXAMPLE_STARCRAFT_SCX_MAP, temp_scx_file)
+            madeup_file_content = b"123456" * 10000
+            open_result = embedded_stormlib.open_archive(
+                temp_scx_file,
+                archive_mode=StormLibArchiveMode.STORMLIB_WRITE_ONLY,
+            )
+            embedded_stormlib.add_file_bytes(
+                open_result,
+                madeup_file_content,
+                _CHK_MPQ_PATH,
+                overwrite_existing=True,
+            )
+            embedded_stormlib.compact_archive(open_result)
+            embedded_stormlib.close_archive(open_result)
+            open_result = embedded_stormlib.open_archive(
+                temp_scx_file,
+                archive_mode=StormLibArchiveMode.STORMLIB_READ_ONLY,
+            )
+            extracted = embedded_stormlib.extract_file_bytes(open_result, _CHK_MPQ_PATH)
+            embedded_stormlib.close_archive(open_result)
+            assert extracted == madeup_file_content
@@ -1,6 +1,7 @@
 from richchk.model.chk.mbrf.decoded_mbrf_section import DecodedMbrfSection
 from richchk.model.richchk.mbrf.briefing_action_id import BriefingActionId
 from richchk.transcoder.chk.transcoders.chk_mbrf_transcoder import ChkMbrfTranscoder
+from richchk.transcoder.chk.transcoders.chk_trig_transcoder import ChkTrigTranscoder
 
 from ....chk_resources import CHK_SECTION_FILE_PATHS
 
@@ -54,3 +55,19 @@ def test_it_decodes_and_encodes_without_changing_data():
     actual_encoded_data = transcoder.encode(section, include_header=False)
     assert actual_encoded_data == chk_binary_data
     assert transcoder.decode(actual_encoded_data) == transcoder.decode(chk_binary_data)
+
+
+def test_it_decodes_briefings_like_the_trig_transcoder_decodes_triggers():
+    chk_binary_data = _read_chk_section()
+    assert (
+        ChkMbrfTranscoder().decode(chk_binary_data).triggers
+        == ChkTrigTranscoder(columnar=False).decode(chk_binary_data).triggers
+    )
+
+
+def test_it_does_not_materialize_empty_slots_after_the_last_used_one():
+    transcoder = ChkMbrfTranscoder()
+    section = transcoder.decode(_read_chk_section())
+    briefing = section.triggers[0]
+    assert [c._condition_id for c in briefing.conditions] == [_MBRF_MARKER_CONDITION_ID]
+    assert briefing.actions[-1]._action_id != BriefingActionId.NO_ACTION.id
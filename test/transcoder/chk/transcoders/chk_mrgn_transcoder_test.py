@@ -1,3 +1,6 @@
+import dataclasses
+
+from richchk.model.chk.mrgn.decoded_location import DecodedLocation
 from richchk.model.chk.mrgn.decoded_mrgn_section import DecodedMrgnSection
 from richchk.transcoder.chk.transcoders.chk_mrgn_transcoder import ChkMrgnTranscoder
 
@@ -39,3 +42,38 @@ def test_it_decodes_and_encodes_without_changing_data():
     actual_encoded_data = transcoder.encode(mrgn_section, include_header=False)
     assert actual_encoded_data == chk_binary_data
     assert transcoder.decode(actual_encoded_data) == transcoder.decode(chk_binary_data)
+
+
+def test_decoded_locations_equal_locations_built_field_by_field():
+    mrgn_section: DecodedMrgnSection = ChkMrgnTranscoder().decode(_read_chk_section())
+    location_zero = mrgn_section.locations[0]
+    expected = DecodedLocation(
+        _left_x1=_EXPECTED_LOCATION_LEFT,
+        _top_y1=_EXPECTED_LOCATION_TOP,
+        _right_x2=_EXPECTED_LOCATION_RIGHT,
+        _bottom_y2=_EXPECTED_LOCATION_BOTTOM,
+        _string_id=location_zero.string_id,
+        _elevation_flags=_EXPECTED_LOCATION_ELEVATION_FLAGS,
+    )
+    assert location_zero == expected
+    assert hash(location_zero) == hash(expected)
+    assert dataclasses.replace(location_zero, _left_x1=0).left_x1 == 0
+
+
+def test_it_encodes_an_unread_section_from_its_binary_data():
+    chk_binary_data = _read_chk_section()
+    mrgn_section: DecodedMrgnSection = ChkMrgnTranscoder().decode(chk_binary_data)
+    assert mrgn_section.unread_binary_data == chk_binary_data
+    assert mrgn_section.locations
+    assert mrgn_section.unread_binary_data is None
+
+
+def test_it_encodes_the_edits_of_read_locations():
+    transcoder: ChkMrgnTranscoder = ChkMrgnTranscoder()
+    mrgn_section: DecodedMrgnSection = transcoder.decode(_read_chk_section())
+    mrgn_section.locations[0] = dataclasses.replace(
+        mrgn_section.locations[0], _left_x1=0
+    )
+    edited_binary_data = transcoder.encode(mrgn_section, include_header=False)
+    assert transcoder.decode(edited_binary_data) == mrgn_section
+    assert transcoder.decode(edited_binary_data).locations[0].left_x1 == 0
@@ -33,3 +33,22 @@ def test_it_decodes_and_encodes_without_changing_data():
     actual_encoded_data = transcoder.encode(str_section, include_header=False)
     assert actual_encoded_data == chk_binary_data
     assert transcoder.decode(actual_encoded_data) == transcoder.decode(chk_binary_data)
+
+
+def test_it_decodes_strings_only_when_they_are_read():
+    transcoder: ChkStrTranscoder = ChkStrTranscoder()
+    str_section: DecodedStrSection = transcoder.decode(_read_chk_section())
+    assert "_strings" not in vars(str_section)
+    assert str_section.binary_data == _read_chk_section()
+    assert set(_EXPECTED_STRINGS).issubset(set(str_section.strings))
+    assert "_strings" in vars(str_section)
+
+
+def test_it_ignores_bytes_after_the_last_null_terminator():
+    transcoder: ChkStrTranscoder = ChkStrTranscoder()
+    str_section: DecodedStrSection = transcoder.decode(
+        b"\x02\x00\x06\x00\x07\x00\x00marine\x00firebat"
+    )
+    assert str_section == DecodedStrSection(
+        _number_of_strings=2, _string_offsets=[6, 7], _strings=["", "marine"]
+    )
@@ -33,3 +33,12 @@ def test_it_decodes_and_encodes_without_changing_data():
     actual_encoded_data = transcoder.encode(strx_section, include_header=False)
     assert actual_encoded_data == chk_binary_data
     assert transcoder.decode(actual_encoded_data) == transcoder.decode(chk_binary_data)
+
+
+def test_it_decodes_strings_only_when_they_are_read():
+    transcoder = ChkStrxTranscoder()
+    strx_section = transcoder.decode(_read_chk_section())
+    assert "_strings" not in vars(strx_section)
+    assert strx_section.binary_data == _read_chk_section()
+    assert set(_EXPECTED_STRINGS).issubset(set(strx_section.strings))
+    assert "_strings" in vars(strx_section)
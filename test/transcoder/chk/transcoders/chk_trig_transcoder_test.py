@@ -1,11 +1,15 @@
+from io import BytesIO
+
+import pytest
+
 from richchk.model.chk.trig.decoded_player_execution import DecodedPlayerExecution
-from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
+from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection, TrigLazySpec
 from richchk.model.chk.trig.decoded_trigger import DecodedTrigger
 from richchk.model.chk.trig.decoded_trigger_action import DecodedTriggerAction
 from richchk.model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
 from richchk.transcoder.chk.transcoders.chk_trig_transcoder import ChkTrigTranscoder
 
-from ....chk_resources import CHK_SECTION_FILE_PATHS
+from ....chk_resources import CHK_SECTION_FILE_PATHS, DEMON_LORE_CHK_SECTION_FILE_PATHS
 
 # these are the default triggers in melee/SCM maps
 # CONDITION: always ACTION: modify resources for current player set to 50 minerals
@@ -154,3 +158,149 @@ def test_it_decodes_and_encodes_without_changing_data():
     actual_encoded_data = transcoder.encode(trig_section, include_header=False)
     assert actual_encoded_data == chk_binary_data
     assert transcoder.decode(actual_encoded_data) == transcoder.decode(chk_binary_data)
+
+
+def _read_demon_lore_chk_section() -> bytes:
+    with open(
+        DEMON_LORE_CHK_SECTION_FILE_PATHS[DecodedTrigSection.section_name().value], "rb"
+    ) as f:
+        chk_binary_data = f.read()
+    return chk_binary_data
+
+
+@pytest.mark.parametrize(
+    "chk_binary_data", [_read_chk_section(), _read_demon_lore_chk_section()]
+)
+def test_vectorized_decode_is_equivalent_to_per_trigger_decode(chk_binary_data):
+    vectorized = ChkTrigTranscoder(columnar=False).decode(chk_binary_data)
+    per_trigger = ChkTrigTranscoder(vectorized=False, columnar=False).decode(
+        chk_binary_data
+    )
+    assert len(vectorized.triggers) == len(per_trigger.triggers)
+    for actual, expected in zip(vectorized.triggers, per_trigger.triggers):
+        num_conditions = len(actual.conditions)
+        num_actions = len(actual.actions)
+        assert actual.conditions == expected.conditions[:num_conditions]
+        assert actual.actions == expected.actions[:num_actions]
+        assert all(
+            not condition.condition_id
+            for condition in expected.conditions[num_conditions:]
+        )
+        assert all(not action.action_id for action in expected.actions[num_actions:])
+        assert actual.player_execution == expected.player_execution
+
+
+@pytest.mark.parametrize(
+    "chk_binary_data", [_read_chk_section(), _read_demon_lore_chk_section()]
+)
+def test_vectorized_decode_encodes_without_changing_data(chk_binary_data):
+    transcoder: ChkTrigTranscoder = ChkTrigTranscoder(columnar=False)
+    trig_section: DecodedTrigSection = transcoder.decode(chk_binary_data)
+    assert transcoder.encode(trig_section, include_header=False) == chk_binary_data
+
+
+@pytest.mark.parametrize(
+    "chk_binary_data", [_read_chk_section(), _read_demon_lore_chk_section()]
+)
+def test_columnar_decode_is_equivalent_to_vectorized_decode(chk_binary_data):
+    columnar = ChkTrigTranscoder().decode(chk_binary_data)
+    vectorized = ChkTrigTranscoder(columnar=False).decode(chk_binary_data)
+    assert columnar.columns is not None
+    assert vectorized.columns is None
+    assert columnar.columns.num_triggers == len(vectorized.triggers)
+    assert columnar.triggers == vectorized.triggers
+    assert columnar == vectorized
+
+
+@pytest.mark.parametrize(
+    "chk_binary_data", [_read_chk_section(), _read_demon_lore_chk_section()]
+)
+def test_columnar_decode_encodes_without_changing_data(chk_binary_data):
+    transcoder: ChkTrigTranscoder = ChkTrigTranscoder()
+    trig_section: DecodedTrigSection = transcoder.decode(chk_binary_data)
+    assert transcoder.encode(trig_section, include_header=False) == chk_binary_data
+    assert not trig_section.has_materialized_triggers
+
+
+def test_it_encodes_changes_to_columns():
+    transcoder: ChkTrigTranscoder = ChkTrigTranscoder()
+    trig_section: DecodedTrigSection = transcoder.decode(_read_chk_section())
+    # the resources amount of the starting resources trigger is its second group
+    trig_section.columns.action_columns[5][0] = 75
+    encoded = transcoder.encode(trig_section, include_header=False)
+    assert transcoder.decode(encoded).triggers[0].actions[0].second_group == 75
+
+
+def test_it_encodes_changes_to_materialized_triggers():
+    transcoder: ChkTrigTranscoder = ChkTrigTranscoder()
+    trig_section: DecodedTrigSection = transcoder.decode(_read_chk_section())
+    trig_section.triggers[0].actions[0]._second_group = 75
+    assert trig_section.has_materialized_triggers
+    encoded = transcoder.encode(trig_section, include_header=False)
+    assert transcoder.decode(encoded).triggers[0].actions[0].second_group == 75
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+def test_it_encodes_into_a_sink_in_chunks_without_changing_data(columnar):
+    chk_binary_data = _read_demon_lore_chk_section()
+    transcoder: ChkTrigTranscoder = ChkTrigTranscoder(columnar=columnar)
+    trig_section: DecodedTrigSection = transcoder.decode(chk_binary_data)
+    sink = BytesIO()
+    num_bytes_written = transcoder.encode_into(trig_section, sink)
+    assert sink.getvalue() == transcoder.encode(trig_section)
+    assert num_bytes_written == len(sink.getvalue())
+
+
+def test_it_encodes_a_lazy_spec_into_a_sink_in_chunks():
+    num_triggers = 600
+    trig_size = ChkTrigTranscoder._NUM_BYTES_PER_TRIGGER
+    lazy_spec = TrigLazySpec(
+        num_triggers,
+        trig_size,
+        [(60, bytes([1]) * num_triggers), (2399, bytes([3]) * num_triggers)],
+        8,
+        bytes(range(256)) * (4 * num_triggers // 256) + bytes(4 * num_triggers % 256),
+        328,
+        bytes(reversed(range(200))) * (4 * num_triggers // 200),
+    )
+    trig_section = DecodedTrigSection(_triggers=[], _lazy_spec=lazy_spec)
+    sink = BytesIO()
+    ChkTrigTranscoder().encode_into(trig_section, sink)
+    assert sink.getvalue()[8:] == lazy_spec.materialize()
+    assert not trig_section._cache_box
+
+
+def _make_trigger_with_data_in_empty_slots() -> bytes:
+    """A trigger with a condition after an empty slot, and data in empty slots after
+    its last condition and action."""
+    trigger = bytearray(ChkTrigTranscoder._NUM_BYTES_PER_TRIGGER)
+    condition_size = ChkTrigTranscoder._NUM_BYTES_PER_CONDITION
+    action_size = ChkTrigTranscoder._NUM_BYTES_PER_ACTION
+    first_action = condition_size * ChkTrigTranscoder._NUM_CONDITIONS_PER_TRIGGER
+    # Always in slot 0, Never in slot 2 after the empty slot 1
+    trigger[15] = 22
+    trigger[2 * condition_size + 15] = 23
+    # a location in slot 4, which has no condition byte
+    trigger[4 * condition_size] = 7
+    # Preserve Trigger in slot 0, and a text string in slot 9 without an action byte
+    trigger[first_action + 26] = 3
+    trigger[first_action + 9 * action_size + 4] = 5
+    # executed for player 1
+    trigger[-28] = 1
+    return bytes(trigger)
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+def test_it_encodes_data_in_empty_slots_with_and_without_reading_triggers(columnar):
+    chk_binary_data = _make_trigger_with_data_in_empty_slots()
+    transcoder: ChkTrigTranscoder = ChkTrigTranscoder(columnar=columnar)
+    trig_section: DecodedTrigSection = transcoder.decode(chk_binary_data)
+    assert transcoder.encode(trig_section, include_header=False) == chk_binary_data
+    read_trig_section: DecodedTrigSection = transcoder.decode(chk_binary_data)
+    assert [
+        condition.condition_id for condition in read_trig_section.triggers[0].conditions
+    ] == [22, 0, 23, 0, 0]
+    assert len(read_trig_section.triggers[0].actions) == 10
+    assert transcoder.encode(read_trig_section, include_header=False) == (
+        chk_binary_data
+    )
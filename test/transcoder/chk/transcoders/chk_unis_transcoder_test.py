@@ -1,3 +1,5 @@
+import dataclasses
+
 from richchk.model.chk.unis.decoded_unis_section import DecodedUnisSection
 from richchk.transcoder.chk.transcoders.chk_unis_transcoder import ChkUnisTranscoder
 
@@ -75,3 +77,32 @@ def _assert_terran_marine_has_modified_values(unis_section: DecodedUnisSection):
         unis_section.unit_upgrade_weapon_damages[_TERRAN_GAUSS_RIFLE_ID]
         == _TERRAN_MARINE_GAUSS_WEAPON_UPGRADE_DAMAGE
     )
+
+
+def test_it_encodes_a_decoded_section_from_its_binary_data():
+    chk_binary_data = _read_chk_section()
+    unis_section: DecodedUnisSection = ChkUnisTranscoder().decode(chk_binary_data)
+    assert unis_section.binary_data == chk_binary_data
+
+
+def test_it_encodes_the_edits_of_a_decoded_section():
+    transcoder: ChkUnisTranscoder = ChkUnisTranscoder()
+    unis_section: DecodedUnisSection = transcoder.decode(_read_chk_section())
+    unit_hitpoints = unis_section.unit_hitpoints
+    unit_hitpoints[_TERRAN_MARINE_UNIT_ID] = 40 * 256
+    edited_section = dataclasses.replace(unis_section, _unit_hitpoints=unit_hitpoints)
+    assert edited_section.binary_data is None
+    edited_binary_data = transcoder.encode(edited_section, include_header=False)
+    assert transcoder.decode(edited_binary_data) == edited_section
+    assert (
+        transcoder.decode(edited_binary_data).unit_hitpoints[_TERRAN_MARINE_UNIT_ID]
+        == 40 * 256
+    )
+
+
+def test_it_encodes_a_section_built_from_the_decoded_fields_to_the_same_data():
+    transcoder: ChkUnisTranscoder = ChkUnisTranscoder()
+    chk_binary_data = _read_chk_section()
+    rebuilt_section = dataclasses.replace(transcoder.decode(chk_binary_data))
+    assert rebuilt_section.binary_data is None
+    assert transcoder.encode(rebuilt_section, include_header=False) == chk_binary_data
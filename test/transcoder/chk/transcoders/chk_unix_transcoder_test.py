@@ -1,3 +1,5 @@
+import dataclasses
+
 from richchk.model.chk.unix.decoded_unix_section import DecodedUnixSection
 from richchk.model.richchk.unis.unit_id import UnitId
 from richchk.model.richchk.unis.weapon_id import WeaponId
@@ -92,3 +94,32 @@ def _assert_terran_valkyrie_has_modified_values(unis_section: DecodedUnixSection
         unis_section.unit_upgrade_weapon_damages[WeaponId.HALO_ROCKETS.id]
         == _TERRAN_VALK_WEAPON_UPGRADE_DAMAGE
     )
+
+
+def test_it_encodes_a_decoded_section_from_its_binary_data():
+    chk_binary_data = _read_chk_section()
+    unix_section: DecodedUnixSection = ChkUnixTranscoder().decode(chk_binary_data)
+    assert unix_section.binary_data == chk_binary_data
+
+
+def test_it_encodes_the_edits_of_a_decoded_section():
+    transcoder: ChkUnixTranscoder = ChkUnixTranscoder()
+    unix_section: DecodedUnixSection = transcoder.decode(_read_chk_section())
+    unit_hitpoints = unix_section.unit_hitpoints
+    unit_hitpoints[_TERRAN_MARINE_UNIT_ID] = 40 * 256
+    edited_section = dataclasses.replace(unix_section, _unit_hitpoints=unit_hitpoints)
+    assert edited_section.binary_data is None
+    edited_binary_data = transcoder.encode(edited_section, include_header=False)
+    assert transcoder.decode(edited_binary_data) == edited_section
+    assert (
+        transcoder.decode(edited_binary_data).unit_hitpoints[_TERRAN_MARINE_UNIT_ID]
+        == 40 * 256
+    )
+
+
+def test_it_encodes_a_section_built_from_the_decoded_fields_to_the_same_data():
+    transcoder: ChkUnixTranscoder = ChkUnixTranscoder()
+    chk_binary_data = _read_chk_section()
+    rebuilt_section = dataclasses.replace(transcoder.decode(chk_binary_data))
+    assert rebuilt_section.binary_data is None
+    assert transcoder.encode(rebuilt_section, include_header=False) == chk_binary_data
@@ -42,3 +42,32 @@ def test_it_decodes_and_encodes_without_changing_data():
     actual_encoded_data = transcoder.encode(uprp_section, include_header=False)
     assert actual_encoded_data == chk_binary_data
     assert transcoder.decode(actual_encoded_data) == transcoder.decode(chk_binary_data)
+
+
+def test_it_encodes_an_unread_section_from_its_binary_data():
+    chk_binary_data = _read_chk_section()
+    uprp_section: DecodedUprpSection = ChkUprpTranscoder().decode(chk_binary_data)
+    assert uprp_section.unread_binary_data == chk_binary_data
+    assert len(uprp_section.cuwp_slots) == 64
+    assert uprp_section.unread_binary_data is None
+
+
+def test_it_encodes_the_edits_of_read_cuwp_slots():
+    transcoder: ChkUprpTranscoder = ChkUprpTranscoder()
+    uprp_section: DecodedUprpSection = transcoder.decode(_read_chk_section())
+    uprp_section.cuwp_slots[0] = _EXPECTED_DECODED_CUWP_SLOT
+    edited_binary_data = transcoder.encode(uprp_section, include_header=False)
+    assert transcoder.decode(edited_binary_data) == uprp_section
+    assert transcoder.decode(edited_binary_data).cuwp_slots[0] == (
+        _EXPECTED_DECODED_CUWP_SLOT
+    )
+
+
+def test_it_encodes_a_section_built_from_the_decoded_cuwp_slots_to_the_same_data():
+    transcoder: ChkUprpTranscoder = ChkUprpTranscoder()
+    chk_binary_data = _read_chk_section()
+    uprp_section = DecodedUprpSection(
+        _cuwp_slots=list(transcoder.decode(chk_binary_data).cuwp_slots)
+    )
+    assert uprp_section.unread_binary_data is None
+    assert transcoder.encode(uprp_section, include_header=False) == chk_binary_data
@@ -1,5 +1,8 @@
 import pytest
 
+from richchk.model.richchk.trig.conditions.comparators.numeric_comparator import (
+    NumericComparator,
+)
 from richchk.model.richchk.trig.player_id import PlayerId
 from richchk.transcoder.richchk.transcoders.helpers.richchk_enum_transcoder import (
     RichChkEnumTranscoder,
@@ -26,3 +29,17 @@ def test_it_throws_if_no_enum_for_id():
 
 def test_it_encodes_enum():
     assert RichChkEnumTranscoder.encode_enum(PlayerId.PLAYER_1) == 0
+
+
+def test_it_indexes_enums_by_id_with_gaps_for_missing_ids():
+    table = RichChkEnumTranscoder.dense_table(NumericComparator)
+    assert len(table) == NumericComparator.EXACTLY.id + 1
+    for comparator in NumericComparator:
+        assert table[comparator.id] is comparator
+    assert table[NumericComparator.AT_MOST.id + 1] is None
+
+
+@pytest.mark.parametrize("enum_id", [-1, 5, 11])
+def test_it_throws_if_no_enum_for_id_between_or_around_enum_ids(enum_id):
+    with pytest.raises(KeyError):
+        RichChkEnumTranscoder.decode_enum(enum_id, NumericComparator)
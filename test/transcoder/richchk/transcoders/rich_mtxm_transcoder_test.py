@@ -2,6 +2,7 @@ import pytest
 
 from richchk.model.chk.mtxm.decoded_mtxm_section import DecodedMtxmSection
 from richchk.model.richchk.mrgn.rich_mrgn_lookup import RichMrgnLookup
+from richchk.model.richchk.mtxm.rich_tile import RichTile
 from richchk.model.richchk.richchk_decode_context import RichChkDecodeContext
 from richchk.model.richchk.richchk_encode_context import RichChkEncodeContext
 from richchk.model.richchk.str.rich_str_lookup import RichStrLookup
@@ -75,3 +76,37 @@ def test_integration_it_decodes_and_encodes_back_without_changing_data(
     )
     assert rich_mtxm == rich_mtxm_again
     assert actual_decoded_mtxm == real_decoded_mtxm
+
+
+def test_it_decodes_a_grid_with_the_map_width(real_decoded_mtxm):
+    rich_mtxm = RichMtxmTranscoder().decode(
+        real_decoded_mtxm,
+        rich_chk_decode_context=RichChkDecodeContext(
+            _rich_str_lookup=RichStrLookup(
+                _string_by_id_lookup={}, _id_by_string_lookup={}
+            ),
+            _map_width=64,
+        ),
+    )
+    assert rich_mtxm.width == 64
+    assert rich_mtxm.height == 256
+    assert rich_mtxm.tile_at(3, 2) == RichTile(_id=real_decoded_mtxm.tiles[2 * 64 + 3])
+    assert rich_mtxm.row(2) == list(rich_mtxm.tiles[2 * 64 : 3 * 64])
+    with pytest.raises(IndexError):
+        rich_mtxm.tile_at(64, 0)
+
+
+def test_it_fills_a_rectangle_in_a_copy(real_decoded_mtxm, rich_decode_context):
+    rich_mtxm = RichMtxmTranscoder().decode(
+        real_decoded_mtxm,
+        rich_chk_decode_context=rich_decode_context,
+    )
+    filled = rich_mtxm.fill_rectangle(2, 3, 4, 5, RichTile(_id=0x1234))
+    for y in range(rich_mtxm.height):
+        for x in range(rich_mtxm.width):
+            in_rectangle = 2 <= x < 6 and 3 <= y < 8
+            expected = RichTile(_id=0x1234) if in_rectangle else rich_mtxm.tile_at(x, y)
+            assert filled.tile_at(x, y) == expected
+    assert rich_mtxm.tile_ids == real_decoded_mtxm.tiles
+    with pytest.raises(IndexError):
+        rich_mtxm.fill_rectangle(126, 0, 4, 1, 0)
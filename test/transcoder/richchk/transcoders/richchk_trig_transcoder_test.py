@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from richchk.io.richchk.lookups.mrgn.rich_mrgn_lookup_builder import (
@@ -13,13 +15,18 @@ from richchk.io.richchk.rich_str_lookup_builder import RichStrLookupBuilder
 from richchk.model.chk.mrgn.decoded_mrgn_section import DecodedMrgnSection
 from richchk.model.chk.str.decoded_str_section import DecodedStrSection
 from richchk.model.chk.swnm.decoded_swnm_section import DecodedSwnmSection
+from richchk.model.chk.trig.decoded_player_execution import DecodedPlayerExecution
 from richchk.model.chk.trig.decoded_trig_section import DecodedTrigSection
+from richchk.model.chk.trig.decoded_trigger import DecodedTrigger
+from richchk.model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
 from richchk.model.chk.uprp.decoded_uprp_section import DecodedUprpSection
 from richchk.model.richchk.mrgn.rich_mrgn_lookup import RichMrgnLookup
 from richchk.model.richchk.richchk_decode_context import RichChkDecodeContext
 from richchk.model.richchk.richchk_encode_context import RichChkEncodeContext
 from richchk.model.richchk.str.rich_str_lookup import RichStrLookup
 from richchk.model.richchk.swnm.rich_swnm_lookup import RichSwnmLookup
+from richchk.model.richchk.trig.rich_trigger_action import RichTriggerAction
+from richchk.model.richchk.trig.rich_trigger_condition import RichTriggerCondition
 from richchk.model.richchk.uprp.rich_cuwp_lookup import RichCuwpLookup
 from richchk.transcoder.chk.transcoders.chk_mrgn_transcoder import ChkMrgnTranscoder
 from richchk.transcoder.chk.transcoders.chk_str_transcoder import ChkStrTranscoder
@@ -35,6 +42,9 @@ from richchk.transcoder.richchk.transcoders.richchk_mrgn_transcoder import (
 from richchk.transcoder.richchk.transcoders.richchk_trig_transcoder import (
     RichChkTrigTranscoder,
 )
+from richchk.transcoder.richchk.transcoders.trig.compiled_trigger_codecs import (
+    CompiledTriggerCodecs,
+)
 
 from ....chk_resources import CHK_SECTION_FILE_PATHS
 from ....fixtures.richchk_io_fixtures import generate_empty_rich_chk_decode_context
@@ -153,3 +163,89 @@ def test_integration_it_decodes_and_encodes_back_to_chk_without_changing_data(
     re_decoded = chk_transcoder.decode(encoded_bytes)
     rich_trig_again = rich_transcoder.decode(re_decoded, real_rich_chk_decode_context)
     assert rich_trig_again == rich_trig
+
+
+def test_integration_it_decodes_columns_same_as_decoded_triggers(
+    real_decoded_trig, real_rich_chk_decode_context
+):
+    assert real_decoded_trig.columns is not None
+    transcoder = RichChkTrigTranscoder()
+    from_columns = transcoder.decode(real_decoded_trig, real_rich_chk_decode_context)
+    assert not real_decoded_trig.has_materialized_triggers
+    from_triggers = transcoder.decode(
+        DecodedTrigSection(_triggers=real_decoded_trig.triggers),
+        real_rich_chk_decode_context,
+    )
+    assert from_columns == from_triggers
+
+
+def _assert_equal_rich_objects_are_shared(rich_trig):
+    shared = {}
+    for trigger in rich_trig.triggers:
+        assert shared.setdefault(trigger.players, trigger.players) is trigger.players
+        for rich_object in [*trigger.conditions, *trigger.actions]:
+            if isinstance(rich_object, (RichTriggerCondition, RichTriggerAction)):
+                assert shared.setdefault(rich_object, rich_object) is rich_object
+
+
+def test_integration_it_shares_equal_conditions_actions_and_players(
+    real_decoded_trig, real_rich_chk_decode_context
+):
+    transcoder = RichChkTrigTranscoder()
+    from_columns = transcoder.decode(real_decoded_trig, real_rich_chk_decode_context)
+    from_triggers = transcoder.decode(
+        DecodedTrigSection(_triggers=real_decoded_trig.triggers),
+        real_rich_chk_decode_context,
+    )
+    _assert_equal_rich_objects_are_shared(from_columns)
+    _assert_equal_rich_objects_are_shared(from_triggers)
+    # each decode has its own table
+    first_action = from_columns.triggers[0].actions[0]
+    assert first_action is not from_triggers.triggers[0].actions[0]
+
+
+def test_integration_it_decodes_shared_objects_same_as_each_slot(
+    real_decoded_trig, real_rich_chk_decode_context
+):
+    rich_trig = RichChkTrigTranscoder().decode(
+        real_decoded_trig, real_rich_chk_decode_context
+    )
+    for trigger, rich_trigger in zip(real_decoded_trig.triggers, rich_trig.triggers):
+        assert rich_trigger.conditions == CompiledTriggerCodecs.decode_conditions(
+            trigger.conditions, real_rich_chk_decode_context
+        )
+        assert rich_trigger.actions == CompiledTriggerCodecs.decode_actions(
+            trigger.actions, real_rich_chk_decode_context
+        )
+
+
+def _decoded_trigger_with_condition(
+    condition: DecodedTriggerCondition,
+) -> DecodedTrigger:
+    return DecodedTrigger(
+        _conditions=[condition],
+        _actions=[],
+        _player_execution=DecodedPlayerExecution(
+            _execution_flags=0, _player_flags=[0] * 27, _current_action_index=0
+        ),
+    )
+
+
+def test_it_does_not_share_conditions_kept_decoded():
+    unknown_conditions = [
+        dataclasses.replace(RichChkTrigTranscoder._EMPTY_CONDITION, _condition_id=200)
+        for _ in range(2)
+    ]
+    rich_trig = RichChkTrigTranscoder().decode(
+        DecodedTrigSection(
+            _triggers=[
+                _decoded_trigger_with_condition(condition)
+                for condition in unknown_conditions
+            ]
+        ),
+        generate_empty_rich_chk_decode_context(),
+    )
+    first, second = rich_trig.triggers
+    assert first.conditions[0] is unknown_conditions[0]
+    assert second.conditions[0] is unknown_conditions[1]
+    assert first.players is second.players
@@ -0,0 +1,299 @@
+import dataclasses
+
+import pytest
+
+from richchk.model.chk.trig.decoded_trigger_action import DecodedTriggerAction
+from richchk.model.richchk.mrgn.rich_location import RichLocation
+from richchk.model.richchk.mrgn.rich_mrgn_lookup import RichMrgnLookup
+from richchk.model.richchk.richchk_encode_context import RichChkEncodeContext
+from richchk.model.richchk.str.rich_str_lookup import RichStrLookup
+from richchk.model.richchk.str.rich_string import RichString
+from richchk.model.richchk.swnm.rich_switch import RichSwitch
+from richchk.model.richchk.swnm.rich_swnm_lookup import RichSwnmLookup
+from richchk.model.richchk.trig.actions.create_unit_action import CreateUnitAction
+from richchk.model.richchk.trig.actions.display_text_message_action import (
+    DisplayTextMessageAction,
+)
+from richchk.model.richchk.trig.actions.preserve_trigger_action import PreserveTrigger
+from richchk.model.richchk.trig.actions.set_switch_action import SetSwitchAction
+from richchk.model.richchk.trig.actions.wait_trigger_action import WaitAction
+from richchk.model.richchk.trig.conditions.always_condition import AlwaysCondition
+from richchk.model.richchk.trig.enums.switch_action import SwitchAction
+from richchk.model.richchk.trig.player_id import PlayerId
+from richchk.model.richchk.trig.rich_trig_section import RichTrigSection
+from richchk.model.richchk.trig.rich_trigger import RichTrigger
+from richchk.model.richchk.unis.unit_id import UnitId
+from richchk.model.richchk.uprp.rich_cuwp_lookup import RichCuwpLookup
+from richchk.transcoder.richchk.transcoders.trig.batched_trig_encode_optimizer import (
+    BatchedTrigEncodeOptimizer,
+)
+
+_NUM_LOCATIONS = 16
+_NUM_SWITCHES = 8
+_NUM_MESSAGES = 32
+
+
+@pytest.fixture(scope="function")
+def locations():
+    return [
+        RichLocation(
+            _left_x1=i,
+            _top_y1=i,
+            _right_x2=i + 32,
+            _bottom_y2=i + 32,
+            _custom_location_name=RichString(_value=f"location {i}"),
+        )
+        for i in range(_NUM_LOCATIONS)
+    ]
+
+
+@pytest.fixture(scope="function")
+def switches():
+    return [
+        RichSwitch(_custom_name=RichString(_value=f"switch {i}"))
+        for i in range(_NUM_SWITCHES)
+    ]
+
+
+@pytest.fixture(scope="function")
+def messages():
+    return [RichString(_value=f"message {i}") for i in range(_NUM_MESSAGES)]
+
+
+@pytest.fixture(scope="function")
+def rich_chk_encode_context(locations, switches, messages):
+    return RichChkEncodeContext(
+        _rich_str_lookup=RichStrLookup(
+            _string_by_id_lookup={},
+            _id_by_string_lookup={
+                message.value: i + 1 for i, message in enumerate(messages)
+            },
+        ),
+        _rich_mrgn_lookup=RichMrgnLookup(
+            _location_by_id_lookup={},
+            _id_by_location_lookup={
+                location: i + 1 for i, location in enumerate(locations)
+            },
+        ),
+        _rich_swnm_lookup=RichSwnmLookup(
+            _switch_by_id_lookup={},
+            _id_by_switch_lookup={switch: i for i, switch in enumerate(switches)},
+        ),
+        _rich_cuwp_lookup=RichCuwpLookup(_cuwp_by_id_lookup={}, _id_by_cuwp_lookup={}),
+    )
+
+
+@pytest.fixture(scope="function")
+def heterogeneous_trig_section(locations, switches, messages):
+    always = AlwaysCondition()
+    players = frozenset({PlayerId.PLAYER_1})
+    triggers = []
+    for i in range(100):
+        triggers.append(
+            RichTrigger(
+                _conditions=[always],
+                _actions=[
+                    CreateUnitAction(
+                        _group=PlayerId.PLAYER_1,
+                        _amount=i % 7 + 1,
+                        _unit=UnitId.TERRAN_MARINE if i % 2 else UnitId.ZERG_ZERGLING,
+                        _location=locations[i % _NUM_LOCATIONS],
+                    ),
+                    PreserveTrigger(),
+                ],
+                _players=players,
+            )
+        )
+    for i in range(50):
+        triggers.append(
+            RichTrigger(
+                _conditions=[always],
+                _actions=[
+                    DisplayTextMessageAction(_text=messages[i % _NUM_MESSAGES]),
+                    WaitAction(_milliseconds=i * 250),
+                    SetSwitchAction(
+                        _switch=switches[i % _NUM_SWITCHES],
+                        _switch_action=SwitchAction.TOGGLE
+                        if i % 3
+                        else SwitchAction.SET,
+                    ),
+                ],
+                _players=players,
+            )
+        )
+    # a run too short for a template, followed by a run for different players
+    for i in range(3):
+        triggers.append(
+            RichTrigger(
+                _conditions=[always],
+                _actions=[WaitAction(_milliseconds=i)],
+                _players=players,
+            )
+        )
+    for i in range(20):
+        triggers.append(
+            RichTrigger(
+                _conditions=[always],
+                _actions=[WaitAction(_milliseconds=i)],
+                _players=frozenset({PlayerId.PLAYER_1, PlayerId.PLAYER_2}),
+            )
+        )
+    return RichTrigSection(_triggers=triggers)
+
+
+def test_it_encodes_heterogeneous_triggers_same_as_per_trigger_packing(
+    heterogeneous_trig_section, rich_chk_encode_context
+):
+    optimizer = BatchedTrigEncodeOptimizer()
+    expected = optimizer._simple_encode_to_bytes(
+        heterogeneous_trig_section, rich_chk_encode_context
+    )
+    actual = optimizer.encode(heterogeneous_trig_section, rich_chk_encode_context)
+    assert bytes(actual) == bytes(expected)
+
+
+def test_it_encodes_runs_of_identical_triggers_same_as_per_trigger_packing(
+    rich_chk_encode_context, messages
+):
+    trigger = RichTrigger(
+        _conditions=[AlwaysCondition()],
+        _actions=[DisplayTextMessageAction(_text=messages[0])],
+        _players=frozenset({PlayerId.ALL_PLAYERS}),
+    )
+    trig_section = RichTrigSection(_triggers=[trigger] * 40)
+    optimizer = BatchedTrigEncodeOptimizer()
+    expected = optimizer._simple_encode_to_bytes(trig_section, rich_chk_encode_context)
+    actual = optimizer.encode(trig_section, rich_chk_encode_context)
+    assert bytes(actual) == bytes(expected)
+
+
+def _count_encoded_chunks(monkeypatch, optimizer):
+    encoded_chunks = []
+    encode_fingerprint_runs = optimizer._encode_fingerprint_runs
+
+    def counting_encode_fingerprint_runs(triggers, *args):
+        encoded_chunks.append(len(triggers))
+        return encode_fingerprint_runs(triggers, *args)
+
+    monkeypatch.setattr(
+        optimizer, "_encode_fingerprint_runs", counting_encode_fingerprint_runs
+    )
+    return encoded_chunks
+
+
+def test_it_only_encodes_the_chunks_of_edited_triggers_again(
+    heterogeneous_trig_section, rich_chk_encode_context, messages, monkeypatch
+):
+    BatchedTrigEncodeOptimizer._chunk_bytes_cache.clear()
+    optimizer = BatchedTrigEncodeOptimizer()
+    encoded_chunks = _count_encoded_chunks(monkeypatch, optimizer)
+    triggers = heterogeneous_trig_section.triggers * 4
+    optimizer.encode(RichTrigSection(_triggers=triggers), rich_chk_encode_context)
+    assert len(encoded_chunks) == 3
+    edited_triggers = list(triggers)
+    edited_triggers[300] = RichTrigger(
+        _conditions=[AlwaysCondition()],
+        _actions=[DisplayTextMessageAction(_text=messages[1])],
+        _players=frozenset({PlayerId.PLAYER_3}),
+    )
+    edited_trig_section = RichTrigSection(_triggers=edited_triggers)
+    encoded_chunks.clear()
+    actual = optimizer.encode(edited_trig_section, rich_chk_encode_context)
+    assert len(encoded_chunks) == 1
+    expected = optimizer._simple_encode_to_bytes(
+        edited_trig_section, rich_chk_encode_context
+    )
+    assert bytes(actual) == bytes(expected)
+
+
+def test_it_encodes_chunks_again_when_decoded_actions_are_edited_in_place(
+    heterogeneous_trig_section, rich_chk_encode_context
+):
+    BatchedTrigEncodeOptimizer._chunk_bytes_cache.clear()
+    optimizer = BatchedTrigEncodeOptimizer()
+    # actions with an unknown ID are kept decoded, and decoded actions are mutable
+    unknown_action = DecodedTriggerAction(
+        _location_id=0,
+        _text_string_id=0,
+        _wav_string_id=0,
+        _time=0,
+        _first_group=0,
+        _second_group=0,
+        _action_argument_type=0,
+        _action_id=200,
+        _quantifier_or_switch_or_order=0,
+        _flags=0,
+        _padding=0,
+        _mask_flag=0,
+    )
+    triggers = list(heterogeneous_trig_section.triggers)
+    triggers[10] = RichTrigger(
+        _conditions=[AlwaysCondition()],
+        _actions=[unknown_action],
+        _players=frozenset({PlayerId.PLAYER_1}),
+    )
+    trig_section = RichTrigSection(_triggers=triggers)
+    optimizer.encode(trig_section, rich_chk_encode_context)
+    unknown_action._time = 1000
+    actual = optimizer.encode(trig_section, rich_chk_encode_context)
+    expected = optimizer._simple_encode_to_bytes(trig_section, rich_chk_encode_context)
+    assert bytes(actual) == bytes(expected)
+
+
+def test_it_encodes_chunks_again_when_the_context_changes_an_id(
+    heterogeneous_trig_section, rich_chk_encode_context, messages
+):
+    BatchedTrigEncodeOptimizer._chunk_bytes_cache.clear()
+    optimizer = BatchedTrigEncodeOptimizer()
+    optimizer.encode(heterogeneous_trig_section, rich_chk_encode_context)
+    renumbered_context = RichChkEncodeContext(
+        _rich_str_lookup=RichStrLookup(
+            _string_by_id_lookup={},
+            _id_by_string_lookup={
+                message.value: len(messages) - i for i, message in enumerate(messages)
+            },
+        ),
+        _rich_mrgn_lookup=rich_chk_encode_context.rich_mrgn_lookup,
+        _rich_swnm_lookup=rich_chk_encode_context.rich_swnm_lookup,
+        _rich_cuwp_lookup=rich_chk_encode_context.rich_cuwp_lookup,
+    )
+    actual = optimizer.encode(heterogeneous_trig_section, renumbered_context)
+    expected = optimizer._simple_encode_to_bytes(
+        heterogeneous_trig_section, renumbered_context
+    )
+    assert bytes(actual) == bytes(expected)
+
+
+def test_it_encodes_chunks_again_when_a_later_context_changes_an_earlier_id(
+    rich_chk_encode_context,
+):
+    BatchedTrigEncodeOptimizer._chunk_bytes_cache.clear()
+    optimizer = BatchedTrigEncodeOptimizer()
+
+    def with_string_ids(id_by_string):
+        return dataclasses.replace(
+            rich_chk_encode_context,
+            _rich_str_lookup=RichStrLookup(
+                _string_by_id_lookup={}, _id_by_string_lookup=id_by_string
+            ),
+        )
+
+    def display_text(text):
+        return RichTrigger(
+            _conditions=[AlwaysCondition()],
+            _actions=[DisplayTextMessageAction(_text=RichString(_value=text))],
+            _players=frozenset({PlayerId.PLAYER_1}),
+        )
+
+    unique_trig_section = RichTrigSection(_triggers=[display_text("unique")])
+    # each context keeps the IDs of the one before, but the last one gives the ID of
+    # "unique" in the first one to another string
+    optimizer.encode(unique_trig_section, with_string_ids({"plain": 1, "unique": 2}))
+    optimizer.encode(
+        RichTrigSection(_triggers=[display_text("plain")]),
+        with_string_ids({"plain": 1, "other": 2}),
+    )
+    last_context = with_string_ids({"plain": 1, "other": 2, "unique": 3})
+    actual = optimizer.encode(unique_trig_section, last_context)
+    expected = optimizer._simple_encode_to_bytes(unique_trig_section, last_context)
+    assert bytes(actual) == bytes(expected)
@@ -0,0 +1,154 @@
+import dataclasses
+
+import pytest
+
+from richchk.model.chk.trig.decoded_trigger_action import DecodedTriggerAction
+from richchk.model.chk.trig.decoded_trigger_condition import DecodedTriggerCondition
+from richchk.model.richchk.mrgn.rich_mrgn_lookup import RichMrgnLookup
+from richchk.model.richchk.richchk_encode_context import RichChkEncodeContext
+from richchk.model.richchk.str.rich_str_lookup import RichStrLookup
+from richchk.model.richchk.swnm.rich_swnm_lookup import RichSwnmLookup
+from richchk.model.richchk.trig.actions.flags.trigger_action_flags import (
+    TriggerActionFlags,
+)
+from richchk.model.richchk.trig.actions.set_deaths_action import SetDeathsAction
+from richchk.model.richchk.trig.conditions.comparators.numeric_comparator import (
+    NumericComparator,
+)
+from richchk.model.richchk.trig.conditions.deaths_condition import DeathsCondition
+from richchk.model.richchk.trig.conditions.flags.trigger_condition_flags import (
+    TriggerConditionFlags,
+)
+from richchk.model.richchk.trig.enums.amount_modifier import AmountModifier
+from richchk.model.richchk.trig.player_id import PlayerId
+from richchk.model.richchk.trig.trigger_action_id import TriggerActionId
+from richchk.model.richchk.trig.trigger_condition_id import TriggerConditionId
+from richchk.model.richchk.unis.unit_id import UnitId
+from richchk.model.richchk.uprp.rich_cuwp_lookup import RichCuwpLookup
+from richchk.transcoder.richchk.transcoders.trig.compiled_trigger_codecs import (
+    CompiledTriggerCodecs,
+)
+
+from .....fixtures.richchk_io_fixtures import generate_empty_rich_chk_decode_context
+
+_DEATHS_CONDITION = DeathsCondition(
+    _group=PlayerId.PLAYER_1,
+    _comparator=NumericComparator.EXACTLY,
+    _amount=3,
+    _unit=UnitId.TERRAN_MARINE,
+)
+_SET_DEATHS_ACTION = SetDeathsAction(
+    _group=PlayerId.PLAYER_1,
+    _unit=UnitId.TERRAN_MARINE,
+    _amount=3,
+    _amount_modifier=AmountModifier.ADD,
+)
+
+
+def _empty_encode_context() -> RichChkEncodeContext:
+    return RichChkEncodeContext(
+        _rich_str_lookup=RichStrLookup(
+            _string_by_id_lookup={}, _id_by_string_lookup={}
+        ),
+        _rich_mrgn_lookup=RichMrgnLookup(
+            _location_by_id_lookup={}, _id_by_location_lookup={}
+        ),
+        _rich_swnm_lookup=RichSwnmLookup(
+            _switch_by_id_lookup={}, _id_by_switch_lookup={}
+        ),
+        _rich_cuwp_lookup=RichCuwpLookup(_cuwp_by_id_lookup={}, _id_by_cuwp_lookup={}),
+    )
+
+
+def _decoded_condition(condition_id: int) -> DecodedTriggerCondition:
+    return DecodedTriggerCondition(
+        _location_id=0,
+        _group=0,
+        _quantity=0,
+        _unit_id=0,
+        _numeric_comparison_operation=0,
+        _condition_id=condition_id,
+        _numeric_comparand_type=0,
+        _flags=0,
+        _mask_flag=0,
+    )
+
+
+def _decoded_action(action_id: int) -> DecodedTriggerAction:
+    return DecodedTriggerAction(
+        _location_id=0,
+        _text_string_id=0,
+        _wav_string_id=0,
+        _time=0,
+        _first_group=0,
+        _second_group=0,
+        _action_argument_type=0,
+        _action_id=action_id,
+        _quantifier_or_switch_or_order=0,
+        _flags=0,
+        _padding=0,
+        _mask_flag=0,
+    )
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        _DEATHS_CONDITION,
+        dataclasses.replace(
+            _DEATHS_CONDITION, _flags=TriggerConditionFlags(disabled=True)
+        ),
+    ],
+)
+def test_it_encodes_and_decodes_conditions_with_and_without_flags(condition):
+    encoder = CompiledTriggerCodecs.condition_encoder(DeathsCondition)
+    decoded = encoder(condition, _empty_encode_context())
+    assert decoded.condition_id == TriggerConditionId.DEATHS.id
+    assert CompiledTriggerCodecs.decode_conditions(
+        [decoded], generate_empty_rich_chk_decode_context()
+    ) == [condition]
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        _SET_DEATHS_ACTION,
+        dataclasses.replace(
+            _SET_DEATHS_ACTION, _flags=TriggerActionFlags(always_display=True)
+        ),
+    ],
+)
+def test_it_encodes_and_decodes_actions_with_and_without_flags(action):
+    encoder = CompiledTriggerCodecs.action_encoder(SetDeathsAction)
+    decoded = encoder(action, _empty_encode_context())
+    assert decoded.action_id == TriggerActionId.SET_DEATHS.id
+    assert CompiledTriggerCodecs.decode_actions(
+        [decoded], generate_empty_rich_chk_decode_context()
+    ) == [action]
+
+
+def test_it_skips_empty_slots_and_keeps_unknown_slots_decoded():
+    unknown_condition = _decoded_condition(200)
+    out_of_range_condition = _decoded_condition(1000)
+    assert CompiledTriggerCodecs.decode_conditions(
+        [
+            _decoded_condition(TriggerConditionId.NO_CONDITION.id),
+            unknown_condition,
+            out_of_range_condition,
+        ],
+        generate_empty_rich_chk_decode_context(),
+    ) == [unknown_condition, out_of_range_condition]
+    unknown_action = _decoded_action(200)
+    assert CompiledTriggerCodecs.decode_actions(
+        [_decoded_action(TriggerActionId.NO_ACTION.id), unknown_action],
+        generate_empty_rich_chk_decode_context(),
+    ) == [unknown_action]
+
+
+def test_it_compiles_the_encoder_of_each_type_once():
+    assert CompiledTriggerCodecs.condition_encoder(
+        DeathsCondition
+    ) is CompiledTriggerCodecs.condition_encoder(DeathsCondition)
+    assert CompiledTriggerCodecs.action_encoder(
+        SetDeathsAction
+    ) is CompiledTriggerCodecs.action_encoder(SetDeathsAction)
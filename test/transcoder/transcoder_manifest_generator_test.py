@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+from richchk.transcoder import transcoder_manifest
+from richchk.transcoder.transcoder_manifest_generator import render_transcoder_manifest
+
+_TRIGGER_ACTIONS_PACKAGE = transcoder_manifest.TRIGGER_ACTION_TRANSCODERS_PACKAGE
+
+
+def test_the_manifest_is_up_to_date():
+    with open(transcoder_manifest.__file__, "r") as f:
+        assert f.read() == render_transcoder_manifest(), (
+            "The transcoder manifest is stale; regenerate it with "
+            "python -m richchk.transcoder.transcoder_manifest_generator"
+        )
+
+
+def _run_in_new_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_it_imports_trigger_action_transcoders_only_when_requested():
+    imported_action_modules = _run_in_new_interpreter(
+        "import sys\n"
+        "from richchk.io.richchk.richchk_io import RichChkIo\n"
+        "from richchk.model.richchk.trig.trigger_action_id import TriggerActionId\n"
+        "from richchk.transcoder.richchk.transcoders.trig."
+        "rich_trigger_action_transcoder_factory import "
+        "RichTriggerActionTranscoderFactory as Factory\n"
+        "def imported():\n"
+        f"    return sum(m.startswith('{_TRIGGER_ACTIONS_PACKAGE}.') "
+        "for m in sys.modules)\n"
+        "before = imported()\n"
+        "assert Factory.supports_transcoding_trig_action(TriggerActionId.CREATE_UNIT)\n"
+        "Factory.make_rich_trigger_action_transcoder(TriggerActionId.CREATE_UNIT)\n"
+        "print(before, imported())\n"
+    )
+    assert imported_action_modules == "0 1"